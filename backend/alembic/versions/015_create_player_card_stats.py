@@ -0,0 +1,116 @@
+"""create normalized player_card_stats table
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+Card leaderboards (/stats/leaderboard/card/{name}) and the cross-player card
+aggregate (/stats/cards) used to load every player_stats row and filter the
+card_stats JSON in Python. This adds one row per (player, card) with an
+index on (card_name, games_played), so both are answered by bounded SQL.
+
+Backfill: every existing player_stats.card_stats entry is copied into the
+new table, which becomes the source of per-card stats. The JSON column is
+kept but no longer written; downgrade folds the table back into it before
+dropping the table, so per-card stats recorded after the upgrade survive.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows per INSERT during backfill
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Create player_card_stats and backfill it from player_stats.card_stats."""
+    player_card_stats = op.create_table(
+        'player_card_stats',
+        sa.Column('player_id', sa.String(length=255), nullable=False),
+        sa.Column('card_name', sa.String(length=255), nullable=False),
+        sa.Column('games_played', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('games_won', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(
+            ['player_id'], ['player_stats.player_id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('player_id', 'card_name'),
+    )
+    op.create_index(
+        'idx_player_card_stats_card_games',
+        'player_card_stats',
+        ['card_name', 'games_played'],
+    )
+
+    bind = op.get_bind()
+    player_stats = sa.table(
+        'player_stats',
+        sa.column('player_id', sa.String),
+        sa.column('card_stats', sa.JSON),
+    )
+    batch = []
+    for player_id, card_stats in bind.execute(
+        sa.select(player_stats.c.player_id, player_stats.c.card_stats)
+    ):
+        for card_name, card_data in (card_stats or {}).items():
+            games_played = int(card_data.get('games_played', 0) or 0)
+            if games_played <= 0:
+                continue
+            batch.append({
+                'player_id': player_id,
+                'card_name': card_name,
+                'games_played': games_played,
+                'games_won': int(card_data.get('games_won', 0) or 0),
+            })
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                op.bulk_insert(player_card_stats, batch)
+                batch = []
+    if batch:
+        op.bulk_insert(player_card_stats, batch)
+
+
+def downgrade() -> None:
+    """Write player_card_stats back into player_stats.card_stats, then drop it."""
+    bind = op.get_bind()
+    player_card_stats = sa.table(
+        'player_card_stats',
+        sa.column('player_id', sa.String),
+        sa.column('card_name', sa.String),
+        sa.column('games_played', sa.Integer),
+        sa.column('games_won', sa.Integer),
+    )
+    player_stats = sa.table(
+        'player_stats',
+        sa.column('player_id', sa.String),
+        sa.column('card_stats', sa.JSON),
+    )
+    card_stats_by_player = {}
+    for player_id, card_name, games_played, games_won in bind.execute(
+        sa.select(
+            player_card_stats.c.player_id,
+            player_card_stats.c.card_name,
+            player_card_stats.c.games_played,
+            player_card_stats.c.games_won,
+        )
+    ):
+        card_stats_by_player.setdefault(player_id, {})[card_name] = {
+            'games_played': games_played,
+            'games_won': games_won,
+        }
+    # The table holds every count the JSON had at upgrade plus everything
+    # recorded since, so it replaces the JSON outright
+    for player_id, card_stats in card_stats_by_player.items():
+        bind.execute(
+            player_stats.update()
+            .where(player_stats.c.player_id == player_id)
+            .values(card_stats=card_stats)
+        )
+
+    op.drop_index('idx_player_card_stats_card_games', table_name='player_card_stats')
+    op.drop_table('player_card_stats')
@@ -0,0 +1,37 @@
+"""add games.game_state_snapshot
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+Adds a nullable binary column for the compact game-state snapshot format
+(api.snapshot_codec, enabled with GAME_STATE_SNAPSHOTS). Rows written with
+snapshots keep a small marker in the game_state JSON column; existing rows
+are untouched and still load from their JSON.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the nullable game_state_snapshot column."""
+    op.add_column('games', sa.Column('game_state_snapshot', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """
+    Drop game_state_snapshot.
+
+    Games saved as snapshots only have a marker in game_state: disable
+    GAME_STATE_SNAPSHOTS and let them be rewritten (any update does) before
+    downgrading, or they cannot be loaded.
+    """
+    op.drop_column('games', 'game_state_snapshot')
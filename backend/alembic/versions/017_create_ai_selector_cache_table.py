@@ -0,0 +1,44 @@
+"""create ai_selector_cache table
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+
+Creates ai_selector_cache, the persistent store of strategic-selector
+responses (game_engine.ai.selector_cache, enabled with
+AI_SELECTOR_CACHE=db). Rows are keyed by a hash of the selector request and
+pruned by age, hence the created_at index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ai_selector_cache table."""
+    op.create_table(
+        'ai_selector_cache',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('prompts_version', sa.String(length=20), nullable=False),
+        sa.Column('response', sa.Text(), nullable=False),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True), nullable=False,
+            server_default=sa.text('now()'),
+        ),
+        sa.PrimaryKeyConstraint('key', name=op.f('pk_ai_selector_cache')),
+    )
+    op.create_index('idx_ai_selector_cache_created', 'ai_selector_cache', ['created_at'])
+
+
+def downgrade() -> None:
+    """Drop ai_selector_cache table."""
+    op.drop_index('idx_ai_selector_cache_created', table_name='ai_selector_cache')
+    op.drop_table('ai_selector_cache')
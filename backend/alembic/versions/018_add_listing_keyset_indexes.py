@@ -0,0 +1,44 @@
+"""add listing keyset indexes
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+
+Composite indexes for the keyset-paginated listings (api.pagination): the
+admin games, AI-log, playback and player listings and the simulation runs
+listing. Each matches a listing's ORDER BY (sort column, id), prefixed by its
+filter column where the listing has one, so a page is an index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('idx_games_updated', 'games', ['updated_at', 'id']),
+    ('idx_games_status_updated', 'games', ['status', 'updated_at', 'id']),
+    ('idx_ai_decision_logs_created', 'ai_decision_logs', ['created_at', 'id']),
+    ('idx_ai_decision_logs_game_created', 'ai_decision_logs', ['game_id', 'created_at', 'id']),
+    ('idx_game_playback_created', 'game_playback', ['created_at', 'id']),
+    ('idx_game_playback_winner_created', 'game_playback', ['winner_id', 'created_at', 'id']),
+    ('idx_player_stats_games_won_player', 'player_stats', ['games_won', 'player_id']),
+    ('idx_simulation_runs_created', 'simulation_runs', ['created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Create the listing indexes."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop the listing indexes."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
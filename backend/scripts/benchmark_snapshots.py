@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark compact game-state snapshots against the JSON storage format.
+
+Plays random legal games between every ordered pair of decks in
+``data/simulation_decks.csv`` and, after every action, stores the state the
+way ``GameService`` does: ``serialize_game_state`` + JSON (the default) and
+``encode_snapshot`` (``GAME_STATE_SNAPSHOTS``). Reports bytes written per
+action and encode/decode time per save/load, and checks that every snapshot
+decodes to the same state.
+
+Usage:
+    python backend/scripts/benchmark_snapshots.py
+    python backend/scripts/benchmark_snapshots.py --games 3 --compression 6
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api.game_service import GameService
+from api.serialization import deserialize_game_state, serialize_game_state
+from api.snapshot_codec import decode_snapshot, encode_snapshot
+from game_engine.validation import ActionExecutor, ActionValidator
+from simulation.deck_loader import load_simulation_decks
+
+MAX_ACTIONS = 200
+
+
+def random_action(engine, rng: random.Random) -> bool:
+    """Take one random legal action for the active player; False once the game is over."""
+    gs = engine.game_state
+    if gs.winner_id is not None:
+        return False
+    player_id = gs.active_player_id
+    actions = [
+        a for a in ActionValidator(engine).get_valid_actions(player_id)
+        if a.action_type in ("play_card", "tussle")
+    ]
+    action = rng.choice(actions + [None])  # None: end the turn
+    executor = ActionExecutor(engine)
+    if action is None:
+        engine.end_turn()
+    elif action.action_type == "play_card":
+        target = rng.choice(action.target_options) if action.target_options else None
+        executor.execute_play_card(player_id, action.card_id, target_card_id=target)
+    else:
+        target = rng.choice(action.target_options)
+        executor.execute_tussle(player_id, action.card_id, None if target == "direct_attack" else target)
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1, help="Games per deck pair (default: 1)")
+    parser.add_argument("--compression", type=int, default=1, help="zlib level, 0 = off (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    service = GameService(str(Path(__file__).parent.parent / "data" / "cards.csv"), use_database=False)
+    catalog = service.card_catalog
+    rng = random.Random(args.seed)
+    random.seed(args.seed)  # the engine's own random choices
+    decks = load_simulation_decks()
+
+    saves = 0
+    totals = {"json_bytes": 0, "snap_bytes": 0, "json_enc": 0.0, "snap_enc": 0.0, "json_dec": 0.0, "snap_dec": 0.0}
+    for d1 in decks:
+        for d2 in decks:
+            if d1.name == d2.name:
+                continue
+            for _ in range(args.games):
+                _, engine = service.create_game("p1", d1.name, d1.cards, "p2", d2.name, d2.cards, "p1")
+                for _ in range(MAX_ACTIONS):
+                    if not random_action(engine, rng):
+                        break
+                    gs = engine.game_state
+
+                    start = time.perf_counter()
+                    doc = json.dumps(serialize_game_state(gs)).encode("utf-8")
+                    totals["json_enc"] += time.perf_counter() - start
+                    start = time.perf_counter()
+                    blob = encode_snapshot(gs, catalog, args.compression)
+                    totals["snap_enc"] += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    from_json = deserialize_game_state(json.loads(doc))
+                    totals["json_dec"] += time.perf_counter() - start
+                    start = time.perf_counter()
+                    from_snap = decode_snapshot(blob, catalog)
+                    totals["snap_dec"] += time.perf_counter() - start
+
+                    if serialize_game_state(from_snap) != serialize_game_state(from_json):
+                        print(f"MISMATCH: snapshot of {gs.game_id} decoded to a different state")
+                        return 1
+                    totals["json_bytes"] += len(doc)
+                    totals["snap_bytes"] += len(blob)
+                    saves += 1
+
+    print(f"Saves: {saves} ({len(decks)} decks, ordered pairs, random play)")
+    for label, prefix in (("json", "json"), ("snapshot", "snap")):
+        print(
+            f"{label:>9}: {totals[prefix + '_bytes'] / saves:8.0f} bytes/action, "
+            f"encode {totals[prefix + '_enc'] / saves * 1e6:6.0f} us, "
+            f"decode {totals[prefix + '_dec'] / saves * 1e6:6.0f} us"
+        )
+    print(f"  bytes: {totals['json_bytes'] / totals['snap_bytes']:.1f}x smaller, "
+          f"decode: {totals['json_dec'] / totals['snap_dec']:.2f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ Main entry point for the REST API server.
 
 import logging
 import os
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -41,11 +43,28 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Flush write-behind game updates and queued AI stats on shutdown."""
+    yield
+    from .game_service import shutdown_game_service
+    from .stats_service import shutdown_stats_service
+    from .worker_pools import shutdown_worker_pools
+    from game_engine.ai.enumerator import shutdown_enumeration_pool
+    # Let in-flight route work finish before flushing what it wrote
+    shutdown_worker_pools()
+    shutdown_game_service()
+    shutdown_stats_service()
+    shutdown_enumeration_pool()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="GGLTCG API",
     description="REST API for Googooland TCG game engine",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS - allow frontend origins
@@ -92,12 +111,58 @@ async def root():
 async def health_check():
     """Health check endpoint with database, migration, deploy, and AI config status."""
     from .game_service import get_game_service
-    from .database import SessionLocal
-    from .db_models import GameModel
+    from .stats_service import get_stats_service
+    from .worker_pools import DB_POOL, run_blocking, worker_pool_stats
+    from game_engine.ai.enumerator import get_enumeration_metrics
+    from game_engine.ai.prompts.fragment_cache import get_prompt_metrics
+    from game_engine.ai.selector_cache import selector_cache_stats
 
     service = get_game_service()
+    db_connected, alembic_version, games_in_progress, total_games = await run_blocking(
+        DB_POOL, _database_status
+    )
     
-    # Get game counts by status
+    return {
+        "status": "healthy",
+        "database": {
+            "connected": db_connected,
+            "migration_version": alembic_version,
+        },
+        "games": {
+            "in_progress": games_in_progress,
+            "total": total_games,
+        },
+        "cache": service.cache_stats(),
+        "persistence": service.persistence_stats(),
+        "storage": service.storage_stats(),
+        "stats_queue": get_stats_service().queue_stats(),
+        # Route worker pools (see api.worker_pools): load, queueing, wait times
+        "worker_pools": worker_pool_stats(),
+        "deploy": {
+            # Render sets these automatically per deploy; useful to confirm
+            # which commit/branch is actually live without playing a game.
+            "git_commit": os.getenv("RENDER_GIT_COMMIT"),
+            "git_branch": os.getenv("RENDER_GIT_BRANCH"),
+        },
+        "ai": {
+            "planner": "enum",
+            "model": os.getenv("GEMINI_MODEL") or "gemini-flash-lite-latest",
+            "fallback_model": os.getenv("GEMINI_FALLBACK_MODEL") or "gemini-2.5-flash-lite",
+            # Sequence-search latency (p50/p95 ms), depth and nodes/sec
+            "enumeration": get_enumeration_metrics(),
+            # Strategic-prompt build time (p50/p95 ms) and fragment reuse
+            "prompt": get_prompt_metrics(),
+            # Strategic-selector response cache (AI_SELECTOR_CACHE): hit rate, evictions
+            "selector_cache": selector_cache_stats(),
+        },
+    }
+
+
+def _database_status() -> tuple:
+    """(connected, migration version, active games, total games) for /health."""
+    from .database import SessionLocal
+    from .db_models import GameModel
+
     db_connected = False
     games_in_progress = 0
     total_games = 0
@@ -121,28 +186,7 @@ async def health_check():
     except Exception as e:
         logger.warning(f"Health check database query failed: {e}")
     
-    return {
-        "status": "healthy",
-        "database": {
-            "connected": db_connected,
-            "migration_version": alembic_version,
-        },
-        "games": {
-            "in_progress": games_in_progress,
-            "total": total_games,
-        },
-        "deploy": {
-            # Render sets these automatically per deploy; useful to confirm
-            # which commit/branch is actually live without playing a game.
-            "git_commit": os.getenv("RENDER_GIT_COMMIT"),
-            "git_branch": os.getenv("RENDER_GIT_BRANCH"),
-        },
-        "ai": {
-            "planner": "enum",
-            "model": os.getenv("GEMINI_MODEL") or "gemini-flash-lite-latest",
-            "fallback_model": os.getenv("GEMINI_FALLBACK_MODEL") or "gemini-2.5-flash-lite",
-        },
-    }
+    return db_connected, alembic_version, games_in_progress, total_games
 
 
 if __name__ == "__main__":
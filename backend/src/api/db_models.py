@@ -6,7 +6,8 @@ Defines the database schema using SQLAlchemy declarative models.
 
 from datetime import datetime
 from sqlalchemy import (
-    Column, String, Integer, DateTime, Date, Text, CheckConstraint, Index, ForeignKey, JSON
+    Column, String, Integer, DateTime, Date, Text, CheckConstraint, Index, ForeignKey, JSON,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
@@ -119,6 +120,9 @@ class GameModel(Base):
     
     # Full game state (JSONB for PostgreSQL, JSON for SQLite)
     game_state = Column(JSONType, nullable=False)
+    # Compact binary snapshot (api.snapshot_codec). When set it is the game
+    # state, and game_state only holds a {"snapshot": <version>} marker.
+    game_state_snapshot = Column(LargeBinary, nullable=True)
     
     # Constraints
     __table_args__ = (
@@ -137,6 +141,9 @@ class GameModel(Base):
             'active_player_id',
             postgresql_where=Column('status') == 'active'
         ),
+        # Keyset pagination of the admin games listing (see api.pagination)
+        Index('idx_games_updated', 'updated_at', 'id'),
+        Index('idx_games_status_updated', 'status', 'updated_at', 'id'),
     )
     
     def __repr__(self):
@@ -148,7 +155,9 @@ class GameActionModel(Base):
     Database model for individual game actions.
     
     Stores each action taken during a game for analytics and debugging.
-    This table is optional for Phase 1 but included for future use.
+    With GAME_EVENT_LOG enabled, action_data holds the state delta of each
+    update, replayed on load on top of the last game snapshot (see
+    api.event_log).
     """
     __tablename__ = "game_actions"
     
@@ -293,6 +302,12 @@ class AIDecisionLogModel(Base):
         index=True  # Index for cleanup queries
     )
     
+    # Keyset pagination of the admin AI-logs listing (see api.pagination)
+    __table_args__ = (
+        Index('idx_ai_decision_logs_created', 'created_at', 'id'),
+        Index('idx_ai_decision_logs_game_created', 'game_id', 'created_at', 'id'),
+    )
+    
     def __repr__(self):
         return f"<AIDecisionLog(id={self.id}, game_id={self.game_id}, turn={self.turn_number}, v={self.ai_version})>"
 
@@ -341,6 +356,12 @@ class GamePlaybackModel(Base):
     )
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
+    # Keyset pagination of the admin playbacks listing (see api.pagination)
+    __table_args__ = (
+        Index('idx_game_playback_created', 'created_at', 'id'),
+        Index('idx_game_playback_winner_created', 'winner_id', 'created_at', 'id'),
+    )
+    
     def __repr__(self):
         return f"<GamePlayback(id={self.id}, game_id={self.game_id}, turns={self.turn_count})>"
 
@@ -373,7 +394,8 @@ class PlayerStatsModel(Base):
     total_turns = Column(Integer, nullable=False, default=0)
     total_game_duration_seconds = Column(Integer, nullable=False, default=0)
     
-    # Card-specific stats (JSONB for flexibility)
+    # Legacy card-specific stats (JSONB). No longer written: per-card stats
+    # live in player_card_stats (PlayerCardStatsModel), backfilled from here.
     # Structure: {
     #   "Ka": {"games_played": 50, "games_won": 28, "tussles_initiated": 30, "tussles_won": 22},
     #   "Knight": {"games_played": 45, "games_won": 25, ...}
@@ -397,6 +419,8 @@ class PlayerStatsModel(Base):
     __table_args__ = (
         Index('idx_player_stats_games_won', 'games_won'),
         Index('idx_player_stats_games_played', 'games_played'),
+        # Keyset pagination of the admin players listing (see api.pagination)
+        Index('idx_player_stats_games_won_player', 'games_won', 'player_id'),
     )
     
     def __repr__(self):
@@ -424,6 +448,41 @@ class PlayerStatsModel(Base):
         return self.total_game_duration_seconds / self.games_played
 
 
+class PlayerCardStatsModel(Base):
+    """
+    Database model for per-player, per-card statistics.
+
+    Normalized copy of ``PlayerStatsModel.card_stats`` (one row per player
+    and card) so card leaderboards and cross-player card aggregates are
+    answered by indexed SQL instead of scanning every player's JSON blob.
+    Maintained by ``StatsService.update_player_stats`` with atomic upserts.
+    Retention: Permanent (cascades with the player's stats row).
+    """
+    __tablename__ = "player_card_stats"
+
+    player_id = Column(
+        String(255),
+        ForeignKey("player_stats.player_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    card_name = Column(String(255), primary_key=True)
+
+    # Deck-inclusion counts (each card counts once per game)
+    games_played = Column(Integer, nullable=False, default=0)
+    games_won = Column(Integer, nullable=False, default=0)
+
+    # Card leaderboards filter by card and minimum games; aggregates group by card
+    __table_args__ = (
+        Index('idx_player_card_stats_card_games', 'card_name', 'games_played'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<PlayerCardStats(player_id={self.player_id}, card={self.card_name}, "
+            f"wins={self.games_won}/{self.games_played})>"
+        )
+
+
 class SimulationRunModel(Base):
     """
     Database model for simulation runs.
@@ -484,6 +543,8 @@ class SimulationRunModel(Base):
             "'paused', 'budget_exhausted')",
             name="simulation_runs_status_check"
         ),
+        # Keyset pagination of the runs listing (see api.pagination)
+        Index('idx_simulation_runs_created', 'created_at', 'id'),
     )
     
     def __repr__(self):
@@ -580,3 +641,33 @@ class ApiUsageModel(Base):
 
     def __repr__(self):
         return f"<ApiUsage(provider={self.provider}, day={self.day}, count={self.request_count})>"
+
+
+class SelectorCacheModel(Base):
+    """
+    Database model for cached strategic-selector responses.
+
+    Backs ``game_engine.ai.selector_cache.SelectorResponseCache`` with
+    ``AI_SELECTOR_CACHE=db``, so repeated positions reuse an earlier Gemini
+    answer across processes and restarts. Rows expire by ``created_at``.
+    """
+    __tablename__ = "ai_selector_cache"
+
+    # SHA-256 of the prompt, system instruction, model, temperature and prompt version
+    key = Column(String(64), primary_key=True)
+
+    model = Column(String(100), nullable=False)
+    prompts_version = Column(String(20), nullable=False)
+
+    # Raw selector response (JSON text)
+    response = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # TTL and size pruning scan by age
+        Index('idx_ai_selector_cache_created', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f"<SelectorCache(key={self.key[:12]}, model={self.model})>"
@@ -0,0 +1,177 @@
+"""
+Bounded in-memory cache of live GameEngine objects.
+
+``GameService`` keeps engines for active games in memory so each request does
+not deserialize the game from the database. Without a bound, completed and
+abandoned games stayed resident until the worker restarted. ``EngineCache``
+evicts:
+
+- the least recently used game once ``max_size`` is exceeded,
+- games idle for longer than ``idle_ttl`` seconds (checked lazily on access
+  and on every insert, oldest first),
+- completed games, explicitly, via ``evict(game_id, "completed")``.
+
+An evicted game is not lost: ``GameService.get_game`` reloads it from the
+database on the next miss. Memory-only services (``use_database=False``) have
+nothing to reload from and use an unbounded cache.
+
+Hit, miss and eviction counters are exposed on ``/health``.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from game_engine.game_engine import GameEngine
+
+
+class EngineCache:
+    """
+    LRU + idle-TTL cache of game_id -> GameEngine.
+
+    Supports the dict operations GameService uses (``[]``, ``in``, ``del``,
+    ``get``, ``pop``, ``clear``). Only ``get`` counts hits and misses.
+
+    Args:
+        max_size: Maximum cached games; None for unbounded
+        idle_ttl: Seconds since last access before a game expires; None to disable
+        clock: Monotonic clock (injectable for tests)
+        on_evict: Optional callback(game_id) run after each eviction, for
+            per-game bookkeeping kept outside the cache
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        self._on_evict = on_evict
+        # game_id -> (engine, last access time), least recently used first
+        self._entries: "OrderedDict[str, tuple[GameEngine, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "evictions_lru": 0,
+            "evictions_ttl": 0,
+            "evictions_completed": 0,
+        }
+
+    def get(self, game_id: str, default: Optional[GameEngine] = None) -> Optional[GameEngine]:
+        """Return the cached engine (refreshing its recency), or default on a miss."""
+        expired = False
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(game_id)
+            if entry is not None and self._expired(entry, now):
+                del self._entries[game_id]
+                self._counters["evictions_ttl"] += 1
+                entry = None
+                expired = True
+            if entry is None:
+                self._counters["misses"] += 1
+            else:
+                self._counters["hits"] += 1
+                self._entries[game_id] = (entry[0], now)
+                self._entries.move_to_end(game_id)
+        if expired:
+            self._notify([game_id])
+        return entry[0] if entry is not None else default
+
+    def __getitem__(self, game_id: str) -> GameEngine:
+        engine = self.get(game_id)
+        if engine is None:
+            raise KeyError(game_id)
+        return engine
+
+    def __setitem__(self, game_id: str, engine: GameEngine) -> None:
+        with self._lock:
+            now = self._clock()
+            self._entries[game_id] = (engine, now)
+            self._entries.move_to_end(game_id)
+            evicted = self._sweep_locked(now)
+        self._notify(evicted)
+
+    def __contains__(self, game_id: object) -> bool:
+        with self._lock:
+            return game_id in self._entries
+
+    def __delitem__(self, game_id: str) -> None:
+        with self._lock:
+            del self._entries[game_id]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def pop(self, game_id: str, default: Any = None) -> Any:
+        """Remove a game without counting it as an eviction."""
+        with self._lock:
+            entry = self._entries.pop(game_id, None)
+        return entry[0] if entry is not None else default
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def evict(self, game_id: str, reason: str = "completed") -> bool:
+        """
+        Evict a game and count it under ``evictions_<reason>``.
+
+        Returns:
+            True if the game was cached
+        """
+        with self._lock:
+            if self._entries.pop(game_id, None) is None:
+                return False
+            key = f"evictions_{reason}"
+            self._counters[key] = self._counters.get(key, 0) + 1
+        self._notify([game_id])
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, limits and hit/miss/eviction counters (exposed on /health)."""
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "idle_ttl_seconds": self.idle_ttl,
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+            **counters,
+        }
+
+    def _expired(self, entry: tuple, now: float) -> bool:
+        return self.idle_ttl is not None and now - entry[1] > self.idle_ttl
+
+    def _sweep_locked(self, now: float) -> list[str]:
+        """Drop expired, then least recently used, entries; return their ids."""
+        evicted = []
+        # Oldest entries are first, so expiry stops at the first live one.
+        while self._entries:
+            game_id, entry = next(iter(self._entries.items()))
+            if not self._expired(entry, now):
+                break
+            del self._entries[game_id]
+            self._counters["evictions_ttl"] += 1
+            evicted.append(game_id)
+        while self.max_size is not None and len(self._entries) > self.max_size:
+            game_id, _ = self._entries.popitem(last=False)
+            self._counters["evictions_lru"] += 1
+            evicted.append(game_id)
+        return evicted
+
+    def _notify(self, game_ids: list[str]) -> None:
+        if self._on_evict is not None:
+            for game_id in game_ids:
+                self._on_evict(game_id)
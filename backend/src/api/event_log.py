@@ -0,0 +1,201 @@
+"""
+Event-sourced game persistence: per-action deltas plus periodic snapshots.
+
+With ``GAME_EVENT_LOG`` enabled, ``GameService.update_game`` no longer
+rewrites the game row on every action. Each update instead appends one small
+``game_actions`` row whose ``action_data`` is the *delta* since the previous
+update:
+
+- ``v``: the game's state version after the update
+- ``s``: changed scalars (active player, turn, phase, winner, in-turn Charge)
+- ``p``: changed players, as [charge, direct attacks, hand ids, in-play ids,
+  break ids]
+- ``c``: changed cards, as ``snapshot_codec.card_row`` rows
+- ``log`` / ``pbp`` / ``ch``: entries appended to the game log, the
+  play-by-play and the Charge history (all append-only)
+
+The full game row is written as a snapshot at turn end, when the game is
+won, and after ``snapshot_every`` events, which bounds replay. Loading a game
+reads the snapshot and replays the events with a newer state version, in
+order (see ``replay_events``).
+
+Deltas record the resulting state rather than the command, so replay never
+re-runs engine code: the random hand break of a direct attack and any
+play-by-play entries added by the route handlers replay exactly. The events
+also remain as a per-action audit trail of the game.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from game_engine.data.card_catalog import CardCatalog
+from game_engine.models.game_state import GameState, Phase, TurnChargeRecord
+from game_engine.models.player import Player
+
+from api.snapshot_codec import card_row, decode_card_row, template_ref
+
+# Players' zones, in row order after [charge, direct attacks]
+_ZONES = ("hand", "in_play", "break_zone")
+
+
+@dataclass
+class GameImage:
+    """A game's state as of its last persisted update, in row form (for diffing)."""
+    version: int
+    turn_number: int
+    active_player_id: str
+    scalars: Dict[str, Any]
+    players: Dict[str, List[Any]]
+    cards: Dict[str, List[Any]]
+    # Lengths of game_log, play_by_play and charge_history
+    log_lengths: Tuple[int, int, int]
+    # Events appended since the last snapshot
+    events_since_snapshot: int = 0
+    # Catalog name or inline values per template (templates are immutable)
+    template_refs: Dict[Any, Any] = field(default_factory=dict, repr=False, compare=False)
+
+
+def capture_image(game_state: GameState, catalog: CardCatalog,
+                  template_refs: Optional[Dict[Any, Any]] = None) -> GameImage:
+    """Row-form image of ``game_state`` (taken after each persisted update)."""
+    refs = {} if template_refs is None else template_refs
+    cards: Dict[str, List[Any]] = {}
+    players: Dict[str, List[Any]] = {}
+    for player_id, player in game_state.players.items():
+        row: List[Any] = [player.charge, player.direct_attacks_this_turn]
+        for zone in _ZONES:
+            ids = []
+            for card in getattr(player, zone):
+                ref = refs.get(card.template)
+                if ref is None:
+                    ref = refs[card.template] = template_ref(card.template, catalog)
+                cards[card.id] = card_row(card, ref)
+                ids.append(card.id)
+            row.append(ids)
+        players[player_id] = row
+    return GameImage(
+        version=game_state.state_version,
+        turn_number=game_state.turn_number,
+        active_player_id=game_state.active_player_id,
+        scalars=_scalars(game_state),
+        players=players,
+        cards=cards,
+        log_lengths=(
+            len(game_state.game_log), len(game_state.play_by_play), len(game_state.charge_history),
+        ),
+        template_refs=refs,
+    )
+
+
+def diff_event(previous: GameImage, game_state: GameState,
+               catalog: CardCatalog) -> Tuple[Dict[str, Any], GameImage]:
+    """
+    The delta from ``previous`` to ``game_state``, and the new image.
+
+    Returns:
+        (action_data for the game_actions row, image to diff the next update against)
+    """
+    image = capture_image(game_state, catalog, previous.template_refs)
+    image.events_since_snapshot = previous.events_since_snapshot + 1
+    log_len, pbp_len, charge_len = previous.log_lengths
+
+    event: Dict[str, Any] = {"v": image.version}
+    scalars = {k: v for k, v in image.scalars.items() if previous.scalars.get(k) != v}
+    if scalars:
+        event["s"] = scalars
+    players = {pid: row for pid, row in image.players.items() if previous.players.get(pid) != row}
+    if players:
+        event["p"] = players
+    cards = [row for card_id, row in image.cards.items() if previous.cards.get(card_id) != row]
+    if cards:
+        event["c"] = cards
+    if len(game_state.game_log) > log_len:
+        event["log"] = game_state.game_log[log_len:]
+    if len(game_state.play_by_play) > pbp_len:
+        event["pbp"] = game_state.play_by_play[pbp_len:]
+    if len(game_state.charge_history) > charge_len:
+        event["ch"] = [
+            [r.turn, r.player_id, r.charge_start, r.charge_gained, r.charge_spent, r.charge_end]
+            for r in game_state.charge_history[charge_len:]
+        ]
+    return event, image
+
+
+def describe_event(event: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """(action_type, result_description) for an event's game_actions row."""
+    entries = [e for e in event.get("pbp", ()) if e.get("action_type") != "victory"]
+    if not entries:
+        return "update", None
+    description = "; ".join(e["description"] for e in entries if e.get("description")) or None
+    return entries[-1].get("action_type") or "update", description
+
+
+def replay_events(game_state: GameState, events: List[Dict[str, Any]],
+                  catalog: CardCatalog) -> GameState:
+    """
+    Apply events (in order) on top of a snapshot's state.
+
+    Events at or below the snapshot's state version are skipped. Returns
+    ``game_state`` itself when nothing newer was logged, else a new state.
+    """
+    events = [e for e in events if e["v"] > game_state.state_version]
+    if not events:
+        return game_state
+
+    image = capture_image(game_state, catalog)
+    scalars = dict(image.scalars)
+    players = dict(image.players)
+    cards = dict(image.cards)
+    game_log = list(game_state.game_log)
+    play_by_play = list(game_state.play_by_play)
+    charge_history = list(game_state.charge_history)
+    for event in events:
+        scalars.update(event.get("s", {}))
+        players.update(event.get("p", {}))
+        for row in event.get("c", ()):
+            cards[row[0]] = row
+        game_log.extend(event.get("log", ()))
+        play_by_play.extend(event.get("pbp", ()))
+        charge_history.extend(TurnChargeRecord(*values) for values in event.get("ch", ()))
+        scalars["state_version"] = event["v"]
+
+    def zone(ids: List[str]) -> List[Any]:
+        return [decode_card_row(cards[card_id], catalog) for card_id in ids]
+
+    rebuilt = GameState(
+        game_id=game_state.game_id,
+        players={
+            player_id: Player(
+                player_id=player_id,
+                name=game_state.players[player_id].name,
+                charge=charge,
+                hand=zone(hand),
+                in_play=zone(in_play),
+                break_zone=zone(break_zone),
+                direct_attacks_this_turn=direct_attacks,
+            )
+            for player_id, (charge, direct_attacks, hand, in_play, break_zone) in players.items()
+        },
+        active_player_id=scalars["active_player_id"],
+        turn_number=scalars["turn_number"],
+        phase=Phase(scalars["phase"]),
+        first_player_id=game_state.first_player_id,
+        winner_id=scalars["winner_id"],
+        game_log=game_log,
+        play_by_play=play_by_play,
+        starting_decks=game_state.starting_decks,
+        charge_history=charge_history,
+        state_version=scalars["state_version"],
+    )
+    rebuilt._turn_charge_snapshot, rebuilt._turn_charge_gained = scalars["turn_charge"]
+    return rebuilt
+
+
+def _scalars(game_state: GameState) -> Dict[str, Any]:
+    return {
+        "active_player_id": game_state.active_player_id,
+        "turn_number": game_state.turn_number,
+        "phase": game_state.phase.value,
+        "winner_id": game_state.winner_id,
+        "turn_charge": [game_state._turn_charge_snapshot, game_state._turn_charge_gained],
+    }
@@ -2,12 +2,20 @@
 Game service for managing active games.
 
 This service manages game persistence using PostgreSQL database.
-Games are stored in the database and loaded on demand.
+Games are stored in the database and loaded on demand. Updates are written
+through by default; set GAME_WRITE_BEHIND_INTERVAL_MS to batch them instead
+(see api.write_behind), or GAME_EVENT_LOG to append one small delta row per
+update and snapshot the game periodically (see api.event_log). Set
+GAME_STATE_SNAPSHOTS to store compact binary snapshots instead of the full
+JSON document (see api.snapshot_codec).
 """
 
+import json
 import uuid
 import logging
-from typing import Dict, Optional
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
 import os
 from pathlib import Path
 from sqlalchemy.orm import Session
@@ -18,9 +26,10 @@ from game_engine.game_engine import GameEngine
 from game_engine.models.game_state import GameState, Phase
 from game_engine.models.player import Player
 from game_engine.models.card import Card
-from game_engine.data.card_loader import CardLoader
+from game_engine.data.card_catalog import get_card_catalog
+from game_engine.ai.llm_player import release_ai_player
 from api.database import SessionLocal, get_session_local
-from api.db_models import GameModel, GameStatsModel
+from api.db_models import GameActionModel, GameModel, GameStatsModel
 from api.serialization import (
     serialize_game_state,
     deserialize_game_state,
@@ -28,6 +37,37 @@ from api.serialization import (
 )
 from api.stats_service import get_stats_service
 from api.analytics import capture_game_analyzed, is_ai_player
+from api.event_log import GameImage, capture_image, describe_event, diff_event, replay_events
+from api.snapshot_codec import DEFAULT_COMPRESS_LEVEL, SNAPSHOT_VERSION, decode_snapshot, encode_snapshot
+from api.write_behind import GameRow, GameWriteBehind
+from api.engine_cache import EngineCache
+from api.game_updates import GameUpdateHub
+
+# Write-behind is off unless an interval is configured (see get_game_service).
+WRITE_BEHIND_INTERVAL_ENV = "GAME_WRITE_BEHIND_INTERVAL_MS"
+WRITE_BEHIND_MAX_DIRTY_ENV = "GAME_WRITE_BEHIND_MAX_DIRTY"
+
+# Compact game-state snapshots (see api.snapshot_codec); off unless enabled.
+SNAPSHOTS_ENV = "GAME_STATE_SNAPSHOTS"
+SNAPSHOT_COMPRESSION_ENV = "GAME_STATE_SNAPSHOT_COMPRESSION"
+
+# Event-sourced persistence (see api.event_log); off unless enabled.
+EVENT_LOG_ENV = "GAME_EVENT_LOG"
+EVENT_SNAPSHOT_EVERY_ENV = "GAME_EVENT_SNAPSHOT_EVERY"
+DEFAULT_EVENT_SNAPSHOT_EVERY = 50
+
+# Engine cache bounds (see api.engine_cache); 0 disables a bound.
+CACHE_MAX_GAMES_ENV = "GAME_CACHE_MAX_GAMES"
+CACHE_IDLE_TTL_ENV = "GAME_CACHE_IDLE_TTL_SECONDS"
+DEFAULT_CACHE_MAX_GAMES = 500
+DEFAULT_CACHE_IDLE_TTL = 30 * 60
+
+
+def _with_load_id(engine: GameEngine) -> GameEngine:
+    """Give an engine entering the cache its load id, unless it already has one."""
+    if engine.load_id is None:
+        engine.load_id = uuid.uuid4().hex[:12]
+    return engine
 
 
 class GameService:
@@ -35,23 +75,98 @@ class GameService:
     Manages active game sessions with PostgreSQL persistence.
     
     Games are stored in the database and loaded on demand.
-    An in-memory cache is maintained for active games to improve performance.
+    An in-memory cache is maintained for active games to improve performance;
+    it is bounded (LRU + idle TTL) and evicted games reload from the database.
     """
     
-    def __init__(self, cards_csv_path: str, use_database: bool = True):
+    def __init__(
+        self,
+        cards_csv_path: str,
+        use_database: bool = True,
+        write_behind_interval: Optional[float] = None,
+        write_behind_max_dirty: int = 256,
+        cache_max_games: Optional[int] = DEFAULT_CACHE_MAX_GAMES,
+        cache_idle_ttl: Optional[float] = DEFAULT_CACHE_IDLE_TTL,
+        compact_snapshots: bool = False,
+        snapshot_compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        event_log: bool = False,
+        event_snapshot_every: int = DEFAULT_EVENT_SNAPSHOT_EVERY,
+    ):
         """
         Initialize the game service.
         
         Args:
             cards_csv_path: Path to cards.csv file
             use_database: If True, use database persistence. If False, use in-memory only (for testing)
+            write_behind_interval: Seconds between batched flushes of game
+                updates. None (default) writes every update through.
+            write_behind_max_dirty: Maximum games with unflushed updates
+                before the oldest is flushed inline
+            cache_max_games: Maximum engines kept in memory (LRU beyond
+                that); None for unbounded
+            cache_idle_ttl: Seconds a cached game may sit unused before it
+                is evicted; None to disable. Both bounds are ignored without
+                a database, since evicted games could not be reloaded.
+            compact_snapshots: Store games as compact binary snapshots
+                (games.game_state_snapshot) instead of the full JSON
+                document. Either format loads regardless of this setting.
+            snapshot_compress_level: zlib level for snapshots (0 = none)
+            event_log: Persist each update as a delta row in game_actions
+                and write the game row only at turn end, on a win and every
+                ``event_snapshot_every`` events. An alternative to
+                write-behind; they cannot be combined.
+            event_snapshot_every: Events between snapshots within a turn
+        
+        Raises:
+            ValueError: If both event_log and write_behind_interval are set
         """
-        self.card_loader = CardLoader(cards_csv_path)
-        self.all_cards = self.card_loader.load_cards()
+        if event_log and write_behind_interval:
+            raise ValueError("event_log and write-behind are alternative persistence modes")
+        self.card_catalog = get_card_catalog(cards_csv_path)
+        self.all_cards = self.card_catalog.create_cards()
         self.use_database = use_database
+        self.compact_snapshots = compact_snapshots
+        self.snapshot_compress_level = snapshot_compress_level
+        self.event_log = event_log and use_database
+        self.event_snapshot_every = max(1, event_snapshot_every)
+        
+        # Snapshot/event bytes written and decode time of loaded games (see storage_stats)
+        self._storage_lock = threading.Lock()
+        self._storage_metrics = {
+            "writes": 0, "bytes_written": 0, "loads": 0, "decode_ms": 0.0,
+            "events": 0, "event_bytes": 0, "replayed_events": 0,
+        }
         
+        # Turn number of each game's last synchronous flush (turn-end trigger)
+        self._flushed_turns: Dict[str, int] = {}
+        # Event log: each cached game's state as last persisted, to diff against
+        self._event_images: Dict[str, GameImage] = {}
+
         # In-memory cache for active games (improves performance)
-        self._cache: Dict[str, GameEngine] = {}
+        self._cache = EngineCache(
+            max_size=cache_max_games if use_database else None,
+            idle_ttl=cache_idle_ttl if use_database else None,
+            on_evict=self._forget_game,
+        )
+
+        # Fan-out of state versions to streaming/long-polling clients
+        self.update_hub = GameUpdateHub()
+
+        # Optional write-behind buffer for update_game (None = write-through)
+        self._write_behind: Optional[GameWriteBehind] = None
+        if use_database and write_behind_interval:
+            self._write_behind = GameWriteBehind(
+                self._write_game_rows,
+                flush_interval=write_behind_interval,
+                max_dirty=write_behind_max_dirty,
+            )
+            logger.info(
+                f"Game write-behind enabled (interval {write_behind_interval}s, "
+                f"max {write_behind_max_dirty} dirty games)"
+            )
+        
+        if self.event_log:
+            logger.info(f"Game event log enabled (snapshot every {self.event_snapshot_every} events)")
         
         if use_database:
             logger.info("GameService initialized with database persistence")
@@ -69,49 +184,211 @@ class GameService:
         if not self.use_database:
             return
         
+        # Serialize game state
+        stored_state = self._serialize_for_db(engine.game_state)
+        metadata = extract_metadata(engine.game_state)
+        
+        try:
+            self._write_game_rows([(game_id, stored_state, metadata)])
+        except Exception as e:
+            logger.error(f"Failed to save game {game_id} to database: {e}")
+            raise
+    
+    def _write_game_rows(self, rows: list[GameRow]) -> None:
+        """
+        Upsert serialized games in one session and one commit.
+        
+        Used for write-through saves (one row) and write-behind flushes (a batch).
+        
+        Args:
+            rows: (game_id, serialized game_state, metadata) tuples; the
+                state is a JSON dict or snapshot bytes (_serialize_for_db)
+        """
         db = SessionLocal()
         try:
-            # Serialize game state
-            game_state_dict = serialize_game_state(engine.game_state)
-            metadata = extract_metadata(engine.game_state)
-            
-            # Check if game exists
-            game_model = db.query(GameModel).filter(GameModel.id == uuid.UUID(game_id)).first()
+            ids = [uuid.UUID(game_id) for game_id, _, _ in rows]
+            existing = {
+                model.id: model
+                for model in db.query(GameModel).filter(GameModel.id.in_(ids))
+            }
             
-            if game_model:
-                # Update existing game
-                game_model.game_state = game_state_dict
-                game_model.turn_number = metadata["turn_number"]
-                game_model.active_player_id = metadata["active_player_id"]
-                game_model.phase = metadata["phase"]
-                game_model.status = metadata["status"]
-                game_model.winner_id = metadata["winner_id"]
-                logger.debug(f"Updated game {game_id} in database")
-            else:
-                # Create new game
-                game_model = GameModel(
-                    id=uuid.UUID(game_id),
-                    player1_id=metadata["player1_id"],
-                    player1_name=metadata["player1_name"],
-                    player2_id=metadata["player2_id"],
-                    player2_name=metadata["player2_name"],
-                    status=metadata["status"],
-                    winner_id=metadata["winner_id"],
-                    turn_number=metadata["turn_number"],
-                    active_player_id=metadata["active_player_id"],
-                    phase=metadata["phase"],
-                    game_state=game_state_dict,
-                )
-                db.add(game_model)
-                logger.info(f"Created new game {game_id} in database")
+            for game_id, stored_state, metadata in rows:
+                game_state_dict, snapshot = self._state_columns(stored_state)
+                game_model = existing.get(uuid.UUID(game_id))
+                if game_model:
+                    # Update existing game
+                    game_model.game_state = game_state_dict
+                    game_model.game_state_snapshot = snapshot
+                    game_model.turn_number = metadata["turn_number"]
+                    game_model.active_player_id = metadata["active_player_id"]
+                    game_model.phase = metadata["phase"]
+                    game_model.status = metadata["status"]
+                    game_model.winner_id = metadata["winner_id"]
+                    logger.debug(f"Updated game {game_id} in database")
+                else:
+                    # Create new game
+                    game_model = GameModel(
+                        id=uuid.UUID(game_id),
+                        player1_id=metadata["player1_id"],
+                        player1_name=metadata["player1_name"],
+                        player2_id=metadata["player2_id"],
+                        player2_name=metadata["player2_name"],
+                        status=metadata["status"],
+                        winner_id=metadata["winner_id"],
+                        turn_number=metadata["turn_number"],
+                        active_player_id=metadata["active_player_id"],
+                        phase=metadata["phase"],
+                        game_state=game_state_dict,
+                        game_state_snapshot=snapshot,
+                    )
+                    db.add(game_model)
+                    logger.info(f"Created new game {game_id} in database")
             
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    def _queue_game_save(self, game_id: str, engine: GameEngine) -> None:
+        """
+        Snapshot a game into the write-behind buffer.
+        
+        JSON snapshots copy the append-only log lists so the flush thread
+        never iterates a list the request thread is still appending to
+        (binary snapshots are already immutable bytes).
+        """
+        stored_state = self._serialize_for_db(engine.game_state)
+        if isinstance(stored_state, dict):
+            stored_state["game_log"] = list(stored_state["game_log"])
+            stored_state["play_by_play"] = list(stored_state["play_by_play"])
+        metadata = extract_metadata(engine.game_state)
+        self._write_behind.mark_dirty(game_id, stored_state, metadata)
+    
+    def _log_game_event(self, game_id: str, engine: GameEngine) -> None:
+        """
+        Persist an update as an event row (see api.event_log).
+        
+        The game row is rewritten only when there is no image to diff
+        against yet, at a turn change, on a win, or after
+        ``event_snapshot_every`` events.
+        """
+        game_state = engine.game_state
+        previous = self._event_images.get(game_id)
+        if previous is not None:
+            event, image = diff_event(previous, game_state, self.card_catalog)
+            self._append_game_event(game_id, previous, event)
+            if (game_state.turn_number == previous.turn_number
+                    and game_state.winner_id is None
+                    and image.events_since_snapshot < self.event_snapshot_every):
+                self._event_images[game_id] = image
+                return
+        self._save_game_to_db(game_id, engine)
+        self._event_images[game_id] = capture_image(
+            game_state, self.card_catalog, previous.template_refs if previous else None
+        )
+    
+    def _append_game_event(self, game_id: str, previous: GameImage, event: Dict[str, Any]) -> None:
+        """Insert one event row, attributed to the turn and player it started in."""
+        action_type, description = describe_event(event)
+        db = SessionLocal()
+        try:
+            db.add(GameActionModel(
+                game_id=uuid.UUID(game_id),
+                turn_number=previous.turn_number,
+                player_id=previous.active_player_id,
+                action_type=action_type[:50],
+                action_data=event,
+                result_description=description,
+            ))
             db.commit()
         except Exception as e:
             db.rollback()
-            logger.error(f"Failed to save game {game_id} to database: {e}")
+            logger.error(f"Failed to log event for game {game_id}: {e}")
             raise
         finally:
             db.close()
+        size = len(json.dumps(event, separators=(",", ":")))
+        with self._storage_lock:
+            self._storage_metrics["events"] += 1
+            self._storage_metrics["event_bytes"] += size
+    
+    def _forget_game(self, game_id: str) -> None:
+        """Drop per-game persistence state when a game leaves the cache."""
+        self._flushed_turns.pop(game_id, None)
+        self._event_images.pop(game_id, None)
+    
+    def _serialize_for_db(self, game_state: GameState) -> Union[Dict[str, Any], bytes]:
+        """The game state as stored: a snapshot if enabled, else the JSON dict."""
+        if self.compact_snapshots:
+            return encode_snapshot(game_state, self.card_catalog, self.snapshot_compress_level)
+        return serialize_game_state(game_state)
+    
+    def _state_columns(self, stored_state: Union[Dict[str, Any], bytes]) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """(games.game_state, games.game_state_snapshot) values for a stored state."""
+        if not isinstance(stored_state, bytes):
+            return stored_state, None
+        with self._storage_lock:
+            self._storage_metrics["writes"] += 1
+            self._storage_metrics["bytes_written"] += len(stored_state)
+        return {"snapshot": SNAPSHOT_VERSION}, stored_state
+    
+    def _decode_game_row(self, game_model: GameModel) -> GameState:
+        """Rebuild a stored game's state from whichever format it was saved in."""
+        start = time.perf_counter()
+        if game_model.game_state_snapshot is not None:
+            game_state = decode_snapshot(game_model.game_state_snapshot, self.card_catalog)
+        else:
+            game_state = deserialize_game_state(game_model.game_state)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._storage_lock:
+            self._storage_metrics["loads"] += 1
+            self._storage_metrics["decode_ms"] += elapsed_ms
+        return game_state
+    
+    def flush_pending_writes(self) -> int:
+        """
+        Write every buffered game update now (no-op without write-behind).
+        
+        Returns:
+            Number of games written
+        """
+        if self._write_behind is None:
+            return 0
+        return self._write_behind.flush()
+    
+    def shutdown(self) -> None:
+        """Stop the write-behind thread and flush pending updates (app shutdown)."""
+        if self._write_behind is not None:
+            self._write_behind.close()
+    
+    def cache_stats(self) -> dict:
+        """Engine cache size and hit/miss/eviction counters for /health."""
+        return self._cache.stats()
+    
+    def persistence_stats(self) -> dict:
+        """Write-behind metrics for /health (flush latency, dirty games)."""
+        if self._write_behind is None:
+            return {"enabled": False}
+        return self._write_behind.stats()
+    
+    def storage_stats(self) -> dict:
+        """Stored game-state format, snapshot/event sizes and load decode time for /health."""
+        with self._storage_lock:
+            metrics = dict(self._storage_metrics)
+        writes, loads, events = metrics["writes"], metrics["loads"], metrics["events"]
+        return {
+            "format": "snapshot" if self.compact_snapshots else "json",
+            "snapshot_writes": writes,
+            "avg_snapshot_bytes": round(metrics["bytes_written"] / writes) if writes else 0,
+            "loads": loads,
+            "avg_decode_ms": round(metrics["decode_ms"] / loads, 3) if loads else 0.0,
+            "event_log": self.event_log,
+            "events": events,
+            "avg_event_bytes": round(metrics["event_bytes"] / events) if events else 0,
+            "replayed_events": metrics["replayed_events"],
+        }
     
     def _load_game_from_db(self, game_id: str) -> Optional[GameEngine]:
         """
@@ -134,7 +411,28 @@ class GameService:
                 return None
             
             # Deserialize game state
-            game_state = deserialize_game_state(game_model.game_state)
+            game_state = self._decode_game_row(game_model)
+            
+            # Replay actions logged after the snapshot (see api.event_log).
+            # Checked even with the event log off, so switching it off never
+            # strands logged actions.
+            events = [
+                action_data for (action_data,) in db.query(GameActionModel.action_data)
+                .filter(
+                    GameActionModel.game_id == game_model.id,
+                    GameActionModel.turn_number >= game_state.turn_number,
+                )
+                .order_by(GameActionModel.id)
+            ]
+            replayed = sum(1 for event in events if event.get("v", 0) > game_state.state_version)
+            if replayed:
+                game_state = replay_events(game_state, events, self.card_catalog)
+                with self._storage_lock:
+                    self._storage_metrics["replayed_events"] += replayed
+            if self.event_log:
+                image = capture_image(game_state, self.card_catalog)
+                image.events_since_snapshot = replayed
+                self._event_images[game_id] = image
             
             # Create GameEngine instance
             engine = GameEngine(game_state)
@@ -231,9 +529,13 @@ class GameService:
         
         # Save to database
         self._save_game_to_db(game_id, engine)
+        if self._write_behind is not None:
+            self._flushed_turns[game_id] = game_state.turn_number
+        if self.event_log:
+            self._event_images[game_id] = capture_image(game_state, self.card_catalog)
         
         # Cache in memory
-        self._cache[game_id] = engine
+        self._cache[game_id] = _with_load_id(engine)
         
         return game_id, engine
     
@@ -250,15 +552,20 @@ class GameService:
             GameEngine instance or None if not found
         """
         # Check cache first
-        if game_id in self._cache:
-            return self._cache[game_id]
+        engine = self._cache.get(game_id)
+        if engine is not None:
+            return engine
+        
+        # A buffered update is newer than the stored row
+        if self._write_behind is not None:
+            self._write_behind.flush_game(game_id)
         
         # Load from database
         engine = self._load_game_from_db(game_id)
         
         # Cache if found
         if engine:
-            self._cache[game_id] = engine
+            self._cache[game_id] = _with_load_id(engine)
         
         return engine
     
@@ -267,20 +574,44 @@ class GameService:
         Update a game in the database.
         
         This should be called after any game state changes to persist them.
+        It bumps the game's state version and notifies watching clients.
+        With write-behind enabled, mid-turn updates are buffered; a turn
+        change or a finished game is flushed before this returns. With the
+        event log enabled, mid-turn updates append a delta row instead of
+        rewriting the game.
         
         Args:
             game_id: Game ID
             engine: Updated GameEngine instance
         """
-        # Update cache
-        self._cache[game_id] = engine
+        version = engine.game_state.bump_state_version()
         
-        # Save to database
-        self._save_game_to_db(game_id, engine)
+        # Update cache
+        self._cache[game_id] = _with_load_id(engine)
         
-        # If game just completed, save stats
+        if self.event_log:
+            self._log_game_event(game_id, engine)
+        elif self._write_behind is None:
+            # Save to database
+            self._save_game_to_db(game_id, engine)
+        else:
+            game_state = engine.game_state
+            self._queue_game_save(game_id, engine)
+            turn_ended = game_state.turn_number != self._flushed_turns.get(game_id)
+            if turn_ended or game_state.winner_id is not None:
+                self._write_behind.flush_game(game_id)
+                self._flushed_turns[game_id] = game_state.turn_number
+        
+        # If game just completed, save stats and free the engine and AI
+        # player; any later read (e.g. the final state view) reloads the
+        # engine from the database
         if engine.game_state.winner_id is not None:
             self._save_game_stats(game_id, engine)
+            release_ai_player(game_id)
+            if self.use_database:
+                self._cache.evict(game_id, "completed")
+        
+        self.update_hub.publish(game_id, version)
     
     def delete_game(self, game_id: str) -> bool:
         """
@@ -293,8 +624,13 @@ class GameService:
             True if deleted, False if not found
         """
         # Remove from cache
-        if game_id in self._cache:
-            del self._cache[game_id]
+        self._cache.pop(game_id)
+        self._forget_game(game_id)
+        release_ai_player(game_id)
+        if self._write_behind is not None:
+            self._write_behind.discard(game_id)
+        # Wake watchers so they notice the game is gone
+        self.update_hub.publish(game_id, -1)
         
         # Remove from database
         if self.use_database:
@@ -302,6 +638,9 @@ class GameService:
             try:
                 game_model = db.query(GameModel).filter(GameModel.id == uuid.UUID(game_id)).first()
                 if game_model:
+                    db.query(GameActionModel).filter(
+                        GameActionModel.game_id == game_model.id
+                    ).delete(synchronize_session=False)
                     db.delete(game_model)
                     db.commit()
                     logger.info(f"Deleted game {game_id} from database")
@@ -855,7 +1194,9 @@ class GameService:
                 game_state_dict = serialize_game_state(engine.game_state)
                 metadata = extract_metadata(engine.game_state)
                 
-                game_model.game_state = game_state_dict
+                game_model.game_state, game_model.game_state_snapshot = self._state_columns(
+                    self._serialize_for_db(engine.game_state)
+                )
                 game_model.status = "active"
                 game_model.turn_number = metadata["turn_number"]
                 game_model.active_player_id = metadata["active_player_id"]
@@ -864,7 +1205,7 @@ class GameService:
                 db.commit()
                 
                 # Cache the engine
-                self._cache[str(game_model.id)] = engine
+                self._cache[str(game_model.id)] = _with_load_id(engine)
                 
                 return {
                     "game_id": str(game_model.id),
@@ -908,7 +1249,7 @@ class GameService:
         
         # Check if all cards exist
         for name in card_names:
-            if not any(c.name == name for c in self.all_cards):
+            if name not in self.card_catalog:
                 return False, f"Card '{name}' not found in card database"
         
         return True, None
@@ -926,27 +1267,7 @@ class GameService:
         """
         deck = []
         for name in card_names:
-            # Find card template
-            template = next((c for c in self.all_cards if c.name == name), None)
-            if template is None:
-                raise ValueError(f"Card '{name}' not found in card database")
-            
-            # Create a copy of the card
-            card = Card(
-                name=template.name,
-                card_type=template.card_type,
-                cost=template.cost,
-                effect_text=template.effect_text,
-                effect_definitions=template.effect_definitions,
-                speed=template.speed,
-                strength=template.strength,
-                stamina=template.stamina,
-                primary_color=template.primary_color,
-                accent_color=template.accent_color,
-                owner=owner_id,
-                controller=owner_id,
-            )
-            deck.append(card)
+            deck.append(self.card_catalog.create_card(name, owner=owner_id))
         
         return deck
     
@@ -1052,5 +1373,40 @@ def get_game_service() -> GameService:
             cards_path = backend_dir / "data" / "cards.csv"
             logger.info(f"Using default cards CSV: {cards_path}")
         
-        _game_service = GameService(str(cards_path))
+        # Optional write-behind batching of game updates
+        interval_ms = int(os.environ.get(WRITE_BEHIND_INTERVAL_ENV, "0") or 0)
+        max_dirty = int(os.environ.get(WRITE_BEHIND_MAX_DIRTY_ENV, "256") or 256)
+        
+        # Engine cache bounds
+        cache_max = int(os.environ.get(CACHE_MAX_GAMES_ENV, DEFAULT_CACHE_MAX_GAMES))
+        cache_ttl = float(os.environ.get(CACHE_IDLE_TTL_ENV, DEFAULT_CACHE_IDLE_TTL))
+        
+        # Optional compact game-state snapshots
+        snapshots = os.environ.get(SNAPSHOTS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+        compress_level = int(os.environ.get(SNAPSHOT_COMPRESSION_ENV, DEFAULT_COMPRESS_LEVEL))
+        
+        # Optional event-sourced persistence (replaces write-behind)
+        event_log = os.environ.get(EVENT_LOG_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+        snapshot_every = int(os.environ.get(EVENT_SNAPSHOT_EVERY_ENV, DEFAULT_EVENT_SNAPSHOT_EVERY))
+        if event_log and interval_ms > 0:
+            logger.warning(f"{EVENT_LOG_ENV} is set; ignoring {WRITE_BEHIND_INTERVAL_ENV}")
+            interval_ms = 0
+        
+        _game_service = GameService(
+            str(cards_path),
+            write_behind_interval=interval_ms / 1000 if interval_ms > 0 else None,
+            write_behind_max_dirty=max_dirty,
+            cache_max_games=cache_max if cache_max > 0 else None,
+            cache_idle_ttl=cache_ttl if cache_ttl > 0 else None,
+            compact_snapshots=snapshots,
+            snapshot_compress_level=compress_level,
+            event_log=event_log,
+            event_snapshot_every=snapshot_every,
+        )
     return _game_service
+
+
+def shutdown_game_service() -> None:
+    """Flush buffered game updates if the singleton was ever created (app shutdown)."""
+    if _game_service is not None:
+        _game_service.shutdown()
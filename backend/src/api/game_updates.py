@@ -0,0 +1,194 @@
+"""
+In-process fan-out of game updates to streaming and long-polling clients.
+
+``GameService.update_game`` bumps ``GameState.state_version`` and publishes it
+here. Watchers (the SSE stream and the long-poll endpoint in
+``routes_games``) wait on a per-game channel and wake when the version
+changes, instead of re-fetching the full state on a timer.
+
+Fan-out cost is independent of the number of watchers:
+
+- ``publish`` only records the version and sets one asyncio.Event per
+  watcher (thread-safe, so it also works from worker threads).
+- ``render`` memoizes rendered payloads per (version, key), so one update is
+  rendered once per distinct payload (the key names the viewer, whose hand
+  is revealed, and the play-by-play offset), not once per watcher.
+
+The hub is per process. With several server workers, a watcher only sees
+updates made by its own worker, so clients keep a slow polling fallback.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+@dataclass
+class _Watcher:
+    loop: asyncio.AbstractEventLoop
+    event: asyncio.Event
+
+
+@dataclass
+class _Channel:
+    version: int = 0
+    watchers: Set[int] = field(default_factory=set)
+    # (key, version) -> rendered payload; only the current version is kept
+    rendered: Dict[Tuple[Hashable, int], Any] = field(default_factory=dict)
+
+
+class GameUpdateHub:
+    """Per-game version channels with memoized payload rendering."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: Dict[str, _Channel] = {}
+        self._watchers: Dict[int, _Watcher] = {}
+        self._next_watcher = 0
+        self._published = 0
+        self._renders = 0
+        self._render_hits = 0
+
+    def publish(self, game_id: str, version: int) -> None:
+        """
+        Announce a new state version for a game (no-op if nobody is watching).
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            self._published += 1
+            channel = self._channels.get(game_id)
+            if channel is None:
+                return
+            channel.version = version
+            channel.rendered.clear()
+            watchers = [self._watchers[w] for w in channel.watchers]
+        for watcher in watchers:
+            watcher.loop.call_soon_threadsafe(watcher.event.set)
+
+    def watch(self, game_id: str, version: int) -> "Subscription":
+        """
+        Register a watcher on the running event loop.
+
+        Args:
+            game_id: Game to watch
+            version: The game's current state version (seeds a new channel)
+
+        Returns:
+            Subscription; close it (or use ``with``) when the client leaves
+        """
+        watcher = _Watcher(loop=asyncio.get_running_loop(), event=asyncio.Event())
+        with self._lock:
+            channel = self._channels.get(game_id)
+            if channel is None:
+                channel = self._channels[game_id] = _Channel(version=version)
+            elif version > channel.version:
+                channel.version = version
+            watcher_id = self._next_watcher
+            self._next_watcher += 1
+            self._watchers[watcher_id] = watcher
+            channel.watchers.add(watcher_id)
+        return Subscription(self, game_id, watcher_id, watcher.event)
+
+    def version(self, game_id: str) -> Optional[int]:
+        """Latest published version for a watched game, or None if unwatched."""
+        with self._lock:
+            channel = self._channels.get(game_id)
+            return channel.version if channel is not None else None
+
+    def render(
+        self,
+        game_id: str,
+        version: int,
+        key: Hashable,
+        render_fn: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the payload for (key, version), rendering it at most once.
+
+        Args:
+            game_id: Game being rendered
+            version: State version the payload describes
+            key: Identifies the payload variant (e.g. viewer and offset)
+            render_fn: Builds the payload on a cache miss
+        """
+        key = (key, version)
+        with self._lock:
+            channel = self._channels.get(game_id)
+            if channel is not None and key in channel.rendered:
+                self._render_hits += 1
+                return channel.rendered[key]
+        payload = render_fn()
+        with self._lock:
+            self._renders += 1
+            channel = self._channels.get(game_id)
+            if channel is not None and channel.version == version:
+                channel.rendered[key] = payload
+        return payload
+
+    def stats(self) -> Dict[str, int]:
+        """Watcher and fan-out counters."""
+        with self._lock:
+            return {
+                "games_watched": len(self._channels),
+                "watchers": len(self._watchers),
+                "published": self._published,
+                "renders": self._renders,
+                "render_hits": self._render_hits,
+            }
+
+    def _unwatch(self, game_id: str, watcher_id: int) -> None:
+        with self._lock:
+            self._watchers.pop(watcher_id, None)
+            channel = self._channels.get(game_id)
+            if channel is None:
+                return
+            channel.watchers.discard(watcher_id)
+            if not channel.watchers:
+                del self._channels[game_id]
+
+
+class Subscription:
+    """One watcher's view of a game channel (see ``GameUpdateHub.watch``)."""
+
+    def __init__(self, hub: GameUpdateHub, game_id: str, watcher_id: int, event: asyncio.Event):
+        self._hub = hub
+        self._game_id = game_id
+        self._watcher_id = watcher_id
+        self._event = event
+
+    async def wait_for_change(self, seen_version: int, timeout: float) -> Optional[int]:
+        """
+        Wait until the game's version differs from ``seen_version``.
+
+        A version *different* from the client's (not just greater) counts as
+        a change, so a stale cursor from before a server restart is answered
+        immediately rather than waited on.
+
+        Returns:
+            The new version, or None on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            self._event.clear()
+            current = self._hub.version(self._game_id)
+            if current is not None and current != seen_version:
+                return current
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def close(self) -> None:
+        self._hub._unwatch(self._game_id, self._watcher_id)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,100 @@
+"""
+Keyset (seek) pagination for the admin and simulation listings.
+
+Listings are ordered newest (or highest) first by a sort column, with the
+primary key as tie-breaker. Each page ends with an opaque cursor encoding the
+last row's (sort value, id); the next page asks for the rows strictly after
+it in that order. An index on (sort column, id) — or (filter column, sort
+column, id) for filtered listings — serves that directly, where an OFFSET
+has to walk every skipped row.
+
+The listings also load only the columns they return (``load_only``), so the
+large JSON columns (game state, prompts, play-by-play, run results) are not
+read for a page of summaries.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Uuid, and_, or_
+from sqlalchemy.orm import Query
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a cursor that was not produced by ``keyset_page``."""
+
+
+def keyset_page(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    One page of ``query``, ordered by (sort_column, id_column) descending.
+
+    Args:
+        query: Filtered query (no ordering or limit applied yet)
+        sort_column: Model column to order by (e.g. ``GameModel.updated_at``)
+        id_column: Unique tie-breaker column (the primary key)
+        limit: Page size
+        cursor: ``next_cursor`` of the previous page; None for the first page
+
+    Returns:
+        (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        InvalidCursorError: The cursor is malformed
+    """
+    if cursor is not None:
+        sort_value, row_id = decode_cursor(cursor, sort_column, id_column)
+        query = query.filter(or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < row_id),
+        ))
+    rows = query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """Opaque cursor for the row with ``sort_value`` and ``row_id``."""
+    payload = json.dumps([_plain(sort_value), _plain(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column: Any, id_column: Any) -> Tuple[Any, Any]:
+    """(sort value, id) from a cursor, typed for the two columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return _typed(sort_column, sort_value), _typed(id_column, row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _typed(column: Any, value: Any) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise TypeError(f"Unexpected cursor value {value!r}")
+    column_type = column.property.columns[0].type
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, Uuid):
+        return uuid.UUID(value)
+    return value
@@ -19,6 +19,7 @@ from api.schemas import (
 )
 from api.game_service import get_game_service
 from api.stats_service import get_stats_service
+from api.worker_pools import AI_POOL, DB_POOL, game_state_locks, offload
 from game_engine.models.card import CardType
 from game_engine.ai.llm_player import get_ai_player
 from game_engine.validation import ActionValidator, ActionExecutor, build_tussle_description, card_label
@@ -36,7 +37,8 @@ router = APIRouter(prefix="/games", tags=["actions"])
 
 
 @router.post("/{game_id}/play-card", response_model=ActionResponse)
-async def play_card(game_id: str, request: PlayCardRequest) -> ActionResponse:
+@offload(DB_POOL, per_game=True)
+def play_card(game_id: str, request: PlayCardRequest) -> ActionResponse:
     """
     Play a card from hand.
     
@@ -124,7 +126,8 @@ async def play_card(game_id: str, request: PlayCardRequest) -> ActionResponse:
 
 
 @router.post("/{game_id}/tussle", response_model=ActionResponse)
-async def initiate_tussle(game_id: str, request: TussleRequest) -> ActionResponse:
+@offload(DB_POOL, per_game=True)
+def initiate_tussle(game_id: str, request: TussleRequest) -> ActionResponse:
     """
     Initiate a tussle between two cards.
     
@@ -230,7 +233,8 @@ async def initiate_tussle(game_id: str, request: TussleRequest) -> ActionRespons
 
 
 @router.post("/{game_id}/end-turn", response_model=ActionResponse)
-async def end_turn(game_id: str, request: EndTurnRequest) -> ActionResponse:
+@offload(DB_POOL, per_game=True)
+def end_turn(game_id: str, request: EndTurnRequest) -> ActionResponse:
     """
     End the current player's turn.
     
@@ -282,7 +286,8 @@ async def end_turn(game_id: str, request: EndTurnRequest) -> ActionResponse:
 
 
 @router.post("/{game_id}/activate-ability", response_model=ActionResponse)
-async def activate_ability(game_id: str, request: ActivateAbilityRequest) -> ActionResponse:
+@offload(DB_POOL, per_game=True)
+def activate_ability(game_id: str, request: ActivateAbilityRequest) -> ActionResponse:
     """
     Activate a card's ability.
     
@@ -419,7 +424,8 @@ async def activate_ability(game_id: str, request: ActivateAbilityRequest) -> Act
 
 
 @router.get("/{game_id}/valid-actions", response_model=ValidActionsResponse)
-async def get_valid_actions(game_id: str, player_id: str) -> ValidActionsResponse:
+@offload(DB_POOL, reads_game=True)
+def get_valid_actions(game_id: str, player_id: str) -> ValidActionsResponse:
     """
     Get list of valid actions for a player.
     
@@ -446,7 +452,8 @@ async def get_valid_actions(game_id: str, player_id: str) -> ValidActionsRespons
 
 
 @router.post("/{game_id}/ai-turn", response_model=ActionResponse)
-async def ai_take_turn(game_id: str, player_id: str) -> ActionResponse:
+@offload(AI_POOL, per_game=True)
+def ai_take_turn(game_id: str, player_id: str) -> ActionResponse:
     """
     Have the AI select and execute an action for the specified player.
     
@@ -486,7 +493,7 @@ async def ai_take_turn(game_id: str, player_id: str) -> ActionResponse:
     if player is None:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    ai_player = get_ai_player()
+    ai_player = get_ai_player(game_id)
 
     # filter_for_ai=True matches what the enumerator used internally to build
     # the plan's candidate sequences (drops guaranteed-loss tussles) — keeping
@@ -501,7 +508,10 @@ async def ai_take_turn(game_id: str, player_id: str) -> ActionResponse:
     try:
         logger.info(f"🤖 AI turn starting for player {player_id} in game {game_id}")
         logger.debug(f"Available actions: {[a.description for a in valid_actions]}")
-        result = ai_player.select_action(game_state, player_id, valid_actions, engine)
+        # Planning (search, then the LLM call) only reads the state: let
+        # state reads in meanwhile. Other writers still wait on the game lock.
+        with game_state_locks.released(game_id):
+            result = ai_player.select_action(game_state, player_id, valid_actions, engine)
         
         if result is None:
             # AI failed to select - default to end turn
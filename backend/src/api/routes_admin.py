@@ -1,25 +1,32 @@
 """
 Admin routes for viewing database data.
 
-Simple data viewer for debugging and monitoring.
+Simple data viewer for debugging and monitoring. The dashboards poll the
+listings every 10-30 s, so listings load only the columns they return and
+page by keyset (``cursor`` / ``next_cursor``, see ``api.pagination``).
 """
 
 import logging
 from typing import List, Optional
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import desc
 
 from .admin_auth import get_current_admin_user
 from .database import SessionLocal
+from .pagination import InvalidCursorError, keyset_page
 from .db_models import (
     AIDecisionLogModel,
     GamePlaybackModel,
     GameModel,
+    PlayerCardStatsModel,
     PlayerStatsModel,
     UserModel
 )
+from .serialization import serialize_game_state
+from .snapshot_codec import decode_snapshot
+from .worker_pools import DB_POOL, offload
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,41 @@ router = APIRouter(
 )
 
 
+# Columns behind each listing's summaries (the JSON payloads stay unloaded)
+_AI_LOG_SUMMARY_COLUMNS = (
+    AIDecisionLogModel.id, AIDecisionLogModel.game_id, AIDecisionLogModel.turn_number,
+    AIDecisionLogModel.player_id, AIDecisionLogModel.model_name,
+    AIDecisionLogModel.prompts_version, AIDecisionLogModel.action_number,
+    AIDecisionLogModel.reasoning, AIDecisionLogModel.created_at, AIDecisionLogModel.ai_version,
+    AIDecisionLogModel.plan_execution_status, AIDecisionLogModel.fallback_reason,
+    AIDecisionLogModel.planned_action_index,
+)
+_PLAYBACK_SUMMARY_COLUMNS = (
+    GamePlaybackModel.id, GamePlaybackModel.game_id, GamePlaybackModel.player1_id,
+    GamePlaybackModel.player1_name, GamePlaybackModel.player2_id, GamePlaybackModel.player2_name,
+    GamePlaybackModel.winner_id, GamePlaybackModel.turn_count, GamePlaybackModel.created_at,
+    GamePlaybackModel.completed_at,
+)
+_GAME_SUMMARY_COLUMNS = (
+    GameModel.id, GameModel.status, GameModel.player1_id, GameModel.player1_name,
+    GameModel.player2_id, GameModel.player2_name, GameModel.game_code, GameModel.turn_number,
+    GameModel.phase, GameModel.winner_id, GameModel.created_at, GameModel.updated_at,
+)
+_PLAYER_SUMMARY_COLUMNS = (
+    PlayerStatsModel.player_id, PlayerStatsModel.display_name, PlayerStatsModel.games_played,
+    PlayerStatsModel.games_won, PlayerStatsModel.total_tussles, PlayerStatsModel.tussles_won,
+    PlayerStatsModel.created_at, PlayerStatsModel.updated_at,
+)
+
+
+def _page(query, sort_column, id_column, limit: int, cursor: Optional[str]):
+    """``keyset_page``, answering a malformed cursor with 400."""
+    try:
+        return keyset_page(query, sort_column, id_column, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 def get_db():
     """Database session dependency."""
     if SessionLocal is None:
@@ -45,9 +87,12 @@ def get_db():
 
 
 @router.get("/ai-logs")
-async def get_ai_logs(
+@offload(DB_POOL)
+def get_ai_logs(
     limit: int = Query(50, ge=1, le=200),
     game_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    summary: bool = False,
     db: Session = Depends(get_db)
 ):
     """
@@ -58,20 +103,28 @@ async def get_ai_logs(
     Args:
         limit: Maximum number of logs to return (default 50, max 200)
         game_id: Optional filter by game ID
+        cursor: next_cursor from the previous page
+        summary: Omit prompt, response and turn_plan (not loaded at all);
+            fetch /ai-logs/{log_id} for a log's payload
         db: Database session
         
     Returns:
         List of AI decision logs with prompts and responses
     """
-    query = db.query(AIDecisionLogModel).order_by(desc(AIDecisionLogModel.created_at))
+    query = db.query(AIDecisionLogModel)
+    if summary:
+        query = query.options(load_only(*_AI_LOG_SUMMARY_COLUMNS))
     
     if game_id:
         query = query.filter(AIDecisionLogModel.game_id == game_id)
     
-    logs = query.limit(limit).all()
+    logs, next_cursor = _page(
+        query, AIDecisionLogModel.created_at, AIDecisionLogModel.id, limit, cursor
+    )
     
     return {
         "count": len(logs),
+        "next_cursor": next_cursor,
         "logs": [
             {
                 "id": log.id,
@@ -80,14 +133,13 @@ async def get_ai_logs(
                 "player_id": log.player_id,
                 "model_name": log.model_name,
                 "prompts_version": log.prompts_version,
-                "prompt": log.prompt,
-                "response": log.response,
+                **({} if summary else {"prompt": log.prompt, "response": log.response}),
                 "action_number": log.action_number,
                 "reasoning": log.reasoning,
                 "created_at": log.created_at.isoformat(),
                 # V3 fields
                 "ai_version": log.ai_version,
-                "turn_plan": log.turn_plan,
+                **({} if summary else {"turn_plan": log.turn_plan}),
                 "plan_execution_status": log.plan_execution_status,
                 "fallback_reason": log.fallback_reason,
                 "planned_action_index": log.planned_action_index,
@@ -98,7 +150,8 @@ async def get_ai_logs(
 
 
 @router.get("/ai-logs/{log_id}")
-async def get_ai_log(
+@offload(DB_POOL)
+def get_ai_log(
     log_id: int,
     db: Session = Depends(get_db)
 ):
@@ -139,9 +192,11 @@ async def get_ai_log(
 
 
 @router.get("/game-playbacks")
-async def get_game_playbacks(
+@offload(DB_POOL)
+def get_game_playbacks(
     limit: int = Query(20, ge=1, le=100),
     winner_id: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -152,20 +207,24 @@ async def get_game_playbacks(
     Args:
         limit: Maximum number of games to return (default 20, max 100)
         winner_id: Optional filter by winner player ID
+        cursor: next_cursor from the previous page
         db: Database session
         
     Returns:
         List of game playback summaries
     """
-    query = db.query(GamePlaybackModel).order_by(desc(GamePlaybackModel.created_at))
+    query = db.query(GamePlaybackModel).options(load_only(*_PLAYBACK_SUMMARY_COLUMNS))
     
     if winner_id:
         query = query.filter(GamePlaybackModel.winner_id == winner_id)
     
-    games = query.limit(limit).all()
+    games, next_cursor = _page(
+        query, GamePlaybackModel.created_at, GamePlaybackModel.id, limit, cursor
+    )
     
     return {
         "count": len(games),
+        "next_cursor": next_cursor,
         "games": [
             {
                 "id": game.id,
@@ -185,7 +244,8 @@ async def get_game_playbacks(
 
 
 @router.get("/game-playbacks/{game_id}")
-async def get_game_playback(
+@offload(DB_POOL)
+def get_game_playback(
     game_id: str,
     db: Session = Depends(get_db)
 ):
@@ -226,9 +286,11 @@ async def get_game_playback(
 
 
 @router.get("/games")
-async def get_games(
+@offload(DB_POOL)
+def get_games(
     limit: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -237,20 +299,22 @@ async def get_games(
     Args:
         limit: Maximum number of games to return (default 20, max 100)
         status: Optional filter by status (active, completed, abandoned, etc.)
+        cursor: next_cursor from the previous page
         db: Database session
         
     Returns:
         List of games with metadata
     """
-    query = db.query(GameModel).order_by(desc(GameModel.updated_at))
+    query = db.query(GameModel).options(load_only(*_GAME_SUMMARY_COLUMNS))
     
     if status:
         query = query.filter(GameModel.status == status)
     
-    games = query.limit(limit).all()
+    games, next_cursor = _page(query, GameModel.updated_at, GameModel.id, limit, cursor)
     
     return {
         "count": len(games),
+        "next_cursor": next_cursor,
         "games": [
             {
                 "id": str(game.id),
@@ -272,7 +336,8 @@ async def get_games(
 
 
 @router.get("/games/{game_id}")
-async def get_game(
+@offload(DB_POOL)
+def get_game(
     game_id: str,
     db: Session = Depends(get_db)
 ):
@@ -305,13 +370,19 @@ async def get_game(
         "winner_id": game.winner_id,
         "created_at": game.created_at.isoformat(),
         "updated_at": game.updated_at.isoformat(),
-        "game_state": game.game_state,
+        # Snapshot rows are decoded so the admin view always sees the JSON shape
+        "game_state": (
+            serialize_game_state(decode_snapshot(game.game_state_snapshot))
+            if game.game_state_snapshot is not None else game.game_state
+        ),
     }
 
 
 @router.get("/players")
-async def get_players(
+@offload(DB_POOL)
+def get_players(
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -319,17 +390,32 @@ async def get_players(
     
     Args:
         limit: Maximum number of players to return (default 20, max 100)
+        cursor: next_cursor from the previous page
         db: Database session
         
     Returns:
         List of player stats ordered by wins
     """
-    players = db.query(PlayerStatsModel).order_by(
-        desc(PlayerStatsModel.games_won)
-    ).limit(limit).all()
+    # Legacy card_stats JSON is never read: per-card stats come from player_card_stats
+    players, next_cursor = _page(
+        db.query(PlayerStatsModel).options(load_only(*_PLAYER_SUMMARY_COLUMNS)),
+        PlayerStatsModel.games_won, PlayerStatsModel.player_id, limit, cursor,
+    )
+    
+    # Per-card stats live in player_card_stats (one query for the page)
+    card_stats = {player.player_id: {} for player in players}
+    if card_stats:
+        for row in db.query(PlayerCardStatsModel).filter(
+            PlayerCardStatsModel.player_id.in_(list(card_stats))
+        ):
+            card_stats[row.player_id][row.card_name] = {
+                "games_played": row.games_played,
+                "games_won": row.games_won,
+            }
     
     return {
         "count": len(players),
+        "next_cursor": next_cursor,
         "players": [
             {
                 "player_id": player.player_id,
@@ -339,7 +425,7 @@ async def get_players(
                 "win_rate": player.win_rate,
                 "total_tussles": player.total_tussles,
                 "tussles_won": player.tussles_won,
-                "card_stats": player.card_stats,
+                "card_stats": card_stats[player.player_id],
                 "created_at": player.created_at.isoformat(),
                 "updated_at": player.updated_at.isoformat(),
             }
@@ -349,7 +435,8 @@ async def get_players(
 
 
 @router.get("/users")
-async def get_users(
+@offload(DB_POOL)
+def get_users(
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
@@ -375,7 +462,9 @@ async def get_users(
         ).first()
         
         # Get last game played (either as player1 or player2)
-        last_game = db.query(GameModel).filter(
+        last_game = db.query(GameModel).options(
+            load_only(GameModel.id, GameModel.status, GameModel.updated_at)
+        ).filter(
             (GameModel.player1_id == user.google_id) | 
             (GameModel.player2_id == user.google_id)
         ).order_by(desc(GameModel.updated_at)).first()
@@ -403,7 +492,8 @@ async def get_users(
 
 
 @router.get("/stats/summary")
-async def get_summary_stats(db: Session = Depends(get_db)):
+@offload(DB_POOL)
+def get_summary_stats(db: Session = Depends(get_db)):
     """
     Get summary statistics for the admin dashboard.
     
@@ -1,11 +1,15 @@
 """
 Game management API routes.
 
-Endpoints for creating, retrieving, and deleting games.
+Endpoints for creating, retrieving, and deleting games, plus push-based
+state updates (SSE stream and a long-poll fallback, see api.game_updates).
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
+import json
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional, Tuple
 
 from api.schemas import (
     GameCreate,
@@ -22,13 +26,19 @@ from api.schemas import (
     CardDataResponse,
 )
 from api.game_service import get_game_service
+from api.worker_pools import DB_POOL, offload, run_game_read
 from game_engine.models.card import Zone
 from game_engine.data.card_loader import load_all_cards
 from game_engine.ai.prompts import get_narrative_prompt
-from game_engine.ai.llm_player import get_llm_response
+from game_engine.ai.llm_player import get_llm_response_async
 
 router = APIRouter(prefix="/games", tags=["games"])
 
+# SSE keepalive comment interval (also how often a stream notices a disconnect)
+STREAM_HEARTBEAT_SECONDS = 15.0
+# Upper bound on how long GET /{game_id}/updates holds a request open
+LONG_POLL_MAX_SECONDS = 30.0
+
 
 @router.get("/cards", response_model=List[CardDataResponse])
 async def get_all_cards() -> List[CardDataResponse]:
@@ -62,7 +72,8 @@ async def get_all_cards() -> List[CardDataResponse]:
 
 
 @router.post("", response_model=GameCreated, status_code=201)
-async def create_game(game_data: GameCreate) -> GameCreated:
+@offload(DB_POOL)
+def create_game(game_data: GameCreate) -> GameCreated:
     """
     Create a new game with two players.
     
@@ -136,7 +147,8 @@ async def get_random_deck(request: RandomDeckRequest) -> RandomDeckResponse:
 
 
 @router.post("/quick-play", response_model=QuickPlayResponse, status_code=201)
-async def create_quick_play_game(request: QuickPlayRequest) -> QuickPlayResponse:
+@offload(DB_POOL)
+def create_quick_play_game(request: QuickPlayRequest) -> QuickPlayResponse:
     """
     Create a Quick Play game with random decks and random starting player.
     
@@ -188,22 +200,235 @@ async def create_quick_play_game(request: QuickPlayRequest) -> QuickPlayResponse
 
 
 @router.get("/{game_id}", response_model=GameStateResponse)
-async def get_game_state(game_id: str, player_id: str = None) -> GameStateResponse:
+@offload(DB_POOL, reads_game=True)
+def get_game_state(
+    game_id: str,
+    request: Request,
+    response: Response,
+    player_id: str = None,
+    since: int = Query(0, ge=0),
+):
     """
     Get the current state of a game.
     
     - **game_id**: The game ID
     - **player_id**: Optional - if provided, includes that player's hand
+    - **since**: Optional - only return play_by_play entries from this index
+      (the number of entries the client already has)
     
     Returns complete game state including player info, cards in play, etc.
+    The response carries an ``ETag`` for the loaded state's version; a request whose
+    ``If-None-Match`` still matches gets 304 Not Modified with no body.
+    """
+    service = get_game_service()
+    engine = service.get_game(game_id)
+    
+    if engine is None:
+        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    
+    etag = _state_etag(engine)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return _build_game_state_response(game_id, engine, player_id, since)
+
+
+@router.get("/{game_id}/stream")
+async def stream_game_state(game_id: str, request: Request, player_id: str = None) -> StreamingResponse:
+    """
+    Stream game state as Server-Sent Events.
+    
+    - **game_id**: The game ID
+    - **player_id**: Optional - if provided, includes that player's hand
+    
+    Sends an ``event: state`` (``id`` = state version) immediately and after
+    every update. The first event carries the full play_by_play; later events
+    carry only new entries, starting at ``play_by_play_start``. A reconnect
+    with a current ``Last-Event-ID`` skips the initial event. The stream ends
+    after the game-over state, or with ``event: gone`` if the game is deleted.
+    """
+    engine = await _locked(game_id, _require_game, game_id)
+    
+    last_event_id = request.headers.get("last-event-id")
+    last_version = int(last_event_id) if last_event_id and last_event_id.lstrip("-").isdigit() else None
+    
+    return StreamingResponse(
+        _state_events(request, game_id, player_id, engine.game_state.state_version, last_version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{game_id}/updates", response_model=GameStateResponse)
+async def poll_game_updates(
+    game_id: str,
+    version: int,
+    player_id: str = None,
+    timeout: float = 25.0,
+    since: int = Query(0, ge=0),
+):
+    """
+    Long-poll for the next game state (fallback for clients without SSE).
+    
+    - **game_id**: The game ID
+    - **version**: The state version the client already has
+    - **player_id**: Optional - if provided, includes that player's hand
+    - **timeout**: Seconds to wait for a change (capped at 30)
+    - **since**: Optional - only return play_by_play entries from this index
+    
+    Returns the full state as soon as the version differs from ``version``,
+    or 204 No Content if nothing changed before the timeout.
+    """
+    service = get_game_service()
+    engine = await _locked(game_id, _require_game, game_id)
+    
+    if engine.game_state.state_version == version:
+        timeout = max(0.0, min(timeout, LONG_POLL_MAX_SECONDS))
+        with service.update_hub.watch(game_id, engine.game_state.state_version) as subscription:
+            if await subscription.wait_for_change(version, timeout) is None:
+                return Response(status_code=204)
+    
+    return await _locked(game_id, _current_state_response, game_id, player_id, since)
+
+
+async def _state_events(
+    request: Request,
+    game_id: str,
+    player_id: Optional[str],
+    current_version: int,
+    last_version: Optional[int],
+):
+    """SSE generator for stream_game_state."""
+    service = get_game_service()
+    hub = service.update_hub
+    sent_version = last_version
+    # Play-by-play entries the client already has (None = send full history)
+    sent_entries: Optional[int] = None
+    
+    with hub.watch(game_id, current_version) as subscription:
+        while True:
+            step = await _locked(game_id, _stream_step, game_id, player_id, sent_version, sent_entries)
+            if step is None:
+                yield "event: gone\ndata: {}\n\n"
+                return
+            
+            version, entries, finished, data = step
+            if data is not None:
+                yield f"id: {version}\nevent: state\ndata: {data}\n\n"
+                if finished:
+                    return
+            # (A reconnect at the current version skips the send: the client
+            # is already up to date.)
+            sent_version = version
+            sent_entries = entries
+            
+            if await request.is_disconnected():
+                return
+            changed = await subscription.wait_for_change(sent_version, STREAM_HEARTBEAT_SECONDS)
+            if changed is None:
+                yield ": keepalive\n\n"
+                if await request.is_disconnected():
+                    return
+
+
+def _stream_step(
+    game_id: str,
+    player_id: Optional[str],
+    sent_version: Optional[int],
+    sent_entries: Optional[int],
+) -> Optional[Tuple[int, int, bool, Optional[str]]]:
+    """
+    One read of a streamed game (on the DB pool, under the game's state lock).
+    
+    Returns:
+        None if the game is gone, else (version, play_by_play length,
+        finished, event data or None if the client has this version)
     """
     service = get_game_service()
     engine = service.get_game(game_id)
+    if engine is None:
+        return None
     
+    game_state = engine.game_state
+    version = game_state.state_version
+    # Read under the lock: the game may move on once it is released
+    entries = len(game_state.play_by_play)
+    finished = game_state.winner_id is not None
+    data = None
+    if version != sent_version:
+        start = sent_entries or 0
+        data = service.update_hub.render(
+            game_id, version, ("sse", player_id, start),
+            lambda: _render_state_event(game_id, engine, player_id, start),
+        )
+    return version, entries, finished, data
+
+
+async def _locked(game_id: str, fn, *args):
+    """Run a blocking game read on the DB pool, under the game's state lock."""
+    return await run_game_read(DB_POOL, game_id, fn, *args)
+
+
+def _require_game(game_id: str):
+    """The game's engine (loading it if needed), or 404."""
+    engine = get_game_service().get_game(game_id)
     if engine is None:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    return engine
+
+
+def _current_state_response(game_id: str, player_id: Optional[str], since: int) -> GameStateResponse:
+    return _build_game_state_response(game_id, _require_game(game_id), player_id, since)
+
+
+def _render_state_event(game_id: str, engine, player_id: Optional[str], start: int) -> str:
+    """JSON for one SSE state event: full board, play_by_play from ``start``."""
+    payload = _build_game_state_response(game_id, engine, player_id, start).model_dump()
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _state_etag(engine) -> str:
+    """
+    Weak ETag for a game's current state: the engine's load id, its version,
+    plus the winner once decided.
+
+    The load id changes whenever the game is (re)loaded, so versions reused
+    after a restart lost unflushed write-behind updates never match a tag
+    issued for the lost states.
+    """
+    game_state = engine.game_state
+    # check_victory() can settle the winner on read, without an update_game
+    winner = game_state.check_victory()
+    suffix = f"-{winner}" if winner else ""
+    return f'W/"{engine.load_id}-{game_state.state_version}{suffix}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _build_game_state_response(
+    game_id: str,
+    engine,
+    player_id: Optional[str],
+    since: int = 0,
+) -> GameStateResponse:
+    """
+    Build the GameStateResponse for a game (hand revealed to player_id).
     
+    Only play_by_play entries from index ``since`` are included (clamped to
+    the history length); ``play_by_play_start`` records the index used.
+    """
     game_state = engine.game_state
+    since = min(since, len(game_state.play_by_play))
     
     # Convert to response format
     players_state = {}
@@ -240,12 +465,15 @@ async def get_game_state(game_id: str, player_id: str = None) -> GameStateRespon
         players=players_state,
         winner=winner,
         is_game_over=winner is not None,
-        play_by_play=game_state.play_by_play,  # Include play-by-play history
+        play_by_play=game_state.play_by_play[since:],  # Play-by-play history from `since`
+        version=game_state.state_version,
+        play_by_play_start=since,
     )
 
 
 @router.delete("/{game_id}")
-async def delete_game(game_id: str) -> Dict[str, str]:
+@offload(DB_POOL, per_game=True)
+def delete_game(game_id: str) -> Dict[str, str]:
     """
     Delete a game.
     
@@ -338,7 +566,8 @@ def _card_to_state(card, engine, player) -> CardState:
 
 
 @router.get("/{game_id}/logs")
-async def get_game_logs(game_id: str) -> Dict[str, List[str]]:
+@offload(DB_POOL, reads_game=True)
+def get_game_logs(game_id: str) -> Dict[str, List[str]]:
     """
     Get the game event log for debugging.
     
@@ -350,11 +579,13 @@ async def get_game_logs(game_id: str) -> Dict[str, List[str]]:
     if engine is None:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
     
-    return {"logs": engine.game_state.game_log}
+    # A copy: the response is encoded after the state lock is released
+    return {"logs": list(engine.game_state.game_log)}
 
 
 @router.get("/{game_id}/debug")
-async def get_game_debug_state(game_id: str) -> Dict[str, Any]:
+@offload(DB_POOL, reads_game=True)
+def get_game_debug_state(game_id: str) -> Dict[str, Any]:
     """
     Get detailed debug information about a game's internal state.
     
@@ -518,8 +749,8 @@ async def generate_narrative(request: NarrativeRequest) -> NarrativeResponse:
         # Generate narrative prompt
         prompt = get_narrative_prompt(request.play_by_play)
         
-        # Get narrative from LLM
-        narrative = get_llm_response(prompt, is_json=False)
+        # Get narrative from LLM (awaited: no worker thread held for the call)
+        narrative = await get_llm_response_async(prompt, is_json=False)
         
         return NarrativeResponse(narrative=narrative)
     
@@ -12,14 +12,15 @@ Architecture:
 
 import logging
 import threading
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from .admin_auth import get_current_admin_user
 from .database import SessionLocal
+from .pagination import InvalidCursorError
 from simulation.config import SimulationConfig, SUPPORTED_MODELS, is_valid_model_name, default_simulation_model
 from simulation.orchestrator import SimulationOrchestrator
 from simulation.deck_loader import load_simulation_decks
@@ -312,21 +313,33 @@ async def start_simulation(
 
 @router.get("/runs")
 async def list_simulation_runs(
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
     List recent simulation runs.
     
+    The next page's cursor is sent in the X-Next-Cursor header (absent on
+    the last page), keeping the body a plain list.
+    
     Args:
         limit: Maximum number of runs to return
+        cursor: X-Next-Cursor of the previous page
         db: Database session
         
     Returns:
         List of simulation run summaries
     """
     orchestrator = SimulationOrchestrator(db)
-    return orchestrator.list_runs(limit=limit)
+    try:
+        runs, next_cursor = orchestrator.list_runs_page(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return runs
 
 
 @router.get("/runs/{run_id}")
@@ -16,6 +16,7 @@ from api.schemas import (
     CardAggregateResponse,
 )
 from api.stats_service import get_stats_service
+from api.worker_pools import DB_POOL, offload
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,8 @@ router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/players/{player_id}", response_model=PlayerStatsResponse)
-async def get_player_stats(player_id: str) -> PlayerStatsResponse:
+@offload(DB_POOL)
+def get_player_stats(player_id: str) -> PlayerStatsResponse:
     """
     Get statistics for a specific player.
     
@@ -87,7 +89,8 @@ async def get_player_stats(player_id: str) -> PlayerStatsResponse:
 
 
 @router.get("/leaderboard", response_model=LeaderboardResponse)
-async def get_leaderboard(
+@offload(DB_POOL)
+def get_leaderboard(
     limit: int = Query(default=10, ge=1, le=100, description="Number of players to return"),
     min_games: int = Query(default=3, ge=1, le=100, description="Minimum games played to qualify"),
 ) -> LeaderboardResponse:
@@ -121,7 +124,8 @@ async def get_leaderboard(
 
 
 @router.get("/leaderboard/card/{card_name}", response_model=LeaderboardResponse)
-async def get_card_leaderboard(
+@offload(DB_POOL)
+def get_card_leaderboard(
     card_name: str,
     limit: int = Query(default=10, ge=1, le=100, description="Number of players to return"),
     min_games: int = Query(default=3, ge=1, le=100, description="Minimum games with card to qualify"),
@@ -167,7 +171,8 @@ async def get_card_leaderboard(
 
 
 @router.get("/cards", response_model=CardAggregateResponse)
-async def get_card_stats(
+@offload(DB_POOL)
+def get_card_stats(
     limit: int = Query(default=50, ge=1, le=200, description="Number of cards to return"),
     min_games: int = Query(default=1, ge=1, le=100, description="Minimum games with card to qualify"),
 ) -> CardAggregateResponse:
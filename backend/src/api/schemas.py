@@ -178,7 +178,12 @@ class GameStateResponse(BaseModel):
     is_game_over: bool = False
     play_by_play: Optional[List[Dict[str, Any]]] = Field(
         None,
-        description="Complete play-by-play history of all actions taken in the game"
+        description="Play-by-play history of actions taken in the game, from play_by_play_start"
+    )
+    version: int = Field(0, description="State version; changes on every committed update")
+    play_by_play_start: int = Field(
+        0,
+        description="Index of the first play_by_play entry included (0 = full history)"
     )
 
 
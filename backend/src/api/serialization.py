@@ -8,7 +8,7 @@ to Python objects.
 
 import logging
 from typing import Dict, Any, List
-from game_engine.models.game_state import GameState, Phase
+from game_engine.models.game_state import GameState, Phase, TurnChargeRecord
 from game_engine.models.player import Player
 from game_engine.models.card import Card, CardType, Zone
 from game_engine.data.card_loader import CardLoader
@@ -172,6 +172,8 @@ def serialize_game_state(game_state: GameState) -> Dict[str, Any]:
         "game_log": game_state.game_log,
         "play_by_play": game_state.play_by_play,
         "starting_decks": game_state.starting_decks,
+        "charge_history": [record.to_dict() for record in game_state.charge_history],
+        "state_version": game_state.state_version,
     }
 
 
@@ -201,6 +203,10 @@ def deserialize_game_state(data: Dict[str, Any]) -> GameState:
         game_log=data.get("game_log", []),
         play_by_play=data.get("play_by_play", []),
         starting_decks=data.get("starting_decks", {}),
+        charge_history=[
+            TurnChargeRecord.from_dict(record) for record in data.get("charge_history", [])
+        ],
+        state_version=data.get("state_version", 0),
     )
 
 
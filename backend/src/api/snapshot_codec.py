@@ -0,0 +1,261 @@
+"""
+Compact, versioned binary snapshots of a GameState for persistence.
+
+``serialize_game_state`` writes a verbose JSON document: every card repeats
+its full template (name, type, cost, effect text and definitions, stats,
+colors) under long key names, and the whole document is rewritten on every
+action. A snapshot instead stores:
+
+- Cards as positional rows. A card whose template matches its card catalog
+  definition is stored as a reference by name; other templates (a
+  transformed Copy, a card whose stats an effect rewrote) are stored once
+  in a per-snapshot template table and referenced by index.
+- Everything ``serialize_game_state`` drops or loses: ``charge_history``,
+  the in-turn Charge tracking, ``turn_modifications`` and the Copy
+  transformation attributes.
+- Optional zlib compression (the log lists compress well).
+
+Layout: ``MAGIC`` + version byte + flags byte + body, where the body is a
+compact JSON array (zlib-compressed if ``FLAG_ZLIB`` is set). JSON keeps
+the codec dependency-free and, unlike pickle, safe to decode from the
+database.
+
+Decoding rebuilds card-referenced templates from the current catalog. The
+snapshot records the catalog's fingerprint; a mismatch (cards.csv changed
+since the game was saved) is logged and the current definitions are used,
+as for any card created after the change.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from game_engine.data.card_catalog import CardCatalog, get_card_catalog
+from game_engine.models.card import TEMPLATE_FIELDS, Card, CardTemplate, CardType, Zone, intern_template
+from game_engine.models.game_state import GameState, Phase, TurnChargeRecord
+from game_engine.models.player import Player
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GGS"
+SNAPSHOT_VERSION = 1
+FLAG_ZLIB = 0x01
+DEFAULT_COMPRESS_LEVEL = 1
+
+_HEADER_LEN = len(MAGIC) + 2
+# Card attributes set only on some cards (Copy transformation state)
+_OPTIONAL_CARD_ATTRS = ("_is_transformed", "_original_name", "_original_cost")
+_CARD_TYPE_INDEX = TEMPLATE_FIELDS.index("card_type")
+
+
+class SnapshotError(ValueError):
+    """Raised when bytes are not a snapshot this codec can decode."""
+
+
+def is_snapshot(data: Any) -> bool:
+    """True if ``data`` looks like an encoded snapshot (bytes with the magic)."""
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def encode_snapshot(
+    game_state: GameState,
+    catalog: Optional[CardCatalog] = None,
+    compress_level: Optional[int] = DEFAULT_COMPRESS_LEVEL,
+) -> bytes:
+    """
+    Encode a game state as a compact snapshot.
+
+    Args:
+        game_state: State to encode
+        catalog: Card catalog for template references (default: the
+            process-wide catalog)
+        compress_level: zlib level 1-9, or None/0 for no compression
+    """
+    if catalog is None:
+        catalog = get_card_catalog()
+    templates: List[List[Any]] = []
+    # template -> catalog name or index into templates
+    refs: Dict[CardTemplate, Union[str, int]] = {}
+
+    def encode_card(card: Card) -> List[Any]:
+        ref = refs.get(card.template)
+        if ref is None:
+            ref = template_ref(card.template, catalog)
+            if not isinstance(ref, str):
+                templates.append(ref)
+                ref = len(templates) - 1
+            refs[card.template] = ref
+        return card_row(card, ref)
+
+    players = [
+        [
+            player.player_id, player.name, player.charge, player.direct_attacks_this_turn,
+            [encode_card(card) for card in player.hand],
+            [encode_card(card) for card in player.in_play],
+            [encode_card(card) for card in player.break_zone],
+        ]
+        for player in game_state.players.values()
+    ]
+    body = [
+        game_state.game_id,
+        game_state.active_player_id,
+        game_state.turn_number,
+        game_state.phase.value,
+        game_state.first_player_id,
+        game_state.winner_id,
+        game_state.state_version,
+        [game_state._turn_charge_snapshot, game_state._turn_charge_gained],
+        [
+            [r.turn, r.player_id, r.charge_start, r.charge_gained, r.charge_spent, r.charge_end]
+            for r in game_state.charge_history
+        ],
+        game_state.starting_decks,
+        game_state.game_log,
+        game_state.play_by_play,
+        catalog.fingerprint,
+        templates,
+        players,
+    ]
+    raw = json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    flags = 0
+    if compress_level:
+        raw = zlib.compress(raw, compress_level)
+        flags |= FLAG_ZLIB
+    return MAGIC + bytes((SNAPSHOT_VERSION, flags)) + raw
+
+
+def decode_snapshot(data: bytes, catalog: Optional[CardCatalog] = None) -> GameState:
+    """
+    Rebuild a game state from ``encode_snapshot`` output.
+
+    Raises:
+        SnapshotError: Not a snapshot, an unsupported version, or a card
+            name the catalog does not know
+    """
+    data = bytes(data)
+    if not is_snapshot(data) or len(data) < _HEADER_LEN:
+        raise SnapshotError("Not a game state snapshot")
+    version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported game state snapshot version {version}")
+    raw = data[_HEADER_LEN:]
+    if flags & FLAG_ZLIB:
+        raw = zlib.decompress(raw)
+    (
+        game_id, active_player_id, turn_number, phase, first_player_id, winner_id,
+        state_version, turn_charge, charge_history, starting_decks, game_log,
+        play_by_play, fingerprint, template_rows, player_rows,
+    ) = json.loads(raw)
+
+    if catalog is None:
+        catalog = get_card_catalog()
+    if fingerprint != catalog.fingerprint:
+        logger.warning(
+            f"Game {game_id} was saved with a different card catalog; "
+            "using current card definitions"
+        )
+    templates = [_template_from_values(values) for values in template_rows]
+
+    def decode_card(row: List[Any]) -> Card:
+        return decode_card_row(row, catalog, templates)
+
+    players = {}
+    for player_id, name, charge, direct_attacks, hand, in_play, break_zone in player_rows:
+        players[player_id] = Player(
+            player_id=player_id,
+            name=name,
+            charge=charge,
+            hand=[decode_card(row) for row in hand],
+            in_play=[decode_card(row) for row in in_play],
+            break_zone=[decode_card(row) for row in break_zone],
+            direct_attacks_this_turn=direct_attacks,
+        )
+    game_state = GameState(
+        game_id=game_id,
+        players=players,
+        active_player_id=active_player_id,
+        turn_number=turn_number,
+        phase=Phase(phase),
+        first_player_id=first_player_id,
+        winner_id=winner_id,
+        game_log=game_log,
+        play_by_play=play_by_play,
+        starting_decks=starting_decks,
+        charge_history=[TurnChargeRecord(*values) for values in charge_history],
+        state_version=state_version,
+    )
+    game_state._turn_charge_snapshot, game_state._turn_charge_gained = turn_charge
+    return game_state
+
+
+def template_ref(template: CardTemplate, catalog: CardCatalog) -> Union[str, List[Any]]:
+    """A card template as stored: its catalog name if it matches, else its field values."""
+    definition = catalog.get(template.name)
+    if definition is not None and (
+        template is definition or _template_values(template) == _template_values(definition)
+    ):
+        return template.name
+    values = list(_template_values(template))
+    values[_CARD_TYPE_INDEX] = values[_CARD_TYPE_INDEX].value
+    return values
+
+
+def card_row(card: Card, ref: Union[str, int, List[Any]]) -> List[Any]:
+    """
+    One card's state as a JSON-ready row (shared with api.event_log).
+
+    ``ref`` is the card's template as stored (see ``template_ref``; snapshots
+    replace inline values with an index into their template table). The
+    modification dicts are copied, so a row never changes with the card.
+    """
+    row = [
+        card.id, ref, card.owner, card.controller, card.zone.value, card.current_stamina,
+        dict(card.modifications),
+        {turn: dict(mods) for turn, mods in card.turn_modifications.items()},
+    ]
+    extra = {name: getattr(card, name) for name in _OPTIONAL_CARD_ATTRS if hasattr(card, name)}
+    if extra:
+        row.append(extra)
+    return row
+
+
+def decode_card_row(row: List[Any], catalog: CardCatalog, templates: List[CardTemplate] = ()) -> Card:
+    """
+    Rebuild a card from a ``card_row`` row.
+
+    Raises:
+        SnapshotError: The row references a card the catalog does not know
+    """
+    card_id, ref, owner, controller, zone, current_stamina, modifications, turn_modifications = row[:8]
+    if isinstance(ref, int):
+        template = templates[ref]
+    elif isinstance(ref, list):
+        template = _template_from_values(ref)
+    else:
+        template = catalog.get(ref)
+        if template is None:
+            raise SnapshotError(f"Card '{ref}' not found in card database")
+    card = Card.from_template(
+        template, owner=owner, controller=controller, zone=Zone(zone), id=card_id,
+        current_stamina=current_stamina, modifications=dict(modifications),
+        turn_modifications={turn: dict(mods) for turn, mods in turn_modifications.items()},
+    )
+    if len(row) > 8:
+        for name, value in row[8].items():
+            setattr(card, name, value)
+        if getattr(card, "_is_transformed", False) and card.effect_definitions:
+            # Same as deserialize_card: re-attach the copied card's effects
+            from game_engine.rules.effects.effect_registry import EffectFactory
+            card._copied_effects = EffectFactory.parse_effects(card.effect_definitions, card)
+    return card
+
+
+def _template_values(template: CardTemplate) -> Tuple[Any, ...]:
+    return tuple(getattr(template, name) for name in TEMPLATE_FIELDS)
+
+
+def _template_from_values(values: List[Any]) -> CardTemplate:
+    values = list(values)
+    values[_CARD_TYPE_INDEX] = CardType(values[_CARD_TYPE_INDEX])
+    return intern_template(*values)
@@ -0,0 +1,185 @@
+"""
+Batched aggregation of player stats increments.
+
+``StatsService.update_player_stats`` applies each finished game as atomic SQL
+upserts (``col = col + n``), so concurrent completions never lose increments.
+The shared AI player IDs (``ai-*``) are on one side of almost every game,
+though, so their rows are the hottest in the table. With a queue configured,
+their increments are merged in memory and applied in one transaction per
+interval instead of one per game.
+
+Deltas are additive, so merging is exact: N queued games for one player
+become a single upsert with the summed counters. A failed flush merges
+whatever queued up meanwhile into the failed batch (newer deltas last, so the
+latest display name still wins) and retries on the next interval. A hard crash loses at most one interval of AI stats; humans are
+never queued.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlayerStatsDelta:
+    """Counter increments for one player (one game, or several merged)."""
+    player_id: str
+    display_name: str
+    games_played: int = 0
+    games_won: int = 0
+    total_tussles: int = 0
+    tussles_won: int = 0
+    total_turns: int = 0
+    total_game_duration_seconds: int = 0
+    # card_name -> [games_played, games_won]
+    cards: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def for_game(
+        cls,
+        player_id: str,
+        display_name: str,
+        won: bool,
+        cards_used: List[str],
+        tussles_initiated: int = 0,
+        tussles_won: int = 0,
+        turn_count: int = 0,
+        game_duration_seconds: int = 0,
+    ) -> "PlayerStatsDelta":
+        """Increments for one finished game (each card counts once per game)."""
+        return cls(
+            player_id=player_id,
+            display_name=display_name,
+            games_played=1,
+            games_won=int(won),
+            total_tussles=tussles_initiated,
+            tussles_won=tussles_won,
+            total_turns=turn_count,
+            total_game_duration_seconds=game_duration_seconds,
+            cards={name: [1, int(won)] for name in set(cards_used)},
+        )
+
+    def merge(self, other: "PlayerStatsDelta") -> None:
+        """Add another delta for the same player into this one (latest name wins)."""
+        self.display_name = other.display_name
+        self.games_played += other.games_played
+        self.games_won += other.games_won
+        self.total_tussles += other.total_tussles
+        self.tussles_won += other.tussles_won
+        self.total_turns += other.total_turns
+        self.total_game_duration_seconds += other.total_game_duration_seconds
+        for name, (played, won) in other.cards.items():
+            counts = self.cards.setdefault(name, [0, 0])
+            counts[0] += played
+            counts[1] += won
+
+
+class PlayerStatsQueue:
+    """
+    Merges per-player stat deltas and applies them in batches.
+
+    Args:
+        apply_deltas: Applies a batch in one transaction; raises on failure
+            (``StatsService._apply_deltas``)
+        flush_interval: Seconds between background flushes
+        start_thread: Start the background flush thread. Tests pass False and
+            call ``flush()`` directly.
+    """
+
+    def __init__(
+        self,
+        apply_deltas: Callable[[List[PlayerStatsDelta]], None],
+        flush_interval: float = 2.0,
+        start_thread: bool = True,
+    ):
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self._apply_deltas = apply_deltas
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, PlayerStatsDelta] = {}
+        self._lock = threading.Lock()
+        # One flush at a time, so a requeued batch can't race a newer one
+        self._flush_lock = threading.Lock()
+        self._metrics = {
+            "queued_games": 0,
+            "flushes": 0,
+            "players_written": 0,
+            "flush_errors": 0,
+        }
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if start_thread:
+            self._thread = threading.Thread(
+                target=self._run, name="player-stats-queue", daemon=True
+            )
+            self._thread.start()
+
+    def add(self, delta: PlayerStatsDelta) -> None:
+        """Queue a delta, merging it into the player's pending one."""
+        with self._lock:
+            self._metrics["queued_games"] += delta.games_played
+            self._merge_locked(delta)
+
+    def flush(self) -> int:
+        """
+        Apply every pending delta in one batch.
+
+        Returns:
+            Number of players written (0 if the batch failed and was requeued)
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending.values())
+                self._pending = {}
+            if not batch:
+                return 0
+            try:
+                self._apply_deltas(batch)
+            except Exception as e:
+                logger.error(f"Player stats flush of {len(batch)} player(s) failed: {e}")
+                with self._lock:
+                    self._metrics["flush_errors"] += 1
+                    newer = self._pending
+                    self._pending = {delta.player_id: delta for delta in batch}
+                    for delta in newer.values():
+                        self._merge_locked(delta)
+                return 0
+            with self._lock:
+                self._metrics["flushes"] += 1
+                self._metrics["players_written"] += len(batch)
+            return len(batch)
+
+    def close(self) -> None:
+        """Stop the background thread and apply whatever is still pending."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and flush counters."""
+        with self._lock:
+            return {
+                "flush_interval_ms": int(self.flush_interval * 1000),
+                "pending_players": len(self._pending),
+                **self._metrics,
+            }
+
+    def _merge_locked(self, delta: PlayerStatsDelta) -> None:
+        pending = self._pending.get(delta.player_id)
+        if pending is None:
+            self._pending[delta.player_id] = PlayerStatsDelta(
+                player_id=delta.player_id,
+                display_name=delta.display_name,
+            )
+            pending = self._pending[delta.player_id]
+        pending.merge(delta)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
@@ -5,13 +5,21 @@ Handles AI decision logging, game playback recording, and player stats updates.
 """
 
 import logging
+import os
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy import Float, cast, func
+
+from api.analytics import is_ai_player
+from api.stats_queue import PlayerStatsDelta, PlayerStatsQueue
 
 logger = logging.getLogger(__name__)
 
+# Milliseconds between batched flushes of AI player stats (unset/0 = apply
+# every game immediately, like human players)
+AI_STATS_BATCH_INTERVAL_ENV = "AI_STATS_BATCH_INTERVAL_MS"
+
 
 def _get_session_local():
     """Lazy import of SessionLocal to avoid requiring DATABASE_URL at import time."""
@@ -30,6 +38,24 @@ def _get_models():
     return AIDecisionLogModel, GamePlaybackModel, PlayerStatsModel, GameModel
 
 
+def _get_card_stats_model():
+    """Lazy import of the normalized per-card stats model."""
+    from api.db_models import PlayerCardStatsModel
+    return PlayerCardStatsModel
+
+
+def _dialect_insert(db):
+    """INSERT construct with ON CONFLICT support for the session's database."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Atomic stats upserts are not supported on {dialect}")
+    return insert
+
+
 class StatsService:
     """
     Service for managing game statistics and logging.
@@ -41,14 +67,19 @@ class StatsService:
     - Cleaning up old records
     """
     
-    def __init__(self, use_database: bool = True):
+    def __init__(self, use_database: bool = True, ai_batch_interval: Optional[float] = None):
         """
         Initialize the stats service.
         
         Args:
             use_database: Whether to persist to database (False for testing)
+            ai_batch_interval: Seconds between batched flushes of AI player
+                stats (see api.stats_queue); None applies them per game
         """
         self.use_database = use_database
+        self._ai_queue: Optional[PlayerStatsQueue] = None
+        if use_database and ai_batch_interval:
+            self._ai_queue = PlayerStatsQueue(self._apply_deltas, flush_interval=ai_batch_interval)
     
     # ========================================
     # AI Decision Logging
@@ -224,6 +255,10 @@ class StatsService:
         """
         Update a player's statistics after a game.
         
+        Counters are incremented SQL-side (atomic upserts), so games finishing
+        at the same time for one player never lose updates. AI players' stats
+        go through the batch queue when one is configured.
+        
         Args:
             player_id: Player ID (Google ID or AI ID)
             display_name: Player's display name
@@ -238,64 +273,103 @@ class StatsService:
             logger.debug(f"Player stats updated (no-db): player={player_id}")
             return
         
+        delta = PlayerStatsDelta.for_game(
+            player_id, display_name, won, cards_used,
+            tussles_initiated=tussles_initiated,
+            tussles_won=tussles_won,
+            turn_count=turn_count,
+            game_duration_seconds=game_duration_seconds,
+        )
+        if self._ai_queue is not None and is_ai_player(player_id):
+            self._ai_queue.add(delta)
+            return
+        
+        try:
+            self._apply_deltas([delta])
+            logger.info(f"Player stats updated: player={player_id}")
+        except Exception as e:
+            logger.error(f"Failed to update player stats: {e}")
+            # Don't raise - stats are non-critical
+    
+    def _apply_deltas(self, deltas: list[PlayerStatsDelta]) -> None:
+        """
+        Apply stat increments as INSERT ... ON CONFLICT DO UPDATE upserts.
+        
+        One transaction for the whole batch; raises on failure (after
+        rolling back) so the batch queue can retry.
+        """
         SessionLocal = _get_session_local()
         _, _, PlayerStatsModel, _ = _get_models()
+        PlayerCardStatsModel = _get_card_stats_model()
+        players = PlayerStatsModel.__table__
+        cards = PlayerCardStatsModel.__table__
+        counters = (
+            "games_played", "games_won", "total_tussles",
+            "tussles_won", "total_turns", "total_game_duration_seconds",
+        )
+        # Consistent row lock order across concurrent batches
+        deltas = sorted(deltas, key=lambda d: d.player_id)
         
         db = SessionLocal()
         try:
-            # Get or create player stats
-            stats = db.query(PlayerStatsModel).filter(
-                PlayerStatsModel.player_id == player_id
-            ).first()
+            insert = _dialect_insert(db)
             
-            if not stats:
-                stats = PlayerStatsModel(
-                    player_id=player_id,
-                    display_name=display_name,
-                    games_played=0,
-                    games_won=0,
-                    total_tussles=0,
-                    tussles_won=0,
-                    total_turns=0,
-                    total_game_duration_seconds=0,
-                    card_stats={},
-                )
-                db.add(stats)
-            
-            # Update overall stats
-            stats.games_played += 1
-            if won:
-                stats.games_won += 1
-            stats.total_tussles += tussles_initiated
-            stats.tussles_won += tussles_won
-            stats.total_turns += turn_count
-            stats.total_game_duration_seconds += game_duration_seconds
-            stats.display_name = display_name  # Update display name in case it changed
-            
-            # Update card-specific stats
-            card_stats = dict(stats.card_stats or {})
-            for card_name in set(cards_used):  # Use set to count each card once per game
-                if card_name not in card_stats:
-                    card_stats[card_name] = {
-                        "games_played": 0,
-                        "games_won": 0,
-                    }
-                card_stats[card_name]["games_played"] += 1
-                if won:
-                    card_stats[card_name]["games_won"] += 1
+            stmt = insert(players).values([
+                {
+                    "player_id": d.player_id,
+                    "display_name": d.display_name,
+                    "card_stats": {},
+                    **{name: getattr(d, name) for name in counters},
+                }
+                for d in deltas
+            ])
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[players.c.player_id],
+                set_={
+                    **{name: players.c[name] + stmt.excluded[name] for name in counters},
+                    # Update display name in case it changed
+                    "display_name": stmt.excluded.display_name,
+                    "updated_at": func.now(),
+                },
+            ))
             
-            stats.card_stats = card_stats
-            flag_modified(stats, 'card_stats')  # Ensure SQLAlchemy detects JSON change
+            card_rows = [
+                {"player_id": d.player_id, "card_name": name, "games_played": played, "games_won": won}
+                for d in deltas
+                for name, (played, won) in sorted(d.cards.items())
+            ]
+            if card_rows:
+                stmt = insert(cards).values(card_rows)
+                db.execute(stmt.on_conflict_do_update(
+                    index_elements=[cards.c.player_id, cards.c.card_name],
+                    set_={
+                        "games_played": cards.c.games_played + stmt.excluded.games_played,
+                        "games_won": cards.c.games_won + stmt.excluded.games_won,
+                    },
+                ))
             
             db.commit()
-            logger.info(f"Player stats updated: player={player_id}, total_games={stats.games_played}")
-        except Exception as e:
+        except Exception:
             db.rollback()
-            logger.error(f"Failed to update player stats: {e}")
-            # Don't raise - stats are non-critical
+            raise
         finally:
             db.close()
     
+    def flush(self) -> int:
+        """Apply queued AI player stats now; returns the number of players written."""
+        return self._ai_queue.flush() if self._ai_queue is not None else 0
+    
+    def shutdown(self) -> None:
+        """Stop the AI stats queue, applying anything still pending."""
+        if self._ai_queue is not None:
+            self._ai_queue.close()
+    
+    def queue_stats(self) -> dict:
+        """AI stats queue counters (exposed on /health)."""
+        if self._ai_queue is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._ai_queue.stats()}
+    
     # ========================================
     # Query Methods (for future stats API)
     # ========================================
@@ -315,6 +389,7 @@ class StatsService:
         
         SessionLocal = _get_session_local()
         _, _, PlayerStatsModel, _ = _get_models()
+        PlayerCardStatsModel = _get_card_stats_model()
         
         db = SessionLocal()
         try:
@@ -325,6 +400,10 @@ class StatsService:
             if not stats:
                 return None
             
+            card_rows = db.query(PlayerCardStatsModel).filter(
+                PlayerCardStatsModel.player_id == player_id
+            ).all()
+            
             return {
                 "player_id": stats.player_id,
                 "display_name": stats.display_name,
@@ -335,7 +414,10 @@ class StatsService:
                 "tussles_won": stats.tussles_won,
                 "avg_turns": stats.avg_turns,
                 "avg_game_duration_seconds": stats.avg_game_duration_seconds,
-                "card_stats": stats.card_stats,
+                "card_stats": {
+                    row.card_name: {"games_played": row.games_played, "games_won": row.games_won}
+                    for row in card_rows
+                },
             }
         except Exception as e:
             logger.error(f"Failed to get player stats: {e}")
@@ -414,42 +496,41 @@ class StatsService:
         
         SessionLocal = _get_session_local()
         _, _, PlayerStatsModel, _ = _get_models()
+        PlayerCardStatsModel = _get_card_stats_model()
         
         db = SessionLocal()
         try:
-            # Get all players who have used this card
-            all_stats = db.query(PlayerStatsModel).all()
-            
-            # Filter and calculate card-specific stats
-            card_stats_list = []
-            for stats in all_stats:
-                if not stats.card_stats or card_name not in stats.card_stats:
-                    continue
-                
-                card_data = stats.card_stats[card_name]
-                games_played = card_data.get("games_played", 0)
-                games_won = card_data.get("games_won", 0)
-                
-                if games_played < min_games:
-                    continue
-                
-                win_rate = (games_won / games_played * 100) if games_played > 0 else 0.0
-                
-                card_stats_list.append({
-                    "player_id": stats.player_id,
-                    "display_name": stats.display_name,
-                    "games_played": games_played,
-                    "games_won": games_won,
-                    "win_rate": win_rate,
-                })
-            
-            # Sort by win rate (descending), then by total wins (descending)
-            card_stats_list.sort(
-                key=lambda s: (s["win_rate"], s["games_won"]),
-                reverse=True
+            # One indexed (card_name, games_played) range scan, sorted and
+            # limited in SQL
+            win_ratio = cast(PlayerCardStatsModel.games_won, Float) / PlayerCardStatsModel.games_played
+            rows = (
+                db.query(
+                    PlayerCardStatsModel.player_id,
+                    PlayerStatsModel.display_name,
+                    PlayerCardStatsModel.games_played,
+                    PlayerCardStatsModel.games_won,
+                )
+                .join(PlayerStatsModel, PlayerStatsModel.player_id == PlayerCardStatsModel.player_id)
+                .filter(
+                    PlayerCardStatsModel.card_name == card_name,
+                    PlayerCardStatsModel.games_played >= max(min_games, 1),
+                )
+                # Sort by win rate (descending), then by total wins (descending)
+                .order_by(win_ratio.desc(), PlayerCardStatsModel.games_won.desc())
+                .limit(limit)
+                .all()
             )
             
-            return card_stats_list[:limit]
+            return [
+                {
+                    "player_id": row.player_id,
+                    "display_name": row.display_name,
+                    "games_played": row.games_played,
+                    "games_won": row.games_won,
+                    "win_rate": row.games_won / row.games_played * 100,
+                }
+                for row in rows
+            ]
         except Exception as e:
             logger.error(f"Failed to get card leaderboard: {e}")
             return []
@@ -461,7 +542,7 @@ class StatsService:
         Aggregate per-card statistics across ALL players.
 
         Sums each card's games_played / games_won over every player's
-        ``card_stats`` (deck-inclusion counts; one per game per player).
+        per-card rows (deck-inclusion counts; one per game per player).
 
         Args:
             min_games: Minimum total games played with a card to include it
@@ -476,58 +557,49 @@ class StatsService:
 
         SessionLocal = _get_session_local()
         _, _, PlayerStatsModel, _ = _get_models()
+        PlayerCardStatsModel = _get_card_stats_model()
 
         db = SessionLocal()
         try:
-            all_stats = db.query(PlayerStatsModel).all()
-
-            # Accumulate per-card totals across all players
-            aggregate: dict[str, dict] = {}
-            total_player_games = 0
-            for stats in all_stats:
-                total_player_games += stats.games_played or 0
-                if not stats.card_stats:
-                    continue
-                for card_name, card_data in stats.card_stats.items():
-                    games_played = card_data.get("games_played", 0)
-                    games_won = card_data.get("games_won", 0)
-                    if games_played <= 0:
-                        continue
-                    entry = aggregate.setdefault(
-                        card_name,
-                        {"games_played": 0, "games_won": 0, "player_count": 0},
-                    )
-                    entry["games_played"] += games_played
-                    entry["games_won"] += games_won
-                    entry["player_count"] += 1
+            total_player_games = db.query(
+                func.coalesce(func.sum(PlayerStatsModel.games_played), 0)
+            ).scalar() or 0
+
+            # Per-card totals across all players, grouped, filtered and
+            # sorted in SQL
+            games_played = func.sum(PlayerCardStatsModel.games_played)
+            games_won = func.sum(PlayerCardStatsModel.games_won)
+            rows = (
+                db.query(
+                    PlayerCardStatsModel.card_name,
+                    games_played.label("games_played"),
+                    games_won.label("games_won"),
+                    func.count().label("player_count"),
+                )
+                .filter(PlayerCardStatsModel.games_played > 0)
+                .group_by(PlayerCardStatsModel.card_name)
+                .having(games_played >= max(min_games, 1))
+                # Sort by win rate (descending), then by games played (descending)
+                .order_by((cast(games_won, Float) / games_played).desc(), games_played.desc())
+                .all()
+            )
 
             card_list = []
-            for card_name, entry in aggregate.items():
-                games_played = entry["games_played"]
-                games_won = entry["games_won"]
-                if games_played < min_games:
-                    continue
-                win_rate = (games_won / games_played * 100) if games_played > 0 else 0.0
+            for row in rows:
                 pick_rate = (
-                    games_played / total_player_games * 100
+                    row.games_played / total_player_games * 100
                     if total_player_games > 0 else 0.0
                 )
                 card_list.append({
-                    "card_name": card_name,
-                    "games_played": games_played,
-                    "games_won": games_won,
-                    "games_lost": games_played - games_won,
-                    "win_rate": win_rate,
+                    "card_name": row.card_name,
+                    "games_played": row.games_played,
+                    "games_won": row.games_won,
+                    "games_lost": row.games_played - row.games_won,
+                    "win_rate": row.games_won / row.games_played * 100,
                     "pick_rate": pick_rate,
-                    "player_count": entry["player_count"],
+                    "player_count": row.player_count,
                 })
 
-            # Sort by win rate (descending), then by games played (descending)
-            card_list.sort(
-                key=lambda c: (c["win_rate"], c["games_played"]),
-                reverse=True,
-            )
-
             return card_list, total_player_games
         except Exception as e:
             logger.error(f"Failed to get card stats aggregate: {e}")
@@ -549,5 +621,14 @@ def get_stats_service() -> StatsService:
     """
     global _stats_service
     if _stats_service is None:
-        _stats_service = StatsService()
+        interval_ms = int(os.environ.get(AI_STATS_BATCH_INTERVAL_ENV, "0") or 0)
+        _stats_service = StatsService(
+            ai_batch_interval=interval_ms / 1000 if interval_ms > 0 else None,
+        )
     return _stats_service
+
+
+def shutdown_stats_service() -> None:
+    """Apply queued AI stats if the singleton was ever created (app shutdown)."""
+    if _stats_service is not None:
+        _stats_service.shutdown()
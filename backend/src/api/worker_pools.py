@@ -0,0 +1,341 @@
+"""
+Bounded worker pools for the blocking work behind async routes.
+
+The route handlers are ``async def``, but their work is synchronous:
+SQLAlchemy sessions (GameService saves, StatsService, admin queries) and the
+AI turn (sequence enumeration plus the planner's Gemini call). Run directly
+in a handler, any of it stalls every other request on the worker's event
+loop. Handlers instead hand it to a named pool:
+
+- ``db``: game actions and state reads, stats and admin queries
+- ``ai``: AI turns (CPU-heavy search, then a blocking LLM call)
+
+LLM-only calls (narratives) need no pool: they await the provider's async
+path (``GeminiProvider.generate_text_async``).
+
+Separate pools keep slow AI turns from starving human actions. Pool sizes
+are set with ``API_DB_WORKERS`` and ``API_AI_WORKERS``;
+``API_POOL_MAX_QUEUED`` optionally caps the requests waiting per pool, past
+which requests are rejected with 503 instead of queueing without bound.
+
+Moving game work off the event loop also removes the implicit per-game
+serialization the loop used to provide, so ``offload(..., per_game=True)``
+takes an asyncio lock per game id before submitting. Waiters queue on the
+event loop, not in a pool thread. Read-only handlers
+(``offload(..., reads_game=True)``) skip that queue: they only take the
+game's ``game_state_locks`` entry, which writers hold while they touch the
+state. The AI turn releases it while it plans (search and LLM call), so
+state reads are not held up for the whole turn.
+
+Per-pool saturation metrics (active and queued work, wait and run times,
+submissions that found every worker busy) are reported under
+``worker_pools`` on /health.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DB_POOL = "db"
+AI_POOL = "ai"
+
+# pool -> (workers env var, default workers)
+POOL_WORKERS: Dict[str, Tuple[str, int]] = {
+    DB_POOL: ("API_DB_WORKERS", 8),
+    AI_POOL: ("API_AI_WORKERS", 2),
+}
+MAX_QUEUED_ENV = "API_POOL_MAX_QUEUED"
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when a pool's queue is full (see ``WorkerPool.max_queued``)."""
+
+
+class WorkerPool:
+    """
+    A named, bounded thread pool with saturation metrics.
+
+    Args:
+        name: Pool name (for logs and metrics)
+        max_workers: Threads running work concurrently
+        max_queued: Submissions allowed to wait for a thread; 0 = unbounded
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queued: int = 0):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queued = max(0, max_queued)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"api-{name}"
+        )
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._saturated = 0
+        self._wait_ms = 0.0
+        self._max_wait_ms = 0.0
+        self._run_ms = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` on a pool thread and await its result.
+
+        The caller's context variables (e.g. trace scopes) are carried over.
+        Cancelling the caller drops the call if it is still queued; a call
+        already running is waited for before the cancellation propagates,
+        so locks the caller holds (e.g. ``game_locks``) cover the whole call.
+
+        Raises:
+            PoolSaturatedError: The pool's queue is full
+        """
+        with self._lock:
+            if self.max_queued and self._queued >= self.max_queued:
+                self._rejected += 1
+                raise PoolSaturatedError(f"Worker pool '{self.name}' is saturated")
+            self._submitted += 1
+            if self._active + self._queued >= self.max_workers:
+                self._saturated += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, self._call, time.perf_counter(), fn, args, kwargs)
+        future.add_done_callback(self._dropped)
+        waiter = asyncio.wrap_future(future)
+        try:
+            return await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                # Already running: it cannot be stopped, so outlive it
+                while not waiter.done():
+                    try:
+                        await asyncio.wait([waiter])
+                    except asyncio.CancelledError:
+                        pass
+                if not waiter.cancelled():
+                    waiter.exception()  # Retrieved; the caller is gone
+            raise
+
+    def _dropped(self, future: Future) -> None:
+        """Done callback: a call cancelled while queued never reaches ``_call``."""
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def _call(self, submitted_at: float, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        started = time.perf_counter()
+        wait_ms = (started - submitted_at) * 1000
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._failed += failed
+                self._run_ms += (time.perf_counter() - started) * 1000
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, current load and wait/run times for /health."""
+        with self._lock:
+            completed = self._completed
+            started = completed + self._active
+            return {
+                "workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "peak_queued": self._peak_queued,
+                "max_queued": self.max_queued,
+                "submitted": self._submitted,
+                "completed": completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                # Submissions that found every worker busy
+                "saturated": self._saturated,
+                "avg_wait_ms": round(self._wait_ms / started, 3) if started else 0.0,
+                "max_wait_ms": round(self._max_wait_ms, 3),
+                "avg_run_ms": round(self._run_ms / completed, 3) if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+class KeyedLocks:
+    """asyncio locks by key (e.g. game id), dropped once nobody holds or awaits them."""
+
+    def __init__(self):
+        # key -> (lock, holders + waiters)
+        self._locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        lock, users = self._locks.get(key) or (asyncio.Lock(), 0)
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class GameStateLocks:
+    """
+    Thread locks by key (game id) around reads and writes of a loaded game.
+
+    Held on the pool thread: by writers for their whole call (unless they
+    step out with ``released``) and by readers while they read.
+    """
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        # key -> (lock, holders + waiters)
+        self._locks: Dict[str, Tuple[threading.Lock, int]] = {}
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        with self._guard:
+            lock, users = self._locks.get(key) or (threading.Lock(), 0)
+            self._locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._guard:
+                lock, users = self._locks[key]
+                if users == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (lock, users - 1)
+
+    @contextmanager
+    def released(self, key: str) -> Iterator[None]:
+        """Let readers in while the holder works without touching the state."""
+        with self._guard:
+            lock, _ = self._locks[key]
+        lock.release()
+        try:
+            yield
+        finally:
+            lock.acquire()
+
+    def __len__(self) -> int:
+        with self._guard:
+            return len(self._locks)
+
+
+_pools: Optional[Dict[str, WorkerPool]] = None
+_pools_lock = threading.Lock()
+game_locks = KeyedLocks()
+game_state_locks = GameStateLocks()
+
+
+def get_worker_pools() -> Dict[str, WorkerPool]:
+    """The process-wide pools, created on first use from the environment."""
+    global _pools
+    if _pools is None:
+        with _pools_lock:
+            if _pools is None:
+                max_queued = int(os.environ.get(MAX_QUEUED_ENV, "0") or 0)
+                _pools = {
+                    name: WorkerPool(name, int(os.environ.get(env, default) or default), max_queued)
+                    for name, (env, default) in POOL_WORKERS.items()
+                }
+    return _pools
+
+
+async def run_blocking(pool: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the named pool (see ``WorkerPool.run``)."""
+    return await get_worker_pools()[pool].run(fn, *args, **kwargs)
+
+
+async def run_game_read(pool: str, game_id: str, fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking read of a game on the named pool, under its state lock."""
+    return await run_blocking(pool, _holding_game_state, game_id, functools.partial(fn, *args))
+
+
+def _holding_game_state(game_id: str, call: Callable[[], T]) -> T:
+    with game_state_locks.hold(game_id):
+        return call()
+
+
+def offload(
+    pool: str,
+    per_game: bool = False,
+    reads_game: bool = False,
+) -> Callable[[Callable[..., T]], Callable[..., Any]]:
+    """
+    Turn a synchronous route handler into an async one that runs on ``pool``.
+
+    FastAPI sees the wrapped function's signature and docstring. A full
+    queue is answered with 503.
+
+    Args:
+        pool: Pool name (DB_POOL or AI_POOL)
+        per_game: Serialize calls per ``game_id`` argument (game writes);
+            the call also holds the game's state lock
+        reads_game: Only hold the ``game_id`` argument's state lock (read-only
+            handlers; they do not wait for queued or planning writers)
+    """
+    def decorate(fn: Callable[..., T]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def endpoint(*args: Any, **kwargs: Any) -> T:
+            try:
+                if not (per_game or reads_game):
+                    return await run_blocking(pool, fn, *args, **kwargs)
+                game_id = kwargs["game_id"]
+                call = functools.partial(fn, *args, **kwargs)
+                if reads_game:
+                    return await run_blocking(pool, _holding_game_state, game_id, call)
+                async with game_locks.hold(game_id):
+                    return await run_blocking(pool, _holding_game_state, game_id, call)
+            except PoolSaturatedError as e:
+                logger.warning(str(e))
+                raise HTTPException(status_code=503, detail="Server busy, please retry")
+        return endpoint
+    return decorate
+
+
+def worker_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-pool metrics for /health."""
+    return {name: pool.stats() for name, pool in get_worker_pools().items()}
+
+
+def shutdown_worker_pools() -> None:
+    """Wait for running work and stop the pools (app shutdown)."""
+    global _pools
+    with _pools_lock:
+        pools, _pools = _pools, None
+    for pool in (pools or {}).values():
+        pool.shutdown()
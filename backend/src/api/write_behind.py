@@ -0,0 +1,230 @@
+"""
+Write-behind persistence for game state.
+
+By default ``GameService.update_game`` writes through: every play, tussle and
+end-turn opens a session, rewrites the game's full ``game_state`` JSON blob
+and commits. With write-behind enabled, updates are instead snapshotted into
+a per-game dirty map and written in batches, so several clicks within one
+interval cost one row write.
+
+Flush triggers:
+
+- Interval: a background thread flushes every dirty game each
+  ``flush_interval`` seconds, in one session and one commit.
+- Turn end and game completion: ``GameService`` flushes the game
+  synchronously (``flush_game``) before returning.
+- Backpressure: the dirty map is bounded (``max_dirty``). Marking a new game
+  while it is full flushes the oldest dirty game in the caller's thread.
+
+Crash safety: turn boundaries, completed games and newly created games are
+always durable when the request returns. A hard crash loses at most the last
+``flush_interval`` seconds of mid-turn actions; a restarted server resumes
+each affected game from the start of the current turn. A clean shutdown
+(``close``) flushes everything. A failed flush keeps the snapshots dirty (a
+newer snapshot for the same game wins) and retries on the next trigger.
+
+Snapshots are taken when a game is marked dirty, on the request's thread, so
+the flush thread never reads a live ``GameState`` that a request is mutating.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (game_id, serialized game_state, denormalized metadata columns)
+GameRow = Tuple[str, Dict[str, Any], Dict[str, Any]]
+
+
+class GameWriteBehind:
+    """
+    Coalescing, bounded write-behind buffer for game rows.
+
+    Args:
+        write_rows: Persists a batch of GameRows in one transaction; raises on
+            failure (``GameService._write_game_rows``)
+        flush_interval: Seconds between background flushes
+        max_dirty: Maximum number of dirty games held before backpressure
+        clock: Monotonic clock for latency metrics (injectable for tests)
+        start_thread: Start the background flush thread. Tests pass False and
+            call ``flush()`` directly.
+    """
+
+    def __init__(
+        self,
+        write_rows: Callable[[List[GameRow]], None],
+        flush_interval: float = 1.0,
+        max_dirty: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+        start_thread: bool = True,
+    ):
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_dirty < 1:
+            raise ValueError("max_dirty must be at least 1")
+        self._write_rows = write_rows
+        self.flush_interval = flush_interval
+        self.max_dirty = max_dirty
+        self._clock = clock
+
+        # game_id -> (state_dict, metadata), oldest first
+        self._dirty: "OrderedDict[str, Tuple[Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes writers so a game's older snapshot never lands after a newer one.
+        self._flush_lock = threading.Lock()
+
+        self._metrics = {
+            "updates": 0,
+            "coalesced_updates": 0,
+            "flushes": 0,
+            "games_written": 0,
+            "flush_errors": 0,
+            "backpressure_flushes": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if start_thread:
+            self._thread = threading.Thread(
+                target=self._run, name="game-write-behind", daemon=True
+            )
+            self._thread.start()
+
+    # -- public API ---------------------------------------------------
+
+    def mark_dirty(self, game_id: str, state_dict: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        """
+        Record the latest snapshot of a game, replacing any unflushed one.
+
+        Flushes the oldest dirty game first if the buffer is full.
+        """
+        with self._lock:
+            self._metrics["updates"] += 1
+            if game_id in self._dirty:
+                self._metrics["coalesced_updates"] += 1
+                self._dirty[game_id] = (state_dict, metadata)
+                self._dirty.move_to_end(game_id)
+                return
+            full = len(self._dirty) >= self.max_dirty
+        if full:
+            with self._flush_lock:
+                with self._lock:
+                    oldest = self._dirty.popitem(last=False) if self._dirty else None
+                    self._metrics["backpressure_flushes"] += 1
+                if oldest is not None:
+                    self._write([(oldest[0], oldest[1][0], oldest[1][1])])
+        with self._lock:
+            self._dirty[game_id] = (state_dict, metadata)
+
+    def is_dirty(self, game_id: str) -> bool:
+        """True if the game has an unflushed snapshot."""
+        with self._lock:
+            return game_id in self._dirty
+
+    def discard(self, game_id: str) -> None:
+        """Drop a game's unflushed snapshot (e.g. the game was deleted)."""
+        with self._lock:
+            self._dirty.pop(game_id, None)
+
+    def flush_game(self, game_id: str) -> bool:
+        """
+        Write one game's pending snapshot now.
+
+        Returns:
+            True if there was something to write
+
+        Raises:
+            Exception: Whatever the write raised; the snapshot stays dirty
+        """
+        with self._flush_lock:
+            with self._lock:
+                entry = self._dirty.pop(game_id, None)
+            if entry is None:
+                return False
+            self._write([(game_id, entry[0], entry[1])], raise_errors=True)
+        return True
+
+    def flush(self) -> int:
+        """
+        Write every dirty game in one batch.
+
+        Returns:
+            Number of games written (0 if the batch failed and was requeued)
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows = [(gid, state, meta) for gid, (state, meta) in self._dirty.items()]
+                self._dirty.clear()
+            if not rows:
+                return 0
+            return len(rows) if self._write(rows) else 0
+
+    def close(self) -> None:
+        """Stop the background thread and flush whatever is still dirty."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Flush latency and dirty-game counters (exposed on /health)."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            dirty = len(self._dirty)
+        flushes = metrics.pop("flushes")
+        total_ms = metrics.pop("total_flush_ms")
+        return {
+            "enabled": True,
+            "flush_interval_ms": int(self.flush_interval * 1000),
+            "max_dirty": self.max_dirty,
+            "dirty_games": dirty,
+            "flushes": flushes,
+            "avg_flush_ms": round(total_ms / flushes, 2) if flushes else 0.0,
+            **{k: round(v, 2) if isinstance(v, float) else v for k, v in metrics.items()},
+        }
+
+    # -- internals ----------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - _write already logs
+                logger.exception("Write-behind flush loop error")
+
+    def _write(self, rows: List[GameRow], raise_errors: bool = False) -> bool:
+        """Write a batch; caller holds _flush_lock so batches land in order."""
+        start = self._clock()
+        try:
+            self._write_rows(rows)
+        except Exception as e:
+            logger.error(f"Write-behind flush of {len(rows)} game(s) failed: {e}")
+            self._requeue(rows)
+            with self._lock:
+                self._metrics["flush_errors"] += 1
+            if raise_errors:
+                raise
+            return False
+        elapsed_ms = (self._clock() - start) * 1000
+        with self._lock:
+            self._metrics["flushes"] += 1
+            self._metrics["games_written"] += len(rows)
+            self._metrics["last_flush_ms"] = elapsed_ms
+            self._metrics["total_flush_ms"] += elapsed_ms
+            self._metrics["max_flush_ms"] = max(self._metrics["max_flush_ms"], elapsed_ms)
+        return True
+
+    def _requeue(self, rows: List[GameRow]) -> None:
+        """Put failed snapshots back unless a newer one arrived meanwhile."""
+        with self._lock:
+            for game_id, state, meta in reversed(rows):
+                if game_id not in self._dirty:
+                    self._dirty[game_id] = (state, meta)
+                    self._dirty.move_to_end(game_id, last=False)
@@ -2,42 +2,31 @@
 
 Single source of truth for facts that several AI modules previously hardcoded
 independently (and which drifted — e.g. one copy was missing Cake). Computed
-once at import time since cards.csv doesn't change at runtime.
+once at import time from the shared card catalog.
 """
-from game_engine.data.card_loader import load_cards_dict
-from game_engine.models.card import CardType
+from game_engine.data.card_catalog import get_card_catalog
 
 
-def _has_play_triggered_gain_charge(effect_definitions: str) -> bool:
-    """True for a bare ``gain_charge:N`` effect (fires when the card is played).
+def _build_charge_gain_on_play() -> dict[str, int]:
+    """Cards with a bare ``gain_charge:N`` effect (fires when the card is played).
 
     Distinguishes the play-triggered ``gain_charge`` from other Charge-gain
     effects whose first colon-segment differs: ``start_of_turn_gain_charge``,
     ``on_card_played_gain_charge``, ``gain_charge_when_broken``.
     """
-    for token in (effect_definitions or "").split(";"):
-        if token.strip().split(":")[0] == "gain_charge":
-            return True
-    return False
-
-
-def _build_charge_gain_on_play() -> dict[str, int]:
     table: dict[str, int] = {}
-    for name, card in load_cards_dict().items():
-        if not _has_play_triggered_gain_charge(card.effect_definitions):
-            continue
-        for token in card.effect_definitions.split(";"):
-            parts = token.strip().split(":")
-            if parts[0] == "gain_charge":
-                table[name] = int(parts[1])
+    for definition in get_card_catalog():
+        for template in definition.effect_templates:
+            if template[0] == "gain_charge":
+                table[definition.name] = int(template[1])
                 break
     return table
 
 
 def _build_action_card_names() -> frozenset[str]:
     return frozenset(
-        name for name, card in load_cards_dict().items()
-        if card.card_type == CardType.ACTION
+        definition.name for definition in get_card_catalog()
+        if definition.is_action()
     )
 
 
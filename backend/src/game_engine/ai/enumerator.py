@@ -24,18 +24,28 @@ plus ``total_charge_spent``, ``charge_available``, ``cards_broken`` and a human-
 per-step Charge are a strict improvement over the LLM's regex-parsed string path.
 """
 
-import contextlib
 import copy
 import itertools
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
+import pickle
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
 from game_engine.game_engine import GameEngine
+from game_engine.models.state_hash import signature_hash
 from game_engine.rules.effects import EffectRegistry
 from game_engine.rules.effects.base_effect import ActivatedEffect
+from game_engine.tracing import TraceRecorder, Tracer, get_tracer, trace_scope
 from game_engine.validation import ActionExecutor, ActionValidator
 
 from .card_metadata import CHARGE_GAIN_ON_PLAY
+from .search_cache import CachedSubtree, SearchCache, Trace
 from .prompts.card_loader import build_card_labels
 
 if TYPE_CHECKING:
@@ -53,27 +63,23 @@ DEFAULT_MAX_TARGET_OPTIONS = 5   # target ids considered per targeted action
 DEFAULT_MAX_TARGET_COMBOS = 8    # multi-target combinations considered per action
 MAX_NODES = 4000                 # hard safety stop on total states expanded
 
+# Set to 1/true to cross-check the incremental state hash against a full
+# recompute from _state_signature at every search node (slow; for debugging).
+DEBUG_STATE_HASH_ENV = "GGLTCG_DEBUG_STATE_HASH"
 
-@contextlib.contextmanager
-def _quiet_simulation_logs():
-    """Silence ActionExecutor's per-play INFO logging during enumeration.
+# Worker processes for root-split enumeration; unset/0/1 searches serially.
+# Processes, not threads: the search is pure Python and holds the GIL.
+ENUM_WORKERS_ENV = "AI_ENUM_WORKERS"
+# Wall-clock budget for one enumeration in ms; unset = bounded only by
+# MAX_NODES and max_actions (see _deepen)
+TIME_BUDGET_ENV = "AI_ENUM_TIME_BUDGET_MS"
+# "spawn" avoids forking a server that holds DB connections and threads
+POOL_START_METHOD = "spawn"
 
-    The DFS drives ``ActionExecutor`` hundreds of times on cloned states; each
-    play would otherwise emit an INFO line ("Playing X with target ..."),
-    flooding the logs with *simulated* (non-real) moves. We raise only that one
-    logger to WARNING for the search and restore it afterward.
-
-    Note: logger levels are process-global, so under heavy concurrency a parallel
-    real action could be briefly de-noised too. Acceptable for the experimental
-    enum path — the window is the (sub-second) enumeration only.
-    """
-    exec_logger = logging.getLogger("game_engine.validation.action_executor")
-    prev = exec_logger.level
-    exec_logger.setLevel(logging.WARNING)
-    try:
-        yield
-    finally:
-        exec_logger.setLevel(prev)
+# Shared across calls so worker start-up is paid once per process
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
 
 
 def clone_game_state(game_state: "GameState") -> "GameState":
@@ -92,9 +98,9 @@ def clone_game_state(game_state: "GameState") -> "GameState":
     ``copy.deepcopy`` reproduces the entire object graph — both hands,
     ``charge_history``, transient Charge tracking, and any dynamic per-card attributes
     (e.g. ``_copied_effects``) — with no references shared back to the original,
-    so mutations during search cannot leak into the live game. It is safe
-    because cards hold no live effect-object references: effects are resolved
-    from ``EffectRegistry`` by the card's data strings, not stored on the card.
+    so mutations during search cannot leak into the live game. Effect objects
+    cached on a card by ``EffectRegistry`` are cloned through the same memo, so
+    their ``source_card`` points at the cloned card, never the original.
     """
     return copy.deepcopy(game_state)
 
@@ -102,9 +108,10 @@ def clone_game_state(game_state: "GameState") -> "GameState":
 def _state_signature(game_state: "GameState") -> Tuple:
     """A canonical, hashable fingerprint of the parts of state that affect search.
 
-    Used as a transposition key so order-equivalent lines that reach the same
-    board (e.g. Surge→Knight vs Knight→Surge) are explored once. Captures each
-    player's Charge, per-card id/stamina/zone, and direct-attack count.
+    Captures each player's Charge, per-card id/stamina/zone, and direct-attack
+    count. The search keys transpositions on ``GameState.get_state_hash()``,
+    the incremental Zobrist hash of the same components; this full rebuild is
+    the reference it is checked against in debug mode (``_check_state_hash``).
     """
     parts: List[Any] = []
     for pid in sorted(game_state.players):
@@ -118,6 +125,26 @@ def _state_signature(game_state: "GameState") -> Tuple:
     return tuple(parts)
 
 
+def _debug_state_hash_enabled() -> bool:
+    """Whether the ``GGLTCG_DEBUG_STATE_HASH`` cross-check is switched on."""
+    return os.getenv(DEBUG_STATE_HASH_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _check_state_hash(game_state: "GameState", state_hash: int) -> None:
+    """Raise if the incremental hash disagrees with a full recompute.
+
+    A mismatch means some mutation path changed hashed state without going
+    through the card/player attribute hooks, so transpositions would be
+    mis-pruned or missed.
+    """
+    expected = signature_hash(_state_signature(game_state))
+    if state_hash != expected:
+        raise RuntimeError(
+            f"State hash drift on turn {game_state.turn_number}: incremental "
+            f"{state_hash:#018x} != recomputed {expected:#018x}"
+        )
+
+
 def _expand_action(va, game_state: "GameState") -> List[Dict[str, Any]]:
     """Expand one ValidAction into concrete, applyable step dicts (one per target choice).
 
@@ -251,27 +278,619 @@ def _action_charge_cost(step: Dict[str, Any], charge_before: int, charge_after:
     return max(0, charge_before - charge_after + gain)
 
 
+class _SequenceSearch:
+    """One depth-limited DFS over the action space (see ``enumerate_sequences``).
+
+    Holds the search's bookkeeping: recorded lines, the transposition table
+    and the node budget. A serial enumeration runs one search from the root; a
+    root split runs one per first action (possibly in worker processes) and
+    merges their ``recorded`` dicts.
+    """
+
+    def __init__(
+        self,
+        player_id: str,
+        card_labels: Dict[str, str],
+        start_broken: Tuple[int, int],
+        *,
+        max_actions: int,
+        use_rollback: bool,
+        verify_state_hash: bool,
+        node_budget: int,
+    ):
+        self.player_id = player_id
+        self.card_labels = card_labels
+        self.start_opp_broken, self.start_own_broken = start_broken
+        self.max_actions = max_actions
+        self.use_rollback = use_rollback
+        self.verify_state_hash = verify_state_hash
+        self.node_budget = node_budget
+        self.nodes_expanded = 0
+        self.children_applied = 0
+        # multiset-of-steps signature -> best recorded sequence (order-equivalent dedupe)
+        self.recorded: Dict[frozenset, Dict[str, Any]] = {}
+        # state hash -> shallowest depth it was expanded at. A plain set would be
+        # depth-insensitive: reaching a state via a *longer* path first would prune a
+        # later *shorter* path that still has more depth budget under max_actions,
+        # dropping valid (possibly best) continuations. Tracking the min depth lets us
+        # re-expand when we arrive with more budget to spend.
+        self.expanded_depth: Dict[int, int] = {}
+        self.root_engine: Optional[GameEngine] = None
+        self.root_validator: Optional[ActionValidator] = None
+        # Set by bind_root inside the search's trace scope; None when not tracing
+        self.tracer: Optional[Tracer] = None
+        # Iterative deepening (see _deepen): wall-clock deadline, move scores
+        # from the previous iteration, and this iteration's scores
+        self.deadline: Optional[float] = None
+        self.move_order: Optional[Dict[Tuple, Tuple]] = None
+        self.move_scores: Dict[Tuple, Tuple] = {}
+        # Longest line recorded / whether max_actions cut any line short
+        self.depth_reached = 0
+        self.depth_cut = False
+        # Lines not explored because of the depth limit or node budget, and
+        # positions skipped as transpositions; a subtree with neither is
+        # exhaustive (the root only needs no cuts: a fresh search from it
+        # skips the same transpositions)
+        self.cuts = 0
+        self.transpositions = 0
+        # With a SearchCache: every recorded line, and exhaustive subtrees as
+        # state hash -> (first trace, end trace, depth)
+        self.traces: Optional[List[Trace]] = None
+        self.subtrees: Dict[int, Tuple[int, int, int]] = {}
+
+    def bind_root(self, root: "GameState") -> None:
+        """Share one engine and validator for in-place (rollback) search of ``root``.
+
+        Call inside the search's ``trace_scope`` so the tracer sees its recorder.
+        """
+        self.root_engine = GameEngine(root)
+        self.root_validator = ActionValidator(self.root_engine)
+        self.tracer = get_tracer(logger)
+
+    def record(self, state: "GameState", path: List[Dict[str, Any]], costs: List[int]) -> Tuple:
+        # The empty path is the explicit "pass" line (do nothing, then end_turn);
+        # recording it keeps behavior consistent with _expand_action's "every
+        # prefix is recorded" contract and always gives the selector a pass option.
+        player_id = self.player_id
+        opp_broken = len(state.get_opponent(player_id).break_zone)
+        me = state.players[player_id]
+        own_broken = len(me.break_zone)
+        wins = state.winner_id == player_id
+        actions = _format_actions(path, state)
+        if self.traces is not None:
+            self.traces.append((
+                path, costs, tuple(dict(a) for a in actions),
+                opp_broken, own_broken, me.charge, wins,
+            ))
+
+        candidate = _candidate(
+            path, costs, actions,
+            opp_broken - self.start_opp_broken, own_broken - self.start_own_broken,
+            me.charge, wins, self.card_labels,
+        )
+        _keep_best(self.recorded, _multiset_signature(path), candidate)
+        if len(path) > self.depth_reached:
+            self.depth_reached = len(path)
+        return _rank_key(candidate)
+
+    def dfs(self, state: "GameState", path: List[Dict[str, Any]], costs: List[int]) -> Optional[Tuple]:
+        """Search below ``state``; return the best rank key recorded in the subtree.
+
+        Returns None if the state was pruned as a transposition (its subtree
+        was scored where it was first expanded).
+        """
+        best = self.record(state, path, costs)
+
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise _SearchTimeout()
+        if len(path) >= self.max_actions:
+            if state.winner_id is None:
+                self.depth_cut = True
+                self.cuts += 1
+            return best
+        if state.winner_id is not None:
+            return best
+        if self.node_budget <= 0:
+            self.cuts += 1
+            return best
+        sig = state.get_state_hash()
+        if self.verify_state_hash:
+            _check_state_hash(state, sig)
+        # Prune only if we already expanded this state at an equal-or-shallower
+        # depth (i.e. with at least as much remaining budget). Arriving via a
+        # shorter path means more depth left, so re-expand and update the record.
+        prev_depth = self.expanded_depth.get(sig)
+        if prev_depth is not None and prev_depth <= len(path):
+            self.transpositions += 1
+            if self.tracer:
+                self.tracer.event("transposition", depth=len(path), expanded_at=prev_depth)
+            return None
+        self.expanded_depth[sig] = len(path)
+        self.node_budget -= 1
+        self.nodes_expanded += 1
+        # This node's own trace was just recorded (see SearchCache)
+        trace_start = len(self.traces) - 1 if self.traces is not None else 0
+        cuts_before, transpositions_before = self.cuts, self.transpositions
+
+        use_rollback = self.use_rollback
+        if use_rollback:
+            engine, validator = self.root_engine, self.root_validator
+            checkpoint = state.checkpoint()
+        else:
+            engine = GameEngine(state)
+            validator = ActionValidator(engine)
+        valid = validator.get_valid_actions(self.player_id, filter_for_ai=True)
+        steps = [step for va in valid for step in _expand_action(va, state)]
+        if self.tracer:
+            self.tracer.event("expand", depth=len(path), steps=len(steps),
+                              path=[_step_key(st) for st in path])
+        if self.move_order is not None:
+            # Most promising moves (per the previous iteration) first; the
+            # sort is stable, so unscored moves keep their generated order.
+            move_order = self.move_order
+            steps.sort(key=lambda st: move_order.get((sig, _step_key(st)), _UNSCORED), reverse=True)
+        for step in steps:
+            if use_rollback:
+                child, child_engine = state, engine
+            else:
+                child = clone_game_state(state)
+                child_engine = GameEngine(child)
+            cost = self.apply(child_engine, step)
+            if cost is not None:
+                sub = self.dfs(child, path + [step], costs + [cost])
+                if sub is not None:
+                    self.move_scores[(sig, _step_key(step))] = sub
+                    if sub > best:
+                        best = sub
+            if use_rollback:
+                # Undo the step (and everything the subtree did) before the next sibling;
+                # a failed step may have partially mutated the state too.
+                state.rollback(checkpoint)
+        if self.traces is not None and self.cuts == cuts_before and (
+            not path or self.transpositions == transpositions_before
+        ):
+            # Nothing below was cut short: the subtree is exhaustive and cacheable
+            self.subtrees[sig] = (trace_start, len(self.traces), len(path))
+        return best
+
+    def apply(self, engine: GameEngine, step: Dict[str, Any]) -> Optional[int]:
+        """Apply ``step``; return its real Charge cost, or None if it was rejected."""
+        player = engine.game_state.players[self.player_id]
+        charge_before = player.charge
+        if not _apply_step(engine, self.player_id, step):
+            if self.tracer:
+                self.tracer.event("step_rejected", step=_step_key(step))
+            return None
+        self.children_applied += 1
+        cost = _action_charge_cost(step, charge_before, player.charge)
+        step["charge_cost"] = cost  # real engine-derived cost (e.g. Raggy tussle = 0)
+        return cost
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the DFS when the wall-clock budget runs out."""
+
+
+# Sorts below every real rank key (their first element is 0 or 1)
+_UNSCORED: Tuple = (float("-inf"),)
+
+
+def _step_key(step: Dict[str, Any]) -> Tuple:
+    return (step["action_type"], step["card_id"], step["target_ids"])
+
+
+def _deepen(search: _SequenceSearch, root: "GameState", max_actions: int,
+            time_budget: float) -> Dict[str, Any]:
+    """Iterative deepening under a wall-clock budget.
+
+    Searches to depth 1, 2, ... ``max_actions``, each iteration ordering
+    moves by the best line found below them in the previous one, until the
+    deadline hits, the tree is exhausted, or an iteration runs out of nodes.
+    Lines recorded by an interrupted iteration are kept, so the result is
+    always the best found so far (at least the pass line).
+
+    Returns:
+        Deepening counters for the stats dict
+    """
+    search.deadline = time.monotonic() + time_budget
+    completed = 0
+    iterations = 0
+    timed_out = False
+    checkpoint = root.checkpoint() if search.use_rollback else None
+    # max_actions=0 still needs one (root-only) pass to record the pass line
+    for depth in range(1, max_actions + 1) if max_actions > 0 else [0]:
+        iterations += 1
+        search.max_actions = depth
+        search.node_budget = MAX_NODES
+        search.expanded_depth = {}
+        search.depth_cut = False
+        search.move_scores = {}
+        try:
+            search.dfs(root, [], [])
+        except _SearchTimeout:
+            timed_out = True
+            break
+        finally:
+            if checkpoint is not None:
+                root.rollback(checkpoint)
+        completed = depth
+        search.move_order = search.move_scores
+        if not search.depth_cut or search.node_budget <= 0:
+            break  # deeper iterations would find nothing new
+    return {
+        "depth_completed": completed,
+        "iterations": iterations,
+        "timed_out": timed_out,
+    }
+
+
+def _multiset_signature(path: List[Dict[str, Any]]) -> frozenset:
+    """frozenset of (step signature, count): order-equivalent paths collide."""
+    sig_counts: Dict[Tuple, int] = {}
+    for s in path:
+        key = _step_key(s)
+        sig_counts[key] = sig_counts.get(key, 0) + 1
+    return frozenset(sig_counts.items())
+
+
+def _candidate(path: List[Dict[str, Any]], costs: List[int], actions: List[Dict[str, Any]],
+               cards_broken: int, own_broken: int, charge_left: int, wins: bool,
+               card_labels: Dict[str, str]) -> Dict[str, Any]:
+    """Sequence dict for one line, with its internal ranking fields.
+
+    ``cards_broken``/``own_broken`` are break-zone growth since the search
+    root. Own breaks are net: Wake/Sun move cards back out of the break zone,
+    so a Drop+Wake recovery combo nets to 0 (no penalty); only a self-break
+    with no payoff leaves the count positive.
+    """
+    cards_broken = max(0, cards_broken)
+    total_charge_spent = sum(costs)
+    charge_wasted = charge_left  # leftover Charge the line did not spend
+    charge_available = total_charge_spent + charge_wasted
+    return {
+        "actions": actions,
+        "total_charge_spent": total_charge_spent,
+        "charge_available": charge_available,
+        "cards_broken": cards_broken,
+        "raw_string": _raw_string(path, total_charge_spent, charge_available, cards_broken, card_labels),
+        # internal ranking fields (ignored by downstream consumers)
+        "_wins": wins,
+        "_own_broken": max(0, own_broken),
+        "_charge_wasted": charge_wasted,
+        "_length": len(path),
+    }
+
+
+def _answer_from_cache(subtree: CachedSubtree, root: "GameState", player_id: str,
+                       card_labels: Dict[str, str], max_actions: int) -> Tuple[Dict[frozenset, Dict[str, Any]], int]:
+    """Rebuild a search's recorded lines from a cached subtree.
+
+    Each trace recorded under the cached position contributes its suffix
+    from that position, re-scored against ``root`` (same state hash, so the
+    same board) and labelled with ``root``'s card labels.
+
+    Returns:
+        (recorded lines, longest line length)
+    """
+    start_opp = len(root.get_opponent(player_id).break_zone)
+    start_own = len(root.players[player_id].break_zone)
+    depth = subtree.depth
+    recorded: Dict[frozenset, Dict[str, Any]] = {}
+    longest = 0
+    for steps, costs, actions, opp_broken, own_broken, charge_left, wins in (
+        subtree.traces[subtree.start:subtree.end]
+    ):
+        suffix = steps[depth:]
+        if len(suffix) > max_actions:
+            continue
+        candidate = _candidate(
+            suffix, costs[depth:], [dict(a) for a in actions[depth:]],
+            opp_broken - start_opp, own_broken - start_own, charge_left, wins, card_labels,
+        )
+        _keep_best(recorded, _multiset_signature(suffix), candidate)
+        longest = max(longest, len(suffix))
+    return recorded, longest
+
+
+def _keep_best(recorded: Dict[frozenset, Dict[str, Any]], sig: frozenset,
+               candidate: Dict[str, Any]) -> None:
+    """Record ``candidate`` under ``sig`` unless an equal-or-better line is there."""
+    prev = recorded.get(sig)
+    if prev is None or _rank_key(candidate) > _rank_key(prev):
+        recorded[sig] = candidate
+
+
+def enumeration_workers() -> int:
+    """Worker processes for root-split enumeration (``AI_ENUM_WORKERS``; 0 = serial)."""
+    raw = os.getenv(ENUM_WORKERS_ENV, "").strip()
+    if not raw:
+        return 0
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {ENUM_WORKERS_ENV}={raw!r}")
+        return 0
+
+
+def enumeration_time_budget() -> Optional[float]:
+    """Wall-clock budget in seconds (``AI_ENUM_TIME_BUDGET_MS``), or None if unbounded."""
+    raw = os.getenv(TIME_BUDGET_ENV, "").strip()
+    if not raw:
+        return None
+    try:
+        budget_ms = float(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {TIME_BUDGET_ENV}={raw!r}")
+        return None
+    return budget_ms / 1000 if budget_ms > 0 else None
+
+
+class EnumerationMetrics:
+    """
+    Process-wide enumeration latency and depth counters.
+
+    Keeps totals plus the most recent ``window`` runs for latency
+    percentiles, so an AI-turn latency SLO can be watched on /health.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._window = window
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._runs = 0
+            self._timed_out = 0
+            self._cache_hits = 0
+            self._nodes = 0
+            self._seconds = 0.0
+            self._recent: Deque[Tuple[float, int]] = deque(maxlen=self._window)
+
+    def record(self, run_stats: Dict[str, Any]) -> None:
+        elapsed_ms = run_stats["elapsed_ms"]
+        with self._lock:
+            self._runs += 1
+            self._timed_out += int(bool(run_stats.get("timed_out")))
+            self._cache_hits += int(bool(run_stats.get("cache_hit")))
+            self._nodes += run_stats["nodes_expanded"]
+            self._seconds += elapsed_ms / 1000
+            self._recent.append((elapsed_ms, run_stats["depth_reached"]))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = list(self._recent)
+            runs, timed_out, nodes, seconds = self._runs, self._timed_out, self._nodes, self._seconds
+            cache_hits = self._cache_hits
+        latencies = sorted(ms for ms, _ in recent)
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            "runs": runs,
+            "timed_out": timed_out,
+            "cache_hits": cache_hits,
+            "time_budget_ms": (
+                int(budget * 1000) if (budget := enumeration_time_budget()) is not None else None
+            ),
+            "nodes_per_sec": round(nodes / seconds) if seconds > 0 else 0,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": latencies[-1] if latencies else None,
+            "avg_depth_reached": (
+                round(sum(depth for _, depth in recent) / len(recent), 2) if recent else None
+            ),
+        }
+
+
+_metrics = EnumerationMetrics()
+
+
+def get_enumeration_metrics() -> Dict[str, Any]:
+    """Enumeration latency/depth metrics for this process (reported on /health)."""
+    return _metrics.snapshot()
+
+
+def reset_enumeration_metrics() -> None:
+    """Clear the enumeration metrics (useful for testing)."""
+    _metrics.reset()
+
+
+def _get_pool(workers: int) -> Executor:
+    """The shared enumeration process pool, (re)created for ``workers`` processes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(POOL_START_METHOD),
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_enumeration_pool() -> None:
+    """Stop the enumeration worker processes, if any were started."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def _search_branch(
+    root_blob: bytes,
+    branch: int,
+    player_id: str,
+    step: Dict[str, Any],
+    card_labels: Dict[str, str],
+    start_broken: Tuple[int, int],
+    max_actions: int,
+    use_rollback: bool,
+    verify_state_hash: bool,
+    node_budget: int,
+) -> Tuple[Dict[frozenset, Dict[str, Any]], int, int]:
+    """Search the subtree under one first action (runs in a worker process).
+
+    ``root_blob`` is the pickled root state; each branch unpickles its own
+    copy and searches it in place. The engine's random choices (a direct
+    attack breaks a random hand card) are seeded with the branch index, so a
+    branch's result does not depend on which process ran it; the caller's
+    ``random`` state is restored afterwards.
+
+    Returns:
+        (recorded lines, nodes expanded, children applied)
+    """
+    search = _SequenceSearch(
+        player_id, card_labels, start_broken,
+        max_actions=max_actions, use_rollback=use_rollback,
+        verify_state_hash=verify_state_hash, node_budget=node_budget,
+    )
+    root = pickle.loads(root_blob)
+    random_state = random.getstate()
+    random.seed(branch)
+    try:
+        with trace_scope(simulated=True):
+            search.bind_root(root)
+            cost = search.apply(search.root_engine, step)
+            if cost is not None:
+                search.dfs(root, [step], [cost])
+    finally:
+        random.setstate(random_state)
+    return search.recorded, search.nodes_expanded, search.children_applied
+
+
+def _root_split(search: _SequenceSearch, root: "GameState", workers: int) -> None:
+    """Expand the root, then search each first action's subtree on the pool.
+
+    Each branch gets an equal share of the remaining node budget and its own
+    transposition table, so a branch's result does not depend on the others
+    or on scheduling. Branch results are merged in root-action order, which
+    keeps the final ranking deterministic for a given state.
+    """
+    search.record(root, [], [])
+    if search.max_actions <= 0 or root.winner_id is not None:
+        return
+    search.node_budget -= 1
+    search.nodes_expanded += 1
+    search.expanded_depth[root.get_state_hash()] = 0
+    valid = search.root_validator.get_valid_actions(search.player_id, filter_for_ai=True)
+    steps = [step for va in valid for step in _expand_action(va, root)]
+    if not steps:
+        return
+
+    budget = max(1, search.node_budget // len(steps))
+    args = (
+        search.card_labels, (search.start_opp_broken, search.start_own_broken),
+        search.max_actions, search.use_rollback, search.verify_state_hash, budget,
+    )
+    root_blob = pickle.dumps(root, protocol=pickle.HIGHEST_PROTOCOL)
+    pool = _get_pool(workers)
+    try:
+        futures = [
+            pool.submit(_search_branch, root_blob, branch, search.player_id, step, *args)
+            for branch, step in enumerate(steps)
+        ]
+        results = [future.result() for future in futures]
+    except BrokenExecutor as e:
+        # A worker died (e.g. OOM); finish this turn in-process
+        logger.warning(f"enumerator: worker pool failed ({e}); searching branches serially")
+        shutdown_enumeration_pool()
+        results = [
+            _search_branch(root_blob, branch, search.player_id, step, *args)
+            for branch, step in enumerate(steps)
+        ]
+
+    for recorded, nodes, children in results:
+        search.node_budget -= nodes
+        search.nodes_expanded += nodes
+        search.children_applied += children
+        for sig, candidate in recorded.items():
+            _keep_best(search.recorded, sig, candidate)
+            search.depth_reached = max(search.depth_reached, candidate["_length"])
+
+
 def enumerate_sequences(
     game_state: "GameState",
     player_id: str,
     *,
     max_actions: int = DEFAULT_MAX_ACTIONS,
     max_sequences: int = DEFAULT_MAX_SEQUENCES,
+    use_rollback: bool = True,
+    stats: Optional[Dict[str, Any]] = None,
+    verify_state_hash: Optional[bool] = None,
+    workers: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    cache: Optional[SearchCache] = None,
+    trace: Optional[TraceRecorder] = None,
 ) -> List[Dict[str, Any]]:
     """Enumerate legal action sequences for ``player_id`` from ``game_state``.
 
-    Depth-limited DFS over the real action space on cloned states. Every prefix
+    Depth-limited DFS over the real action space on a cloned state. Every prefix
     is a valid "do these actions, then end turn" line, so each is recorded;
     order-equivalent lines are de-duplicated and the result is ranked
     (winning → most breaks → least Charge wasted → shortest) and capped at
     ``max_sequences``.
 
+    The live ``game_state`` is cloned once. With ``use_rollback`` (the default)
+    the search then applies each move in place on that clone and undoes it via
+    ``GameState.checkpoint``/``rollback``, sharing one engine and validator.
+    ``use_rollback=False`` deep-clones every child instead; it explores the
+    same tree and is kept as the reference path for benchmarks
+    (``scripts/benchmark_enumerator.py``).
+
+    With ``workers`` > 1 (default: the ``AI_ENUM_WORKERS`` env var) the search
+    is split at the root: each first action's subtree is searched in a worker
+    process with an equal share of ``MAX_NODES`` and the results are merged
+    (see ``_root_split``). Branches do not share a transposition table, so the
+    split can record lines the serial search pruned; for a given state its
+    result does not depend on the worker count.
+
+    With ``time_budget`` (seconds; default: the ``AI_ENUM_TIME_BUDGET_MS`` env
+    var, unset = unbounded) the search instead deepens iteratively — depth
+    1, 2, ... ``max_actions`` — ordering moves by the previous iteration's
+    results, and returns the best lines found when the deadline hits (see
+    ``_deepen``). The budgeted search is serial.
+
+    If ``stats`` is given it is filled with search counters
+    (``nodes_expanded``, ``children_applied``, ``workers``, ``depth_reached``,
+    ``elapsed_ms``, ``nodes_per_sec``, plus ``depth_completed``,
+    ``iterations`` and ``timed_out`` for a budgeted search, ``cache_hit`` with
+    a cache). Every call is also added to the process-wide
+    ``get_enumeration_metrics()``.
+
+    With a ``cache`` (one per planner, reused across the turn; see
+    ``search_cache``), a position that an earlier search this turn explored
+    exhaustively is answered from that search's lines without searching
+    again, and a serial search stores its own results for later calls.
+
+    The search runs in a simulated ``game_engine.tracing`` scope: the
+    executor does not log its simulated plays at INFO, and the engine's
+    per-decision events (expansions, transpositions, rejected steps, target
+    and tussle filtering) are traced only when DEBUG is enabled or a
+    ``trace`` recorder is given (it collects them for this search only;
+    root-split branches in worker processes are not recorded).
+
+    Transpositions are keyed on the incremental ``GameState.get_state_hash()``.
+    ``verify_state_hash`` (default: the ``GGLTCG_DEBUG_STATE_HASH`` env flag)
+    recomputes the hash from scratch at every node and raises on a mismatch.
+
     Returns sequence dicts matching ``parse_sequences_response``'s shape so the
     rest of the V4 pipeline (validation cross-check, ``add_tactical_labels``,
-    strategic selection, ``convert_sequence_to_turn_plan``) is unchanged.
+    strategic selection, ``convert_sequence_to_turn_plan``) is unchanged. Each
+    also carries its ``rank_key`` tuple for local selectors
+    (``selectors.HeuristicSelector``).
     """
-    start_opp_broken = len(game_state.get_opponent(player_id).break_zone)
-    start_own_broken = len(game_state.players[player_id].break_zone)
+    start_broken = (
+        len(game_state.get_opponent(player_id).break_zone),
+        len(game_state.players[player_id].break_zone),
+    )
 
     # Built once from the root state, before any simulated action moves cards
     # between zones. Card ids are stable through deepcopy, so this same
@@ -280,88 +899,62 @@ def enumerate_sequences(
     # for its board legend (see build_card_labels' docstring).
     card_labels = build_card_labels(game_state, player_id)
 
-    # multiset-of-steps signature -> best recorded sequence (order-equivalent dedupe)
-    recorded: Dict[frozenset, Dict[str, Any]] = {}
-    # state signature -> shallowest depth it was expanded at. A plain set would be
-    # depth-insensitive: reaching a state via a *longer* path first would prune a
-    # later *shorter* path that still has more depth budget under max_actions,
-    # dropping valid (possibly best) continuations. Tracking the min depth lets us
-    # re-expand when we arrive with more budget to spend.
-    expanded_depth: Dict[Tuple, int] = {}
-    node_budget = [MAX_NODES]
-
-    def record(state: "GameState", path: List[Dict[str, Any]], costs: List[int]) -> None:
-        # The empty path is the explicit "pass" line (do nothing, then end_turn);
-        # recording it keeps behavior consistent with _expand_action's "every
-        # prefix is recorded" contract and always gives the selector a pass option.
-        # frozenset of (signature, count) makes order-equivalent paths collide.
-        sig_counts: Dict[Tuple, int] = {}
-        for s in path:
-            key = (s["action_type"], s["card_id"], s["target_ids"])
-            sig_counts[key] = sig_counts.get(key, 0) + 1
-        multiset_sig = frozenset(sig_counts.items())
-
-        opp = state.get_opponent(player_id)
-        me = state.players[player_id]
-        cards_broken = max(0, len(opp.break_zone) - start_opp_broken)
-        # Net own cards left broken by this line. Wake/Sun move cards back out of
-        # the break zone, so a Drop+Wake recovery combo nets to 0 (no penalty);
-        # only a self-break with no payoff leaves the count positive.
-        own_broken = max(0, len(me.break_zone) - start_own_broken)
-        wins = state.winner_id == player_id
-        total_charge_spent = sum(costs)
-        charge_wasted = me.charge  # leftover Charge the line did not spend
-        charge_available = total_charge_spent + charge_wasted
-
-        candidate = {
-            "actions": _format_actions(path, state),
-            "total_charge_spent": total_charge_spent,
-            "charge_available": charge_available,
-            "cards_broken": cards_broken,
-            "raw_string": _raw_string(path, total_charge_spent, charge_available, cards_broken, card_labels),
-            # internal ranking fields (ignored by downstream consumers)
-            "_wins": wins,
-            "_own_broken": own_broken,
-            "_charge_wasted": charge_wasted,
-            "_length": len(path),
-        }
-        prev = recorded.get(multiset_sig)
-        if prev is None or _rank_key(candidate) > _rank_key(prev):
-            recorded[multiset_sig] = candidate
-
-    def dfs(state: "GameState", path: List[Dict[str, Any]], costs: List[int]) -> None:
-        record(state, path, costs)
-
-        if len(path) >= max_actions or node_budget[0] <= 0 or state.winner_id is not None:
-            return
-        sig = _state_signature(state)
-        # Prune only if we already expanded this state at an equal-or-shallower
-        # depth (i.e. with at least as much remaining budget). Arriving via a
-        # shorter path means more depth left, so re-expand and update the record.
-        prev_depth = expanded_depth.get(sig)
-        if prev_depth is not None and prev_depth <= len(path):
-            return
-        expanded_depth[sig] = len(path)
-        node_budget[0] -= 1
-
-        engine = GameEngine(state)
-        valid = ActionValidator(engine).get_valid_actions(player_id, filter_for_ai=True)
-        for va in valid:
-            for step in _expand_action(va, state):
-                child = clone_game_state(state)
-                child_engine = GameEngine(child)
-                charge_before = child.players[player_id].charge
-                if not _apply_step(child_engine, player_id, step):
-                    continue
-                charge_after = child.players[player_id].charge
-                cost = _action_charge_cost(step, charge_before, charge_after)
-                step["charge_cost"] = cost  # real engine-derived cost (e.g. Raggy tussle = 0)
-                dfs(child, path + [step], costs + [cost])
+    if verify_state_hash is None:
+        verify_state_hash = _debug_state_hash_enabled()
+    if workers is None:
+        workers = enumeration_workers()
+    if time_budget is None:
+        time_budget = enumeration_time_budget()
+    search = _SequenceSearch(
+        player_id, card_labels, start_broken,
+        max_actions=max_actions, use_rollback=use_rollback,
+        verify_state_hash=verify_state_hash, node_budget=MAX_NODES,
+    )
 
+    started = time.perf_counter()
+    run_stats: Dict[str, Any] = {}
     root = clone_game_state(game_state)
-    with _quiet_simulation_logs():
-        dfs(root, [], [])
-
+    cached = None
+    if cache is not None:
+        turn_key = (game_state.game_id, game_state.turn_number, player_id)
+        cache.start_turn(turn_key)
+        cached = cache.lookup(turn_key, root.get_state_hash())
+        if cached is None and cache.has_room(turn_key) and time_budget is None and workers <= 1:
+            search.traces = []
+    if cached is not None:
+        search.recorded, search.depth_reached = _answer_from_cache(
+            cached, root, player_id, card_labels, max_actions
+        )
+        workers = 1
+    else:
+        with trace_scope(simulated=True, recorder=trace):
+            search.bind_root(root)
+            if time_budget is not None:
+                workers = 1
+                run_stats.update(_deepen(search, root, max_actions, time_budget))
+            elif workers > 1:
+                _root_split(search, root, workers)
+            else:
+                search.dfs(root, [], [])
+    elapsed = time.perf_counter() - started
+    if search.traces is not None:
+        cache.store(turn_key, search.traces, search.subtrees)
+    if cache is not None:
+        run_stats["cache_hit"] = cached is not None
+
+    run_stats.update({
+        "nodes_expanded": search.nodes_expanded,
+        "children_applied": search.children_applied,
+        "workers": workers if workers > 1 else 1,
+        "depth_reached": search.depth_reached,
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "nodes_per_sec": round(search.nodes_expanded / elapsed) if elapsed > 0 else 0,
+    })
+    _metrics.record(run_stats)
+    if stats is not None:
+        stats.update(run_stats)
+
+    recorded = search.recorded
     # recorded always contains at least the empty "pass" line (recorded at the
     # root), so sequences is never empty.
     ranked = sorted(recorded.values(), key=_rank_key, reverse=True)
@@ -373,7 +966,8 @@ def enumerate_sequences(
         sequences.append(pass_seq)
     else:
         sequences = ranked[:max_sequences]
-    for seq in sequences:  # strip internal ranking fields
+    for seq in sequences:  # strip internal ranking fields, keeping their rank
+        seq["rank_key"] = _rank_key(seq)  # used by selectors.HeuristicSelector
         for k in ("_wins", "_own_broken", "_charge_wasted", "_length"):
             seq.pop(k, None)
 
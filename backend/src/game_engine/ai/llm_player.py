@@ -6,11 +6,21 @@ Phase 1: TurnPlanner generates a complete turn plan (deterministic action-sequen
 enumeration + one Gemini strategic-selection call).
 Phase 2: Each planned action is matched to an available action — a heuristic
 match first, falling back to a small LLM execution call only when ambiguous.
+
+With a local ``SequenceSelector`` (see ``selectors``), Phase 1 makes no LLM
+call and no provider is built, so the player runs without an API key.
+
+A player holds the plan and decision state of the game it is playing, so the
+API keeps one per game (``get_ai_player(game_id)``); the per-game players
+share one provider (client, request gate and rate limiter).
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -29,6 +39,10 @@ from api.schemas import ValidAction
 from .providers import build_provider
 from .rate_limiter import BudgetExhaustedError
 
+if TYPE_CHECKING:
+    from .selectors import SequenceSelector
+    from .prompts.schemas import TurnPlan
+
 
 class LLMPlayer:
     """
@@ -40,6 +54,9 @@ class LLMPlayer:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         rate_limiter: Optional[Any] = None,
+        selector: Optional['SequenceSelector'] = None,
+        selector_cache: bool = True,
+        provider_client: Optional[Any] = None,
     ):
         """
         Initialize the AI player.
@@ -49,11 +66,32 @@ class LLMPlayer:
             model: Model to use (defaults to GEMINI_MODEL / providers.DEFAULT_MODEL)
             rate_limiter: Optional rate/budget limiter forwarded to the Gemini
                 provider. Defaults to a no-op limiter (no behavior change).
+            selector: Optional local SequenceSelector that replaces the
+                strategic-selection LLM call. When given, no Gemini provider
+                is built and the player makes no LLM calls at all.
+            selector_cache: Reuse cached strategic-selector responses for
+                repeated positions (see ``selector_cache``); False bypasses
+                the cache, e.g. for evaluation runs
+            provider_client: Optional already-built Gemini provider to share
+                (see ``spawn``); its config replaces api_key/model
         """
-        self.provider_client, config = build_provider(api_key=api_key, model=model, rate_limiter=rate_limiter)
-        self.api_key = config.api_key
-        self.model_name = config.model
-        self.fallback_model = config.fallback_model
+        self.selector = selector
+        self.selector_cache = selector_cache
+        if selector is not None:
+            self.provider_client = None
+            self.api_key = None
+            self.model_name = selector.name
+            self.fallback_model = None
+        elif provider_client is not None:
+            self.provider_client = provider_client
+            self.api_key = provider_client.config.api_key
+            self.model_name = provider_client.config.model
+            self.fallback_model = provider_client.config.fallback_model
+        else:
+            self.provider_client, config = build_provider(api_key=api_key, model=model, rate_limiter=rate_limiter)
+            self.api_key = config.api_key
+            self.model_name = config.model
+            self.fallback_model = config.fallback_model
         self.client = getattr(self.provider_client, "client", None)
 
         from .turn_planner import TurnPlanner
@@ -75,11 +113,21 @@ class LLMPlayer:
             provider_client=self.provider_client,
             model_name=self.model_name,
             fallback_model=self.fallback_model,
+            selector=selector,
+            use_response_cache=selector_cache,
         )
 
         logger.debug("Initialized LLMPlayer (model: %s)", self.model_name)
         logger.debug("Fallback model: %s", self.fallback_model)
 
+    def spawn(self) -> 'LLMPlayer':
+        """A fresh player (no plan state) sharing this player's provider and selector."""
+        return LLMPlayer(
+            selector=self.selector,
+            selector_cache=self.selector_cache,
+            provider_client=self.provider_client,
+        )
+
     def select_action(
         self,
         game_state: 'GameState',
@@ -108,28 +156,58 @@ class LLMPlayer:
 
         logger.debug(f"🤖 AI Turn {game_state.turn_number} - {len(valid_actions)} actions available")
 
-        # Check if we need a new plan
         if self._needs_new_plan(game_state):
             self._create_turn_plan(game_state, ai_player_id, game_engine)
+        if self._replan_warranted(game_state, ai_player_id, valid_actions):
+            self._create_turn_plan(game_state, ai_player_id, game_engine)
+        return self._next_action(valid_actions, game_state, ai_player_id, game_engine)
+
+    async def select_action_async(
+        self,
+        game_state: 'GameState',
+        ai_player_id: str,
+        valid_actions: list['ValidAction'],
+        game_engine=None
+    ) -> Optional[tuple[int, str]]:
+        """
+        ``select_action`` with turn planning awaited
+        (``TurnPlanner.create_plan_async``) instead of blocking a thread, so
+        many games can plan concurrently on one event loop.
+        """
+        if not valid_actions:
+            logger.warning("No valid actions available for AI")
+            return None
+
+        if self._needs_new_plan(game_state):
+            await self._create_turn_plan_async(game_state, ai_player_id, game_engine)
+        if self._replan_warranted(game_state, ai_player_id, valid_actions):
+            await self._create_turn_plan_async(game_state, ai_player_id, game_engine)
+        if self.provider_client is not None:
+            # An ambiguous plan step falls back to a (blocking) execution call
+            return await asyncio.to_thread(
+                self._next_action, valid_actions, game_state, ai_player_id, game_engine
+            )
+        return self._next_action(valid_actions, game_state, ai_player_id, game_engine)
 
-        # Execute next action from plan
+    def _next_action(
+        self,
+        valid_actions: list['ValidAction'],
+        game_state: 'GameState',
+        ai_player_id: str,
+        game_engine,
+    ) -> Optional[tuple[int, str]]:
+        """Execute the next planned action, or end the turn when none is left."""
         if self._current_plan and self._plan_action_index < len(self._current_plan.action_sequence):
             return self._execute_planned_action(valid_actions, game_state, ai_player_id, game_engine)
-        else:
-            # Plan was exhausted (not absent) — check if a mid-turn re-plan is warranted
-            if self._current_plan is not None:
-                result = self._maybe_replan(game_state, ai_player_id, valid_actions, game_engine)
-                if result is not None:
-                    return result
-            # No plan, or no re-plan warranted — the enumerator always includes
-            # "pass" as a legal sequence, so a missing/exhausted plan just means
-            # ending the turn. Find end_turn directly rather than falling back
-            # to a second selection path.
-            logger.debug("Plan exhausted or absent, ending turn")
-            for i, action in enumerate(valid_actions):
-                if action.action_type == "end_turn" or "end turn" in action.description.lower():
-                    return (i, "[fallback] Plan exhausted, ending turn")
-            return None
+        # No plan, or no re-plan warranted — the enumerator always includes
+        # "pass" as a legal sequence, so a missing/exhausted plan just means
+        # ending the turn. Find end_turn directly rather than falling back
+        # to a second selection path.
+        logger.debug("Plan exhausted or absent, ending turn")
+        for i, action in enumerate(valid_actions):
+            if action.action_type == "end_turn" or "end turn" in action.description.lower():
+                return (i, "[fallback] Plan exhausted, ending turn")
+        return None
 
     def _needs_new_plan(self, game_state: 'GameState') -> bool:
         """Check if we need to create a new turn plan.
@@ -157,59 +235,89 @@ class LLMPlayer:
         game_engine
     ) -> None:
         """Create a new turn plan."""
-        # Reset mid-turn re-plan counter only for a genuinely new turn
-        if self._plan_turn_number is None or self._plan_turn_number != game_state.turn_number:
-            self._midturn_replan_count = 0
-        logger.debug("📋 Creating new turn plan...")
-
+        self._start_turn_plan(game_state)
         try:
             plan = self.turn_planner.create_plan(
                 game_state=game_state,
                 player_id=ai_player_id,
                 game_engine=game_engine
             )
-
-            if plan:
-                self._current_plan = plan
-                self._plan_action_index = 0
-                self._completed_actions = []
-                self._plan_turn_number = game_state.turn_number
-                self._execution_log = []  # Reset execution log for new plan
-
-                # Log plan summary
-                logger.debug(f"✅ Plan created: {len(plan.action_sequence)} actions")
-                logger.debug(f"📊 Charge: {plan.charge_start} → {plan.charge_after_plan}")
-                logger.debug(f"🎯 Expected cards broken: {plan.expected_cards_broken}")
-                logger.debug(f"💡 Strategy: {plan.selected_strategy[:100]}...")
-
-                for i, action in enumerate(plan.action_sequence):
-                    logger.debug(f"  {i+1}. {action.action_type}: {action.card_name or 'N/A'} ({action.charge_cost} Charge)")
-            else:
-                logger.warning("Failed to create plan, will use fallback")
-                self._current_plan = None
-
         except BudgetExhaustedError:
             # Daily API budget spent — propagate so the simulation pauses
             # instead of silently playing on without the LLM.
             raise
         except Exception as e:
             logger.exception(f"Error creating turn plan: {e}")
+            plan = None
+        self._adopt_plan(plan, game_state)
+
+    async def _create_turn_plan_async(
+        self,
+        game_state: 'GameState',
+        ai_player_id: str,
+        game_engine
+    ) -> None:
+        """``_create_turn_plan`` through ``TurnPlanner.create_plan_async``."""
+        self._start_turn_plan(game_state)
+        try:
+            plan = await self.turn_planner.create_plan_async(
+                game_state=game_state,
+                player_id=ai_player_id,
+                game_engine=game_engine
+            )
+        except BudgetExhaustedError:
+            raise
+        except Exception as e:
+            logger.exception(f"Error creating turn plan: {e}")
+            plan = None
+        self._adopt_plan(plan, game_state)
+
+    def _start_turn_plan(self, game_state: 'GameState') -> None:
+        """Reset the mid-turn re-plan counter only for a genuinely new turn."""
+        if self._plan_turn_number is None or self._plan_turn_number != game_state.turn_number:
+            self._midturn_replan_count = 0
+        logger.debug("📋 Creating new turn plan...")
+
+    def _adopt_plan(self, plan: Optional['TurnPlan'], game_state: 'GameState') -> None:
+        """Make a freshly created plan (or its absence) the current one."""
+        if plan:
+            self._current_plan = plan
+            self._plan_action_index = 0
+            self._completed_actions = []
+            self._plan_turn_number = game_state.turn_number
+            self._execution_log = []  # Reset execution log for new plan
+
+            # Log plan summary
+            logger.debug(f"✅ Plan created: {len(plan.action_sequence)} actions")
+            logger.debug(f"📊 Charge: {plan.charge_start} → {plan.charge_after_plan}")
+            logger.debug(f"🎯 Expected cards broken: {plan.expected_cards_broken}")
+            logger.debug(f"💡 Strategy: {plan.selected_strategy[:100]}...")
+
+            for i, action in enumerate(plan.action_sequence):
+                logger.debug(f"  {i+1}. {action.action_type}: {action.card_name or 'N/A'} ({action.charge_cost} Charge)")
+        else:
+            logger.warning("Failed to create plan, will use fallback")
             self._current_plan = None
 
-    def _maybe_replan(
+    def _replan_warranted(
         self,
         game_state: 'GameState',
         ai_player_id: str,
         valid_actions: list['ValidAction'],
-        game_engine,
-    ) -> Optional[tuple[int, str]]:
-        """Trigger a mid-turn re-plan when combat options remain but the plan is exhausted.
+    ) -> bool:
+        """Whether to re-plan mid-turn: combat options remain but the plan is exhausted.
 
         Only re-plans when ALL of:
+        - The current plan exists and is exhausted (not absent)
         - Player has > 1 Charge remaining (minimum for tussle/direct_attack)
         - At least one tussle or direct_attack is in valid_actions
         - Re-plan count for this turn is < 2 (prevents infinite loops)
+
+        A warranted re-plan is counted here; the caller creates the plan.
         """
+        if self._current_plan is None or self._plan_action_index < len(self._current_plan.action_sequence):
+            return False
+
         ai_player = game_state.players[ai_player_id]
 
         if self._midturn_replan_count >= 2:
@@ -217,7 +325,7 @@ class LLMPlayer:
                 "⏭️ Mid-turn re-plan limit reached (%d/2), skipping",
                 self._midturn_replan_count,
             )
-            return None
+            return False
 
         has_combat = any(
             a.action_type in ("tussle", "direct_attack") for a in valid_actions
@@ -228,7 +336,7 @@ class LLMPlayer:
                 ai_player.charge,
                 has_combat,
             )
-            return None
+            return False
 
         self._midturn_replan_count += 1
         logger.debug(
@@ -236,13 +344,7 @@ class LLMPlayer:
             self._midturn_replan_count,
             ai_player.charge,
         )
-
-        self._create_turn_plan(game_state, ai_player_id, game_engine)
-
-        if self._current_plan and self._plan_action_index < len(self._current_plan.action_sequence):
-            return self._execute_planned_action(valid_actions, game_state, ai_player_id, game_engine)
-
-        return None
+        return True
 
     def _execute_planned_action(
         self,
@@ -313,6 +415,10 @@ class LLMPlayer:
             return None
 
         # Heuristic didn't match but action type IS available - use LLM to resolve
+        if self.provider_client is None:
+            # Local selector mode: no LLM to disambiguate with.
+            return self._handle_plan_failure(valid_actions, "No heuristic match (no LLM available)")
+
         logger.debug("   Using LLM to match action...")
 
         # Log that heuristic matching fell back to LLM
@@ -665,25 +771,56 @@ class LLMPlayer:
         Get a human-readable name for the AI endpoint being used.
 
         Returns:
-            String like "Gemini Flash Lite (Latest)"
+            String like "Gemini Flash Lite (Latest)", or the selector name
+            (e.g. "heuristic") when no LLM is used
         """
+        if self.provider_client is None:
+            return self.model_name
         return self.provider_client.get_display_name(self.model_name)
 
 
-# Singleton instance
+# Singleton instance (owns the shared provider)
 _ai_player: Optional[LLMPlayer] = None
 
+# Per-game players, least recently used first. An evicted game's next turn
+# just re-plans from its current state.
+MAX_GAME_PLAYERS = 256
+_game_players: "OrderedDict[str, LLMPlayer]" = OrderedDict()
+_game_players_lock = threading.Lock()
+
 
-def get_ai_player() -> LLMPlayer:
+def get_ai_player(game_id: Optional[str] = None) -> LLMPlayer:
     """
-    Get the singleton AI player instance (Gemini, enum-based planning).
+    Get the AI player (Gemini, enum-based planning).
+
+    Args:
+        game_id: The game the player acts in. Each game gets its own player,
+            so concurrent turns of different games never share plan state or
+            decision info. None returns the shared singleton, for calls
+            outside a game (``get_llm_response``).
     """
     global _ai_player
 
-    if _ai_player is None:
-        logger.debug("🤖 Initializing AI player")
-        _ai_player = LLMPlayer()
-    return _ai_player
+    with _game_players_lock:
+        if _ai_player is None:
+            logger.debug("🤖 Initializing AI player")
+            _ai_player = LLMPlayer()
+        if game_id is None:
+            return _ai_player
+        player = _game_players.get(game_id)
+        if player is None:
+            player = _game_players[game_id] = _ai_player.spawn()
+            while len(_game_players) > MAX_GAME_PLAYERS:
+                _game_players.popitem(last=False)
+        else:
+            _game_players.move_to_end(game_id)
+        return player
+
+
+def release_ai_player(game_id: str) -> None:
+    """Drop a finished or deleted game's player (its plan and search caches)."""
+    with _game_players_lock:
+        _game_players.pop(game_id, None)
 
 
 def get_llm_response(prompt: str, is_json: bool = True) -> str:
@@ -703,26 +840,41 @@ def get_llm_response(prompt: str, is_json: bool = True) -> str:
     ai_player = get_ai_player()
 
     response_text = ai_player.provider_client.generate_text(
-        prompt,
-        temperature=0.8,
-        max_output_tokens=2048,
-        retry_count=3,
-        allow_fallback=True,
-        model=ai_player.model_name,
-        fallback_model=ai_player.fallback_model,
+        prompt, **_custom_prompt_kwargs(ai_player)
     )
+    return _parse_custom_response(response_text) if is_json else response_text
 
-    if is_json:
-        # Parse JSON response
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
 
-        return json.loads(response_text)
+async def get_llm_response_async(prompt: str, is_json: bool = True) -> str:
+    """``get_llm_response`` without blocking: awaits the provider's async path."""
+    ai_player = get_ai_player()
 
-    return response_text
+    response_text = await ai_player.provider_client.generate_text_async(
+        prompt, **_custom_prompt_kwargs(ai_player)
+    )
+    return _parse_custom_response(response_text) if is_json else response_text
+
+
+def _custom_prompt_kwargs(ai_player: LLMPlayer) -> Dict[str, Any]:
+    return {
+        "temperature": 0.8,
+        "max_output_tokens": 2048,
+        "retry_count": 3,
+        "allow_fallback": True,
+        "model": ai_player.model_name,
+        "fallback_model": ai_player.fallback_model,
+    }
+
+
+def _parse_custom_response(response_text: str) -> Any:
+    """Parse a JSON response, unwrapping a markdown code fence if present."""
+    if "```json" in response_text:
+        json_start = response_text.find("```json") + 7
+        json_end = response_text.find("```", json_start)
+        response_text = response_text[json_start:json_end].strip()
+    elif "```" in response_text:
+        json_start = response_text.find("```") + 3
+        json_end = response_text.find("```", json_start)
+        response_text = response_text[json_start:json_end].strip()
+
+    return json.loads(response_text)
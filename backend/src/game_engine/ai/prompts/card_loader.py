@@ -9,14 +9,18 @@ Architecture:
 - YAML file contains condensed guidance (trap, reminder, threat)
 - Loader filters to cards in: player.hand + player.in_play + opponent.in_play
 - Output formatted as compact text (not full dict structure)
+- Guidance and threat priorities are memoized per set of card names; legend
+  lines per card through an optional ``PromptFragments`` (see fragment_cache)
 """
 
 import os
 import yaml
-from typing import Set, Dict, Any, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Set, Dict, Any, FrozenSet, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from game_engine.models.game_state import GameState
+    from .fragment_cache import PromptFragments
 
 # Cache the loaded YAML to avoid repeated file I/O
 _CARD_GUIDANCE_CACHE: Dict[str, Any] = {}
@@ -89,24 +93,30 @@ def generate_threat_priorities(game_state: "GameState", player_id: str) -> str:
     are omitted since card_guidance's per-card trap/reminder text already
     covers them without needing a priority callout.
     """
-    guidance_data = load_card_guidance()
     opponent = game_state.get_opponent(player_id)
+    return _render_threat_priorities(tuple(card.name for card in opponent.in_play))
+
+
+@lru_cache(maxsize=1024)
+def _render_threat_priorities(opponent_names: Tuple[str, ...]) -> str:
+    """Threat priorities for the opponent's in-play card names, in board order."""
+    guidance_data = load_card_guidance()
 
     critical: list[str] = []
     high: list[str] = []
     medium: list[str] = []
 
-    for card in opponent.in_play:
-        card_info = guidance_data.get(card.name)
+    for name in opponent_names:
+        card_info = guidance_data.get(name)
         if not card_info:
             continue
         threat = card_info.get("threat", "MEDIUM")
         if threat == "CRITICAL":
-            critical.append(card.name)
+            critical.append(name)
         elif threat == "HIGH":
-            high.append(card.name)
+            high.append(name)
         elif threat == "MEDIUM":
-            medium.append(card.name)
+            medium.append(name)
 
     if not critical and not high and not medium:
         return ""
@@ -132,8 +142,13 @@ def get_relevant_card_guidance(game_state: "GameState", player_id: str) -> str:
     Returns:
         Formatted string with card guidance (empty if no relevant cards)
     """
+    return _render_card_guidance(frozenset(get_relevant_card_names(game_state, player_id)))
+
+
+@lru_cache(maxsize=1024)
+def _render_card_guidance(relevant_names: FrozenSet[str]) -> str:
+    """Card guidance for a set of card names (see ``get_relevant_card_guidance``)."""
     guidance_data = load_card_guidance()
-    relevant_names = get_relevant_card_names(game_state, player_id)
 
     # Filter to only cards with guidance entries
     relevant_with_guidance = relevant_names & guidance_data.keys()
@@ -184,6 +199,17 @@ def format_card_guidance(game_state: "GameState", player_id: str) -> str:
     return guidance_text
 
 
+def guidance_cache_info() -> Dict[str, int]:
+    """Hit/miss counts of the memoized guidance and threat-priority fragments."""
+    guidance = _render_card_guidance.cache_info()
+    threats = _render_threat_priorities.cache_info()
+    return {
+        "hits": guidance.hits + threats.hits,
+        "misses": guidance.misses + threats.misses,
+        "entries": guidance.currsize + threats.currsize,
+    }
+
+
 def build_card_labels(game_state: "GameState", player_id: str) -> Dict[str, str]:
     """
     Assign a short, stable label to every card the AI is allowed to see: its
@@ -222,7 +248,10 @@ def build_card_labels(game_state: "GameState", player_id: str) -> Dict[str, str]
 
 
 def format_board_legend(
-    game_state: "GameState", player_id: str, game_engine: Optional[Any] = None
+    game_state: "GameState",
+    player_id: str,
+    game_engine: Optional[Any] = None,
+    fragments: Optional["PromptFragments"] = None,
 ) -> str:
     """
     Render the board-state legend for the Request 2 prompt: one line per card
@@ -234,10 +263,15 @@ def format_board_legend(
     Passing ``game_engine`` lets in-play stats reflect continuous effects
     (Ka's +2 STR aura, Gibbers' cost tax, etc); without it, base stats/cost
     are shown.
+
+    With ``fragments``, lines whose inputs are unchanged since the previous
+    legend for this effect context are reused instead of re-rendered.
     """
     labels = build_card_labels(game_state, player_id)
     player = game_state.players[player_id]
     opponent = game_state.get_opponent(player_id)
+    if fragments is not None:
+        fragments.start(_legend_context(game_state, player_id, game_engine))
 
     lines = ["# BOARD LEGEND (label [side zone] Name (cost) stats - effect)"]
     for side_label, side, zones in (
@@ -251,26 +285,55 @@ def format_board_legend(
         for zone_label, zone in zones:
             for card in zone:
                 label = labels[card.id]
-
-                if game_engine is not None and card.cost >= 0:
-                    cost = game_engine.calculate_card_cost(card, side)
-                else:
-                    cost = card.cost
-
-                if card.is_toy():
-                    if zone_label == "in_play" and game_engine is not None:
-                        spd = game_engine.get_card_stat(card, "speed")
-                        str_val = game_engine.get_card_stat(card, "strength")
-                        cur_sta = game_engine.get_effective_stamina(card)
-                        max_sta = game_engine.get_card_stat(card, "stamina")
-                    else:
-                        spd, str_val = card.speed, card.strength
-                        cur_sta = max_sta = card.stamina
-                    stats = f" [{spd} SPD, {str_val} STR, {cur_sta}/{max_sta} STA]"
-                else:
-                    stats = ""
-
-                lines.append(
-                    f"{label} [{side_label} {zone_label}] {card.name} (cost {cost}){stats} - {card.effect_text}"
+                if fragments is None:
+                    lines.append(_legend_line(card, label, side_label, zone_label, side, game_engine))
+                    continue
+                key = (
+                    card.id, label, side_label, zone_label, card.template, card.current_stamina,
+                    repr(card.modifications), repr(card.turn_modifications),
                 )
+                lines.append(fragments.line(
+                    key,
+                    lambda: _legend_line(card, label, side_label, zone_label, side, game_engine),
+                ))
     return "\n".join(lines)
+
+
+def _legend_context(game_state: "GameState", player_id: str, game_engine: Optional[Any]) -> Tuple[Any, ...]:
+    """
+    What every legend line depends on beyond its own card (see fragment_cache).
+
+    Effective costs and stats hold while the board's continuous-effect index
+    is current; Dream-style costs also count the break zone, and
+    lowest-target costs (Copy, Glue) look at the board, so zone sizes are
+    included too.
+    """
+    sizes = tuple(
+        (len(p.hand), len(p.in_play), len(p.break_zone)) for p in game_state.players.values()
+    )
+    index = game_state.get_effect_index() if game_engine is not None else None
+    return (game_state.game_id, player_id, index, sizes)
+
+
+def _legend_line(
+    card: Any, label: str, side_label: str, zone_label: str, side: Any, game_engine: Optional[Any]
+) -> str:
+    if game_engine is not None and card.cost >= 0:
+        cost = game_engine.calculate_card_cost(card, side)
+    else:
+        cost = card.cost
+
+    if card.is_toy():
+        if zone_label == "in_play" and game_engine is not None:
+            spd = game_engine.get_card_stat(card, "speed")
+            str_val = game_engine.get_card_stat(card, "strength")
+            cur_sta = game_engine.get_effective_stamina(card)
+            max_sta = game_engine.get_card_stat(card, "stamina")
+        else:
+            spd, str_val = card.speed, card.strength
+            cur_sta = max_sta = card.stamina
+        stats = f" [{spd} SPD, {str_val} STR, {cur_sta}/{max_sta} STA]"
+    else:
+        stats = ""
+
+    return f"{label} [{side_label} {zone_label}] {card.name} (cost {cost}){stats} - {card.effect_text}"
@@ -0,0 +1,127 @@
+"""
+Memoized fragments of the strategic-selector prompt.
+
+``generate_strategic_prompt`` used to rebuild every fragment for each plan
+and re-plan. The board legend is the costly part: each line asks the engine
+for the card's effective cost and stats, and each of those walks the
+continuous effects on the board.
+
+``PromptFragments`` (one per ``TurnPlanner``, like ``SearchCache``) keeps the
+rendered legend lines of the current *effect context*: the board's
+``ContinuousEffectIndex`` (rebuilt by the engine after any zone move or turn
+change) plus each player's hand and break-zone sizes. Within a context, a
+line is keyed by everything card-local it depends on — id, label, zone,
+template, stamina and stat modifications — so a re-plan after a tussle that
+only damaged one card re-renders that card's line alone. A new context drops
+every line.
+
+Card guidance and threat priorities depend only on card names (the guidance
+YAML is loaded once), so ``card_loader`` memoizes them per set of names,
+process-wide.
+
+Prompt construction time and fragment hit counts are recorded process-wide
+(``record_prompt_build``), reported under ``ai.prompt`` on /health.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+class PromptFragments:
+    """Rendered legend lines for one effect context (see module docstring)."""
+
+    def __init__(self):
+        self._context: Optional[Tuple[Any, ...]] = None
+        self._lines: Dict[Hashable, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, context: Tuple[Any, ...]) -> None:
+        """Drop every line unless ``context`` is unchanged."""
+        # The effect index compares by identity: a rebuilt index is a new context
+        if context != self._context:
+            self._context = context
+            self._lines = {}
+
+    def line(self, key: Hashable, render: Callable[[], str]) -> str:
+        """The cached line for ``key``, rendering it on a miss."""
+        line = self._lines.get(key)
+        if line is None:
+            self.misses += 1
+            line = self._lines[key] = render()
+        else:
+            self.hits += 1
+        return line
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+
+class PromptMetrics:
+    """
+    Process-wide prompt construction timing and legend-line hit counters.
+
+    Keeps totals plus the most recent ``window`` builds for latency
+    percentiles, like ``enumerator.EnumerationMetrics``.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._window = window
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._builds = 0
+            self._line_hits = 0
+            self._line_misses = 0
+            self._recent: Deque[float] = deque(maxlen=self._window)
+
+    def record(self, elapsed_ms: float, line_hits: int, line_misses: int) -> None:
+        with self._lock:
+            self._builds += 1
+            self._line_hits += line_hits
+            self._line_misses += line_misses
+            self._recent.append(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        from .card_loader import guidance_cache_info
+
+        with self._lock:
+            latencies = sorted(self._recent)
+            builds, hits, misses = self._builds, self._line_hits, self._line_misses
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3)
+
+        return {
+            "builds": builds,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(latencies[-1], 3) if latencies else None,
+            "legend_line_hits": hits,
+            "legend_line_misses": misses,
+            "legend_line_hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "guidance": guidance_cache_info(),
+        }
+
+
+_metrics = PromptMetrics()
+
+
+def record_prompt_build(elapsed_ms: float, line_hits: int = 0, line_misses: int = 0) -> None:
+    """Record one strategic-prompt build (called by TurnPlanner)."""
+    _metrics.record(elapsed_ms, line_hits, line_misses)
+
+
+def get_prompt_metrics() -> Dict[str, Any]:
+    """Prompt construction timing and fragment hit counts (reported on /health)."""
+    return _metrics.snapshot()
+
+
+def reset_prompt_metrics() -> None:
+    """Clear the prompt metrics (useful for testing)."""
+    _metrics.reset()
@@ -20,6 +20,7 @@ from .card_loader import format_card_guidance, format_board_legend, generate_thr
 
 if TYPE_CHECKING:
     from game_engine.models.game_state import GameState
+    from .fragment_cache import PromptFragments
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,7 @@ def generate_strategic_prompt(
     player_id: str,
     validated_sequences: list[dict],
     game_engine: Optional[Any] = None,
+    fragments: Optional["PromptFragments"] = None,
 ) -> str:
     """
     Generate the Request 2 prompt for strategic selection.
@@ -97,6 +99,8 @@ def generate_strategic_prompt(
         validated_sequences: List of validated sequence dicts with tactical labels
         game_engine: Optional GameEngine, used so the legend's in-play stats
             reflect continuous effects (Ka's aura, Gibbers' cost tax, etc).
+        fragments: Optional per-planner legend-line cache; lines unchanged
+            since the previous prompt are reused (see fragment_cache)
 
     Returns:
         Prompt string
@@ -114,7 +118,7 @@ def generate_strategic_prompt(
         for i, seq in enumerate(validated_sequences)
     )
 
-    legend_text = format_board_legend(game_state, player_id, game_engine)
+    legend_text = format_board_legend(game_state, player_id, game_engine, fragments)
     guidance_text = format_card_guidance(game_state, player_id)
     threat_priorities = generate_threat_priorities(game_state, player_id)
 
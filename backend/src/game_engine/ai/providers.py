@@ -1,12 +1,25 @@
-"""Gemini provider for the AI player's model backend."""
+"""
+Gemini provider for the AI player's model backend.
+
+Each call has a blocking form (``generate_json`` / ``generate_text``) and an
+asyncio form (``generate_json_async`` / ``generate_text_async``). The async
+form awaits the SDK's async client, the rate limiter and retry backoff, so
+many callers can wait on Gemini from one event loop without a thread each.
+Async requests share one ``AsyncRequestGate`` per provider, which bounds how
+many are in flight and coalesces identical concurrent requests at
+temperature 0 (sampled requests are expected to differ, so each is sent).
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional
 
 from game_engine.ai.rate_limiter import BudgetExhaustedError, NoopLimiter
 
@@ -15,6 +28,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "gemini-flash-lite-latest"  # Stable alias for latest Flash Lite; no geographic restriction
 DEFAULT_FALLBACK_MODEL = "gemini-2.5-flash-lite"
 
+# Concurrent async Gemini requests per provider (see AsyncRequestGate)
+MAX_IN_FLIGHT_ENV = "GEMINI_MAX_IN_FLIGHT"
+DEFAULT_MAX_IN_FLIGHT = 32
+
 
 @dataclass(frozen=True)
 class AIProviderConfig:
@@ -45,10 +62,101 @@ def resolve_provider_config(
     )
 
 
+class AsyncRequestGate:
+    """
+    Bounds a provider's concurrent async requests and coalesces duplicates.
+
+    At most ``max_in_flight`` requests are on the wire at once; the rest
+    wait on a semaphore. A request identical to one already in flight (same
+    key: model, prompt, schema and settings) awaits that request's result
+    instead of sending another. Callers opt in per request by passing a key;
+    ``key=None`` always sends its own request.
+
+    State is bound to the event loop the gate is used on; a new loop (e.g.
+    another ``asyncio.run``) starts fresh.
+
+    Args:
+        max_in_flight: Concurrent requests allowed
+        coalesce: Share results between identical concurrent requests
+    """
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, coalesce: bool = True):
+        self.max_in_flight = max(1, max_in_flight)
+        self.coalesce = coalesce
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._in_flight = 0
+        self._metrics = {"requests": 0, "coalesced": 0, "queued": 0, "peak_in_flight": 0}
+
+    async def run(self, key: Optional[Hashable], factory: Callable[[], Awaitable[str]]) -> str:
+        """Await ``factory()``, or the in-flight request with the same key (if any)."""
+        self._bind()
+        self._metrics["requests"] += 1
+        if not self.coalesce or key is None:
+            return await factory()
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._metrics["coalesced"] += 1
+        # Shielded: one caller's cancellation must not cancel the others' request
+        return await asyncio.shield(task)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one in-flight slot for the duration of a request."""
+        self._bind()
+        if self._semaphore.locked():
+            self._metrics["queued"] += 1
+        async with self._semaphore:
+            self._in_flight += 1
+            self._metrics["peak_in_flight"] = max(self._metrics["peak_in_flight"], self._in_flight)
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+    def stats(self) -> dict:
+        """Request, coalescing and concurrency counters."""
+        return {**self._metrics, "in_flight": self._in_flight, "max_in_flight": self.max_in_flight}
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._pending = {}
+            self._in_flight = 0
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+
+@dataclass(frozen=True)
+class _RetryStep:
+    """What follows a failed attempt: back off and retry, or try the fallback."""
+    wait_seconds: Optional[int] = None
+    fallback_model: Optional[str] = None
+
+
+def _json_config(schema: dict[str, Any]) -> dict[str, Any]:
+    return {"response_mime_type": "application/json", "response_json_schema": schema}
+
+
 class GeminiProvider:
     """Google Gemini provider using the google-genai SDK."""
 
-    def __init__(self, config: AIProviderConfig, client: Any | None = None, rate_limiter: Any | None = None):
+    def __init__(
+        self,
+        config: AIProviderConfig,
+        client: Any | None = None,
+        rate_limiter: Any | None = None,
+        max_in_flight: Optional[int] = None,
+    ):
         self.config = config
         if client is None:
             from google import genai
@@ -56,6 +164,9 @@ class GeminiProvider:
             client = genai.Client(api_key=config.api_key)
         self.client = client
         self.rate_limiter = rate_limiter if rate_limiter is not None else NoopLimiter()
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv(MAX_IN_FLIGHT_ENV) or DEFAULT_MAX_IN_FLIGHT)
+        self.request_gate = AsyncRequestGate(max_in_flight)
 
     def generate_json(
         self,
@@ -70,182 +181,311 @@ class GeminiProvider:
         fallback_model: Optional[str] = None,
         system_instruction: Optional[str] = None,
     ) -> str:
-        from google.genai import types
+        return self._generate(
+            prompt,
+            _json_config(schema),
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            retry_count=retry_count,
+            allow_fallback=allow_fallback,
+            current_model=model or self.config.model,
+            resolved_fallback=fallback_model or self.config.fallback_model,
+            system_instruction=system_instruction,
+        )
 
-        current_model = model or self.config.model
-        resolved_fallback = fallback_model or self.config.fallback_model
-        last_exception: Exception | None = None
+    def generate_text(
+        self,
+        prompt: str,
+        *,
+        temperature: float,
+        max_output_tokens: int,
+        retry_count: int = 3,
+        allow_fallback: bool = True,
+        model: Optional[str] = None,
+        fallback_model: Optional[str] = None,
+        system_instruction: Optional[str] = None,
+    ) -> str:
+        return self._generate(
+            prompt,
+            {},
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            retry_count=retry_count,
+            allow_fallback=allow_fallback,
+            current_model=model or self.config.model,
+            resolved_fallback=fallback_model or self.config.fallback_model,
+            system_instruction=system_instruction,
+        )
 
+    async def generate_json_async(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        *,
+        temperature: float,
+        max_output_tokens: int,
+        retry_count: int = 3,
+        allow_fallback: bool = True,
+        model: Optional[str] = None,
+        fallback_model: Optional[str] = None,
+        system_instruction: Optional[str] = None,
+    ) -> str:
+        """Async ``generate_json``: same retries and fallback, nothing blocks."""
+        return await self._generate_async(
+            prompt,
+            _json_config(schema),
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            retry_count=retry_count,
+            allow_fallback=allow_fallback,
+            model=model,
+            fallback_model=fallback_model,
+            system_instruction=system_instruction,
+        )
+
+    async def generate_text_async(
+        self,
+        prompt: str,
+        *,
+        temperature: float,
+        max_output_tokens: int,
+        retry_count: int = 3,
+        allow_fallback: bool = True,
+        model: Optional[str] = None,
+        fallback_model: Optional[str] = None,
+        system_instruction: Optional[str] = None,
+    ) -> str:
+        """Async ``generate_text``: same retries and fallback, nothing blocks."""
+        return await self._generate_async(
+            prompt,
+            {},
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            retry_count=retry_count,
+            allow_fallback=allow_fallback,
+            model=model,
+            fallback_model=fallback_model,
+            system_instruction=system_instruction,
+        )
+
+    def _generate(
+        self,
+        prompt: str,
+        extra_config: dict[str, Any],
+        *,
+        temperature: float,
+        max_output_tokens: int,
+        retry_count: int,
+        allow_fallback: bool,
+        current_model: str,
+        resolved_fallback: str,
+        system_instruction: Optional[str],
+    ) -> str:
         for attempt in range(retry_count):
             try:
                 self.rate_limiter.acquire()
                 response = self.client.models.generate_content(
-                    model=current_model,
-                    contents=[
-                        types.Content(
-                            role="user",
-                            parts=[types.Part.from_text(text=prompt)],
-                        )
-                    ],
-                    config=types.GenerateContentConfig(
-                        temperature=temperature,
-                        max_output_tokens=max_output_tokens,
-                        response_mime_type="application/json",
-                        response_json_schema=schema,
-                        system_instruction=system_instruction,
-                    ),
-                )
-
-                if not response.candidates or not response.candidates[0].content.parts:
-                    finish_reason = (
-                        response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
-                    )
-                    raise ValueError(
-                        f"Gemini returned empty response (finish_reason: {finish_reason})"
+                    **self._request(
+                        prompt, extra_config, current_model,
+                        temperature, max_output_tokens, system_instruction,
                     )
-
-                return response.text.strip()
+                )
+                return self._response_text(response)
             except BudgetExhaustedError:
                 raise
             except Exception as exc:
-                last_exception = exc
-                if self._is_location_precondition(exc):
-                    logger.error(
-                        "Gemini location precondition failed for model %s (fallback %s). "
-                        "This is typically a key/project policy or hosting egress geolocation issue; "
-                        "model fallback will not resolve it.",
-                        current_model,
-                        resolved_fallback,
-                    )
+                step = self._after_failure(
+                    exc, attempt, retry_count, allow_fallback, current_model, resolved_fallback
+                )
+                if step is None:
                     raise
-
-                if self._is_retryable(exc) and attempt < retry_count - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(
-                        "Gemini capacity issue. Retry %s/%s after %ss.",
-                        attempt + 1,
-                        retry_count,
-                        wait_time,
-                    )
-                    time.sleep(wait_time)
+                if step.wait_seconds is not None:
+                    time.sleep(step.wait_seconds)
                     continue
+            return self._generate(
+                prompt,
+                extra_config,
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                retry_count=1,
+                allow_fallback=False,
+                current_model=step.fallback_model,
+                resolved_fallback=step.fallback_model,
+                system_instruction=system_instruction,
+            )
 
-                if allow_fallback and current_model != resolved_fallback:
-                    logger.warning(
-                        "Gemini model %s failed, falling back to %s.",
-                        current_model,
-                        resolved_fallback,
-                    )
-                    return self.generate_json(
-                        prompt,
-                        schema,
-                        temperature=temperature,
-                        max_output_tokens=max_output_tokens,
-                        retry_count=1,
-                        allow_fallback=False,
-                        model=resolved_fallback,
-                        fallback_model=resolved_fallback,
-                        system_instruction=system_instruction,
-                    )
-
-                raise
-
-        if last_exception is not None:
-            raise last_exception
         raise RuntimeError("Gemini request failed without an exception")
 
-    def generate_text(
+    async def _generate_async(
         self,
         prompt: str,
+        extra_config: dict[str, Any],
         *,
         temperature: float,
         max_output_tokens: int,
-        retry_count: int = 3,
-        allow_fallback: bool = True,
-        model: Optional[str] = None,
-        fallback_model: Optional[str] = None,
-        system_instruction: Optional[str] = None,
+        retry_count: int,
+        allow_fallback: bool,
+        model: Optional[str],
+        fallback_model: Optional[str],
+        system_instruction: Optional[str],
     ) -> str:
-        from google.genai import types
-
         current_model = model or self.config.model
         resolved_fallback = fallback_model or self.config.fallback_model
-        last_exception: Exception | None = None
-
+        key = None
+        if temperature == 0:
+            # Only deterministic requests can share a response; at a higher
+            # temperature each caller expects its own sample.
+            key = (
+                current_model, resolved_fallback, prompt,
+                json.dumps(extra_config, sort_keys=True, default=str),
+                max_output_tokens, retry_count, allow_fallback, system_instruction,
+            )
+
+        async def request() -> str:
+            return await self._generate_with_retries_async(
+                prompt,
+                extra_config,
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                retry_count=retry_count,
+                allow_fallback=allow_fallback,
+                current_model=current_model,
+                resolved_fallback=resolved_fallback,
+                system_instruction=system_instruction,
+            )
+
+        return await self.request_gate.run(key, request)
+
+    async def _generate_with_retries_async(
+        self,
+        prompt: str,
+        extra_config: dict[str, Any],
+        *,
+        temperature: float,
+        max_output_tokens: int,
+        retry_count: int,
+        allow_fallback: bool,
+        current_model: str,
+        resolved_fallback: str,
+        system_instruction: Optional[str],
+    ) -> str:
         for attempt in range(retry_count):
             try:
-                self.rate_limiter.acquire()
-                response = self.client.models.generate_content(
-                    model=current_model,
-                    contents=[
-                        types.Content(
-                            role="user",
-                            parts=[types.Part.from_text(text=prompt)],
+                await self._acquire_async()
+                async with self.request_gate.slot():
+                    response = await self.client.aio.models.generate_content(
+                        **self._request(
+                            prompt, extra_config, current_model,
+                            temperature, max_output_tokens, system_instruction,
                         )
-                    ],
-                    config=types.GenerateContentConfig(
-                        temperature=temperature,
-                        max_output_tokens=max_output_tokens,
-                        system_instruction=system_instruction,
-                    ),
-                )
-
-                if not response.candidates or not response.candidates[0].content.parts:
-                    finish_reason = (
-                        response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
                     )
-                    raise ValueError(
-                        f"Gemini returned empty response (finish_reason: {finish_reason})"
-                    )
-
-                return response.text.strip()
+                return self._response_text(response)
             except BudgetExhaustedError:
                 raise
             except Exception as exc:
-                last_exception = exc
-                if self._is_location_precondition(exc):
-                    logger.error(
-                        "Gemini location precondition failed for model %s (fallback %s). "
-                        "This is typically a key/project policy or hosting egress geolocation issue; "
-                        "model fallback will not resolve it.",
-                        current_model,
-                        resolved_fallback,
-                    )
+                step = self._after_failure(
+                    exc, attempt, retry_count, allow_fallback, current_model, resolved_fallback
+                )
+                if step is None:
                     raise
-
-                if self._is_retryable(exc) and attempt < retry_count - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(
-                        "Gemini capacity issue. Retry %s/%s after %ss.",
-                        attempt + 1,
-                        retry_count,
-                        wait_time,
-                    )
-                    time.sleep(wait_time)
+                if step.wait_seconds is not None:
+                    await asyncio.sleep(step.wait_seconds)
                     continue
+            return await self._generate_with_retries_async(
+                prompt,
+                extra_config,
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                retry_count=1,
+                allow_fallback=False,
+                current_model=step.fallback_model,
+                resolved_fallback=step.fallback_model,
+                system_instruction=system_instruction,
+            )
 
-                if allow_fallback and current_model != resolved_fallback:
-                    logger.warning(
-                        "Gemini model %s failed, falling back to %s.",
-                        current_model,
-                        resolved_fallback,
-                    )
-                    return self.generate_text(
-                        prompt,
-                        temperature=temperature,
-                        max_output_tokens=max_output_tokens,
-                        retry_count=1,
-                        allow_fallback=False,
-                        model=resolved_fallback,
-                        fallback_model=resolved_fallback,
-                        system_instruction=system_instruction,
-                    )
+        raise RuntimeError("Gemini request failed without an exception")
 
-                raise
+    @staticmethod
+    def _request(
+        prompt: str,
+        extra_config: dict[str, Any],
+        model: str,
+        temperature: float,
+        max_output_tokens: int,
+        system_instruction: Optional[str],
+    ) -> dict[str, Any]:
+        """Keyword arguments for ``generate_content`` (sync and async clients)."""
+        from google.genai import types
 
-        if last_exception is not None:
-            raise last_exception
-        raise RuntimeError("Gemini request failed without an exception")
+        return {
+            "model": model,
+            "contents": [
+                types.Content(
+                    role="user",
+                    parts=[types.Part.from_text(text=prompt)],
+                )
+            ],
+            "config": types.GenerateContentConfig(
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+                system_instruction=system_instruction,
+                **extra_config,
+            ),
+        }
+
+    def _after_failure(
+        self,
+        exc: Exception,
+        attempt: int,
+        retry_count: int,
+        allow_fallback: bool,
+        current_model: str,
+        resolved_fallback: str,
+    ) -> Optional[_RetryStep]:
+        """
+        Decide what follows a failed attempt (the retry policy of both paths).
+
+        Returns:
+            A backoff retry on the same model, a single attempt on the
+            fallback model, or None when the error should be raised
+        """
+        if self._is_location_precondition(exc):
+            logger.error(
+                "Gemini location precondition failed for model %s (fallback %s). "
+                "This is typically a key/project policy or hosting egress geolocation issue; "
+                "model fallback will not resolve it.",
+                current_model,
+                resolved_fallback,
+            )
+            return None
+
+        if self._is_retryable(exc) and attempt < retry_count - 1:
+            wait_time = 2 ** attempt
+            logger.warning(
+                "Gemini capacity issue. Retry %s/%s after %ss.",
+                attempt + 1,
+                retry_count,
+                wait_time,
+            )
+            return _RetryStep(wait_seconds=wait_time)
+
+        if allow_fallback and current_model != resolved_fallback:
+            logger.warning(
+                "Gemini model %s failed, falling back to %s.",
+                current_model,
+                resolved_fallback,
+            )
+            return _RetryStep(fallback_model=resolved_fallback)
+
+        return None
+
+    async def _acquire_async(self) -> None:
+        acquire_async = getattr(self.rate_limiter, "acquire_async", None)
+        if acquire_async is not None:
+            await acquire_async()
+        else:
+            # Limiters without an async path (e.g. a simulation worker's RemoteLimiter)
+            await asyncio.to_thread(self.rate_limiter.acquire)
 
     def get_display_name(self, model_name: str) -> str:
         model_map = {
@@ -260,6 +500,18 @@ class GeminiProvider:
         }
         return model_map.get(model_name, f"Gemini ({model_name})")
 
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        if not response.candidates or not response.candidates[0].content.parts:
+            finish_reason = (
+                response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
+            )
+            raise ValueError(
+                f"Gemini returned empty response (finish_reason: {finish_reason})"
+            )
+
+        return response.text.strip()
+
     @staticmethod
     def _is_retryable(exc: Exception) -> bool:
         error_text = str(exc)
@@ -285,7 +537,11 @@ def build_provider(
     fallback_model: Optional[str] = None,
     client: Any | None = None,
     rate_limiter: Any | None = None,
+    max_in_flight: Optional[int] = None,
 ) -> tuple[GeminiProvider, AIProviderConfig]:
     """Build a Gemini provider instance and return it with its resolved config."""
     config = resolve_provider_config(api_key=api_key, model=model, fallback_model=fallback_model)
-    return GeminiProvider(config, client=client, rate_limiter=rate_limiter), config
+    provider = GeminiProvider(
+        config, client=client, rate_limiter=rate_limiter, max_in_flight=max_in_flight
+    )
+    return provider, config
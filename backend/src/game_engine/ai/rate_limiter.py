@@ -20,15 +20,21 @@ Thread-safety: a single `threading.Lock` serializes `acquire()` and
 `flush()`. This is deliberate — a shared daily budget across the whole
 process must be counted exactly once per request even if multiple threads
 call `acquire()` concurrently.
+
+Async callers (`GeminiProvider`'s async path) use `acquire_async()`: the
+same accounting, but an RPM wait is an `asyncio.sleep` taken *after*
+reserving the token and releasing the lock, so concurrent coroutines queue
+up behind each other without blocking the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Optional
 from zoneinfo import ZoneInfo
 
 from api.database import SessionLocal
@@ -48,6 +54,10 @@ class BudgetExhaustedError(Exception):
             message or f"Daily API request budget exhausted; resets at {resets_at.isoformat()}"
         )
 
+    def __reduce__(self):
+        # Keep resets_at when pickled back from a simulation worker process.
+        return (self.__class__, (self.resets_at, str(self)))
+
 
 class RateBudgetLimiter:
     """
@@ -68,6 +78,8 @@ class RateBudgetLimiter:
             for deterministic tests.
         sleep: sleep function used to block until an RPM token is available.
             Injectable for deterministic tests (avoid real sleeping).
+        async_sleep: coroutine function `acquire_async()` awaits for the
+            same wait. Defaults to `asyncio.sleep`.
         now_fn: returns the current timezone-aware datetime, used to derive
             "today" for the daily budget. Defaults to
             `datetime.now(ZoneInfo(tz))`. Injectable for deterministic tests.
@@ -83,6 +95,7 @@ class RateBudgetLimiter:
         clock: Callable[[], float] = time.monotonic,
         sleep: Callable[[float], None] = time.sleep,
         now_fn: Optional[Callable[[], datetime]] = None,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ):
         self.rpm = rpm
         self.daily_budget = daily_budget
@@ -91,6 +104,7 @@ class RateBudgetLimiter:
         self.tz = ZoneInfo(tz)
         self._clock = clock
         self._sleep = sleep
+        self._async_sleep = async_sleep
         self._now_fn = now_fn or (lambda: datetime.now(self.tz))
 
         self._lock = threading.Lock()
@@ -129,6 +143,33 @@ class RateBudgetLimiter:
             if self._acquires_since_flush >= _FLUSH_EVERY:
                 self._flush_locked()
 
+    async def acquire_async(self) -> None:
+        """
+        Async variant of `acquire()`.
+
+        Reserves an RPM token (the bucket may go into debt) and accounts for
+        the request under the lock, then awaits the token's wait outside it.
+
+        Raises:
+            BudgetExhaustedError: if the daily budget (if configured) has
+                already been reached for today.
+        """
+        with self._lock:
+            self._check_rollover_locked()
+
+            if self.daily_budget is not None and self._count >= self.daily_budget:
+                raise BudgetExhaustedError(resets_at=self._next_midnight_locked())
+
+            wait = self._reserve_rpm_token_locked()
+
+            self._count += 1
+            self._acquires_since_flush += 1
+            if self._acquires_since_flush >= _FLUSH_EVERY:
+                self._flush_locked()
+
+        if wait > 0:
+            await self._async_sleep(wait)
+
     def remaining(self) -> dict:
         """Return current limiter status."""
         with self._lock:
@@ -182,6 +223,19 @@ class RateBudgetLimiter:
         else:
             self._tokens -= 1.0
 
+    def _reserve_rpm_token_locked(self) -> float:
+        """Take one token, possibly into debt; return seconds until it is earned."""
+        if self.rpm is None:
+            return 0.0
+
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._tokens = min(float(self.rpm), self._tokens + elapsed * self._refill_rate)
+        self._last_refill = now
+
+        self._tokens -= 1.0
+        return -self._tokens / self._refill_rate if self._tokens < 0 else 0.0
+
     def _load_count_locked(self, day: date) -> int:
         """Read (or implicitly initialize to 0) today's persisted count."""
         session = self.session_factory()
@@ -221,6 +275,9 @@ class NoopLimiter:
     def acquire(self) -> None:
         pass
 
+    async def acquire_async(self) -> None:
+        pass
+
     def remaining(self) -> dict:
         return {
             "rpm": None,
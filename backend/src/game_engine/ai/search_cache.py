@@ -0,0 +1,137 @@
+"""
+Per-turn cache of sequence-search results (see ``enumerator.enumerate_sequences``).
+
+A mid-turn re-plan (``LLMPlayer._replan_warranted``) or a repeated
+``TurnPlanner.create_plan`` call in the same turn starts from a position the
+turn's first search already walked through. The search therefore keeps a
+*trace* of every line it records, and for each position whose subtree it
+searched exhaustively — nothing below it cut by the depth limit, the node
+budget or a transposition — the range of traces recorded under it.
+
+A later search from a position with a cached entry rebuilds its lines from
+those traces (re-scored against the live position) instead of searching
+again. Entries are keyed by ``GameState.get_state_hash()``, the same key the
+search already uses for transpositions, within the *turn key* (game id, turn
+number, player id) of the search. Each game holds the entries of its current
+turn only; a new turn or player drops them. The cache is thread-safe, and
+searches of different games sharing one cache neither see nor evict each
+other's entries (up to ``max_games`` games, least recently used dropped).
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# One recorded line: (steps, per-step Charge costs, formatted actions,
+# opponent break-zone size, own break-zone size, Charge left, wins) — the
+# last four measured in the line's final state.
+Trace = Tuple[List[Dict[str, Any]], List[int], Tuple[Dict[str, Any], ...], int, int, int, bool]
+
+
+@dataclass(frozen=True)
+class CachedSubtree:
+    """Traces recorded under one exhaustively searched position."""
+    traces: List[Trace]
+    start: int  # index of the position's own (empty-suffix) trace
+    end: int
+    depth: int  # steps from the search root to the position
+
+
+@dataclass
+class _TurnEntries:
+    """One game's cached positions for its current turn."""
+    key: Hashable
+    subtrees: Dict[int, CachedSubtree] = field(default_factory=dict)
+    trace_count: int = 0
+
+
+class SearchCache:
+    """
+    Search results for the rest of each game's turn, keyed by state hash.
+
+    Every call takes the search's turn key, ``(game_id, turn_number,
+    player_id)``.
+
+    Args:
+        max_traces: Stop caching new searches of a turn once this many traces
+            are held for it (bounds memory on very wide turns)
+        max_games: Games whose turns are held at once
+    """
+
+    def __init__(self, max_traces: int = 50_000, max_games: int = 8):
+        self.max_traces = max_traces
+        self.max_games = max_games
+        self._games: "OrderedDict[Hashable, _TurnEntries]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def start_turn(self, key: Hashable) -> None:
+        """Drop the game's entries unless ``key`` is its current turn."""
+        game_id = key[0]
+        with self._lock:
+            entries = self._games.get(game_id)
+            if entries is None or entries.key != key:
+                self._games[game_id] = _TurnEntries(key)
+            self._games.move_to_end(game_id)
+            while len(self._games) > self.max_games:
+                self._games.popitem(last=False)
+
+    def lookup(self, key: Hashable, state_hash: int) -> Optional[CachedSubtree]:
+        """The cached subtree for a position, counting the hit or miss."""
+        with self._lock:
+            entries = self._entries(key)
+            subtree = entries.subtrees.get(state_hash) if entries is not None else None
+            if subtree is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return subtree
+
+    def has_room(self, key: Hashable) -> bool:
+        with self._lock:
+            entries = self._entries(key)
+            return entries is not None and entries.trace_count < self.max_traces
+
+    def store(
+        self,
+        key: Hashable,
+        traces: List[Trace],
+        subtrees: Dict[int, Tuple[int, int, int]],
+    ) -> None:
+        """
+        Add one search's traces and its exhaustively searched positions.
+
+        Dropped if the game has moved on to another turn meanwhile.
+
+        Args:
+            key: The search's turn key
+            traces: Every line the search recorded, in record order
+            subtrees: state hash -> (start, end, depth) into ``traces``
+        """
+        with self._lock:
+            entries = self._entries(key)
+            if entries is None:
+                return
+            entries.trace_count += len(traces)
+            for state_hash, (start, end, depth) in subtrees.items():
+                entries.subtrees.setdefault(state_hash, CachedSubtree(traces, start, end, depth))
+
+    def _entries(self, key: Hashable) -> Optional[_TurnEntries]:
+        entries = self._games.get(key[0])
+        return entries if entries is not None and entries.key == key else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries.subtrees) for entries in self._games.values())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "games": len(self._games),
+                "positions": sum(len(entries.subtrees) for entries in self._games.values()),
+                "traces": sum(entries.trace_count for entries in self._games.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
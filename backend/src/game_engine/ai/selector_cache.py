@@ -0,0 +1,316 @@
+"""
+Response cache for the strategic-selection call (``TurnPlanner``'s Request 2).
+
+The same positions come up again and again — opening turns of a deck matchup
+across a simulation run, rematches in production — and each one used to cost
+a Gemini call. The selector prompt is a pure function of the position: it
+holds the board legend, threat priorities, card guidance and the enumerated
+sequences (by label, never by card id), with no game id or player names. Two
+identical prompts therefore describe the same position *and* number its
+sequences the same way, so a cached ``selected_index`` stays valid.
+
+Entries are keyed by ``selector_cache_key``: a SHA-256 of the prompt, the
+system instruction, the model, the temperature and ``PROMPTS_VERSION`` (a
+prompt or model change never reuses an old answer). Only responses that
+parsed cleanly with a valid index are stored.
+
+``SelectorResponseCache`` keeps an in-memory LRU in front of an optional
+persistent store (the ``ai_selector_cache`` table, see
+``api.db_models.SelectorCacheModel``), shared across processes and restarts.
+Entries expire ``ttl`` seconds after they were stored, in both tiers. Store
+errors are logged and treated as misses: the cache never fails a turn.
+
+Configuration (``get_selector_cache``):
+
+- ``AI_SELECTOR_CACHE``: ``off`` (default), ``memory`` or ``db``
+- ``AI_SELECTOR_CACHE_SIZE``: entries kept in memory, and rows kept in the
+  table (default 10000)
+- ``AI_SELECTOR_CACHE_TTL_HOURS``: entry lifetime (default 168)
+
+Evaluation runs that must pay for every selection bypass the cache per
+planner (``TurnPlanner(use_response_cache=False)``, the simulation's
+``selector_cache`` option). Hit/miss counters are reported on /health.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .prompts import PROMPTS_VERSION
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "AI_SELECTOR_CACHE"
+SIZE_ENV = "AI_SELECTOR_CACHE_SIZE"
+TTL_ENV = "AI_SELECTOR_CACHE_TTL_HOURS"
+CACHE_MODES = ("off", "memory", "db")
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL_HOURS = 168.0
+
+# Prune expired and surplus rows from the store every N stores
+_PRUNE_EVERY = 100
+
+
+def selector_cache_key(
+    prompt: str,
+    system_instruction: str,
+    model: str,
+    temperature: float,
+) -> str:
+    """Canonical key of one strategic-selection request."""
+    payload = json.dumps(
+        [PROMPTS_VERSION, model, temperature, system_instruction, prompt],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SelectorResponseCache:
+    """
+    LRU + TTL cache of selector responses, optionally backed by the database.
+
+    Thread-safe: planners on the AI worker pool and simulation threads share
+    one instance.
+
+    Args:
+        max_entries: Entries kept in memory (least recently used evicted
+            first); also the row cap of the persistent store
+        ttl: Seconds an entry stays valid after it was stored; None to disable
+        session_factory: SQLAlchemy sessionmaker for the ``ai_selector_cache``
+            table; None keeps the cache in memory only
+        clock: Wall clock in seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL_HOURS * 3600,
+        session_factory=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.session_factory = session_factory
+        self._clock = clock
+        # key -> (response, stored at), least recently used first
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stores_since_prune = 0
+        self._counters = {
+            "memory_hits": 0,
+            "store_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions_lru": 0,
+            "evictions_ttl": 0,
+            "store_errors": 0,
+        }
+
+    def get(self, key: str) -> Optional[str]:
+        """The cached response for ``key``, or None (counting the hit or miss)."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[1], now):
+                del self._entries[key]
+                self._counters["evictions_ttl"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return entry[0]
+
+        entry = self._load(key, now)
+        with self._lock:
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["store_hits"] += 1
+            self._insert_locked(key, entry)
+        return entry[0]
+
+    def put(self, key: str, response: str, model: str) -> None:
+        """Cache a cleanly parsed response."""
+        now = self._clock()
+        with self._lock:
+            self._counters["stores"] += 1
+            self._insert_locked(key, (response, now))
+            self._stores_since_prune += 1
+            prune = self._stores_since_prune >= _PRUNE_EVERY
+            if prune:
+                self._stores_since_prune = 0
+        if self.session_factory is not None:
+            self._save(key, response, model, now)
+            if prune:
+                self._prune(now)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the persistent store is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, hit rate and eviction counters for /health."""
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        hits = counters["memory_hits"] + counters["store_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            "enabled": True,
+            "store": "db" if self.session_factory is not None else "memory",
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_hours": round(self.ttl / 3600, 3) if self.ttl is not None else None,
+            "hits": hits,
+            **counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _insert_locked(self, key: str, entry: Tuple[str, float]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions_lru"] += 1
+
+    # --- persistent store ---
+
+    def _load(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        if self.session_factory is None:
+            return None
+        from api.db_models import SelectorCacheModel
+
+        try:
+            session = self.session_factory()
+            try:
+                row = session.get(SelectorCacheModel, key)
+                if row is None:
+                    return None
+                stored_at = _timestamp(row.created_at)
+                if self._expired(stored_at, now):
+                    return None
+                return row.response, stored_at
+            finally:
+                session.close()
+        except Exception as e:
+            self._store_error("read", e)
+            return None
+
+    def _save(self, key: str, response: str, model: str, now: float) -> None:
+        from api.db_models import SelectorCacheModel
+
+        try:
+            session = self.session_factory()
+            try:
+                session.merge(SelectorCacheModel(
+                    key=key,
+                    model=model,
+                    prompts_version=PROMPTS_VERSION,
+                    response=response,
+                    created_at=datetime.fromtimestamp(now, timezone.utc),
+                ))
+                session.commit()
+            finally:
+                session.close()
+        except Exception as e:
+            self._store_error("write", e)
+
+    def _prune(self, now: float) -> None:
+        """Delete expired rows, then the oldest rows past ``max_entries``."""
+        from api.db_models import SelectorCacheModel
+
+        try:
+            session = self.session_factory()
+            try:
+                query = session.query(SelectorCacheModel)
+                if self.ttl is not None:
+                    cutoff = datetime.fromtimestamp(now, timezone.utc) - timedelta(seconds=self.ttl)
+                    query.filter(SelectorCacheModel.created_at < cutoff).delete(
+                        synchronize_session=False
+                    )
+                keep = (
+                    session.query(SelectorCacheModel.created_at)
+                    .order_by(SelectorCacheModel.created_at.desc())
+                    .offset(self.max_entries - 1)
+                    .limit(1)
+                    .scalar()
+                )
+                if keep is not None:
+                    query.filter(SelectorCacheModel.created_at < keep).delete(
+                        synchronize_session=False
+                    )
+                session.commit()
+            finally:
+                session.close()
+        except Exception as e:
+            self._store_error("prune", e)
+
+    def _store_error(self, operation: str, error: Exception) -> None:
+        logger.warning("Selector cache %s failed: %s", operation, error)
+        with self._lock:
+            self._counters["store_errors"] += 1
+
+
+def _timestamp(value: datetime) -> float:
+    # SQLite hands back naive datetimes; they were stored as UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+_cache: Optional[SelectorResponseCache] = None
+_cache_configured = False
+_cache_lock = threading.Lock()
+
+
+def get_selector_cache() -> Optional[SelectorResponseCache]:
+    """The process-wide cache, built on first use from the environment (None when off)."""
+    global _cache, _cache_configured
+    if not _cache_configured:
+        with _cache_lock:
+            if not _cache_configured:
+                _cache = _build_from_env()
+                _cache_configured = True
+    return _cache
+
+
+def _build_from_env() -> Optional[SelectorResponseCache]:
+    mode = (os.environ.get(CACHE_ENV) or "off").strip().lower()
+    if mode not in CACHE_MODES:
+        logger.warning("Unknown %s=%r; selector cache disabled", CACHE_ENV, mode)
+        return None
+    if mode == "off":
+        return None
+    session_factory = None
+    if mode == "db":
+        from api.database import SessionLocal
+        session_factory = SessionLocal
+    ttl_hours = float(os.environ.get(TTL_ENV) or DEFAULT_TTL_HOURS)
+    return SelectorResponseCache(
+        max_entries=int(os.environ.get(SIZE_ENV) or DEFAULT_MAX_ENTRIES),
+        ttl=ttl_hours * 3600 if ttl_hours > 0 else None,
+        session_factory=session_factory,
+    )
+
+
+def selector_cache_stats() -> Dict[str, Any]:
+    """Stats of the process-wide cache for /health."""
+    cache = get_selector_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
@@ -0,0 +1,152 @@
+"""
+Pluggable sequence selectors for the turn planner (Request 2).
+
+``TurnPlanner`` enumerates every legal sequence deterministically, then picks
+one. By default the pick is a Gemini strategic-selection call
+(``prompts.strategic_selector``). A ``SequenceSelector`` replaces that call
+with a local decision. ``HeuristicSelector`` is a deterministic scorer built
+on the enumerator's own ranking plus the tactical labels. It makes no network
+calls, so card-balance sweeps are bound by CPU rather than RPM limits or
+latency.
+
+Selectors are chosen by name (``SELECTOR_KINDS``) in ``SimulationConfig`` and
+the simulation CLI, per player, so heuristic and LLM players can be mixed.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game_engine.models.game_state import GameState
+
+# Selector names accepted by build_selector(). "llm" means the default
+# strategic-selection call inside TurnPlanner (no SequenceSelector object).
+SELECTOR_KINDS = ("llm", "heuristic")
+
+
+@dataclass
+class Selection:
+    """A selector's choice: index into the sequence list, plus its reasoning."""
+    index: int
+    reasoning: str
+
+
+class SequenceSelector:
+    """
+    Interface for choosing one enumerated sequence without the LLM.
+
+    Subclasses implement ``select``. Sequences arrive in enumerator rank order
+    with tactical labels applied (see ``prompts.sequence_format``).
+    """
+
+    name = "selector"
+
+    def select(
+        self,
+        game_state: "GameState",
+        player_id: str,
+        sequences: List[Dict[str, Any]],
+        game_engine=None,
+    ) -> Selection:
+        """
+        Pick the sequence to play.
+
+        Args:
+            game_state: Current GameState object
+            player_id: ID of the AI player
+            sequences: Labeled sequences from enumerate_sequences()
+            game_engine: Optional GameEngine for effective stats
+
+        Returns:
+            Selection with a valid index into ``sequences``
+        """
+        raise NotImplementedError
+
+
+class HeuristicSelector(SequenceSelector):
+    """
+    Deterministic local scorer: enumerator rank first, tactical label second.
+
+    The primary score is the enumerator's ``rank_key`` (win, most opponent
+    breaks, fewest own breaks, least Charge wasted, shortest). Lines that tie
+    on it are ordered by tactical label, preferring lines that develop the
+    board over lines that only bank resources. Remaining ties go to the
+    earliest sequence, or to a seeded random pick when ``rng`` is given. This
+    keeps repeated games of one matchup from all playing out identically.
+    """
+
+    name = "heuristic"
+
+    # Tie-break preference among equally ranked lines (higher is better).
+    LABEL_PRIORITY = {
+        "[Lethal]": 5,
+        "[Aggressive Removal]": 4,
+        "[Board Setup]": 3,
+        "[Balanced]": 2,
+        "[Resource Building]": 1,
+        "[Conservative]": 0,
+    }
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Args:
+            rng: Optional random source for breaking exact ties. None always
+                picks the earliest tied sequence.
+        """
+        self._rng = rng
+
+    def score(self, sequence: Dict[str, Any]) -> Tuple:
+        """
+        Score one sequence; higher is better.
+
+        Args:
+            sequence: Labeled sequence dict from the enumerator
+
+        Returns:
+            Comparable tuple: rank_key terms followed by label priority
+        """
+        rank_key = tuple(sequence.get("rank_key") or (0, sequence.get("cards_broken", 0)))
+        label_priority = self.LABEL_PRIORITY.get(sequence.get("tactical_label"), 0)
+        return rank_key + (label_priority,)
+
+    def select(
+        self,
+        game_state: "GameState",
+        player_id: str,
+        sequences: List[Dict[str, Any]],
+        game_engine=None,
+    ) -> Selection:
+        scores = [self.score(seq) for seq in sequences]
+        best = max(scores)
+        tied = [i for i, score in enumerate(scores) if score == best]
+        index = self._rng.choice(tied) if self._rng is not None and len(tied) > 1 else tied[0]
+
+        seq = sequences[index]
+        reasoning = (
+            f"[heuristic] {seq.get('tactical_label', '[Unknown]')} "
+            f"broken={seq.get('cards_broken', 0)} "
+            f"charge={seq.get('total_charge_spent', 0)}/{seq.get('charge_available', 0)}"
+        )
+        return Selection(index=index, reasoning=reasoning)
+
+
+def build_selector(kind: str, seed: Optional[int] = None) -> Optional[SequenceSelector]:
+    """
+    Build a selector by name.
+
+    Args:
+        kind: One of SELECTOR_KINDS
+        seed: Optional seed for the heuristic selector's tie-breaking
+
+    Returns:
+        A SequenceSelector, or None for "llm" (TurnPlanner's default selection)
+
+    Raises:
+        ValueError: If kind is not a known selector
+    """
+    if kind == "llm":
+        return None
+    if kind == "heuristic":
+        return HeuristicSelector(rng=random.Random(seed) if seed is not None else None)
+    raise ValueError(f"Unknown selector '{kind}'; must be one of {list(SELECTOR_KINDS)}")
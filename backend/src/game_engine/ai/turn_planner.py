@@ -5,15 +5,22 @@ Generates a complete turn plan each turn:
 - Request 1: enumerate every engine-legal action sequence deterministically
   (``enumerator.enumerate_sequences`` — no LLM call, no illegal actions possible).
 - Request 2: one Gemini call picks the best sequence strategically
-  (``prompts.strategic_selector``).
+  (``prompts.strategic_selector``), unless a local ``SequenceSelector`` is
+  plugged in (``selectors.HeuristicSelector`` picks with no LLM call).
+  Repeated positions reuse an earlier answer from the selector response
+  cache (``selector_cache``) when it is enabled.
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple
 
 from game_engine.models.game_state import GameState
 from .prompts import TurnPlan, PlannedAction, PROMPTS_VERSION
+from .prompts.fragment_cache import PromptFragments, record_prompt_build
 from .prompts.sequence_format import add_tactical_labels
 from .prompts.strategic_selector import (
     generate_strategic_prompt,
@@ -27,16 +34,31 @@ from .quality_metrics import TurnMetrics, record_turn_metrics
 from .providers import GeminiProvider, build_provider
 from .rate_limiter import BudgetExhaustedError
 from .enumerator import enumerate_sequences
+from .search_cache import SearchCache
+from .selector_cache import SelectorResponseCache, get_selector_cache, selector_cache_key
+from .selectors import SequenceSelector
 
 logger = logging.getLogger(__name__)
 
 PROMPT_TOKEN_ESTIMATE_DIVISOR = 4
 
 
+@dataclass
+class _SelectionRequest:
+    """A turn's pending strategic-selection call (see TurnPlanner._prepare_plan)."""
+    game_state: GameState
+    player_id: str
+    sequences: List[Dict[str, Any]]
+    prompt: str
+    system_instruction: str
+    # selector_cache_key of the request; None when no cache is in use
+    cache_key: Optional[str] = None
+
+
 class TurnPlanner:
     """
     Generates turn plans via deterministic enumeration + one strategic-selection
-    LLM call (see module docstring).
+    LLM call, or a local selector (see module docstring).
     """
 
     # Class-level metrics (shared across instances)
@@ -46,6 +68,7 @@ class TurnPlanner:
         "no_sequences": 0,
         "selection_parse_error": 0,
         "selection_invalid_index": 0,
+        "selection_cache_hits": 0,
     }
 
     @classmethod
@@ -70,6 +93,9 @@ class TurnPlanner:
         model_name: str,
         fallback_model: str,
         provider_client: Optional[GeminiProvider] = None,
+        selector: Optional[SequenceSelector] = None,
+        response_cache: Optional[SelectorResponseCache] = None,
+        use_response_cache: bool = True,
     ):
         """
         Initialize the TurnPlanner.
@@ -80,10 +106,18 @@ class TurnPlanner:
             fallback_model: Fallback model for capacity issues
             provider_client: Optional pre-built GeminiProvider (tests construct
                 this directly to avoid requiring a real API key)
+            selector: Optional local SequenceSelector used instead of the
+                strategic-selection LLM call. With a selector and no
+                provider_client, no provider is built (no API key needed).
+            response_cache: Selector response cache; defaults to the
+                process-wide one (``AI_SELECTOR_CACHE``, off unless configured)
+            use_response_cache: False bypasses the cache entirely (no reads
+                or writes), e.g. for evaluation runs that must query the model
         """
         self.client = client
         self.provider_client = provider_client
-        if self.provider_client is None:
+        self.selector = selector
+        if self.provider_client is None and self.selector is None:
             self.provider_client, resolved = build_provider(
                 model=model_name,
                 fallback_model=fallback_model,
@@ -108,6 +142,17 @@ class TurnPlanner:
         # Per-turn enumerator/selection diagnostics for admin UI
         self._enum_debug: Optional[Dict[str, Any]] = None
 
+        # Search results reused by re-plans later in the same turn
+        self._search_cache = SearchCache()
+
+        # Board-legend lines reused by later prompts on an unchanged board
+        self._prompt_fragments = PromptFragments()
+
+        # Selector responses reused across games for repeated positions
+        self.response_cache: Optional[SelectorResponseCache] = None
+        if use_response_cache:
+            self.response_cache = response_cache if response_cache is not None else get_selector_cache()
+
     def create_plan(
         self,
         game_state: GameState,
@@ -125,9 +170,74 @@ class TurnPlanner:
         Returns:
             TurnPlan object if successful, None if planning failed
         """
-        logger.debug(f"🧠 Creating turn plan for Turn {game_state.turn_number}")
+        plan, request = self._prepare_plan(game_state, player_id, game_engine)
+        if request is None:
+            return plan
+        cached = self._cached_selection(request)
+        if cached is not None:
+            return self._complete_selection(request, cached)
+        try:
+            response = self.provider_client.generate_json(
+                request.prompt, STRATEGIC_SELECTOR_SCHEMA, **self._selection_call_kwargs(request)
+            )
+        except BudgetExhaustedError:
+            # Not a selection failure: the daily API budget is spent. Never
+            # fall back to heuristic play — propagate so the run pauses.
+            raise
+        except Exception as e:
+            return self._selection_failed(request, e)
+        plan = self._complete_selection(request, response)
+        self._cache_selection(request, response)
+        return plan
 
-        ai_player = game_state.players[player_id]
+    async def create_plan_async(
+        self,
+        game_state: GameState,
+        player_id: str,
+        game_engine=None
+    ) -> Optional[TurnPlan]:
+        """
+        ``create_plan`` with the strategic-selection call awaited
+        (``GeminiProvider.generate_json_async``) instead of blocking a thread.
+
+        Enumeration and prompt building run in a worker thread so the event
+        loop is never blocked by the search, as do cache lookups and stores
+        (the store may be the database).
+        """
+        plan, request = await asyncio.to_thread(
+            self._prepare_plan, game_state, player_id, game_engine
+        )
+        if request is None:
+            return plan
+        cached = await asyncio.to_thread(self._cached_selection, request)
+        if cached is not None:
+            return self._complete_selection(request, cached)
+        try:
+            response = await self.provider_client.generate_json_async(
+                request.prompt, STRATEGIC_SELECTOR_SCHEMA, **self._selection_call_kwargs(request)
+            )
+        except BudgetExhaustedError:
+            raise
+        except Exception as e:
+            return self._selection_failed(request, e)
+        plan = self._complete_selection(request, response)
+        await asyncio.to_thread(self._cache_selection, request, response)
+        return plan
+
+    def _prepare_plan(
+        self,
+        game_state: GameState,
+        player_id: str,
+        game_engine=None,
+    ) -> Tuple[Optional[TurnPlan], Optional["_SelectionRequest"]]:
+        """
+        Enumerate sequences and build the strategic-selection request.
+
+        Returns:
+            (plan, None) when no LLM call is needed (no sequences, or a local
+            selector picked), else (None, request)
+        """
+        logger.debug(f"🧠 Creating turn plan for Turn {game_state.turn_number}")
 
         TurnPlanner._metrics["total_turns"] += 1
 
@@ -148,12 +258,22 @@ class TurnPlanner:
             "selection_index_used": None,
             "selection_exception": None,
             "selection_fallback_used": False,
+            "selection_cached": False,
+            "prompt_build_ms": None,
+            "selector": self.selector.name if self.selector is not None else "llm",
+            # nodes_expanded / children_applied / workers (AI_ENUM_WORKERS)
+            "enumeration_stats": {},
         }
 
         # === Request 1: deterministic enumeration ===
         logger.debug("🧮 Enumerating action sequences (deterministic)...")
         try:
-            sequences = enumerate_sequences(game_state, player_id)
+            sequences = enumerate_sequences(
+                game_state,
+                player_id,
+                stats=self._enum_debug["enumeration_stats"],
+                cache=self._search_cache,
+            )
         except Exception as e:
             logger.error(f"Enumeration failed: {e}", exc_info=True)
             self._enum_debug["enumeration_exception"] = str(e)
@@ -164,14 +284,25 @@ class TurnPlanner:
         if not sequences:
             logger.warning("⚠️ No sequences enumerated for this turn")
             TurnPlanner._metrics["no_sequences"] += 1
-            return None
+            return None, None
 
         sequences = add_tactical_labels(sequences)
 
+        if self.selector is not None:
+            return self._select_locally(game_state, player_id, sequences, game_engine), None
+
         # === Request 2: strategic selection ===
         logger.debug("🎯 Selecting best sequence...")
 
-        select_prompt = generate_strategic_prompt(game_state, player_id, sequences, game_engine)
+        fragments = self._prompt_fragments
+        hits, misses = fragments.hits, fragments.misses
+        started = time.perf_counter()
+        select_prompt = generate_strategic_prompt(
+            game_state, player_id, sequences, game_engine, fragments=fragments
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._enum_debug["prompt_build_ms"] = round(elapsed_ms, 3)
+        record_prompt_build(elapsed_ms, fragments.hits - hits, fragments.misses - misses)
         select_system_instruction = get_strategic_selector_system_instruction()
         self._last_prompt = select_prompt
         self._selection_prompt = select_prompt
@@ -181,19 +312,53 @@ class TurnPlanner:
             len(select_prompt),
             self._estimate_prompt_tokens(select_prompt),
         )
-
-        try:
-            select_response = self.provider_client.generate_json(
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = selector_cache_key(
                 select_prompt,
-                STRATEGIC_SELECTOR_SCHEMA,
-                temperature=get_strategic_selector_temperature(),
-                max_output_tokens=self._get_selector_output_budget(),
-                retry_count=3,
-                allow_fallback=True,
-                model=self.model_name,
-                fallback_model=self.fallback_model,
-                system_instruction=select_system_instruction,
+                select_system_instruction,
+                self.model_name,
+                get_strategic_selector_temperature(),
             )
+        return None, _SelectionRequest(
+            game_state, player_id, sequences, select_prompt, select_system_instruction, cache_key
+        )
+
+    def _cached_selection(self, request: "_SelectionRequest") -> Optional[str]:
+        """A cached response for the request's position, if any."""
+        if request.cache_key is None:
+            return None
+        response = self.response_cache.get(request.cache_key)
+        if response is not None:
+            logger.debug("   Selector response cache hit")
+            TurnPlanner._metrics["selection_cache_hits"] += 1
+            self._enum_debug["selection_cached"] = True
+        return response
+
+    def _cache_selection(self, request: "_SelectionRequest", response: str) -> None:
+        """Cache a response that parsed cleanly with a valid index."""
+        if request.cache_key is None:
+            return
+        debug = self._enum_debug
+        if debug["selection_parse_error"] or debug["selection_invalid_index"] or debug["selection_exception"]:
+            return
+        self.response_cache.put(request.cache_key, response, self.model_name)
+
+    def _selection_call_kwargs(self, request: "_SelectionRequest") -> Dict[str, Any]:
+        return {
+            "temperature": get_strategic_selector_temperature(),
+            "max_output_tokens": self._get_selector_output_budget(),
+            "retry_count": 3,
+            "allow_fallback": True,
+            "model": self.model_name,
+            "fallback_model": self.fallback_model,
+            "system_instruction": request.system_instruction,
+        }
+
+    def _complete_selection(self, request: "_SelectionRequest", select_response: str) -> Optional[TurnPlan]:
+        """Turn the selector's response into a plan (first sequence on a bad response)."""
+        sequences = request.sequences
+        try:
             self._last_response = select_response
             self._selection_response = select_response
             selection = parse_selector_response(select_response)
@@ -217,54 +382,74 @@ class TurnPlanner:
             logger.debug(f"   Selected sequence {selected_index}: {selected_sequence.get('tactical_label', '?')}")
             logger.debug(f"   Reasoning: {reasoning[:100]}...")
 
-            plan_data = convert_sequence_to_turn_plan(
-                selected_sequence, game_state, player_id, reasoning,
-                trust_action_costs=True,
-            )
-            plan = self._parse_plan(plan_data)
-            # Enumerated sequences already carry exact, engine-derived Charge
-            # (including discounted tussles like Raggy=0 / Wizard=1) — no
-            # regrounding pass needed, unlike LLM-generated plans.
-            plan.charge_start = ai_player.charge
-            self._last_plan = plan
+            return self._finalize_plan(selected_sequence, request.game_state, request.player_id, reasoning)
 
-            TurnPlanner._metrics["success"] += 1
-
-            self._log_plan_summary(plan)
-
-            metrics = TurnMetrics.from_plan(plan, game_state, player_id)
-            record_turn_metrics(metrics)
-            logger.info(f"Turn {metrics.turn_number} metrics: {metrics.to_log_dict()}")
+        except Exception as e:
+            return self._selection_failed(request, e)
+
+    def _selection_failed(self, request: "_SelectionRequest", error: Exception) -> Optional[TurnPlan]:
+        logger.error(f"Strategic selection failed: {error}")
+        TurnPlanner._metrics["selection_parse_error"] += 1
+        self._enum_debug["selection_exception"] = str(error)
+        # Fall back to the first sequence if selection fails
+        if request.sequences:
+            self._enum_debug["selection_fallback_used"] = True
+            return self._finalize_plan(
+                request.sequences[0], request.game_state, request.player_id,
+                "Selection failed, using first sequence",
+                log_summary=False,
+            )
+        return None
 
-            return plan
+    def _select_locally(
+        self,
+        game_state: GameState,
+        player_id: str,
+        sequences: list,
+        game_engine=None,
+    ) -> TurnPlan:
+        """Pick a sequence with the plugged-in selector (no LLM call)."""
+        selection = self.selector.select(game_state, player_id, sequences, game_engine)
+        selected_index = selection.index
+        if not 0 <= selected_index < len(sequences):
+            selected_index = 0
+            logger.warning("Invalid sequence index from %s selector, using 0", self.selector.name)
+            self._enum_debug["selection_invalid_index"] = True
+            TurnPlanner._metrics["selection_invalid_index"] += 1
+        self._enum_debug["selection_index_used"] = selected_index
+        logger.debug(f"   {self.selector.name} selected sequence {selected_index}: {selection.reasoning}")
+        return self._finalize_plan(sequences[selected_index], game_state, player_id, selection.reasoning)
+
+    def _finalize_plan(
+        self,
+        sequence: Dict[str, Any],
+        game_state: GameState,
+        player_id: str,
+        reasoning: str,
+        log_summary: bool = True,
+    ) -> TurnPlan:
+        """Convert the chosen sequence to a TurnPlan and record metrics."""
+        plan_data = convert_sequence_to_turn_plan(
+            sequence, game_state, player_id, reasoning,
+            trust_action_costs=True,
+        )
+        plan = self._parse_plan(plan_data)
+        # Enumerated sequences already carry exact, engine-derived Charge
+        # (including discounted tussles like Raggy=0 / Wizard=1) — no
+        # regrounding pass needed, unlike LLM-generated plans.
+        plan.charge_start = game_state.players[player_id].charge
+        self._last_plan = plan
 
-        except BudgetExhaustedError:
-            # Not a selection failure: the daily API budget is spent. Never
-            # fall back to heuristic play — propagate so the run pauses.
-            raise
-        except Exception as e:
-            logger.error(f"Strategic selection failed: {e}")
-            TurnPlanner._metrics["selection_parse_error"] += 1
-            self._enum_debug["selection_exception"] = str(e)
-            # Fall back to the first sequence if selection fails
-            if sequences:
-                self._enum_debug["selection_fallback_used"] = True
-                plan_data = convert_sequence_to_turn_plan(
-                    sequences[0], game_state, player_id, "Selection failed, using first sequence",
-                    trust_action_costs=True,
-                )
-                plan = self._parse_plan(plan_data)
-                plan.charge_start = ai_player.charge
-                self._last_plan = plan
-                TurnPlanner._metrics["success"] += 1
+        TurnPlanner._metrics["success"] += 1
 
-                metrics = TurnMetrics.from_plan(plan, game_state, player_id)
-                record_turn_metrics(metrics)
-                logger.info(f"Turn {metrics.turn_number} metrics: {metrics.to_log_dict()}")
+        if log_summary:
+            self._log_plan_summary(plan)
 
-                return plan
+        metrics = TurnMetrics.from_plan(plan, game_state, player_id)
+        record_turn_metrics(metrics)
+        logger.info(f"Turn {metrics.turn_number} metrics: {metrics.to_log_dict()}")
 
-        return None
+        return plan
 
     def _estimate_prompt_tokens(self, prompt: str) -> int:
         return max(1, len(prompt) // PROMPT_TOKEN_ESTIMATE_DIVISOR)
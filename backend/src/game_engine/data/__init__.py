@@ -1,9 +1,14 @@
 """Data package for GGLTCG game engine."""
 from .card_loader import CardLoader, load_all_cards, load_cards_dict, get_card_loader
+from .card_catalog import CardCatalog, CardDefinition, get_card_catalog, reload_card_catalog
 
 __all__ = [
     "CardLoader",
     "load_all_cards",
     "load_cards_dict",
     "get_card_loader",
+    "CardCatalog",
+    "CardDefinition",
+    "get_card_catalog",
+    "reload_card_catalog",
 ]
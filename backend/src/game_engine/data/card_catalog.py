@@ -0,0 +1,184 @@
+"""
+Process-wide, immutable catalog of card definitions.
+
+``cards.csv`` is parsed once per process (per CSV path) into frozen
+``CardDefinition`` records, each carrying its effect definitions already
+tokenized into templates. Every card instance — decks built by GameService
+and the simulation runner, a Copy reverting after a zone change, the AI's
+card metadata — is created from the catalog instead of re-reading the CSV.
+
+Reloads are explicit: ``get_card_catalog`` compares the CSV's modification
+time and size with the loaded catalog and re-parses only when they changed
+(or when ``reload_card_catalog`` is called). A catalog object never changes,
+so callers may hold on to one for the duration of a request or game.
+"""
+
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from ..models.card import TEMPLATE_FIELDS, Card, CardTemplate, Zone
+from .card_loader import CardLoader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CardDefinition(CardTemplate):
+    """
+    Immutable definition of one card, as listed in cards.csv.
+
+    Cards created from a definition use it directly as their shared template.
+    """
+    # effect_definitions tokenized once: ((effect_type, *params), ...)
+    effect_templates: Tuple[Tuple[str, ...], ...] = ()
+
+    def new_card(self, owner: str = "", controller: Optional[str] = None, zone: Zone = Zone.HAND) -> Card:
+        """Create a fresh card instance (new id) from this definition; controller defaults to owner."""
+        return Card.from_template(
+            self, owner=owner, controller=owner if controller is None else controller, zone=zone
+        )
+
+
+class CardCatalog:
+    """
+    Read-only mapping of card name -> CardDefinition for one CSV file.
+
+    Args:
+        definitions: Card definitions in CSV order
+        source: CSV file the definitions were parsed from
+        signature: (mtime_ns, size) of the CSV when it was parsed
+    """
+
+    def __init__(
+        self,
+        definitions: List[CardDefinition],
+        source: Optional[Path] = None,
+        signature: Optional[Tuple[int, int]] = None,
+    ):
+        self._definitions: Mapping[str, CardDefinition] = MappingProxyType(
+            {definition.name: definition for definition in definitions}
+        )
+        self.source = source
+        self.signature = signature
+        # Identifies the definitions' contents (recorded in game snapshots)
+        self.fingerprint = zlib.crc32(
+            repr([tuple(getattr(d, f) for f in TEMPLATE_FIELDS) for d in definitions]).encode("utf-8")
+        )
+
+    def __getitem__(self, name: str) -> CardDefinition:
+        return self._definitions[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._definitions
+
+    def __iter__(self) -> Iterator[CardDefinition]:
+        return iter(self._definitions.values())
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def get(self, name: str) -> Optional[CardDefinition]:
+        return self._definitions.get(name)
+
+    @property
+    def names(self) -> List[str]:
+        """Card names in CSV order."""
+        return list(self._definitions)
+
+    def create_card(
+        self, name: str, owner: str = "", controller: Optional[str] = None, zone: Zone = Zone.HAND
+    ) -> Card:
+        """
+        Create a fresh card instance by name (controller defaults to owner).
+
+        Raises:
+            ValueError: If the card is not in the catalog
+        """
+        definition = self._definitions.get(name)
+        if definition is None:
+            raise ValueError(f"Card '{name}' not found in card database")
+        return definition.new_card(owner=owner, controller=controller, zone=zone)
+
+    def create_cards(self) -> List[Card]:
+        """One fresh instance of every card, in CSV order."""
+        return [definition.new_card() for definition in self._definitions.values()]
+
+    @classmethod
+    def from_csv(cls, csv_path: str | Path) -> "CardCatalog":
+        """Parse a cards CSV into a catalog (no caching; see get_card_catalog)."""
+        from ..rules.effects.effect_registry import split_effect_definitions
+
+        path = Path(csv_path)
+        signature = _file_signature(path)
+        definitions = []
+        for card in CardLoader(path).load_cards():
+            definitions.append(CardDefinition(
+                name=card.name,
+                card_type=card.card_type,
+                cost=card.cost,
+                effect_text=card.effect_text,
+                effect_definitions=card.effect_definitions,
+                speed=card.speed,
+                strength=card.strength,
+                stamina=card.stamina,
+                primary_color=card.primary_color,
+                accent_color=card.accent_color,
+                effect_templates=split_effect_definitions(card.effect_definitions),
+            ))
+        return cls(definitions, source=path, signature=signature)
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Loaded catalogs by resolved CSV path
+_catalogs: Dict[Path, CardCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_card_catalog(csv_path: Optional[str | Path] = None) -> CardCatalog:
+    """
+    Get the process-wide catalog for a cards CSV, loading it on first use.
+
+    The catalog is re-parsed only when the file's mtime or size changed
+    since it was loaded.
+
+    Args:
+        csv_path: Cards CSV; defaults to the configured path (CARDS_CSV_PATH
+            or backend/data/cards.csv, see ``get_card_loader``)
+    """
+    if csv_path is None:
+        from .card_loader import get_card_loader
+        csv_path = get_card_loader().csv_path
+    path = Path(csv_path).resolve()
+    signature = _file_signature(path)
+
+    catalog = _catalogs.get(path)
+    if catalog is not None and catalog.signature == signature:
+        return catalog
+    with _catalogs_lock:
+        catalog = _catalogs.get(path)
+        if catalog is None or catalog.signature != signature:
+            if catalog is not None:
+                logger.info(f"Cards CSV changed, reloading catalog: {path}")
+            catalog = CardCatalog.from_csv(path)
+            _catalogs[path] = catalog
+        return catalog
+
+
+def reload_card_catalog(csv_path: Optional[str | Path] = None) -> CardCatalog:
+    """Drop any loaded catalog for the CSV and load it again."""
+    if csv_path is None:
+        from .card_loader import get_card_loader
+        csv_path = get_card_loader().csv_path
+    with _catalogs_lock:
+        _catalogs.pop(Path(csv_path).resolve(), None)
+    return get_card_catalog(csv_path)
+
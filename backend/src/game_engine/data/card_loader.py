@@ -10,7 +10,12 @@ logger = logging.getLogger(__name__)
 
 
 class CardLoader:
-    """Handles loading card data from CSV file."""
+    """
+    Parses card data from a CSV file.
+    
+    Every call re-reads the file; shared lookups should go through the
+    process-wide catalog (``card_catalog.get_card_catalog``) instead.
+    """
     
     def __init__(self, csv_path: str | Path):
         """
@@ -166,17 +171,24 @@ def load_all_cards() -> List[Card]:
     """
     Convenience function to load all cards using default path.
     
+    Instances are built from the shared card catalog (the CSV is parsed once
+    per process), so callers may modify them freely.
+    
     Returns:
         List of all Card objects
     """
-    return get_card_loader().load_cards()
+    from .card_catalog import get_card_catalog
+    return get_card_catalog().create_cards()
 
 
 def load_cards_dict() -> Dict[str, Card]:
     """
     Convenience function to load all cards as dictionary.
     
+    Instances are built from the shared card catalog (the CSV is parsed once
+    per process), so callers may modify them freely.
+    
     Returns:
         Dictionary mapping card name to Card object
     """
-    return get_card_loader().load_cards_dict()
+    return {card.name: card for card in load_all_cards()}
@@ -15,7 +15,7 @@ from .models.player import Player
 from .models.card import Card, CardType, Zone
 from .rules.effects import EffectRegistry, EffectType, TriggerTiming
 from .rules.effects.base_effect import (
-    ContinuousEffect, TriggeredEffect, PlayEffect, 
+    TriggeredEffect, PlayEffect, 
     ActivatedEffect, CostModificationEffect
 )
 
@@ -41,6 +41,10 @@ class GameEngine:
     - Check state-based actions (break defeated cards, check victory)
     - Execute special card mechanics (Copy transformation, etc.)
     """
+
+    # Set by GameService each time it creates or loads the game (see ETags in
+    # api.routes_games); engines built elsewhere keep None
+    load_id: Optional[str] = None
     
     def __init__(self, game_state: GameState):
         """
@@ -322,13 +326,10 @@ class GameEngine:
         final_cost = base_cost
         
         # Check all cards in play for cost modification effects
-        for card_in_play in self.game_state.get_all_cards_in_play():
-            effects = EffectRegistry.get_effects(card_in_play)
-            for effect in effects:
-                if isinstance(effect, CostModificationEffect):
-                    final_cost = effect.modify_card_cost(
-                        card, final_cost, self.game_state, player
-                    )
+        for effect in self.game_state.get_effect_index().cost_modifiers:
+            final_cost = effect.modify_card_cost(
+                card, final_cost, self.game_state, player
+            )
         
         # Also check the card itself for self-cost modifications (e.g., Dream)
         # This allows cards in hand to modify their own cost
@@ -405,6 +406,7 @@ class GameEngine:
             card.zone = Zone.IN_PLAY
             card.controller = player.player_id  # Set controller when entering play
             player.in_play.append(card)
+            self.game_state.invalidate_effect_index()
             
             # Trigger "when played" effects
             self._trigger_when_played_effects(card, player, **kwargs)
@@ -423,6 +425,7 @@ class GameEngine:
                 # Normal Actions go to break zone
                 card.zone = Zone.BREAK
                 player.break_zone.append(card)
+            self.game_state.invalidate_effect_index()
         
         # Check state-based actions
         self.check_state_based_actions()
@@ -519,16 +522,19 @@ class GameEngine:
         """
         # Get base value
         base_value = getattr(card, stat_name, 0)
-        modified_value = base_value
         
-        # Apply all continuous effects from cards in play
-        for card_in_play in self.game_state.get_all_cards_in_play():
-            effects = EffectRegistry.get_effects(card_in_play)
-            for effect in effects:
-                if isinstance(effect, ContinuousEffect):
-                    modified_value = effect.modify_stat(
-                        card, stat_name, modified_value, self.game_state
-                    )
+        # Apply all continuous effects from cards in play (memoized per board/turn)
+        index = self.game_state.get_effect_index()
+        
+        def apply_continuous_effects() -> int:
+            value = base_value
+            for effect in index.continuous:
+                value = effect.modify_stat(card, stat_name, value, self.game_state)
+            return value
+        
+        modified_value = index.memoize(
+            (card.id, stat_name, base_value), apply_continuous_effects
+        )
         
         # Apply turn-scoped modifications (e.g., VeryVeryAppleJuice)
         turn_mod = card.get_turn_modification(stat_name, self.game_state.turn_number)
@@ -557,15 +563,17 @@ class GameEngine:
         # Start with current stamina (base minus damage)
         effective = card.current_stamina
         
-        # Add continuous effect modifications
-        for card_in_play in self.game_state.get_all_cards_in_play():
-            effects = EffectRegistry.get_effects(card_in_play)
-            for effect in effects:
-                if isinstance(effect, ContinuousEffect):
-                    # Get modification amount by asking effect to modify from 0
-                    # This gives us just the bonus/penalty
-                    modification = effect.modify_stat(card, "stamina", 0, self.game_state)
-                    effective += modification
+        # Add continuous effect modifications (memoized per board/turn)
+        index = self.game_state.get_effect_index()
+        
+        def sum_stamina_modifications() -> int:
+            # Ask each effect to modify from 0 to get just the bonus/penalty
+            return sum(
+                effect.modify_stat(card, "stamina", 0, self.game_state)
+                for effect in index.continuous
+            )
+        
+        effective += index.memoize((card.id, "stamina_delta"), sum_stamina_modifications)
         
         # Add turn-scoped modifications (e.g., VeryVeryAppleJuice)
         turn_mod = card.get_turn_modification("stamina", self.game_state.turn_number)
@@ -752,23 +760,21 @@ class GameEngine:
         costs = [base_cost]
         
         # Apply cost modifications from all cards in play
-        for card_in_play in player.in_play:
-            effects = EffectRegistry.get_effects(card_in_play)
-            for effect in effects:
-                if isinstance(effect, CostModificationEffect):
-                    # SetSelfTussleCostEffect only applies to the source card (e.g., Raggy)
-                    if isinstance(effect, SetSelfTussleCostEffect):
-                        if card_in_play == attacker:
-                            modified_cost = effect.modify_tussle_cost(
-                                base_cost, self.game_state, player
-                            )
-                            costs.append(modified_cost)
-                    # SetTussleCostEffect applies to all tussles (e.g., Wizard)
-                    elif isinstance(effect, SetTussleCostEffect):
-                        modified_cost = effect.modify_tussle_cost(
-                            base_cost, self.game_state, player
-                        )
-                        costs.append(modified_cost)
+        index = self.game_state.get_effect_index()
+        for effect in index.cost_modifiers_by_controller.get(player.player_id, []):
+            # SetSelfTussleCostEffect only applies to the source card (e.g., Raggy)
+            if isinstance(effect, SetSelfTussleCostEffect):
+                if effect.source_card == attacker:
+                    modified_cost = effect.modify_tussle_cost(
+                        base_cost, self.game_state, player
+                    )
+                    costs.append(modified_cost)
+            # SetTussleCostEffect applies to all tussles (e.g., Wizard)
+            elif isinstance(effect, SetTussleCostEffect):
+                modified_cost = effect.modify_tussle_cost(
+                    base_cost, self.game_state, player
+                )
+                costs.append(modified_cost)
         
         # Use lowest cost (per rules: modifiers don't stack beyond lowest)
         return min(costs)
@@ -1024,6 +1030,7 @@ class GameEngine:
             card.zone = Zone.BREAK
             card.controller = owner.player_id  # Reset controller back to owner
             owner.break_zone.append(card)
+            self.game_state.invalidate_effect_index()
         else:
             # Normal case - card is controlled by owner
             owner.break_card(card)
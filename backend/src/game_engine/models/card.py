@@ -1,9 +1,12 @@
 """Core data models for GGLTCG game engine."""
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
 import uuid
 
+from .state_hash import HASHED_CARD_FIELDS, card_key
+
 
 class CardType(Enum):
     """Type of card."""
@@ -18,11 +21,85 @@ class Zone(Enum):
     BREAK = "Break"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CardTemplate:
+    """
+    Immutable printed data of a card, shared by every instance of it.
+
+    Instances with identical printed data share one template (see
+    ``intern_template``); a change to one of these fields on a Card (e.g. a
+    Copy transformation) swaps the card over to another shared template.
+    """
+    name: str
+    card_type: CardType
+    cost: int  # Can be -1 for variable cost cards like Copy
+    effect_text: str
+    effect_definitions: str = ""  # Data-driven effects from CSV
+    speed: Optional[int] = None
+    strength: Optional[int] = None
+    stamina: Optional[int] = None
+    primary_color: str = "#C74444"  # Default red for Toys
+    accent_color: str = "#C74444"  # Default red accent
+
+    def is_toy(self) -> bool:
+        return self.card_type == CardType.TOY
+
+    def is_action(self) -> bool:
+        return self.card_type == CardType.ACTION
+
+
+# CardTemplate fields, in constructor order
+TEMPLATE_FIELDS = (
+    "name", "card_type", "cost", "effect_text", "effect_definitions",
+    "speed", "strength", "stamina", "primary_color", "accent_color",
+)
+
+
+@lru_cache(maxsize=4096)
+def intern_template(*values: Any) -> CardTemplate:
+    """Shared CardTemplate for the given field values (in TEMPLATE_FIELDS order)."""
+    return CardTemplate(*values)
+
+
+def _template_property(name: str) -> property:
+    """Card attribute read from the shared template; writes swap templates."""
+    def fget(self: "Card") -> Any:
+        return getattr(self.template, name)
+
+    def fset(self: "Card", value: Any) -> None:
+        template = self.template
+        if getattr(template, name) == value:
+            return
+        values = [getattr(template, field_name) for field_name in TEMPLATE_FIELDS]
+        values[TEMPLATE_FIELDS.index(name)] = value
+        self.template = intern_template(*values)
+
+    return property(fget, fset, doc=f"Template field ``{name}``.")
+
+
+# Per-instance (mutable) Card state, in constructor order
+_STATE_SLOTS = (
+    "id", "owner", "controller", "zone", "current_stamina",
+    "modifications", "turn_modifications",
+)
+# Set only on some cards: Copy transformation flags and the effect cache
+_OPTIONAL_SLOTS = (
+    "_is_transformed", "_original_name", "_original_cost",
+    "_copied_effects", "_effect_cache",
+)
+# Everything snapshot_state() captures
+_SNAPSHOT_SLOTS = ("template",) + _STATE_SLOTS + _OPTIONAL_SLOTS
+
+
 class Card:
     """
     Represents a card in the game.
-    
+
+    A card is a shared, immutable ``CardTemplate`` (its printed data) plus a
+    small slotted record of per-game state. Template fields read through to
+    the template, so every attribute below can be read and assigned as on a
+    plain dataclass.
+
     Attributes:
         id: Unique identifier for this card instance
         name: Card name (e.g., "Ka", "Twist")
@@ -40,30 +117,170 @@ class Card:
         zone: Current zone where card is located
         current_stamina: Current stamina (can be reduced in tussles)
         modifications: Temporary stat modifications applied to this card
+        turn_modifications: Turn-scoped boosts {turn_num: {stat: amount}}
+        template: The shared CardTemplate holding the printed fields
     """
-    name: str
-    card_type: CardType
-    cost: int  # Can be -1 for variable cost cards like Copy
-    effect_text: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    effect_definitions: str = ""  # Data-driven effects from CSV
-    speed: Optional[int] = None
-    strength: Optional[int] = None
-    stamina: Optional[int] = None
-    primary_color: str = "#C74444"  # Default red for Toys
-    accent_color: str = "#C74444"  # Default red accent
-    owner: str = ""
-    controller: str = ""
-    zone: Zone = Zone.HAND
-    current_stamina: Optional[int] = None
-    modifications: Dict[str, int] = field(default_factory=dict)
-    turn_modifications: Dict[str, Any] = field(default_factory=dict)  # Turn-scoped boosts {turn_num: {stat: amount}}
-    
-    def __post_init__(self):
-        """Initialize current_stamina to base stamina."""
-        if self.stamina is not None and self.current_stamina is None:
-            self.current_stamina = self.stamina
-    
+
+    __slots__ = ("template",) + _STATE_SLOTS + _OPTIONAL_SLOTS + ("_hash_listener",)
+
+    name = _template_property("name")
+    card_type = _template_property("card_type")
+    cost = _template_property("cost")
+    effect_text = _template_property("effect_text")
+    effect_definitions = _template_property("effect_definitions")
+    speed = _template_property("speed")
+    strength = _template_property("strength")
+    stamina = _template_property("stamina")
+    primary_color = _template_property("primary_color")
+    accent_color = _template_property("accent_color")
+
+    def __init__(
+        self,
+        name: str,
+        card_type: CardType,
+        cost: int,
+        effect_text: str,
+        id: Optional[str] = None,
+        effect_definitions: str = "",
+        speed: Optional[int] = None,
+        strength: Optional[int] = None,
+        stamina: Optional[int] = None,
+        primary_color: str = "#C74444",
+        accent_color: str = "#C74444",
+        owner: str = "",
+        controller: str = "",
+        zone: Zone = Zone.HAND,
+        current_stamina: Optional[int] = None,
+        modifications: Optional[Dict[str, int]] = None,
+        turn_modifications: Optional[Dict[str, Any]] = None,
+        _hash_listener: Optional[Callable[[int], None]] = None,
+    ):
+        template = intern_template(
+            name, card_type, cost, effect_text, effect_definitions,
+            speed, strength, stamina, primary_color, accent_color,
+        )
+        self._init_state(
+            template, id, owner, controller, zone, current_stamina,
+            modifications, turn_modifications, _hash_listener,
+        )
+
+    @classmethod
+    def from_template(
+        cls,
+        template: CardTemplate,
+        owner: str = "",
+        controller: str = "",
+        zone: Zone = Zone.HAND,
+        id: Optional[str] = None,
+        current_stamina: Optional[int] = None,
+        modifications: Optional[Dict[str, int]] = None,
+        turn_modifications: Optional[Dict[str, Any]] = None,
+    ) -> "Card":
+        """Create an instance sharing an existing template (fresh state unless given)."""
+        card = cls.__new__(cls)
+        card._init_state(
+            template, id, owner, controller, zone,
+            current_stamina, modifications, turn_modifications, None,
+        )
+        return card
+
+    def _init_state(
+        self,
+        template: CardTemplate,
+        id: Optional[str],
+        owner: str,
+        controller: str,
+        zone: Zone,
+        current_stamina: Optional[int],
+        modifications: Optional[Dict[str, int]],
+        turn_modifications: Optional[Dict[str, Any]],
+        hash_listener: Optional[Callable[[int], None]],
+    ) -> None:
+        init = object.__setattr__
+        # Internal: set by GameState to keep its state hash current (not serialized)
+        init(self, "_hash_listener", hash_listener)
+        init(self, "template", template)
+        init(self, "id", id if id is not None else str(uuid.uuid4()))
+        init(self, "owner", owner)
+        init(self, "controller", controller)
+        init(self, "zone", zone)
+        # current_stamina starts at the base stamina
+        if current_stamina is None:
+            current_stamina = template.stamina
+        init(self, "current_stamina", current_stamina)
+        init(self, "modifications", {} if modifications is None else modifications)
+        init(self, "turn_modifications", {} if turn_modifications is None else turn_modifications)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Report changes to hashed fields to the owning GameState's state hash."""
+        listener = self._hash_listener
+        if listener is None or name not in HASHED_CARD_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        before = card_key(self)
+        object.__setattr__(self, name, value)
+        listener(before ^ card_key(self))
+
+    def _compare_key(self) -> tuple:
+        return (self.template_values(),) + tuple(getattr(self, name) for name in _STATE_SLOTS)
+
+    def template_values(self) -> tuple:
+        """The template fields' values, in TEMPLATE_FIELDS order."""
+        template = self.template
+        return tuple(getattr(template, name) for name in TEMPLATE_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._compare_key() == other._compare_key()
+
+    __hash__ = None  # mutable, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in TEMPLATE_FIELDS[:4] + ("id",) + TEMPLATE_FIELDS[4:] + _STATE_SLOTS[1:]
+        )
+        return f"Card({fields})"
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Card":
+        """
+        Deep-copy the per-instance state; the immutable template is shared.
+
+        The hash listener is not copied (it would drag its whole GameState
+        along); a copied GameState re-attaches its own.
+        """
+        from copy import deepcopy
+
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        init = object.__setattr__
+        init(clone, "_hash_listener", None)
+        init(clone, "template", self.template)
+        for name in _STATE_SLOTS + _OPTIONAL_SLOTS:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            init(clone, name, deepcopy(value, memo))
+        return clone
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {}
+        for name in __class__.__slots__:
+            if name == "_hash_listener":
+                continue
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_hash_listener", None)
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def is_toy(self) -> bool:
         """Check if this is a Toy card."""
         return self.card_type == CardType.TOY
@@ -84,27 +301,17 @@ class Card:
             self._reset_copy_transformation()
     
     def _reset_copy_transformation(self):
-        """Reset Copy card to original state by reloading from card definition."""
-        from ..data.card_loader import load_cards_dict
+        """Reset Copy card to original state from its card catalog definition."""
+        from ..data.card_catalog import get_card_catalog
         
-        # Load Copy card definition from CSV (single source of truth)
+        # Copy card definition from the shared catalog (parsed once from CSV)
         try:
-            cards_dict = load_cards_dict()
-            copy_definition = cards_dict.get("Copy")
+            copy_definition = get_card_catalog().get("Copy")
             
             if copy_definition:
-                # Restore properties from card definition
-                self.name = copy_definition.name
-                self.card_type = copy_definition.card_type
-                self.cost = copy_definition.cost
-                self.effect_text = copy_definition.effect_text
-                self.effect_definitions = copy_definition.effect_definitions
-                self.speed = copy_definition.speed
-                self.strength = copy_definition.strength
-                self.stamina = copy_definition.stamina
-                self.current_stamina = copy_definition.current_stamina
-                self.primary_color = copy_definition.primary_color
-                self.accent_color = copy_definition.accent_color
+                # Restore properties from card definition (shared template)
+                self.template = copy_definition
+                self.current_stamina = copy_definition.stamina
             else:
                 # Fallback if Copy not found in CSV (shouldn't happen)
                 self.name = "Copy"
@@ -141,7 +348,59 @@ class Card:
             delattr(self, '_original_cost')
         if hasattr(self, '_copied_effects'):
             delattr(self, '_copied_effects')
+
+        # Drop effects parsed while transformed so lookups re-parse "copy_card"
+        from ..rules.effects.effect_registry import EffectRegistry
+        EffectRegistry.invalidate(self)
     
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Capture this card's full mutable state for a later restore_state().
+
+        Includes the template and the optional slots (Copy transformation
+        flags, cached effects), so restoring also undoes a transformation or
+        its reset.
+
+        Returns:
+            The card's set slots, with private copies of the modification dicts
+        """
+        state = {}
+        for name in _SNAPSHOT_SLOTS:
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        state["modifications"] = dict(self.modifications)
+        state["turn_modifications"] = {
+            turn: dict(mods) for turn, mods in self.turn_modifications.items()
+        }
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore attributes captured by snapshot_state().
+
+        The snapshot is copied again, so the same snapshot can be restored
+        any number of times. Writes bypass the state-hash hook: the caller
+        restores the matching hash itself.
+
+        Args:
+            state: Snapshot returned by snapshot_state()
+        """
+        init = object.__setattr__
+        for name in _OPTIONAL_SLOTS:
+            if name not in state:
+                try:
+                    object.__delattr__(self, name)
+                except AttributeError:
+                    pass
+        for name, value in state.items():
+            init(self, name, value)
+        init(self, "modifications", dict(state["modifications"]))
+        init(self, "turn_modifications", {
+            turn: dict(mods) for turn, mods in state["turn_modifications"].items()
+        })
+
     def get_turn_modification(self, stat_name: str, current_turn: int) -> int:
         """
         Get the turn-scoped modification for a stat.
@@ -1,9 +1,11 @@
 """Game state model for GGLTCG game engine."""
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 from .player import Player
 from .card import Card, Zone
+from .state_hash import compute_state_hash
 
 
 class Phase(Enum):
@@ -55,6 +57,22 @@ class TurnChargeRecord:
         )
 
 
+@dataclass
+class StateCheckpoint:
+    """
+    Snapshot of a GameState's mutable fields, taken by GameState.checkpoint().
+
+    Captures scalars, zone list contents, per-card state, and the lengths of
+    the append-only histories, so GameState.rollback() can undo any number of
+    actions in place. Cards are captured by reference plus a snapshot of their
+    attributes; nothing is deep-copied.
+    """
+    scalars: Dict[str, Any]
+    history_lengths: Tuple[int, int, int]
+    players: List[Tuple[Player, int, int, List[Card], List[Card], List[Card]]]
+    cards: List[Tuple[Card, Dict[str, Any]]]
+
+
 @dataclass
 class GameState:
     """
@@ -72,6 +90,8 @@ class GameState:
         play_by_play: List of detailed action records for end-game summary
         starting_decks: Dict mapping player_id to list of card names at game start
         charge_history: List of Charge tracking records per turn
+        state_version: Count of committed updates (bumped by GameService on
+            every persisted change); lets clients detect new state cheaply
     """
     game_id: str
     players: Dict[str, Player]
@@ -84,6 +104,7 @@ class GameState:
     play_by_play: List[Dict[str, Any]] = field(default_factory=list)
     starting_decks: Dict[str, List[str]] = field(default_factory=dict)
     charge_history: List[TurnChargeRecord] = field(default_factory=list)
+    state_version: int = 0
     # Internal: Charge tracking for current turn (not serialized).
     # Note: If GameState is serialized mid-turn and deserialized,
     # these fields reset to defaults. Mid-turn serialization is not
@@ -91,6 +112,29 @@ class GameState:
     # be called before serialization to preserve accurate Charge data.
     _turn_charge_snapshot: int = field(default=0, repr=False)
     _turn_charge_gained: int = field(default=0, repr=False)
+    # Internal: continuous-effect index (not serialized). Zone moves bump
+    # _effect_version; get_effect_index() rebuilds the index when it is stale.
+    _effect_version: int = field(default=0, repr=False, compare=False)
+    _effect_index: Optional[Any] = field(default=None, repr=False, compare=False)
+    # Internal: Zobrist state hash (not serialized). Computed lazily by
+    # get_state_hash(), then kept current by card/player attribute hooks.
+    _state_hash: Optional[int] = field(default=None, repr=False, compare=False)
+    _hash_card_count: int = field(default=-1, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Subscribe to each player's zone moves to keep the effect index current."""
+        for player in self.players.values():
+            player._zone_listener = self.invalidate_effect_index
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "GameState":
+        """Deep copy whose cards report to the copy's state hash (cards drop theirs)."""
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        for name, value in self.__dict__.items():
+            clone.__dict__[name] = deepcopy(value, memo)
+        if clone._state_hash is not None:
+            clone._attach_hash_listeners()
+        return clone
 
     def get_active_player(self) -> Player:
         """Get the active player object."""
@@ -119,10 +163,183 @@ class GameState:
         """Check if this is the first turn of the game."""
         return self.turn_number == 1
 
+    # ========================================================================
+    # CHECKPOINT / ROLLBACK (in-place search)
+    # ========================================================================
+
+    def checkpoint(self) -> StateCheckpoint:
+        """
+        Capture the mutable state so actions can be applied and then undone.
+
+        Used by the AI sequence enumerator: it applies a move in place,
+        searches the resulting position, and rolls back instead of searching
+        on a deep copy. Much cheaper than ``copy.deepcopy`` because the logs
+        and card templates are not copied.
+
+        Returns:
+            StateCheckpoint to pass to rollback()
+        """
+        players = []
+        cards = []
+        for player in self.players.values():
+            players.append((
+                player,
+                player.charge,
+                player.direct_attacks_this_turn,
+                list(player.hand),
+                list(player.in_play),
+                list(player.break_zone),
+            ))
+            for zone in (player.hand, player.in_play, player.break_zone):
+                for card in zone:
+                    cards.append((card, card.snapshot_state()))
+
+        return StateCheckpoint(
+            scalars={
+                "active_player_id": self.active_player_id,
+                "turn_number": self.turn_number,
+                "phase": self.phase,
+                "winner_id": self.winner_id,
+                "_turn_charge_snapshot": self._turn_charge_snapshot,
+                "_turn_charge_gained": self._turn_charge_gained,
+                "_state_hash": self._state_hash,
+                "_hash_card_count": self._hash_card_count,
+            },
+            history_lengths=(
+                len(self.game_log),
+                len(self.play_by_play),
+                len(self.charge_history),
+            ),
+            players=players,
+            cards=cards,
+        )
+
+    def rollback(self, checkpoint: StateCheckpoint) -> None:
+        """
+        Restore the state captured by checkpoint().
+
+        The same checkpoint can be rolled back to repeatedly (once per
+        explored child in a search). Histories are append-only, so they are
+        truncated back to their checkpointed lengths.
+
+        Args:
+            checkpoint: Snapshot returned by checkpoint() on this game state
+        """
+        for card, state in checkpoint.cards:
+            card.restore_state(state)
+
+        for player, charge, direct_attacks, hand, in_play, break_zone in checkpoint.players:
+            # Bypass the state-hash hooks; _state_hash is restored below.
+            attrs = player.__dict__
+            attrs["charge"] = charge
+            attrs["direct_attacks_this_turn"] = direct_attacks
+            player.hand[:] = hand
+            player.in_play[:] = in_play
+            player.break_zone[:] = break_zone
+
+        for name, value in checkpoint.scalars.items():
+            setattr(self, name, value)
+
+        log_len, play_by_play_len, charge_history_len = checkpoint.history_lengths
+        del self.game_log[log_len:]
+        del self.play_by_play[play_by_play_len:]
+        del self.charge_history[charge_history_len:]
+
+        # Never rewind the effect version: an index built after the
+        # checkpoint must not look current again.
+        self.invalidate_effect_index()
+
+    # ========================================================================
+    # CONTINUOUS-EFFECT INDEX
+    # ========================================================================
+
+    def invalidate_effect_index(self) -> None:
+        """
+        Mark the continuous-effect index (and memoized stats) as stale.
+
+        Called on every zone move. Code that edits zone lists directly must
+        call this too so the next stat query rebuilds the index.
+        """
+        self._effect_version += 1
+
+    def get_effect_index(self):
+        """
+        Get the index of active continuous effects, rebuilding it if stale.
+
+        The index is reused until a zone move, a turn change, or a direct
+        edit to an in-play list makes it stale.
+
+        Returns:
+            ContinuousEffectIndex for the current board
+        """
+        index = self._effect_index
+        if index is None or not index.is_current(self, self._effect_version):
+            from ..rules.effects.effect_index import ContinuousEffectIndex
+            index = ContinuousEffectIndex(self, self._effect_version)
+            self._effect_index = index
+        return index
+
+    # ========================================================================
+    # STATE HASH (search transposition key)
+    # ========================================================================
+
+    def get_state_hash(self) -> int:
+        """
+        Get the Zobrist hash of the search-relevant state.
+
+        Covers each player's Charge and direct attacks, and each card's ID,
+        stamina, zone and holding player (see ``models.state_hash``). The
+        first call hashes every card and subscribes to their attribute
+        changes; after that the hash is updated incrementally. A change in
+        the total card count (cards added to or dropped from zone lists
+        directly) triggers a full recompute.
+
+        Returns:
+            64-bit position hash
+        """
+        card_count = sum(
+            len(p.hand) + len(p.in_play) + len(p.break_zone)
+            for p in self.players.values()
+        )
+        if self._state_hash is None or card_count != self._hash_card_count:
+            self._attach_hash_listeners()
+            self._state_hash = compute_state_hash(self)
+            self._hash_card_count = card_count
+        return self._state_hash
+
+    def _attach_hash_listeners(self) -> None:
+        """Subscribe every player and card to this state's hash updates."""
+        for player in self.players.values():
+            player._hash_listener = self._toggle_state_hash
+            for zone in (player.hand, player.in_play, player.break_zone):
+                for card in zone:
+                    card._hash_listener = self._toggle_state_hash
+
+    def _toggle_state_hash(self, delta: int) -> None:
+        """XOR a component change (old key ^ new key) into the state hash."""
+        if self._state_hash is not None:
+            self._state_hash ^= delta
+
     def log_event(self, message: str):
         """Add an event to the game log."""
         self.game_log.append(f"Turn {self.turn_number} ({self.phase.value}): {message}")
 
+    # ========================================================================
+    # STATE VERSION (client change detection)
+    # ========================================================================
+
+    def bump_state_version(self) -> int:
+        """
+        Record one committed update for clients watching this game.
+
+        Not touched by checkpoint/rollback: search never commits.
+
+        Returns:
+            The new state version
+        """
+        self.state_version += 1
+        return self.state_version
+
     # ========================================================================
     # CHARGE TRACKING (simple design - only 3 method calls per turn)
     # ========================================================================
@@ -394,6 +611,7 @@ class GameState:
 
         # Add to owner's hand
         owner.hand.append(card)
+        self.invalidate_effect_index()
 
     def change_control(self, card: Card, new_controller: Player) -> None:
         """
@@ -419,6 +637,7 @@ class GameState:
 
         # Add to new controller
         new_controller.in_play.append(card)
+        self.invalidate_effect_index()
 
         self.log_event(f"Control of {card.name} changed from {current_controller.name} to {new_controller.name}")
 
@@ -449,13 +668,10 @@ class GameState:
                     return True
 
         # Check team-wide protection from other cards in play
-        for player in self.players.values():
-            for protector in player.in_play:
-                protector_effects = EffectRegistry.get_effects(protector)
-                for protector_effect in protector_effects:
-                    if isinstance(protector_effect, TeamOpponentImmunityEffect):
-                        if protector_effect.is_card_protected(card, effect, self):
-                            return True
+        for protector_effect in self.get_effect_index().protections:
+            if isinstance(protector_effect, TeamOpponentImmunityEffect):
+                if protector_effect.is_card_protected(card, effect, self):
+                    return True
 
         return False
 
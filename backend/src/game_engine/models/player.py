@@ -1,7 +1,8 @@
 """Player model for GGLTCG game engine."""
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from .card import Card, Zone
+from .state_hash import HASHED_PLAYER_FIELDS, player_key
 
 
 @dataclass
@@ -25,6 +26,20 @@ class Player:
     in_play: List[Card] = field(default_factory=list)
     break_zone: List[Card] = field(default_factory=list)
     direct_attacks_this_turn: int = 0
+    # Internal: set by GameState to hear about zone moves (not serialized)
+    _zone_listener: Optional[Callable[[], None]] = field(default=None, repr=False, compare=False)
+    # Internal: set by GameState to keep its state hash current (not serialized)
+    _hash_listener: Optional[Callable[[int], None]] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Report changes to hashed counters to the owning GameState's state hash."""
+        listener = self.__dict__.get("_hash_listener")
+        if listener is None or name not in HASHED_PLAYER_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        before = player_key(self, name)
+        object.__setattr__(self, name, value)
+        listener(before ^ player_key(self, name))
 
     def gain_charge(self, amount: int):
         """
@@ -86,6 +101,9 @@ class Player:
         elif to_zone == Zone.BREAK:
             self.break_zone.append(card)
 
+        if self._zone_listener is not None:
+            self._zone_listener()
+
     def break_card(self, card: Card):
         """
         Move a card to break zone from its current zone.
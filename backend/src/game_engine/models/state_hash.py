@@ -0,0 +1,133 @@
+"""
+Zobrist hashing for GameState.
+
+The AI sequence enumerator uses a position hash as its transposition key. The
+hash covers the same components as the enumerator's canonical state
+signature:
+
+- per player: Charge and direct attacks made this turn
+- per card: ID, current stamina, zone, and the player whose zone holds it
+
+Each component maps to a fixed pseudo-random 64-bit key, and the position
+hash is the XOR of its components' keys. XOR is order-independent, so no
+sorting is needed, and a change to one component is applied incrementally by
+XORing its old key out and its new key in (see ``GameState.get_state_hash``).
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Any, Iterable, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .card import Card
+    from .game_state import GameState
+    from .player import Player
+
+# Card attributes that feed the hash; setting one updates the running hash.
+HASHED_CARD_FIELDS = frozenset({"current_stamina", "zone", "controller", "owner"})
+
+# Player attributes that feed the hash.
+HASHED_PLAYER_FIELDS = frozenset({"charge", "direct_attacks_this_turn"})
+
+# Zone value -> zone-list tag used by the canonical signature. Keyed by the
+# enum value so this module does not import the models it hooks into.
+_ZONE_TAGS = {"Hand": "h", "InPlay": "p", "Break": "s"}
+
+
+@lru_cache(maxsize=65536)
+def zobrist_key(*parts: Any) -> int:
+    """
+    Fixed 64-bit key for one hash component.
+
+    Derived from a digest of the component rather than a random table, so keys
+    are stable across processes and never need to be pre-sized.
+
+    Args:
+        *parts: Hashable description of the component
+
+    Returns:
+        Unsigned 64-bit integer key
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def card_key(card: "Card") -> int:
+    """
+    Key for a card's hashed state, derived from the card's own fields.
+
+    The holding player is the controller while the card is in play and the
+    owner otherwise, matching which player's zone list holds the card.
+
+    Args:
+        card: The card to key
+
+    Returns:
+        64-bit key for the card's current component
+    """
+    zone = card.zone.value
+    holder = (card.controller or card.owner) if zone == "InPlay" else card.owner
+    return zobrist_key("card", holder, _ZONE_TAGS.get(zone), card.id, card.current_stamina, zone)
+
+
+def player_key(player: "Player", field_name: str) -> int:
+    """
+    Key for one hashed player counter.
+
+    Args:
+        player: The player to key
+        field_name: "charge" or "direct_attacks_this_turn"
+
+    Returns:
+        64-bit key for the counter's current value
+    """
+    return zobrist_key("player", player.player_id, field_name, getattr(player, field_name))
+
+
+def compute_state_hash(game_state: "GameState") -> int:
+    """
+    Hash a game state from scratch using each card's own fields.
+
+    Args:
+        game_state: The game state to hash
+
+    Returns:
+        64-bit position hash
+    """
+    value = 0
+    for player in game_state.players.values():
+        for field_name in HASHED_PLAYER_FIELDS:
+            value ^= player_key(player, field_name)
+        for zone in (player.hand, player.in_play, player.break_zone):
+            for card in zone:
+                value ^= card_key(card)
+    return value
+
+
+def signature_hash(signature: Iterable[Tuple]) -> int:
+    """
+    Fold a canonical state signature into the same 64-bit hash.
+
+    The signature (see ``enumerator._state_signature``) records which player's
+    zone list actually holds each card. This is independent of the card-field
+    bookkeeping that the incremental hash relies on, so comparing the two
+    catches any drift between them.
+
+    Args:
+        signature: Tuple of (pid, charge, direct_attacks) and
+            (pid, zone_tag, cards) entries
+
+    Returns:
+        64-bit position hash
+    """
+    value = 0
+    for entry in signature:
+        if len(entry) == 3 and isinstance(entry[2], tuple):
+            pid, zone_tag, cards = entry
+            for card_id, stamina, zone_value in cards:
+                value ^= zobrist_key("card", pid, zone_tag, card_id, stamina, zone_value)
+        else:
+            pid, charge, direct_attacks = entry
+            value ^= zobrist_key("player", pid, "charge", charge)
+            value ^= zobrist_key("player", pid, "direct_attacks_this_turn", direct_attacks)
+    return value
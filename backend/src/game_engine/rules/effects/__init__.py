@@ -4,6 +4,7 @@ Effect system for GGLTCG.
 This package contains all card effects organized by type:
 - base_effect: Abstract base classes for all effects
 - effect_registry: Central registry for looking up effects by card name
+- effect_index: Index of the continuous effects active on the board
 - continuous_effects: Effects that apply while cards are in play (incl. triggered effects)
 - action_effects: Effects for Action cards and activated abilities
 
@@ -35,6 +36,9 @@ from .base_effect import (
 # Effect registry
 from .effect_registry import EffectRegistry
 
+# Board-level index of active continuous effects
+from .effect_index import ContinuousEffectIndex
+
 # Import all effect modules to trigger registration
 # This ensures all effects are registered when the package is imported
 from . import continuous_effects
@@ -53,4 +57,5 @@ __all__ = [
     "TriggerTiming",
     # Registry
     "EffectRegistry",
+    "ContinuousEffectIndex",
 ]
@@ -495,31 +495,18 @@ class CopyEffect(PlayEffect):
         # Mark card as transformed (used by reset_modifications to know to reset)
         copy_card._is_transformed = True
         
-        # Transform Copy card properties to match target
-        copy_card.name = f"Copy of {target.name}"
-        copy_card.card_type = target.card_type
-        copy_card.cost = target.cost
-        copy_card.effect_text = target.effect_text
-        copy_card.effect_definitions = target.effect_definitions
-        
-        # Copy stats if target has them (Toys)
-        if hasattr(target, 'speed'):
-            copy_card.speed = target.speed
-        if hasattr(target, 'strength'):
-            copy_card.strength = target.strength
-        if hasattr(target, 'stamina'):
-            copy_card.stamina = target.stamina
-            copy_card.current_stamina = target.stamina  # Full health
-        
-        # Copy visual properties
-        if hasattr(target, 'primary_color'):
-            copy_card.primary_color = target.primary_color
-        if hasattr(target, 'accent_color'):
-            copy_card.accent_color = target.accent_color
+        # Transform Copy card properties to match target: one shared template
+        # with the target's printed data under the Copy's name
+        from ...models.card import TEMPLATE_FIELDS, intern_template
+        values = list(target.template_values())
+        values[TEMPLATE_FIELDS.index("name")] = f"Copy of {target.name}"
+        copy_card.template = intern_template(*values)
+        copy_card.current_stamina = target.stamina  # Full health
         
         # CRITICAL: Re-parse and attach the target's effects to the Copy card
         # This makes Copy's effects actually work (e.g., Ka's +2 strength)
         from .effect_registry import EffectFactory
+        EffectRegistry.invalidate(copy_card)
         if (copy_card.effect_definitions and 
             isinstance(copy_card.effect_definitions, str) and 
             copy_card.effect_definitions.strip()):
@@ -0,0 +1,122 @@
+"""
+Index of the continuous effects active on the board.
+
+Stat, cost and protection queries used to walk every card in play and test
+every effect with ``isinstance`` on each call. ``ContinuousEffectIndex`` does
+that walk once and groups the active effects by kind, so those queries only
+visit the effects that can actually apply.
+
+The index is owned by ``GameState`` (see ``GameState.get_effect_index``) and
+rebuilt lazily after the board changes. It also memoizes effective stats for
+the current turn; the memo lives on the index, so any rebuild clears it.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+
+from .base_effect import ContinuousEffect, CostModificationEffect, ProtectionEffect
+from .effect_registry import EffectRegistry
+
+if TYPE_CHECKING:
+    from ...models.game_state import GameState
+
+
+class ContinuousEffectIndex:
+    """
+    Active continuous effects on the board, grouped by kind.
+
+    Effects are listed in board order (player order, then in-play order), the
+    same order the full scan used, so chained ``modify_stat`` results are
+    unchanged.
+
+    Attributes:
+        continuous: Every ContinuousEffect from cards in play
+        cost_modifiers: CostModificationEffects from cards in play
+        protections: ProtectionEffects from cards in play
+        cost_modifiers_by_controller: CostModificationEffects keyed by the
+            player ID whose in-play zone holds the source card
+        version: GameState effect version this index was built at
+        turn_number: Turn this index (and its stat memo) was built for
+        zone_sizes: Per-player in-play sizes at build time
+    """
+
+    def __init__(self, game_state: "GameState", version: int):
+        """
+        Build the index from the cards currently in play.
+
+        Args:
+            game_state: The game state to index
+            version: The game state's effect version at build time
+        """
+        self.continuous: List[ContinuousEffect] = []
+        self.cost_modifiers: List[CostModificationEffect] = []
+        self.protections: List[ProtectionEffect] = []
+        self.cost_modifiers_by_controller: Dict[str, List[CostModificationEffect]] = {}
+        self.version = version
+        self.turn_number = game_state.turn_number
+        self.zone_sizes = self.board_sizes(game_state)
+        self._stat_memo: Dict[Tuple, Any] = {}
+
+        for player_id, player in game_state.players.items():
+            controller_costs = self.cost_modifiers_by_controller.setdefault(player_id, [])
+            for card in player.in_play:
+                for effect in EffectRegistry.get_effects(card):
+                    if not isinstance(effect, ContinuousEffect):
+                        continue
+                    self.continuous.append(effect)
+                    if isinstance(effect, CostModificationEffect):
+                        self.cost_modifiers.append(effect)
+                        controller_costs.append(effect)
+                    elif isinstance(effect, ProtectionEffect):
+                        self.protections.append(effect)
+
+    @staticmethod
+    def board_sizes(game_state: "GameState") -> Tuple[int, ...]:
+        """
+        Per-player in-play sizes, used to detect direct zone-list edits.
+
+        Zone moves made through ``Player``/``GameState`` bump the effect
+        version. Code that appends to or removes from ``in_play`` directly
+        (test setup, legacy helpers) does not, but it does change these sizes.
+
+        Args:
+            game_state: The game state to measure
+
+        Returns:
+            Tuple of in-play list lengths in player order
+        """
+        return tuple([len(player.in_play) for player in game_state.players.values()])
+
+    def is_current(self, game_state: "GameState", version: int) -> bool:
+        """
+        Check whether this index still describes the board.
+
+        Args:
+            game_state: The game state the index was built from
+            version: The game state's current effect version
+
+        Returns:
+            True if the index (and its stat memo) can be reused
+        """
+        return (
+            self.version == version
+            and self.turn_number == game_state.turn_number
+            and self.zone_sizes == self.board_sizes(game_state)
+        )
+
+    def memoize(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return a memoized value for this board and turn, computing it on a miss.
+
+        Args:
+            key: Hashable memo key (e.g. card ID, stat name, base value)
+            compute: Zero-argument function producing the value
+
+        Returns:
+            The memoized (or freshly computed) value
+        """
+        try:
+            return self._stat_memo[key]
+        except KeyError:
+            value = compute()
+            self._stat_memo[key] = value
+            return value
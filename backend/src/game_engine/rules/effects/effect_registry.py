@@ -5,13 +5,32 @@ This module provides a central registry for looking up which effects
 belong to each card in the game.
 """
 
-from typing import List, TYPE_CHECKING
+from functools import lru_cache
+from typing import List, Tuple, TYPE_CHECKING
 from .base_effect import BaseEffect
 
 if TYPE_CHECKING:
     from ...models.card import Card
 
 
+@lru_cache(maxsize=None)
+def split_effect_definitions(effect_string: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Tokenize an effect definition string into per-effect templates.
+
+    ``"stat_boost:strength:2;fix"`` -> ``(("stat_boost", "strength", "2"), ("fix",))``
+
+    Cached per distinct string: the card catalog pre-parses every card's
+    definitions at load, so ``EffectFactory.parse_effects`` only
+    instantiates effects.
+    """
+    return tuple(
+        tuple(definition.split(":"))
+        for definition in (e.strip() for e in effect_string.split(";"))
+        if definition
+    )
+
+
 class EffectFactory:
     """
     Factory for parsing effect definitions from CSV data.
@@ -45,12 +64,9 @@ class EffectFactory:
         
         effects = []
         
-        # Split multiple effects
-        effect_definitions = [e.strip() for e in effect_string.split(";") if e.strip()]
-        
-        for definition in effect_definitions:
-            # Parse individual effect
-            parts = definition.split(":")
+        for template in split_effect_definitions(effect_string):
+            # Parse individual effect (parsers get their own list of parts)
+            parts = list(template)
             effect_type = parts[0].strip().lower()
             
             # Dispatch to appropriate parser
@@ -1139,31 +1155,67 @@ class EffectRegistry:
     Central registry for card effects.
 
     Effects are instantiated when needed and attached to cards.
+
+    Parsed effects are cached on the card instance, keyed by the
+    ``effect_definitions`` string they were parsed from. Effect objects are
+    immutable after construction (they only hold their parameters and a
+    ``source_card`` reference), so the same instances can be returned on every
+    lookup. A change to ``effect_definitions`` (e.g. a Copy transformation or
+    its reset) misses the cache and re-parses; ``invalidate`` drops the entry
+    explicitly.
     """
 
+    # Per-card cache attribute: (effect_definitions, parsed effects)
+    _CACHE_ATTR = "_effect_cache"
+
     @classmethod
     def get_effects(cls, card: "Card") -> List[BaseEffect]:
         """
         Get all effects for a card.
 
         First checks if the card has pre-parsed copied effects (for Copy card).
-        Otherwise parses the card's data-driven effect_definitions.
+        Otherwise returns the card's data-driven effect_definitions, parsed
+        once per definition string and cached on the card.
 
         Args:
             card: The card to get effects for
 
         Returns:
-            List of instantiated effect objects for this card
+            List of instantiated effect objects for this card. The list is
+            shared with the cache and must not be mutated by callers.
         """
         # Priority 0: Check for pre-parsed copied effects (Copy card transformation)
         if hasattr(card, '_copied_effects') and card._copied_effects:
             return card._copied_effects
 
         # Priority 1: Check for data-driven effect definitions
-        if hasattr(card, 'effect_definitions') and card.effect_definitions:
-            try:
-                return EffectFactory.parse_effects(card.effect_definitions, card)
-            except ValueError as e:
-                print(f"Warning: Failed to parse effects for {card.name}: {e}")
+        definitions = getattr(card, 'effect_definitions', None)
+        if not definitions:
+            return []
 
-        return []
+        cached = getattr(card, cls._CACHE_ATTR, None)
+        if cached is not None and cached[0] == definitions:
+            return cached[1]
+
+        try:
+            effects = EffectFactory.parse_effects(definitions, card)
+        except ValueError as e:
+            print(f"Warning: Failed to parse effects for {card.name}: {e}")
+            effects = []
+
+        setattr(card, cls._CACHE_ATTR, (definitions, effects))
+        return effects
+
+    @classmethod
+    def invalidate(cls, card: "Card") -> None:
+        """
+        Drop a card's cached parsed effects.
+
+        Called when a card's effect identity changes (Copy transformation
+        applied or reset) so the next lookup re-parses its definitions.
+
+        Args:
+            card: The card whose cache entry should be removed
+        """
+        if hasattr(card, cls._CACHE_ATTR):
+            delattr(card, cls._CACHE_ATTR)
@@ -0,0 +1,120 @@
+"""
+Lazy, per-search tracing for the engine's hot paths.
+
+The validator and executor run thousands of times per AI turn inside the
+sequence search. Formatting debug messages there (f-strings, list
+comprehensions over target names) costs real time even when DEBUG is off,
+and silencing the executor's per-play INFO line by raising its logger level
+would silence concurrent real games too, since logger levels are
+process-global.
+
+Instead, hot code asks for a tracer once per call::
+
+    tracer = get_tracer(logger)
+    ...
+    if tracer:
+        tracer.event("targets", card=card.name, targets=[t.name for t in valid])
+
+``get_tracer`` returns None unless someone is listening: the logger is
+enabled for DEBUG, or the current scope has a ``TraceRecorder``. Event
+fields are only built behind that check, so a disabled trace costs one
+context-variable lookup.
+
+Scopes are set with ``trace_scope`` and held in a ``ContextVar``, so they
+follow the current thread or asyncio task: a search marked ``simulated``
+demotes the executor's INFO logging for its own simulated moves only.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# One recorded event: (logger name, event name, fields)
+TraceEvent = Tuple[str, str, Dict[str, Any]]
+
+
+class TraceRecorder:
+    """
+    Collects trace events for one scope (e.g. one enumerator search).
+
+    Args:
+        max_events: Events kept; later ones are counted in ``dropped`` only
+    """
+
+    def __init__(self, max_events: int = 10_000):
+        self.max_events = max_events
+        self.events: List[TraceEvent] = []
+        self.dropped = 0
+
+    def record(self, source: str, event: str, fields: Dict[str, Any]) -> None:
+        if len(self.events) < self.max_events:
+            self.events.append((source, event, fields))
+        else:
+            self.dropped += 1
+
+    def counts(self) -> Dict[str, int]:
+        """Number of recorded events per event name."""
+        counts: Dict[str, int] = {}
+        for _, event, _ in self.events:
+            counts[event] = counts.get(event, 0) + 1
+        return counts
+
+
+@dataclass(frozen=True)
+class _Scope:
+    simulated: bool
+    recorder: Optional[TraceRecorder]
+
+
+_scope: ContextVar[Optional[_Scope]] = ContextVar("game_engine_trace_scope", default=None)
+
+
+class Tracer:
+    """Emits events to the scope's recorder and/or the logger at DEBUG."""
+
+    __slots__ = ("logger", "recorder", "to_log")
+
+    def __init__(self, logger: logging.Logger, recorder: Optional[TraceRecorder], to_log: bool):
+        self.logger = logger
+        self.recorder = recorder
+        self.to_log = to_log
+
+    def event(self, event: str, **fields: Any) -> None:
+        if self.recorder is not None:
+            self.recorder.record(self.logger.name, event, fields)
+        if self.to_log:
+            self.logger.debug("%s %s", event, " ".join(f"{k}={v!r}" for k, v in fields.items()))
+
+
+def get_tracer(logger: logging.Logger) -> Optional[Tracer]:
+    """A tracer for ``logger``, or None when nothing would see its events."""
+    scope = _scope.get()
+    recorder = scope.recorder if scope is not None else None
+    to_log = logger.isEnabledFor(logging.DEBUG)
+    if recorder is None and not to_log:
+        return None
+    return Tracer(logger, recorder, to_log)
+
+
+def is_simulated() -> bool:
+    """Whether the current scope is a simulated (search) context."""
+    scope = _scope.get()
+    return scope is not None and scope.simulated
+
+
+@contextmanager
+def trace_scope(simulated: bool = False, recorder: Optional[TraceRecorder] = None) -> Iterator[None]:
+    """
+    Run a block in a trace scope (restored on exit; scopes nest).
+
+    Args:
+        simulated: Moves in this scope are simulated, not real game actions
+        recorder: Collects every traced event in the scope
+    """
+    token = _scope.set(_Scope(simulated, recorder))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
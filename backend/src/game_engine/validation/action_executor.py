@@ -16,6 +16,7 @@ from game_engine.models.player import Player
 from game_engine.models.card import Card
 from game_engine.rules.effects.continuous_effects import BallaberCostEffect
 from game_engine.rules.effects.action_effects import FixEffect, CopyEffect, TwistEffect, BreakTargetEffect
+from game_engine.tracing import get_tracer, is_simulated
 
 logger = logging.getLogger(__name__)
 
@@ -143,9 +144,12 @@ class ActionExecutor:
         # Merge kwargs
         kwargs = {**alt_cost_kwargs, **target_kwargs}
         
-        # Log target selection for debugging
+        # Log target selection for debugging (simulated plays are only traced)
         if kwargs.get("target"):
-            logger.info(f"Playing {card.name} with target: {kwargs['target'].name} (ID: {target_card_id})")
+            if not is_simulated():
+                logger.info(f"Playing {card.name} with target: {kwargs['target'].name} (ID: {target_card_id})")
+            elif tracer := get_tracer(logger):
+                tracer.event("play_target", card=card.name, target=kwargs["target"].name, target_id=target_card_id)
         
         # Ownership labels must be captured pre-play: breaking a target resets
         # its controller to its owner, hiding that it was a stolen card.
@@ -435,6 +439,7 @@ class ActionExecutor:
             self.engine._resolve_action_card(card, player, **kwargs)
             card.zone = Zone.BREAK
             player.break_zone.append(card)
+        self.game_state.invalidate_effect_index()
         
         return True
     
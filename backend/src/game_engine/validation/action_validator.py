@@ -25,6 +25,7 @@ from game_engine.models.game_state import GameState
 from game_engine.models.player import Player
 from game_engine.rules.effects import EffectRegistry
 from game_engine.rules.effects.base_effect import PlayEffect, ActivatedEffect
+from game_engine.tracing import get_tracer
 from api.schemas import ValidAction
 
 logger = logging.getLogger(__name__)
@@ -265,26 +266,24 @@ class ActionValidator:
         
         # Get all effects for this card
         effects = EffectRegistry.get_effects(card)
-        logger.debug(f"Card {card.name}: Found {len(effects)} effects")
+        tracer = get_tracer(logger)
         
         for effect in effects:
-            logger.debug(f"  Effect: {type(effect).__name__}, is PlayEffect: {isinstance(effect, PlayEffect)}")
-            if isinstance(effect, PlayEffect):
-                logger.debug(f"  requires_targets: {effect.requires_targets()}")
-                
             if isinstance(effect, PlayEffect) and effect.requires_targets():
                 max_targets = effect.get_max_targets()
                 min_targets = effect.get_min_targets()
                 valid_targets = effect.get_valid_targets(self.game_state, player)
                 
-                logger.debug(
-                    f"Card {card.name}: requires_targets={effect.requires_targets()}, "
-                    f"valid_targets={[t.name for t in valid_targets] if valid_targets else 'None'}"
-                )
+                if tracer:
+                    tracer.event(
+                        "target_options",
+                        card=card.name,
+                        effect=type(effect).__name__,
+                        targets=[t.name for t in valid_targets] if valid_targets else None,
+                    )
                 
                 if valid_targets:
                     target_options = [t.id for t in valid_targets]
-                    logger.debug(f"Card {card.name}: target_options set to {len(target_options)} IDs")
                 
                 # Card requires targets (effect.requires_targets() returned True)
                 requires_targets = True
@@ -314,6 +313,7 @@ class ActionValidator:
         """
         valid_actions = []
         opponent = self.game_state.get_opponent(player.player_id)
+        tracer = get_tracer(logger) if filter_for_ai else None
         
         for card in player.in_play:
             if card.card_type != CardType.TOY:
@@ -351,14 +351,18 @@ class ActionValidator:
                     if filter_for_ai:
                         predicted = self.engine.predict_tussle_winner(card, defender)
                         
-                        logger.debug(
-                            f"Tussle prediction: {card.name} vs {defender.name} = {predicted} "
-                            f"(attacker {card.speed}/{card.strength}/{card.stamina} vs "
-                            f"defender {defender.speed}/{defender.strength}/{defender.stamina})"
-                        )
+                        if tracer:
+                            tracer.event(
+                                "tussle_prediction",
+                                attacker=card.name,
+                                defender=defender.name,
+                                predicted=predicted,
+                                attacker_stats=(card.speed, card.strength, card.stamina),
+                                defender_stats=(defender.speed, defender.strength, defender.stamina),
+                                skipped=predicted == "defender",
+                            )
                         
                         if predicted == "defender":
-                            logger.debug(f"  → Skipping losing tussle for AI")
                             continue
                     
                     cost = self.engine.calculate_tussle_cost(card, player)
@@ -16,6 +16,13 @@ Usage:
 Multi-day throttled batch runs:
     python -m simulation.cli baseline --iterations 200 --rpm 30 --daily-budget 2000
     python -m simulation.cli resume 42 --rpm 30 --daily-budget 2000
+
+CPU-bound runs (use more than one core):
+    python -m simulation.cli baseline --iterations 50 --executor process
+
+High-volume balance sweeps with no LLM calls (or LLM vs heuristic):
+    python -m simulation.cli baseline --iterations 500 --selector heuristic
+    python -m simulation.cli compare --selector1 llm --selector2 heuristic
 See README.md for the long-lived-process and cron/launchd recommendations.
 """
 
@@ -31,8 +38,14 @@ import click
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from simulation.orchestrator import SimulationOrchestrator
-from simulation.config import SimulationConfig, SimulationStatus, default_simulation_model
+from simulation.config import (
+    EXECUTOR_KINDS,
+    SimulationConfig,
+    SimulationStatus,
+    default_simulation_model,
+)
 from simulation.deck_loader import load_simulation_decks_dict
+from game_engine.ai.selectors import SELECTOR_KINDS
 from simulation.reporter import SimulationReporter
 
 logger = logging.getLogger(__name__)
@@ -73,6 +86,49 @@ def _throttle_options(f):
     return f
 
 
+def _executor_option(default='thread'):
+    """Shared --executor option: run games on a thread pool, a process pool or an event loop."""
+    return click.option(
+        '--executor', type=click.Choice(EXECUTOR_KINDS), default=default,
+        help='Parallel backend: thread (default), process (one game per worker '
+             'process; uses more than one core, shares the --rpm/--daily-budget limits) '
+             'or async (games share one event loop and await the LLM; no thread per game)'
+    )
+
+
+def _selector_options(f):
+    """Shared --selector / --selector1 / --selector2 options for the run commands."""
+    f = click.option(
+        '--selector2', type=click.Choice(SELECTOR_KINDS), default=None,
+        help='Player 2 selector (overrides --selector)'
+    )(f)
+    f = click.option(
+        '--selector1', type=click.Choice(SELECTOR_KINDS), default=None,
+        help='Player 1 selector (overrides --selector)'
+    )(f)
+    f = click.option(
+        '--selector-cache/--no-selector-cache', default=True,
+        help='Reuse cached strategic-selector responses when AI_SELECTOR_CACHE is '
+             'enabled (default); --no-selector-cache queries the model every turn, '
+             'e.g. for evaluation runs'
+    )(f)
+    f = click.option(
+        '--selector', type=click.Choice(SELECTOR_KINDS), default='llm',
+        help='How both players pick a turn sequence: llm (Gemini, default) or '
+             'heuristic (local scorer, no API calls or budget)'
+    )(f)
+    return f
+
+
+def _resolve_selectors(selector, selector1, selector2, selector_cache=True) -> dict:
+    """Per-player selector kwargs (and the cache switch) for SimulationConfig."""
+    return {
+        "player1_selector": selector1 or selector,
+        "player2_selector": selector2 or selector,
+        "selector_cache": selector_cache,
+    }
+
+
 @click.group()
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
 def cli(verbose):
@@ -89,7 +145,10 @@ def cli(verbose):
 @click.option('--model', '-m', default=None, help='AI model to use (default: GEMINI_MODEL env or provider default)')
 @click.option('--decks', '-d', default='baseline', help='Deck preset: baseline, top2, all')
 @_throttle_options
-def baseline(iterations, parallel, model, decks, rpm, daily_budget, wait):
+@_executor_option()
+@_selector_options
+def baseline(iterations, parallel, model, decks, rpm, daily_budget, wait, executor,
+        selector, selector1, selector2, selector_cache):
     """
     Run a baseline AI mirror match with standard decks.
 
@@ -116,6 +175,8 @@ def baseline(iterations, parallel, model, decks, rpm, daily_budget, wait):
         iterations_per_matchup=iterations,
         rpm=rpm,
         daily_request_budget=daily_budget,
+        executor=executor,
+        **_resolve_selectors(selector, selector1, selector2, selector_cache),
     )
 
     # Run simulation
@@ -129,7 +190,10 @@ def baseline(iterations, parallel, model, decks, rpm, daily_budget, wait):
 @click.option('--parallel', '-p', default=10, help='Parallel workers (default: 10)')
 @click.option('--decks', '-d', default='baseline', help='Deck preset: baseline, top2, all')
 @_throttle_options
-def compare(model1, model2, iterations, parallel, decks, rpm, daily_budget, wait):
+@_executor_option()
+@_selector_options
+def compare(model1, model2, iterations, parallel, decks, rpm, daily_budget, wait, executor,
+        selector, selector1, selector2, selector_cache):
     """
     Run a cross-model comparison.
 
@@ -157,6 +221,8 @@ def compare(model1, model2, iterations, parallel, decks, rpm, daily_budget, wait
         iterations_per_matchup=iterations,
         rpm=rpm,
         daily_request_budget=daily_budget,
+        executor=executor,
+        **_resolve_selectors(selector, selector1, selector2, selector_cache),
     )
 
     # Run simulation
@@ -170,7 +236,10 @@ def compare(model1, model2, iterations, parallel, decks, rpm, daily_budget, wait
 @click.option('--parallel', '-p', default=10, help='Parallel workers (default: 10)')
 @click.option('--model', '-m', default=None, help='AI model to use (default: GEMINI_MODEL env or provider default)')
 @_throttle_options
-def test_deck(deck_names, against, iterations, parallel, model, rpm, daily_budget, wait):
+@_executor_option()
+@_selector_options
+def test_deck(deck_names, against, iterations, parallel, model, rpm, daily_budget, wait, executor,
+        selector, selector1, selector2, selector_cache):
     """
     Test specific decks against a set of opponents.
 
@@ -200,6 +269,8 @@ def test_deck(deck_names, against, iterations, parallel, model, rpm, daily_budge
         iterations_per_matchup=iterations,
         rpm=rpm,
         daily_request_budget=daily_budget,
+        executor=executor,
+        **_resolve_selectors(selector, selector1, selector2, selector_cache),
     )
 
     # Run simulation
@@ -212,7 +283,10 @@ def test_deck(deck_names, against, iterations, parallel, model, rpm, daily_budge
 @click.option('--iterations', '-i', default=5, help='Number of games (default: 5)')
 @click.option('--model', '-m', default=None, help='AI model to use (default: GEMINI_MODEL env or provider default)')
 @_throttle_options
-def quick(deck1, deck2, iterations, model, rpm, daily_budget, wait):
+@_executor_option()
+@_selector_options
+def quick(deck1, deck2, iterations, model, rpm, daily_budget, wait, executor,
+        selector, selector1, selector2, selector_cache):
     """
     Quick test between two specific decks.
 
@@ -234,6 +308,8 @@ def quick(deck1, deck2, iterations, model, rpm, daily_budget, wait):
         iterations_per_matchup=iterations,
         rpm=rpm,
         daily_request_budget=daily_budget,
+        executor=executor,
+        **_resolve_selectors(selector, selector1, selector2, selector_cache),
     )
 
     # Run simulation
@@ -244,13 +320,15 @@ def quick(deck1, deck2, iterations, model, rpm, daily_budget, wait):
 @click.argument('run_id', type=int)
 @click.option('--parallel', '-p', default=None, type=int, help='Parallel workers override (default: config value)')
 @_throttle_options
-def resume(run_id, parallel, rpm, daily_budget, wait):
+@_executor_option(default=None)
+def resume(run_id, parallel, rpm, daily_budget, wait, executor):
     """
     Resume a paused, budget-exhausted, or failed simulation run.
 
     Example:
         python -m simulation.cli resume 42
         python -m simulation.cli resume 42 --rpm 30 --daily-budget 2000 --no-wait
+        python -m simulation.cli resume 42 --executor process
     """
     orchestrator = SimulationOrchestrator()
 
@@ -269,8 +347,10 @@ def resume(run_id, parallel, rpm, daily_budget, wait):
         )
         sys.exit(1)
 
-    if rpm is not None or daily_budget is not None:
-        _apply_config_overrides(orchestrator, run_id, rpm=rpm, daily_request_budget=daily_budget)
+    if rpm is not None or daily_budget is not None or executor is not None:
+        _apply_config_overrides(
+            orchestrator, run_id, rpm=rpm, daily_request_budget=daily_budget, executor=executor
+        )
 
     click.echo(f"▶️  Resuming simulation run #{run_id}")
     click.echo(f"   Progress so far: {current['completed_games']}/{current['total_games']} games")
@@ -429,11 +509,15 @@ def _get_deck_names(preset: str) -> list[str]:
 
 
 def _apply_config_overrides(
-    orchestrator: SimulationOrchestrator, run_id: int, rpm=None, daily_request_budget=None
+    orchestrator: SimulationOrchestrator,
+    run_id: int,
+    rpm=None,
+    daily_request_budget=None,
+    executor=None,
 ) -> None:
     """
-    Persist rpm/daily_request_budget overrides onto a run's stored config,
-    so a resumed run picks up new throttle settings.
+    Persist rpm/daily_request_budget/executor overrides onto a run's stored
+    config, so a resumed run picks up new throttle and executor settings.
     """
     from api.db_models import SimulationRunModel  # local import: keeps CLI import light
 
@@ -446,6 +530,8 @@ def _apply_config_overrides(
         cfg["rpm"] = rpm
     if daily_request_budget is not None:
         cfg["daily_request_budget"] = daily_request_budget
+    if executor is not None:
+        cfg["executor"] = executor
     run.config = cfg
     db.commit()
 
@@ -470,7 +556,8 @@ def _run_simulation_with_progress(config: SimulationConfig, parallel_games: int
         run_id = orchestrator.start_simulation(config)
         click.echo(f"✨ Started simulation run #{run_id}")
         click.echo(f"   Total games: {config.total_games()}")
-        click.echo(f"   Parallel workers: {parallel_games}")
+        click.echo(f"   Parallel workers: {parallel_games} ({config.executor})")
+        click.echo(f"   Selectors: {config.player1_selector} vs {config.player2_selector}")
         click.echo()
 
         _execute_and_report(orchestrator, run_id, parallel_games, wait=wait, started=True)
@@ -34,6 +34,22 @@ def default_simulation_model() -> str:
     return os.getenv("GEMINI_MODEL") or DEFAULT_MODEL
 
 
+# Executor backends for running games in parallel (SimulationConfig.executor).
+# "thread" shares one interpreter (fine while games wait on the LLM);
+# "process" runs games in worker processes to use more than one core;
+# "async" runs games as tasks on one event loop, awaiting the LLM instead of
+# holding a thread per game.
+EXECUTOR_KINDS = ("thread", "process", "async")
+
+
+def player_model_label(model: str, selector: str) -> str:
+    """
+    Model name recorded for a player: the Gemini model for "llm" players,
+    otherwise the selector name (e.g. "heuristic"), which makes no LLM calls.
+    """
+    return model if selector == "llm" else selector
+
+
 class SimulationStatus(str, Enum):
     """Status of a simulation run."""
     PENDING = "pending"
@@ -139,6 +155,10 @@ class SimulationConfig:
     parallel_games: int = 10  # Number of games to run concurrently
     rpm: Optional[int] = None  # Requests-per-minute limit forwarded to the rate limiter
     daily_request_budget: Optional[int] = None  # Daily API request budget (None = unlimited)
+    executor: str = "thread"  # Parallel backend: "thread", "process" or "async" (see EXECUTOR_KINDS)
+    player1_selector: str = "llm"  # Sequence selector: "llm" or "heuristic" (see selectors.SELECTOR_KINDS)
+    player2_selector: str = "llm"
+    selector_cache: bool = True  # Reuse cached selector responses (ai.selector_cache); False for evaluation runs
 
     def get_matchups(self) -> list[tuple[str, str]]:
         """
@@ -171,6 +191,10 @@ class SimulationConfig:
             "parallel_games": self.parallel_games,
             "rpm": self.rpm,
             "daily_request_budget": self.daily_request_budget,
+            "executor": self.executor,
+            "player1_selector": self.player1_selector,
+            "player2_selector": self.player2_selector,
+            "selector_cache": self.selector_cache,
         }
 
 
@@ -4,21 +4,34 @@ Simulation orchestrator for managing batch AI vs AI simulations.
 This module coordinates running multiple games across deck matchups,
 tracks progress, persists results to database, and aggregates statistics.
 
-Supports parallel game execution to speed up simulations.
+Supports parallel game execution to speed up simulations, on a thread pool
+(default), a process pool (see ``process_pool``) or an event loop
+(``executor="async"``: games await the LLM instead of holding a thread each).
 """
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from concurrent.futures import (
+    BrokenExecutor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import ExitStack, contextmanager
 from datetime import date, datetime
 import threading
-from typing import Optional
+from typing import Iterator, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from api.db_models import SimulationRunModel, SimulationGameModel
 from api.database import get_db, SessionLocal
+from api.pagination import keyset_page
 
+from . import process_pool
 from .config import (
+    EXECUTOR_KINDS,
     GameOutcome,
     GameResult,
     SimulationConfig,
@@ -41,6 +54,32 @@ logger = logging.getLogger(__name__)
 DEFAULT_PARALLEL_GAMES = 10
 
 
+@contextmanager
+def _event_loop_thread() -> Iterator[asyncio.AbstractEventLoop]:
+    """An event loop running in its own thread for ``executor="async"`` games.
+
+    On exit, tasks still pending (a run that failed part-way) are cancelled
+    before the loop stops.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="simulation-games", daemon=True)
+    thread.start()
+
+    async def cancel_pending() -> None:
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    try:
+        yield loop
+    finally:
+        asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
 class SimulationOrchestrator:
     """
     Orchestrates batch simulation runs.
@@ -205,7 +244,10 @@ class SimulationOrchestrator:
         )
 
     def run_simulation(
-        self, run_id: int, parallel_games: Optional[int] = None
+        self,
+        run_id: int,
+        parallel_games: Optional[int] = None,
+        executor: Optional[str] = None,
     ) -> SimulationResult:
         """
         Execute a simulation run with parallel game execution.
@@ -220,9 +262,18 @@ class SimulationOrchestrator:
             run_id: ID of the simulation run to execute
             parallel_games: Number of games to run in parallel. Defaults to
                 config.parallel_games, falling back to DEFAULT_PARALLEL_GAMES.
+            executor: "thread", "process" or "async". Defaults to
+                config.executor. Process mode runs games in worker processes
+                that share this orchestrator's rate limiter through a
+                LimiterCoordinator; async mode runs up to parallel_games games
+                as tasks on one event loop thread. Results still stream back
+                here to be persisted one by one.
 
         Returns:
             SimulationResult with all game outcomes so far
+
+        Raises:
+            ValueError: If the run does not exist or the executor is unknown
         """
         db = self._get_db()
 
@@ -254,6 +305,12 @@ class SimulationOrchestrator:
 
         if parallel_games is None:
             parallel_games = config.parallel_games or DEFAULT_PARALLEL_GAMES
+        if executor is None:
+            executor = config.executor
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unknown executor '{executor}'; must be one of {list(EXECUTOR_KINDS)}"
+            )
 
         # Update status to running
         run.status = "running"
@@ -274,7 +331,14 @@ class SimulationOrchestrator:
         progress_lock = threading.Lock()
         completed_count = len(persisted_game_numbers)
 
-        stop_event = threading.Event()
+        # Process workers check the stop event themselves, so it must be a
+        # multiprocessing Event from the pool's context in that mode.
+        if executor == "process":
+            mp_context = multiprocessing.get_context(process_pool.PROCESS_START_METHOD)
+            stop_event = mp_context.Event()
+        else:
+            mp_context = None
+            stop_event = threading.Event()
         self._stop_event = stop_event
         limiter = self._build_rate_limiter(config)
         self._limiter = limiter
@@ -305,7 +369,8 @@ class SimulationOrchestrator:
                     game_number += 1
 
             logger.info(
-                f"Running {len(games_to_run)} games with {parallel_games} parallel workers"
+                f"Running {len(games_to_run)} games with {parallel_games} parallel "
+                f"{executor} workers"
             )
 
             def run_single_game(game_info: dict) -> Optional[tuple]:
@@ -322,6 +387,9 @@ class SimulationOrchestrator:
                     player2_model=config.player2_model,
                     max_turns=config.max_turns,
                     rate_limiter=limiter,
+                    player1_selector=config.player1_selector,
+                    player2_selector=config.player2_selector,
+                    selector_cache=config.selector_cache,
                 )
                 result = runner.run_game(
                     game_info["deck1"],
@@ -330,6 +398,29 @@ class SimulationOrchestrator:
                 )
                 return (game_info, result)
 
+            async def run_single_game_async(
+                game_info: dict, slots: asyncio.Semaphore
+            ) -> Optional[tuple]:
+                """``run_single_game`` as a task on the games' event loop."""
+                async with slots:
+                    if stop_event.is_set():
+                        return None
+                    runner = SimulationRunner(
+                        player1_model=config.player1_model,
+                        player2_model=config.player2_model,
+                        max_turns=config.max_turns,
+                        rate_limiter=limiter,
+                        player1_selector=config.player1_selector,
+                        player2_selector=config.player2_selector,
+                        selector_cache=config.selector_cache,
+                    )
+                    result = await runner.run_game_async(
+                        game_info["deck1"],
+                        game_info["deck2"],
+                        game_info["game_number"],
+                    )
+                    return (game_info, result)
+
             def persist_result(game_info: dict, result, db_session: Session):
                 """Persist a game result to the database."""
                 nonlocal completed_count
@@ -339,8 +430,8 @@ class SimulationOrchestrator:
                     game_number=game_info["game_number"],
                     deck1_name=game_info["deck1_name"],
                     deck2_name=game_info["deck2_name"],
-                    player1_model=config.player1_model,
-                    player2_model=config.player2_model,
+                    player1_model=result.player1_model,
+                    player2_model=result.player2_model,
                     outcome=result.outcome.value,
                     winner_deck=result.winner_deck,
                     turn_count=result.turn_count,
@@ -366,12 +457,51 @@ class SimulationOrchestrator:
                     self._result.add_game_result(result)
 
             # Run games in parallel
-            with ThreadPoolExecutor(max_workers=parallel_games) as executor:
-                # Submit all games
-                futures = {
-                    executor.submit(run_single_game, game_info): game_info
-                    for game_info in games_to_run
-                }
+            with ExitStack() as stack:
+                if executor == "process":
+                    # Workers share this process's limiter (and its persisted
+                    # daily counter) through a local coordinator.
+                    remote_limiter = None
+                    if not isinstance(limiter, NoopLimiter):
+                        coordinator = stack.enter_context(
+                            process_pool.LimiterCoordinator(limiter)
+                        )
+                        remote_limiter = coordinator.client()
+                    pool = stack.enter_context(ProcessPoolExecutor(
+                        max_workers=parallel_games,
+                        mp_context=mp_context,
+                        initializer=process_pool.init_worker,
+                        initargs=(remote_limiter, stop_event),
+                    ))
+                    runner_kwargs = {
+                        "player1_model": config.player1_model,
+                        "player2_model": config.player2_model,
+                        "max_turns": config.max_turns,
+                        "player1_selector": config.player1_selector,
+                        "player2_selector": config.player2_selector,
+                        "selector_cache": config.selector_cache,
+                    }
+                    futures = {
+                        pool.submit(process_pool.run_game_in_worker, runner_kwargs, game_info): game_info
+                        for game_info in games_to_run
+                    }
+                elif executor == "async":
+                    # Concurrent futures of tasks on the loop's thread, so the
+                    # result handling below is shared with the pools.
+                    loop = stack.enter_context(_event_loop_thread())
+                    slots = asyncio.Semaphore(parallel_games)
+                    futures = {
+                        asyncio.run_coroutine_threadsafe(
+                            run_single_game_async(game_info, slots), loop
+                        ): game_info
+                        for game_info in games_to_run
+                    }
+                else:
+                    pool = stack.enter_context(ThreadPoolExecutor(max_workers=parallel_games))
+                    futures = {
+                        pool.submit(run_single_game, game_info): game_info
+                        for game_info in games_to_run
+                    }
 
                 # Process results as they complete
                 for future in as_completed(futures):
@@ -386,6 +516,10 @@ class SimulationOrchestrator:
                         for other_future in futures:
                             other_future.cancel()
                         continue
+                    except BrokenExecutor:
+                        # A worker process died; the run fails and can be
+                        # resumed (persisted games are skipped).
+                        raise
                     except Exception as e:
                         if stop_event.is_set():
                             # Cancelled/aborted because of a pause or budget
@@ -494,7 +628,10 @@ class SimulationOrchestrator:
         return self._result
 
     def resume_simulation(
-        self, run_id: int, parallel_games: Optional[int] = None
+        self,
+        run_id: int,
+        parallel_games: Optional[int] = None,
+        executor: Optional[str] = None,
     ) -> SimulationResult:
         """
         Resume a paused, budget-exhausted, failed, or stale-running run.
@@ -507,6 +644,7 @@ class SimulationOrchestrator:
         Args:
             run_id: ID of the simulation run to resume
             parallel_games: Optional override for parallel worker count
+            executor: Optional override for the executor ("thread"/"process")
 
         Returns:
             SimulationResult with all game outcomes (pre-pause and new)
@@ -531,7 +669,7 @@ class SimulationOrchestrator:
             run_id, config, SimulationStatus.RUNNING
         )
 
-        return self.run_simulation(run_id, parallel_games=parallel_games)
+        return self.run_simulation(run_id, parallel_games=parallel_games, executor=executor)
 
     def pause_simulation(self, run_id: int) -> bool:
         """
@@ -823,23 +961,50 @@ class SimulationOrchestrator:
             "created_at": game.created_at.isoformat() if game.created_at else None,
         }
     
-    def list_runs(self, limit: int = 20) -> list[dict]:
+    def list_runs(self, limit: int = 20, cursor: Optional[str] = None) -> list[dict]:
         """
         List recent simulation runs.
         
         Args:
             limit: Maximum number of runs to return
+            cursor: next_cursor of the previous page (see list_runs_page)
             
         Returns:
             List of run summaries
         """
+        return self.list_runs_page(limit, cursor)[0]
+    
+    def list_runs_page(
+        self, limit: int = 20, cursor: Optional[str] = None
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        One keyset page of recent simulation runs (newest first).
+        
+        Loads only the summary columns: results and error_message stay
+        unloaded.
+        
+        Args:
+            limit: Maximum number of runs to return
+            cursor: next_cursor of the previous page; None for the first page
+            
+        Returns:
+            (run summaries, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            api.pagination.InvalidCursorError: The cursor is malformed
+        """
         db = self._get_db()
         
-        runs = db.query(SimulationRunModel).order_by(
-            SimulationRunModel.created_at.desc()
-        ).limit(limit).all()
+        query = db.query(SimulationRunModel).options(load_only(
+            SimulationRunModel.id, SimulationRunModel.status, SimulationRunModel.config,
+            SimulationRunModel.total_games, SimulationRunModel.completed_games,
+            SimulationRunModel.created_at, SimulationRunModel.completed_at,
+        ))
+        runs, next_cursor = keyset_page(
+            query, SimulationRunModel.created_at, SimulationRunModel.id, limit, cursor
+        )
         
-        return [
+        summaries = [
             {
                 "run_id": run.id,
                 "status": run.status,
@@ -851,6 +1016,7 @@ class SimulationOrchestrator:
             }
             for run in runs
         ]
+        return summaries, next_cursor
     
     def cancel_simulation(self, run_id: int) -> bool:
         """
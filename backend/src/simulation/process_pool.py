@@ -0,0 +1,212 @@
+"""
+Process-pool backend for simulation runs.
+
+Simulated games are CPU-bound pure Python (enumeration, validation and
+deepcopy-heavy planning), so the default thread pool tops out at roughly one
+core. With ``executor="process"`` the orchestrator runs games in worker
+processes instead. This module holds the pieces the workers need:
+
+- ``LimiterCoordinator`` runs in the orchestrator process and serves its rate
+  limiter over a local connection, so every worker draws on one shared RPM
+  bucket and daily budget (the limiter and its DB counter never leave the
+  parent).
+- ``RemoteLimiter`` is the worker-side stand-in that forwards ``acquire()``.
+- ``init_worker`` / ``run_game_in_worker`` are the pool initializer and task.
+"""
+
+import logging
+import os
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from typing import Any, Optional
+
+from game_engine.ai.rate_limiter import BudgetExhaustedError
+
+from .runner import SimulationRunner
+
+logger = logging.getLogger(__name__)
+
+# Start method for worker processes. "spawn" avoids forking an orchestrator
+# that holds open DB connections and coordinator threads.
+PROCESS_START_METHOD = "spawn"
+
+
+class LimiterCoordinator:
+    """
+    Serve one rate limiter to worker processes over a local connection.
+
+    Each worker opens one connection and sends ``"acquire"`` (or
+    ``"remaining"``) requests; a thread per connection calls the real limiter
+    and replies. ``BudgetExhaustedError`` is sent back as a reply and
+    re-raised in the worker, so exhaustion pauses the run exactly as in
+    thread mode.
+
+    Args:
+        limiter: The RateBudgetLimiter (or NoopLimiter) to share
+    """
+
+    def __init__(self, limiter):
+        self._limiter = limiter
+        self._authkey = os.urandom(32)
+        self._listener = Listener(authkey=self._authkey)
+        self.address = self._listener.address
+        self._closed = threading.Event()
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name="limiter-coordinator", daemon=True
+        )
+        self._accept_thread.start()
+
+    def client(self) -> "RemoteLimiter":
+        """Return a picklable limiter for workers that forwards to this coordinator."""
+        return RemoteLimiter(self.address, self._authkey)
+
+    def close(self) -> None:
+        """Stop accepting connections. Open worker connections end with their process."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            # accept() does not return when the listener is closed from
+            # another thread; connect once to wake it.
+            Client(self.address, authkey=self._authkey).close()
+        except OSError:
+            pass
+        self._accept_thread.join(timeout=5)
+        self._listener.close()
+
+    def __enter__(self) -> "LimiterCoordinator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self._closed.is_set():
+                    return
+                continue
+            if self._closed.is_set():
+                conn.close()
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                conn.send(self._handle(request))
+
+    def _handle(self, request: str) -> tuple:
+        try:
+            if request == "acquire":
+                self._limiter.acquire()
+                return ("ok", None)
+            if request == "remaining":
+                return ("ok", self._limiter.remaining())
+            return ("error", f"Unknown limiter request: {request!r}")
+        except BudgetExhaustedError as e:
+            return ("exhausted", e.resets_at)
+        except Exception as e:
+            logger.exception(f"Rate limiter coordinator error: {e}")
+            return ("error", str(e))
+
+
+class RemoteLimiter:
+    """
+    Worker-side limiter that forwards to a ``LimiterCoordinator``.
+
+    Drop-in for ``RateBudgetLimiter`` inside a worker process. Connects
+    lazily on first use, so it can be pickled into the pool initializer.
+    ``flush()`` is a no-op: the orchestrator flushes the real limiter.
+    """
+
+    def __init__(self, address: Any, authkey: bytes):
+        self._address = address
+        self._authkey = authkey
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        return {"address": self._address, "authkey": self._authkey}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["address"], state["authkey"])
+
+    def acquire(self) -> None:
+        """
+        Take one request from the shared RPM bucket and daily budget.
+
+        Raises:
+            BudgetExhaustedError: if the shared daily budget is used up.
+        """
+        self._call("acquire")
+
+    def remaining(self) -> dict:
+        """Return the shared limiter's status."""
+        return self._call("remaining")
+
+    def flush(self) -> None:
+        pass
+
+    def _call(self, request: str) -> Any:
+        with self._lock:
+            if self._conn is None:
+                self._conn = Client(self._address, authkey=self._authkey)
+            self._conn.send(request)
+            status, payload = self._conn.recv()
+        if status == "exhausted":
+            raise BudgetExhaustedError(resets_at=payload)
+        if status == "error":
+            raise RuntimeError(f"Rate limiter coordinator error: {payload}")
+        return payload
+
+
+# Per-worker state, set once by init_worker().
+_worker_limiter: Optional[RemoteLimiter] = None
+_worker_stop_event = None
+
+
+def init_worker(limiter: Optional[RemoteLimiter], stop_event) -> None:
+    """
+    Pool initializer: keep the shared limiter and stop event for this worker.
+
+    Args:
+        limiter: RemoteLimiter for the run, or None when no limiting is configured
+        stop_event: multiprocessing Event set by the orchestrator on pause or
+            budget exhaustion
+    """
+    global _worker_limiter, _worker_stop_event
+    _worker_limiter = limiter
+    _worker_stop_event = stop_event
+
+
+def run_game_in_worker(runner_kwargs: dict, game_info: dict) -> Optional[tuple]:
+    """
+    Run one game in a worker process.
+
+    Mirrors the thread-mode task: returns None (a "skip, don't persist"
+    sentinel) if a pause was requested before this game started.
+
+    Args:
+        runner_kwargs: SimulationRunner keyword arguments (models, max_turns)
+        game_info: Game number, deck names and DeckConfigs
+
+    Returns:
+        (game_info, GameResult), or None if skipped
+    """
+    if _worker_stop_event is not None and _worker_stop_event.is_set():
+        return None
+    runner = SimulationRunner(rate_limiter=_worker_limiter, **runner_kwargs)
+    result = runner.run_game(
+        game_info["deck1"],
+        game_info["deck2"],
+        game_info["game_number"],
+    )
+    return (game_info, result)
@@ -6,17 +6,18 @@ models and deck compositions, tracking Charge usage per turn for analysis.
 """
 
 import logging
+import random
 import time
-from copy import deepcopy
-from typing import Optional
+from typing import Generator, Optional
 import uuid
 
 from game_engine.game_engine import GameEngine
 from game_engine.models.game_state import GameState, Phase
 from game_engine.models.player import Player
 from game_engine.models.card import Card, Zone
-from game_engine.data.card_loader import load_cards_dict
+from game_engine.data.card_catalog import get_card_catalog
 from game_engine.ai.llm_player import LLMPlayer
+from game_engine.ai.selectors import build_selector
 from game_engine.ai.turn_planner import TurnPlanner
 from game_engine.validation.action_validator import ActionValidator
 from api.schemas import ValidAction
@@ -27,6 +28,7 @@ from .config import (
     GameOutcome,
     TurnCharge,
     default_simulation_model,
+    player_model_label,
 )
 from game_engine.ai.rate_limiter import BudgetExhaustedError
 
@@ -51,6 +53,10 @@ class SimulationRunner:
         max_turns: int = 20,
         log_level: str = "WARNING",
         rate_limiter: Optional[object] = None,
+        player1_selector: str = "llm",
+        player2_selector: str = "llm",
+        selector_cache: bool = True,
+        seed: Optional[int] = None,
     ):
         """
         Initialize the simulation runner.
@@ -64,22 +70,49 @@ class SimulationRunner:
             rate_limiter: Optional rate/budget limiter forwarded to both AI
                 players' Gemini provider. Defaults to a no-op limiter (no
                 behavior change).
+            player1_selector: Sequence selector for player 1: "llm" (Gemini
+                strategic selection) or "heuristic" (local, no API calls)
+            player2_selector: Sequence selector for player 2 (same choices)
+            selector_cache: Let both AI players reuse cached selector
+                responses (False for evaluation runs)
+            seed: Optional base seed for the selectors' tie-breaking. Each
+                game and player gets its own seed derived from it; None draws
+                fresh seeds per game.
+
+        Raises:
+            ValueError: If a selector name is unknown
         """
-        self.player1_model = player1_model or default_simulation_model()
-        self.player2_model = player2_model or default_simulation_model()
+        for selector in (player1_selector, player2_selector):
+            build_selector(selector)  # Fail fast on unknown names
+        self.player1_selector = player1_selector
+        self.player2_selector = player2_selector
+        self.selector_cache = selector_cache
+        self.seed = seed
+        self.player1_model = player_model_label(
+            player1_model or default_simulation_model(), player1_selector
+        )
+        self.player2_model = player_model_label(
+            player2_model or default_simulation_model(), player2_selector
+        )
         self.max_turns = max_turns
         self.rate_limiter = rate_limiter
 
         # Configure logging for simulation
         self._configure_simulation_logging(log_level)
 
-        # Load all card templates
-        self.card_templates = load_cards_dict()
+        # Shared card catalog (parsed once per process)
+        self.card_catalog = get_card_catalog()
 
         # AI players will be created per-game
         self._player1_ai: Optional[LLMPlayer] = None
         self._player2_ai: Optional[LLMPlayer] = None
     
+    def _selector_seed(self, game_number: int, player_number: int) -> int:
+        """Tie-break seed for one player's selector in one game."""
+        if self.seed is None:
+            return random.getrandbits(32)
+        return random.Random(f"{self.seed}:{game_number}:{player_number}").getrandbits(32)
+
     def run_game(
         self,
         deck1: DeckConfig,
@@ -97,6 +130,56 @@ class SimulationRunner:
         Returns:
             GameResult with outcome, turn count, Charge tracking, and action log
         """
+        game = self._play_game(deck1, deck2, game_number)
+        try:
+            ai_player, args = next(game)
+            while True:
+                try:
+                    selection = ai_player.select_action(*args)
+                except Exception as e:
+                    ai_player, args = game.throw(e)
+                else:
+                    ai_player, args = game.send(selection)
+        except StopIteration as finished:
+            return finished.value
+
+    async def run_game_async(
+        self,
+        deck1: DeckConfig,
+        deck2: DeckConfig,
+        game_number: int = 1,
+    ) -> GameResult:
+        """
+        ``run_game`` with the AI players' turn planning awaited
+        (``LLMPlayer.select_action_async``), so many games can wait on the
+        LLM concurrently from one event loop (``executor="async"``).
+        """
+        game = self._play_game(deck1, deck2, game_number)
+        try:
+            ai_player, args = next(game)
+            while True:
+                try:
+                    selection = await ai_player.select_action_async(*args)
+                except Exception as e:
+                    ai_player, args = game.throw(e)
+                else:
+                    ai_player, args = game.send(selection)
+        except StopIteration as finished:
+            return finished.value
+
+    def _play_game(
+        self,
+        deck1: DeckConfig,
+        deck2: DeckConfig,
+        game_number: int,
+    ) -> Generator[tuple[LLMPlayer, tuple], Optional[tuple[int, str]], GameResult]:
+        """
+        Play one game, yielding each AI decision to the caller.
+
+        Yields ``(ai_player, select_action args)`` and expects the selection
+        sent back (an exception from the selection is thrown back in), so
+        ``run_game`` and ``run_game_async`` share one game loop.
+        """
         start_time = time.time()
         charge_tracking: list[TurnCharge] = []
         action_log: list[dict] = []
@@ -111,8 +194,22 @@ class SimulationRunner:
             engine = GameEngine(game_state)
 
             # Create AI players with specified models (enum-based turn planning)
-            self._player1_ai = LLMPlayer(model=self.player1_model, rate_limiter=self.rate_limiter)
-            self._player2_ai = LLMPlayer(model=self.player2_model, rate_limiter=self.rate_limiter)
+            self._player1_ai = LLMPlayer(
+                model=self.player1_model,
+                rate_limiter=self.rate_limiter,
+                selector=build_selector(
+                    self.player1_selector, seed=self._selector_seed(game_number, 1)
+                ),
+                selector_cache=self.selector_cache,
+            )
+            self._player2_ai = LLMPlayer(
+                model=self.player2_model,
+                rate_limiter=self.rate_limiter,
+                selector=build_selector(
+                    self.player2_selector, seed=self._selector_seed(game_number, 2)
+                ),
+                selector_cache=self.selector_cache,
+            )
 
             logger.info(
                 f"Starting game {game_number}: {deck1.name} ({self.player1_model}) vs "
@@ -174,11 +271,11 @@ class SimulationRunner:
                         break
                     
                     # AI selects action
-                    result = ai_player.select_action(
+                    result = yield ai_player, (
                         game_state,
                         current_player_id,
                         valid_actions,
-                        engine
+                        engine,
                     )
                     
                     if result is None:
@@ -342,27 +439,19 @@ class SimulationRunner:
         # Create player 1's cards
         p1_cards = []
         for card_name in deck1.cards:
-            template = self.card_templates.get(card_name)
-            if template is None:
+            definition = self.card_catalog.get(card_name)
+            if definition is None:
                 raise ValueError(f"Card not found in templates: {card_name}")
-            card = deepcopy(template)
-            card.id = str(uuid.uuid4())  # Unique ID for this instance
-            card.owner = "player1"
-            card.controller = "player1"
-            card.zone = Zone.HAND
+            card = definition.new_card(owner="player1", zone=Zone.HAND)
             p1_cards.append(card)
         
         # Create player 2's cards
         p2_cards = []
         for card_name in deck2.cards:
-            template = self.card_templates.get(card_name)
-            if template is None:
+            definition = self.card_catalog.get(card_name)
+            if definition is None:
                 raise ValueError(f"Card not found in templates: {card_name}")
-            card = deepcopy(template)
-            card.id = str(uuid.uuid4())
-            card.owner = "player2"
-            card.controller = "player2"
-            card.zone = Zone.HAND
+            card = definition.new_card(owner="player2", zone=Zone.HAND)
             p2_cards.append(card)
         
         # Create players
@@ -0,0 +1,191 @@
+"""
+Tests for the keyset-paginated, column-projected listings (api.pagination):
+the admin games, AI-log, playback and player listings and
+SimulationOrchestrator.list_runs_page.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api import routes_admin
+from api.db_models import (
+    AIDecisionLogModel,
+    Base,
+    GameModel,
+    GamePlaybackModel,
+    PlayerStatsModel,
+    SimulationRunModel,
+)
+from api.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from simulation.orchestrator import SimulationOrchestrator
+
+T0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def selects(db):
+    """SQL of every SELECT the session runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _selected(statements, table):
+    """Columns of ``table`` named in the SELECT lists of ``statements``."""
+    columns = set()
+    for statement in statements:
+        select_list = statement.split(" FROM ", 1)[0]
+        columns |= {
+            part.strip().split(" ")[0].split(".", 1)[1]
+            for part in select_list[len("SELECT "):].split(",")
+            if part.strip().startswith(f"{table}.")
+        }
+    return columns
+
+
+def _games(db, count):
+    # Two games share each updated_at, so pages must break ties by id
+    for i in range(count):
+        db.add(GameModel(
+            id=uuid.uuid4(),
+            status="active" if i % 2 else "completed",
+            player1_id="p1", player1_name="One",
+            active_player_id="p1",
+            game_state={"blob": "x" * 1000},
+            created_at=T0,
+            updated_at=T0 + timedelta(minutes=i // 2),
+        ))
+    db.commit()
+
+
+def test_games_pages_cover_every_row_once(db):
+    _games(db, 7)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = routes_admin.get_games.__wrapped__(limit=3, status=None, cursor=cursor, db=db)
+        seen += [g["id"] for g in page["games"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3 and len(seen) == len(set(seen)) == 7
+    expected = db.query(GameModel).order_by(GameModel.updated_at.desc(), GameModel.id.desc()).all()
+    assert seen == [str(g.id) for g in expected]
+
+
+def test_games_listing_leaves_game_state_unloaded(db, selects):
+    _games(db, 4)
+    db.expunge_all()
+
+    page = routes_admin.get_games.__wrapped__(limit=10, status="active", cursor=None, db=db)
+
+    assert page["count"] == 2 and page["next_cursor"] is None
+    columns = _selected(selects, "games")
+    assert "updated_at" in columns
+    assert not columns & {"game_state", "game_state_snapshot"}
+
+
+def test_ai_logs_summary_omits_payloads(db, selects):
+    for i in range(3):
+        db.add(AIDecisionLogModel(
+            game_id=uuid.uuid4(), turn_number=i, model_name="m", prompts_version="1",
+            prompt="p" * 1000, response="r", turn_plan={"plan": i},
+            created_at=T0 + timedelta(minutes=i),
+        ))
+    db.commit()
+    db.expunge_all()
+
+    first = routes_admin.get_ai_logs.__wrapped__(limit=2, game_id=None, cursor=None, summary=True, db=db)
+    assert [log["turn_number"] for log in first["logs"]] == [2, 1]
+    assert "prompt" not in first["logs"][0] and "turn_plan" not in first["logs"][0]
+    assert not _selected(selects, "ai_decision_logs") & {"prompt", "response", "turn_plan"}
+
+    rest = routes_admin.get_ai_logs.__wrapped__(
+        limit=2, game_id=None, cursor=first["next_cursor"], summary=False, db=db
+    )
+    assert [log["turn_number"] for log in rest["logs"]] == [0]
+    assert rest["logs"][0]["prompt"] == "p" * 1000 and rest["next_cursor"] is None
+
+
+def test_playbacks_and_players_are_projected(db, selects):
+    db.add(GamePlaybackModel(
+        game_id=uuid.uuid4(), player1_id="a", player1_name="A", player2_id="b", player2_name="B",
+        starting_deck_p1=[], starting_deck_p2=[], first_player_id="a",
+        play_by_play=[{"turn": 1}] * 50, turn_count=5, created_at=T0,
+    ))
+    for name, wins in (("a", 3), ("b", 3), ("c", 1)):
+        db.add(PlayerStatsModel(player_id=name, display_name=name.upper(), games_played=5, games_won=wins))
+    db.commit()
+    db.expunge_all()
+
+    playbacks = routes_admin.get_game_playbacks.__wrapped__(limit=5, winner_id=None, cursor=None, db=db)
+    assert playbacks["count"] == 1
+    assert not _selected(selects, "game_playback") & {
+        "play_by_play", "starting_deck_p1", "starting_deck_p2", "charge_tracking",
+    }
+
+    first = routes_admin.get_players.__wrapped__(limit=2, cursor=None, db=db)
+    rest = routes_admin.get_players.__wrapped__(limit=2, cursor=first["next_cursor"], db=db)
+    assert [p["player_id"] for p in first["players"] + rest["players"]] == ["b", "a", "c"]
+    assert "card_stats" not in _selected(selects, "player_stats")
+
+
+def test_list_runs_page_skips_results(db, selects):
+    for i in range(3):
+        db.add(SimulationRunModel(
+            status="completed", config={"decks": ["A"]}, total_games=1,
+            results={"matchups": "x" * 1000}, created_at=T0 + timedelta(hours=i),
+        ))
+    db.commit()
+    db.expunge_all()
+    orchestrator = SimulationOrchestrator(db)
+
+    first, cursor = orchestrator.list_runs_page(limit=2)
+    rest, end = orchestrator.list_runs_page(limit=2, cursor=cursor)
+
+    assert [r["run_id"] for r in first + rest] == [3, 2, 1] and end is None
+    assert orchestrator.list_runs(limit=2, cursor=cursor) == rest
+    assert not _selected(selects, "simulation_runs") & {"results", "error_message"}
+
+
+def test_invalid_cursors_are_rejected(db):
+    cursor = encode_cursor(T0, uuid.UUID(int=1))
+    assert decode_cursor(cursor, GameModel.updated_at, GameModel.id) == (T0, uuid.UUID(int=1))
+
+    for bad in ("not a cursor", encode_cursor("yesterday", 1), encode_cursor(T0, [1])):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(bad, GameModel.updated_at, GameModel.id)
+
+    with pytest.raises(HTTPException) as exc:
+        routes_admin.get_games.__wrapped__(limit=5, status=None, cursor="garbage", db=db)
+    assert exc.value.status_code == 400
@@ -0,0 +1,273 @@
+"""
+Tests for the asyncio provider path.
+
+Covers GeminiProvider.generate_json_async/generate_text_async (retries with
+async backoff, fallback, rate-limiter integration), the AsyncRequestGate
+(in-flight bound, coalescing of identical temperature-0 requests),
+RateBudgetLimiter.acquire_async, TurnPlanner.create_plan_async, and
+SimulationRunner.run_game_async (executor="async").
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import ApiUsageModel, Base
+from conftest import create_game_with_cards
+from game_engine.ai import providers
+from game_engine.ai.providers import AIProviderConfig, GeminiProvider
+from game_engine.ai.rate_limiter import BudgetExhaustedError, RateBudgetLimiter
+from game_engine.ai.turn_planner import TurnPlanner
+from simulation.config import DeckConfig
+from simulation.runner import SimulationRunner
+
+
+def _response(text):
+    candidate = MagicMock()
+    candidate.content.parts = [MagicMock()]
+    response = MagicMock()
+    response.candidates = [candidate]
+    response.text = text
+    return response
+
+
+class AsyncClient:
+    """Fake google-genai client exposing only the ``aio`` surface."""
+
+    def __init__(self, fail_times=0, delay=0.0, text='{"ok": true}'):
+        self.fail_times = fail_times
+        self.delay = delay
+        self.text = text
+        self.calls = []
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=self._generate_content))
+
+    async def _generate_content(self, **kwargs):
+        self.calls.append(kwargs["model"])
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if len(self.calls) <= self.fail_times:
+            raise Exception("429 Resource exhausted")
+        return _response(self.text)
+
+
+class AsyncCountingLimiter:
+    def __init__(self):
+        self.acquires = 0
+
+    async def acquire_async(self):
+        self.acquires += 1
+
+
+class SyncOnlyLimiter:
+    def __init__(self):
+        self.acquires = 0
+
+    def acquire(self):
+        self.acquires += 1
+
+
+def _provider(client, **kwargs):
+    config = AIProviderConfig(api_key="dummy", model="model-a", fallback_model="model-b")
+    return GeminiProvider(config, client=client, **kwargs)
+
+
+@pytest.fixture
+def backoff(monkeypatch):
+    """Record retry backoff waits instead of sleeping through them."""
+    waits = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(providers.asyncio, "sleep", fake_sleep)
+    return waits
+
+
+def test_retries_with_async_backoff_then_falls_back(backoff):
+    limiter = AsyncCountingLimiter()
+    client = AsyncClient(fail_times=3)
+    provider = _provider(client, rate_limiter=limiter)
+
+    result = asyncio.run(provider.generate_json_async(
+        "prompt", {"type": "object"}, temperature=0.1, max_output_tokens=100,
+    ))
+
+    assert json.loads(result) == {"ok": True}
+    assert client.calls == ["model-a", "model-a", "model-a", "model-b"]
+    assert backoff == [1, 2]
+    assert limiter.acquires == 4
+
+
+def test_budget_exhaustion_propagates_without_retry():
+    class Exhausted:
+        async def acquire_async(self):
+            raise BudgetExhaustedError(resets_at=datetime.now(timezone.utc))
+
+    client = AsyncClient()
+    provider = _provider(client, rate_limiter=Exhausted())
+
+    with pytest.raises(BudgetExhaustedError):
+        asyncio.run(provider.generate_text_async("p", temperature=0.8, max_output_tokens=10))
+    assert client.calls == []
+
+
+def test_sync_only_limiter_is_acquired_off_loop():
+    limiter = SyncOnlyLimiter()
+    provider = _provider(AsyncClient(), rate_limiter=limiter)
+
+    asyncio.run(provider.generate_text_async("p", temperature=0.8, max_output_tokens=10))
+
+    assert limiter.acquires == 1
+
+
+def test_identical_concurrent_requests_are_coalesced():
+    client = AsyncClient(delay=0.01)
+    provider = _provider(client)
+
+    async def main():
+        same = [
+            provider.generate_json_async("same", {}, temperature=0.0, max_output_tokens=10)
+            for _ in range(3)
+        ]
+        other = provider.generate_json_async("other", {}, temperature=0.0, max_output_tokens=10)
+        return await asyncio.gather(*same, other)
+
+    results = asyncio.run(main())
+
+    assert len(results) == 4 and len(client.calls) == 2
+    stats = provider.request_gate.stats()
+    assert stats["requests"] == 4 and stats["coalesced"] == 2
+
+
+def test_sampled_requests_are_not_coalesced():
+    client = AsyncClient(delay=0.01)
+    provider = _provider(client)
+
+    async def main():
+        return await asyncio.gather(*(
+            provider.generate_text_async("same", temperature=0.8, max_output_tokens=10)
+            for _ in range(3)
+        ))
+
+    asyncio.run(main())
+
+    assert len(client.calls) == 3
+    assert provider.request_gate.stats()["coalesced"] == 0
+
+
+def test_in_flight_requests_are_bounded():
+    client = AsyncClient(delay=0.01)
+    provider = _provider(client, max_in_flight=2)
+
+    async def main():
+        await asyncio.gather(*(
+            provider.generate_text_async(f"prompt {i}", temperature=0.8, max_output_tokens=10)
+            for i in range(6)
+        ))
+
+    asyncio.run(main())
+
+    stats = provider.request_gate.stats()
+    assert len(client.calls) == 6
+    assert stats["peak_in_flight"] == 2 and stats["max_in_flight"] == 2
+    assert stats["queued"] >= 4 and stats["in_flight"] == 0
+
+
+def test_limiter_acquire_async_queues_rpm_waits():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[ApiUsageModel.__table__])
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    limiter = RateBudgetLimiter(
+        rpm=60, daily_budget=63, session_factory=sessionmaker(bind=engine),
+        clock=lambda: 0.0, async_sleep=fake_sleep,
+    )
+
+    async def main():
+        for _ in range(62):
+            await limiter.acquire_async()
+        with pytest.raises(BudgetExhaustedError):
+            for _ in range(2):
+                await limiter.acquire_async()
+
+    asyncio.run(main())
+
+    # A full bucket covers 60; later callers reserve into debt and wait in turn
+    assert waits == [pytest.approx(1.0), pytest.approx(2.0), pytest.approx(3.0)]
+    assert limiter.remaining()["used_today"] == 63
+
+
+def test_create_plan_async_matches_sync():
+    setup, _ = create_game_with_cards(
+        player1_in_play=["Knight"],
+        player2_in_play=["Paper Plane"],
+        player1_hand=["Ka"],
+        player1_charge=4,
+        active_player="player1",
+        turn_number=4,
+    )
+    response = json.dumps({"selected_index": 0, "reasoning": "Break the Paper Plane"})
+
+    class Stub:
+        def generate_json(self, prompt, schema, **kwargs):
+            return response
+
+        async def generate_json_async(self, prompt, schema, **kwargs):
+            return response
+
+    def planner():
+        return TurnPlanner(client=None, model_name="m", fallback_model="f", provider_client=Stub())
+
+    sync_plan = planner().create_plan(setup.game_state, "player1", setup.engine)
+    async_plan = asyncio.run(planner().create_plan_async(setup.game_state, "player1", setup.engine))
+
+    assert async_plan is not None
+    assert async_plan.model_dump() == sync_plan.model_dump()
+
+
+def test_create_plan_async_enumerates_off_the_event_loop():
+    setup, _ = create_game_with_cards(
+        player1_in_play=["Knight"], player2_in_play=["Paper Plane"], player1_charge=4,
+    )
+    planner = TurnPlanner(client=None, model_name="m", fallback_model="f", provider_client=MagicMock())
+    threads = []
+    prepare = planner._prepare_plan
+
+    def record(*args):
+        threads.append(threading.current_thread())
+        return prepare(*args)
+
+    planner._prepare_plan = record
+    planner.provider_client.generate_json_async = MagicMock(side_effect=RuntimeError("offline"))
+    asyncio.run(planner.create_plan_async(setup.game_state, "player1", setup.engine))
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_run_game_async_plans_without_the_blocking_planner(monkeypatch):
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.setattr(TurnPlanner, "create_plan", MagicMock(side_effect=AssertionError("blocking")))
+    deck = DeckConfig(name="A", description="", cards=["Knight", "Ka", "Archer", "Wizard", "Surge", "Paper Plane"])
+    runner = SimulationRunner(max_turns=8, player1_selector="heuristic", player2_selector="heuristic")
+
+    result = asyncio.run(runner.run_game_async(deck, deck))
+
+    assert result.error_message is None
+    assert result.turn_count > 1
+    assert {entry["player"] for entry in result.action_log} == {"player1", "player2"}
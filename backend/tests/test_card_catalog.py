@@ -0,0 +1,111 @@
+"""
+Tests for the process-wide card catalog (game_engine.data.card_catalog).
+
+Covers loading each CSV once, reloading when the file changes, immutability
+of definitions, pre-tokenized effect templates, and the consumers
+(GameService decks, Copy reset) building cards from it.
+"""
+
+import dataclasses
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from game_engine.data.card_catalog import get_card_catalog, reload_card_catalog
+from game_engine.data.card_loader import CardLoader
+from game_engine.models.card import Card, CardType, Zone
+from game_engine.rules.effects.effect_registry import split_effect_definitions
+
+CARDS_CSV = Path(__file__).parent.parent / "data" / "cards.csv"
+
+
+@pytest.fixture
+def csv_copy(tmp_path):
+    path = tmp_path / "cards.csv"
+    shutil.copy(CARDS_CSV, path)
+    return path
+
+
+def test_catalog_is_loaded_once_per_csv(csv_copy):
+    with patch.object(CardLoader, "load_cards", wraps=CardLoader(csv_copy).load_cards) as load:
+        first = get_card_catalog(csv_copy)
+        second = get_card_catalog(str(csv_copy))
+
+    assert first is second
+    assert load.call_count == 1
+    assert "Ka" in first and first["Ka"].card_type == CardType.TOY
+
+
+def test_catalog_reloads_when_csv_changes(csv_copy):
+    catalog = get_card_catalog(csv_copy)
+    assert "Testy" not in catalog
+
+    with open(csv_copy, "a") as f:
+        f.write("Testy,18,1,Test card.,1,1,1,,,#000000,#000000,\n")
+
+    reloaded = get_card_catalog(csv_copy)
+    assert reloaded is not catalog
+    assert reloaded["Testy"].cost == 1
+    assert reload_card_catalog(csv_copy) is not reloaded
+
+
+def test_definitions_are_immutable():
+    catalog = get_card_catalog()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        catalog["Ka"].strength = 99
+    with pytest.raises(TypeError):
+        catalog._definitions["Ka"] = None
+
+
+def test_create_card_returns_fresh_instances():
+    catalog = get_card_catalog()
+    first = catalog.create_card("Ka", owner="p1", zone=Zone.HAND)
+    second = catalog.create_card("Ka", owner="p1")
+
+    assert isinstance(first, Card)
+    assert first.id != second.id
+    assert (first.owner, first.controller) == ("p1", "p1")
+    first.strength = 1
+    assert second.strength == catalog["Ka"].strength
+    with pytest.raises(ValueError, match="not found"):
+        catalog.create_card("No Such Card")
+
+
+def test_effect_templates_are_pre_tokenized():
+    assert split_effect_definitions("cannot_tussle; remove_stamina_ability:1") == (
+        ("cannot_tussle",),
+        ("remove_stamina_ability", "1"),
+    )
+    assert split_effect_definitions("") == ()
+
+    archer = get_card_catalog()["Archer"]
+    assert archer.effect_templates == split_effect_definitions(archer.effect_definitions)
+
+
+def test_game_service_builds_decks_from_catalog():
+    from api.game_service import GameService
+
+    service = GameService(str(CARDS_CSV), use_database=False)
+    assert service.card_catalog is get_card_catalog(CARDS_CSV)
+
+    deck = service._create_deck(["Ka", "Knight"], "p1")
+    assert [c.name for c in deck] == ["Ka", "Knight"]
+    assert all(c.owner == "p1" for c in deck)
+    assert service.validate_deck(["Ka", "Knight", "Wizard", "Archer", "Beary", "Nope"])[0] is False
+
+
+def test_copy_reset_does_not_read_csv():
+    catalog = get_card_catalog()
+    copy_card = catalog.create_card("Copy", owner="p1")
+    copy_card._original_name = "Copy"
+    copy_card._is_transformed = True
+    copy_card.name = "Copy of Ka"
+    copy_card.strength = 11
+
+    with patch.object(CardLoader, "load_cards", side_effect=AssertionError("read CSV")):
+        copy_card._reset_copy_transformation()
+
+    assert copy_card.name == "Copy"
+    assert copy_card.strength == catalog["Copy"].strength
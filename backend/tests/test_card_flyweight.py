@@ -0,0 +1,145 @@
+"""
+Tests for the flyweight Card representation.
+
+Cards share an immutable CardTemplate for their printed data and keep only
+per-game state in slots; the attribute API must behave as before.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from conftest import create_game_with_cards
+from game_engine.data.card_catalog import get_card_catalog
+from game_engine.models.card import Card, CardTemplate, CardType, Zone, intern_template
+from game_engine.rules.effects.action_effects import CopyEffect
+
+
+def _ka(**kwargs) -> Card:
+    return Card(
+        name="Ka", card_type=CardType.TOY, cost=2, effect_text="Your cards have +2 strength.",
+        effect_definitions="stat_boost:strength:2", speed=5, strength=11, stamina=1, **kwargs,
+    )
+
+
+def test_instances_share_one_template():
+    first, second = _ka(owner="p1"), _ka(owner="p2")
+
+    assert first.template is second.template
+    assert isinstance(first.template, CardTemplate)
+    assert first.id != second.id
+    assert first.current_stamina == 1
+    assert not hasattr(first, "__dict__")
+
+
+def test_catalog_cards_use_their_definition_as_template():
+    catalog = get_card_catalog()
+    card = catalog.create_card("Ka", owner="p1")
+
+    assert card.template is catalog["Ka"]
+    assert (card.owner, card.controller, card.zone) == ("p1", "p1", Zone.HAND)
+    assert catalog.create_card("Ka", owner="p1", controller="p2").controller == "p2"
+
+
+def test_constructors_share_the_controller_default():
+    built = _ka(owner="p1")
+    from_template = Card.from_template(built.template, owner="p1")
+
+    assert built.controller == from_template.controller == ""
+
+
+def test_template_field_writes_do_not_leak_to_other_instances():
+    first, second = _ka(), _ka()
+    shared = first.template
+
+    first.strength = 20
+    assert first.strength == 20
+    assert second.strength == 11
+    assert second.template is shared
+    assert shared.strength == 11
+
+    # Writing the same value back lands on the shared template again
+    first.strength = 11
+    assert first.template is shared
+
+
+def test_unknown_attributes_are_rejected():
+    with pytest.raises(AttributeError):
+        _ka().not_a_card_field = 1
+
+
+def test_equality_and_repr_match_dataclass_semantics():
+    card = _ka(id="k1")
+    same = _ka(id="k1")
+
+    assert card == same
+    same.current_stamina = 0
+    assert card != same
+    assert repr(card).startswith("Card(name='Ka', card_type=<CardType.TOY: 'Toy'>")
+    with pytest.raises(TypeError):
+        hash(card)
+
+
+def test_deepcopy_and_pickle_share_template_or_round_trip():
+    card = _ka(owner="p1", zone=Zone.IN_PLAY, modifications={"strength": 2})
+    card._is_transformed = True
+
+    clone = copy.deepcopy(card)
+    assert clone == card
+    assert clone.template is card.template
+    assert clone.modifications is not card.modifications
+    assert clone._is_transformed is True
+
+    restored = pickle.loads(pickle.dumps(card))
+    assert restored == card
+    assert restored._is_transformed is True
+
+
+def test_copies_leave_the_state_hash_listener_behind():
+    setup, cards = create_game_with_cards(player1_in_play=["Ka"])
+    state = setup.game_state
+    state.get_state_hash()
+    ka = cards["p1_inplay_Ka"]
+    memo = {}
+
+    clone = copy.deepcopy(ka, memo)
+    assert clone._hash_listener is None
+    assert id(state) not in memo  # The owning GameState is not dragged along
+    assert "_hash_listener" not in ka.__getstate__()
+    assert pickle.loads(pickle.dumps(ka))._hash_listener is None
+
+    # A copied GameState re-attaches its cards, so its hash stays current
+    state_clone = copy.deepcopy(state)
+    state_clone.players["player1"].in_play[0].current_stamina = 0
+    tracked = state_clone.get_state_hash()
+    state_clone._state_hash = None
+    assert tracked == state_clone.get_state_hash() != state.get_state_hash()
+
+
+def test_snapshot_restore_undoes_template_swap_and_optional_slots():
+    card = get_card_catalog().create_card("Copy", owner="p1")
+    state = card.snapshot_state()
+
+    card._is_transformed = True
+    card.name = "Copy of Ka"
+    card.modifications["strength"] = 2
+
+    card.restore_state(state)
+    assert card.name == "Copy"
+    assert card.template is get_card_catalog()["Copy"]
+    assert card.modifications == {}
+    assert not hasattr(card, "_is_transformed")
+
+
+def test_copy_transformation_interns_one_template():
+    setup, cards = create_game_with_cards(player1_hand=["Copy"], player1_in_play=["Ka"])
+    copy_card, ka = cards["p1_hand_Copy"], cards["p1_inplay_Ka"]
+    intern_template.cache_clear()
+
+    CopyEffect(copy_card).apply(setup.game_state, target=ka)
+
+    assert intern_template.cache_info().currsize == 1
+    assert copy_card.name == "Copy of Ka"
+    assert copy_card.template_values()[1:] == ka.template_values()[1:]
+    assert copy_card.current_stamina == ka.stamina
@@ -0,0 +1,140 @@
+"""
+Tests for the normalized per-card stats table (player_card_stats).
+
+Covers StatsService.update_player_stats maintaining the table (and the
+player profile reading from it), the SQL-backed card leaderboard and card
+aggregate, and the 015 migration backfilling the table from existing JSON
+(and folding it back on downgrade).
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import Base, PlayerCardStatsModel, PlayerStatsModel
+from api.stats_service import StatsService
+
+MIGRATION_PATH = (
+    Path(__file__).parent.parent / "alembic" / "versions" / "015_create_player_card_stats.py"
+)
+
+
+def _engine():
+    return create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+@pytest.fixture
+def session_factory():
+    engine = _engine()
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def service(session_factory):
+    with patch("api.stats_service._get_session_local", return_value=session_factory):
+        yield StatsService()
+
+
+def _record(service, player_id, wins, losses, cards):
+    for won in [True] * wins + [False] * losses:
+        service.update_player_stats(player_id, player_id.title(), won=won, cards_used=cards)
+
+
+def test_update_player_stats_maintains_card_rows(service, session_factory):
+    _record(service, "alice", 2, 1, ["Ka", "Knight", "Ka"])
+
+    db = session_factory()
+    rows = {r.card_name: (r.games_played, r.games_won) for r in db.query(PlayerCardStatsModel)}
+    db.close()
+
+    assert rows == {"Ka": (3, 2), "Knight": (3, 2)}
+    profile = service.get_player_stats("alice")["card_stats"]
+    assert {name: (d["games_played"], d["games_won"]) for name, d in profile.items()} == rows
+
+
+def test_card_leaderboard_is_filtered_sorted_and_limited(service):
+    _record(service, "alice", 3, 1, ["Ka"])
+    _record(service, "bob", 3, 0, ["Ka"])
+    _record(service, "carol", 6, 2, ["Ka"])
+    _record(service, "dave", 2, 0, ["Ka"])  # below min_games
+    _record(service, "erin", 5, 0, ["Knight"])  # other card
+
+    board = service.get_card_leaderboard("Ka", limit=3, min_games=3)
+
+    assert [p["player_id"] for p in board] == ["bob", "carol", "alice"]
+    assert board[0]["display_name"] == "Bob"
+    assert board[1] == {
+        "player_id": "carol", "display_name": "Carol",
+        "games_played": 8, "games_won": 6, "win_rate": 75.0,
+    }
+    assert service.get_card_leaderboard("Ka", limit=1, min_games=3)[0]["player_id"] == "bob"
+
+
+def test_card_stats_aggregate(service):
+    _record(service, "alice", 1, 1, ["Ka", "Knight"])
+    _record(service, "bob", 2, 0, ["Ka", "Wizard"])
+
+    cards, total = service.get_card_stats_aggregate(min_games=1)
+
+    assert total == 4
+    assert [c["card_name"] for c in cards] == ["Wizard", "Ka", "Knight"]
+    ka = cards[1]
+    assert (ka["games_played"], ka["games_won"], ka["games_lost"]) == (4, 3, 1)
+    assert ka["player_count"] == 2
+    assert ka["win_rate"] == 75.0 and ka["pick_rate"] == 100.0
+
+    cards, _ = service.get_card_stats_aggregate(min_games=3)
+    assert [c["card_name"] for c in cards] == ["Ka"]
+
+
+def test_migration_backfills_from_json_and_folds_back_on_downgrade():
+    spec = importlib.util.spec_from_file_location("migration_015", str(MIGRATION_PATH))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert (module.revision, module.down_revision) == ("015", "014")
+
+    engine = _engine()
+    PlayerStatsModel.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(PlayerStatsModel.__table__), [
+            {"player_id": "alice", "display_name": "Alice", "games_played": 3, "games_won": 2,
+             "card_stats": {"Ka": {"games_played": 3, "games_won": 2},
+                            "Knight": {"games_played": 0, "games_won": 0}}},
+            {"player_id": "bob", "display_name": "Bob", "games_played": 1, "games_won": 0,
+             "card_stats": {}},
+        ])
+        with Operations.context(MigrationContext.configure(conn)):
+            module.upgrade()
+
+    with engine.connect() as conn:
+        rows = conn.execute(select(PlayerCardStatsModel.__table__)).all()
+    assert [tuple(r) for r in rows] == [("alice", "Ka", 3, 2)]
+
+    # Stats recorded after the upgrade only exist in the table
+    with engine.begin() as conn:
+        conn.execute(insert(PlayerCardStatsModel.__table__), [
+            {"player_id": "bob", "card_name": "Knight", "games_played": 1, "games_won": 0},
+        ])
+        with Operations.context(MigrationContext.configure(conn)):
+            module.downgrade()
+
+    with engine.connect() as conn:
+        card_stats = dict(conn.execute(
+            select(PlayerStatsModel.player_id, PlayerStatsModel.card_stats)
+        ).all())
+    assert card_stats == {
+        "alice": {"Ka": {"games_played": 3, "games_won": 2}},
+        "bob": {"Knight": {"games_played": 1, "games_won": 0}},
+    }
@@ -0,0 +1,93 @@
+"""
+Tests for EffectRegistry's per-card parsed-effect cache.
+
+Stat lookups call ``EffectRegistry.get_effects`` for every card in play, so
+parsed effects are cached on the card, keyed by its ``effect_definitions``
+string. These tests pin the cache's correctness guarantees:
+
+1. Repeated lookups return the same effect instances without re-parsing.
+2. A Copy transformation (and its reset) never serves stale effects.
+3. Deep clones (the enumerator's search states) rebind effects to the clone.
+"""
+
+import copy
+from unittest.mock import patch
+
+from conftest import create_card, create_game_with_cards
+from game_engine.models.card import Zone
+from game_engine.rules.effects import EffectRegistry
+from game_engine.rules.effects.action_effects import CopyEffect
+from game_engine.rules.effects.continuous_effects import StatBoostEffect
+from game_engine.rules.effects.effect_registry import EffectFactory
+
+
+def test_repeated_lookups_parse_once():
+    ka = create_card("Ka", owner="player1", zone=Zone.IN_PLAY)
+
+    with patch.object(EffectFactory, "parse_effects", wraps=EffectFactory.parse_effects) as parse:
+        first = EffectRegistry.get_effects(ka)
+        second = EffectRegistry.get_effects(ka)
+
+    assert parse.call_count == 1
+    assert first is second
+    assert isinstance(first[0], StatBoostEffect)
+    assert first[0].source_card is ka
+
+
+def test_cache_is_per_card():
+    ka1 = create_card("Ka", owner="player1")
+    ka2 = create_card("Ka", owner="player1")
+
+    effects1 = EffectRegistry.get_effects(ka1)
+    effects2 = EffectRegistry.get_effects(ka2)
+
+    assert effects1 is not effects2
+    assert effects1[0].source_card is ka1
+    assert effects2[0].source_card is ka2
+
+
+def test_changed_definitions_miss_the_cache():
+    card = create_card("Ka", owner="player1")
+    EffectRegistry.get_effects(card)
+
+    card.effect_definitions = "stat_boost:speed:1"
+    effects = EffectRegistry.get_effects(card)
+
+    assert effects[0].stat_name == "speed"
+
+
+def test_copy_transformation_and_reset_refresh_effects():
+    setup, cards = create_game_with_cards(
+        player1_hand=["Copy"],
+        player1_in_play=["Ka"],
+    )
+    engine = setup.engine
+    player = setup.player1
+    copy_card = cards["p1_hand_Copy"]
+    ka = cards["p1_inplay_Ka"]
+
+    # Prime the cache with the untransformed Copy effect
+    assert isinstance(EffectRegistry.get_effects(copy_card)[0], CopyEffect)
+
+    assert engine.play_card(player, copy_card, target=ka, target_ids=[ka.id])
+    transformed = EffectRegistry.get_effects(copy_card)
+    assert isinstance(transformed[0], StatBoostEffect)
+    assert transformed[0].source_card is copy_card
+
+    # Leaving play resets the transformation; the Copy effect must come back
+    player.move_card(copy_card, Zone.IN_PLAY, Zone.HAND)
+    reset = EffectRegistry.get_effects(copy_card)
+    assert copy_card.name == "Copy"
+    assert isinstance(reset[0], CopyEffect)
+
+
+def test_deepcopy_rebinds_cached_effects_to_clone():
+    ka = create_card("Ka", owner="player1", zone=Zone.IN_PLAY)
+    original_effects = EffectRegistry.get_effects(ka)
+
+    clone = copy.deepcopy(ka)
+    clone_effects = EffectRegistry.get_effects(clone)
+
+    assert clone_effects[0] is not original_effects[0]
+    assert clone_effects[0].source_card is clone
+    assert original_effects[0].source_card is ka
@@ -0,0 +1,112 @@
+"""
+Tests for the continuous-effect index on GameState.
+
+Stat, cost and protection queries read active effects from
+``GameState.get_effect_index()`` instead of scanning every card in play. The
+index must be rebuilt whenever the board changes, or stat queries would
+serve stale values. These tests pin the rebuild triggers.
+"""
+
+from conftest import create_card, create_game_with_cards, steal_card
+from game_engine.models.card import Zone
+from game_engine.rules.effects.continuous_effects import (
+    OpponentCostIncreaseEffect,
+    StatBoostEffect,
+)
+
+
+def test_index_groups_effects_by_kind():
+    setup, _ = create_game_with_cards(
+        player1_in_play=["Ka", "Wizard"],
+        player2_in_play=["Gibbers"],
+    )
+    index = setup.game_state.get_effect_index()
+
+    assert any(isinstance(e, StatBoostEffect) for e in index.continuous)
+    assert any(isinstance(e, OpponentCostIncreaseEffect) for e in index.cost_modifiers)
+    assert len(index.cost_modifiers_by_controller["player1"]) == 1  # Wizard
+    assert len(index.cost_modifiers_by_controller["player2"]) == 1  # Gibbers
+
+
+def test_index_is_reused_until_board_changes():
+    setup, _ = create_game_with_cards(player1_in_play=["Ka"])
+    gs = setup.game_state
+
+    assert gs.get_effect_index() is gs.get_effect_index()
+
+    gs.invalidate_effect_index()
+    first = gs.get_effect_index()
+    gs.turn_number += 1
+    assert gs.get_effect_index() is not first
+
+
+def test_zone_move_updates_stats():
+    setup, cards = create_game_with_cards(
+        player1_in_play=["Ka", "Knight"],
+    )
+    engine = setup.engine
+    ka = cards["p1_inplay_Ka"]
+    knight = cards["p1_inplay_Knight"]
+    base = knight.strength
+
+    assert engine.get_card_stat(knight, "strength") == base + 2
+
+    setup.player1.move_card(ka, Zone.IN_PLAY, Zone.BREAK)
+    assert engine.get_card_stat(knight, "strength") == base
+
+
+def test_playing_a_card_updates_stats():
+    setup, cards = create_game_with_cards(
+        player1_hand=["Ka"],
+        player1_in_play=["Knight"],
+    )
+    engine = setup.engine
+    knight = cards["p1_inplay_Knight"]
+    base = knight.strength
+
+    assert engine.get_card_stat(knight, "strength") == base
+    assert engine.play_card(setup.player1, cards["p1_hand_Ka"])
+    assert engine.get_card_stat(knight, "strength") == base + 2
+
+
+def test_change_of_control_updates_stats():
+    setup, cards = create_game_with_cards(
+        player1_in_play=["Ka"],
+        player2_in_play=["Knight"],
+    )
+    engine = setup.engine
+    gs = setup.game_state
+    knight = cards["p2_inplay_Knight"]
+    base = knight.strength
+
+    assert engine.get_card_stat(knight, "strength") == base
+    gs.change_control(knight, setup.player1)
+    assert engine.get_card_stat(knight, "strength") == base + 2
+
+
+def test_direct_zone_list_edits_are_detected():
+    """Helpers that edit in_play lists directly still trigger a rebuild."""
+    setup, cards = create_game_with_cards(
+        player1_in_play=["Ka"],
+        player2_in_play=["Knight"],
+    )
+    engine = setup.engine
+    knight = cards["p2_inplay_Knight"]
+    base = knight.strength
+    assert engine.get_card_stat(knight, "strength") == base
+
+    steal_card(setup.game_state, knight, "player1")
+    assert engine.get_card_stat(knight, "strength") == base + 2
+
+    setup.player1.in_play.append(create_card("Ka", owner="player1", zone=Zone.IN_PLAY))
+    assert engine.get_card_stat(knight, "strength") == base + 4
+
+
+def test_effective_stamina_tracks_damage_with_memoized_bonus():
+    setup, cards = create_game_with_cards(player1_in_play=["Demideca", "Knight"])
+    engine = setup.engine
+    knight = cards["p1_inplay_Knight"]
+
+    before = engine.get_effective_stamina(knight)
+    knight.apply_damage(1)
+    assert engine.get_effective_stamina(knight) == before - 1
@@ -0,0 +1,143 @@
+"""
+Tests for the bounded GameService engine cache (api.engine_cache).
+
+Covers LRU and idle-TTL eviction, explicit eviction of completed games, and
+GameService reloading an evicted game from the database on a miss.
+"""
+
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import Base, GameModel
+from api.engine_cache import EngineCache
+from api.game_service import GameService
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEngineCache:
+    def test_lru_eviction_keeps_recently_used(self):
+        evicted = []
+        cache = EngineCache(max_size=2, on_evict=evicted.append)
+        cache["a"], cache["b"] = "engine-a", "engine-b"
+        assert cache.get("a") == "engine-a"  # "b" is now least recently used
+        cache["c"] = "engine-c"
+
+        assert "b" not in cache
+        assert cache.get("a") == "engine-a" and cache.get("c") == "engine-c"
+        assert evicted == ["b"]
+        stats = cache.stats()
+        assert stats["evictions_lru"] == 1
+        assert (stats["hits"], stats["misses"], stats["size"]) == (3, 0, 2)
+
+    def test_idle_ttl_expires_on_access_and_insert(self):
+        clock = FakeClock()
+        cache = EngineCache(idle_ttl=60, clock=clock)
+        cache["a"], cache["b"] = "engine-a", "engine-b"
+
+        clock.now = 50
+        assert cache.get("a") == "engine-a"  # refreshes "a" only
+        clock.now = 100
+        assert cache.get("b") is None
+        clock.now = 200
+        cache["c"] = "engine-c"  # sweeps the idle "a"
+
+        assert "a" not in cache
+        stats = cache.stats()
+        assert stats["evictions_ttl"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_explicit_eviction_is_counted_by_reason(self):
+        cache = EngineCache()
+        cache["a"] = "engine-a"
+        assert cache.evict("a", "completed")
+        assert not cache.evict("a", "completed")
+        assert cache.stats()["evictions_completed"] == 1
+
+    def test_rejects_empty_bound(self):
+        with pytest.raises(ValueError):
+            EngineCache(max_size=0)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db_patches(session_factory):
+    mock_stats = MagicMock()
+    mock_stats.get_player_stats.return_value = None
+    with patch("api.game_service.SessionLocal", session_factory), \
+         patch("api.game_service.get_session_local", return_value=session_factory), \
+         patch("api.game_service.get_stats_service", return_value=mock_stats), \
+         patch("api.game_service.capture_game_analyzed"):
+        yield
+
+
+def _new_game(svc, p1="p1"):
+    return svc.create_game(
+        player1_id=p1, player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+        player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+        first_player_id=p1,
+    )
+
+
+def test_evicted_game_reloads_from_database(db_patches):
+    svc = GameService(CARDS_CSV, cache_max_games=1)
+    first_id, first = _new_game(svc, "p1")
+    _new_game(svc, "p3")
+
+    assert first_id not in svc._cache
+    reloaded = svc.get_game(first_id)
+    assert reloaded is not first
+    assert reloaded.game_state.turn_number == first.game_state.turn_number
+    stats = svc.cache_stats()
+    assert stats["evictions_lru"] >= 1
+    assert stats["misses"] == 1
+
+
+def test_completed_game_is_evicted(db_patches, session_factory):
+    svc = GameService(CARDS_CSV)
+    game_id, engine = _new_game(svc)
+    gs = engine.game_state
+    for card in list(gs.players["p2"].hand):
+        gs.players["p2"].break_card(card)
+    gs.check_victory()
+
+    svc.update_game(game_id, engine)
+
+    assert game_id not in svc._cache
+    assert svc.cache_stats()["evictions_completed"] == 1
+    db = session_factory()
+    assert db.query(GameModel).filter(GameModel.id == uuid.UUID(game_id)).first().winner_id == "p1"
+    db.close()
+    assert svc.get_game(game_id).game_state.winner_id == "p1"
+
+
+def test_memory_only_service_never_evicts():
+    svc = GameService(CARDS_CSV, use_database=False, cache_max_games=1, cache_idle_ttl=1)
+    ids = [_new_game(svc, p)[0] for p in ("p1", "p3", "p4")]
+    assert all(game_id in svc._cache for game_id in ids)
+    assert svc.cache_stats()["max_size"] is None
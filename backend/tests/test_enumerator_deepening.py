@@ -0,0 +1,140 @@
+"""
+Time-budgeted, iterative-deepening sequence enumeration.
+
+With ``time_budget`` the enumerator searches depth 1, 2, ... and returns the
+best lines found when the deadline hits; later iterations try the previous
+iteration's best moves first. Also covers the process-wide latency/depth
+metrics reported on /health.
+"""
+
+import pytest
+
+from conftest import create_game_with_cards
+from game_engine.ai import enumerator
+from game_engine.ai.enumerator import (
+    enumerate_sequences,
+    get_enumeration_metrics,
+    reset_enumeration_metrics,
+)
+
+
+def _tussle_then_direct():
+    return create_game_with_cards(
+        player1_hand=[],
+        player1_in_play=["Knight"],
+        player2_hand=["Ka", "Wizard"],
+        player2_in_play=["Paper Plane"],
+        player1_charge=5,
+        active_player="player1",
+        turn_number=3,
+    )
+
+
+def test_generous_budget_finds_the_unbudgeted_best_line():
+    setup, _ = _tussle_then_direct()
+
+    unbudgeted = enumerate_sequences(setup.game_state, "player1")
+    stats = {}
+    budgeted = enumerate_sequences(setup.game_state, "player1", time_budget=30.0, stats=stats)
+
+    assert budgeted[0]["rank_key"] == unbudgeted[0]["rank_key"]
+    assert {s["raw_string"] for s in budgeted} == {s["raw_string"] for s in unbudgeted}
+    assert stats["timed_out"] is False
+    # The tree is exhausted before max_actions, so deepening stops early
+    assert stats["depth_completed"] == stats["iterations"] < enumerator.DEFAULT_MAX_ACTIONS
+    assert stats["depth_reached"] == len(unbudgeted[0]["actions"]) - 1
+
+
+def test_expired_budget_still_returns_the_pass_line():
+    setup, _ = _tussle_then_direct()
+
+    stats = {}
+    sequences = enumerate_sequences(setup.game_state, "player1", time_budget=0.0, stats=stats)
+
+    assert [s["raw_string"] for s in sequences] == ["end_turn | Charge: 0/5 | Breaks: 0"]
+    assert stats["timed_out"] is True
+    assert stats["depth_completed"] == 0
+    # The live state is untouched by the interrupted search
+    assert len(setup.game_state.players["player2"].in_play) == 1
+
+
+def _root_moves_searched(search, root):
+    """Run one search from ``root``; return the root moves in the order tried."""
+    order = []
+    original_apply = search.apply
+
+    def apply(engine, step):
+        if engine.game_state.players["player1"].charge == root_charge:
+            order.append(step["card_name"])
+        return original_apply(engine, step)
+
+    root_charge = root.players["player1"].charge
+    search.apply = apply
+    search.dfs(root, [], [])
+    return order
+
+
+def _search(max_actions=1):
+    return enumerator._SequenceSearch(
+        "player1", {}, (0, 0), max_actions=max_actions, use_rollback=True,
+        verify_state_hash=False, node_budget=enumerator.MAX_NODES,
+    )
+
+
+def test_move_order_puts_higher_scored_moves_first():
+    setup, _ = create_game_with_cards(
+        player1_hand=["Surge"], player1_in_play=["Knight"], player2_in_play=["Paper Plane"],
+        player1_charge=5, active_player="player1", turn_number=3,
+    )
+    root = enumerator.clone_game_state(setup.game_state)
+
+    search = _search()
+    search.bind_root(root)
+    assert _root_moves_searched(search, root)[0] == "Knight"  # generated order
+    scores = search.move_scores
+    assert {key[1][0] for key in scores} == {"tussle", "play_card"}
+
+    # Seed the next search with inverted scores: Surge must now go first
+    reseeded = _search()
+    reseeded.bind_root(root)
+    reseeded.move_order = {key: (-score[0],) for key, score in scores.items()}
+    assert _root_moves_searched(reseeded, root)[0] == "Surge"
+
+
+def test_each_iteration_is_ordered_by_the_previous_one(monkeypatch):
+    setup, _ = _tussle_then_direct()
+    orders = []
+    original_dfs = enumerator._SequenceSearch.dfs
+
+    def spy(self, state, path, costs):
+        if not path:
+            orders.append(self.move_order)
+        return original_dfs(self, state, path, costs)
+
+    monkeypatch.setattr(enumerator._SequenceSearch, "dfs", spy)
+    enumerate_sequences(setup.game_state, "player1", time_budget=30.0)
+
+    assert orders[0] is None
+    assert len(orders) >= 2 and all(orders[1:])
+
+
+def test_metrics_track_latency_and_depth(monkeypatch):
+    monkeypatch.delenv(enumerator.TIME_BUDGET_ENV, raising=False)
+    reset_enumeration_metrics()
+    setup, _ = _tussle_then_direct()
+
+    enumerate_sequences(setup.game_state, "player1")
+    enumerate_sequences(setup.game_state, "player1", time_budget=0.0)
+    metrics = get_enumeration_metrics()
+
+    assert metrics["runs"] == 2
+    assert metrics["timed_out"] == 1
+    assert metrics["p50_ms"] is not None and metrics["max_ms"] >= metrics["p50_ms"]
+    assert metrics["avg_depth_reached"] > 0
+    assert metrics["time_budget_ms"] is None
+
+
+@pytest.mark.parametrize("raw, expected", [("", None), ("250", 0.25), ("0", None), ("soon", None)])
+def test_time_budget_env_var(monkeypatch, raw, expected):
+    monkeypatch.setenv(enumerator.TIME_BUDGET_ENV, raw)
+    assert enumerator.enumeration_time_budget() == expected
@@ -0,0 +1,120 @@
+"""
+Root-split (parallel) sequence enumeration.
+
+With ``workers`` > 1 the search is split at the root: each first action's
+subtree is searched on the worker pool with its own node budget and the
+results are merged. Most tests swap the process pool for a single-thread
+pool via ``_get_pool`` so they run fast (branches reseed the global
+``random``, so they must not overlap in one process); one test exercises
+real worker processes.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from conftest import create_game_with_cards
+from game_engine.ai import enumerator
+from game_engine.ai.enumerator import enumerate_sequences
+
+
+def _tussle_then_direct():
+    return create_game_with_cards(
+        player1_hand=["Surge"],
+        player1_in_play=["Knight"],
+        player2_hand=["Ka", "Wizard"],
+        player2_in_play=["Paper Plane"],
+        player1_charge=5,
+        active_player="player1",
+        turn_number=3,
+    )
+
+
+def _busy_board():
+    return create_game_with_cards(
+        player1_hand=["Surge", "Copy", "Ka"],
+        player1_in_play=["Archer", "Knight"],
+        player2_hand=["Ka", "Wake"],
+        player2_in_play=["Paper Plane", "Wizard"],
+        player1_charge=7,
+        turn_number=4,
+    )
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(enumerator, "_get_pool", lambda workers: pool)
+    yield pool
+    pool.shutdown()
+
+
+def _lines(sequences):
+    return [s["raw_string"] for s in sequences]
+
+
+def test_split_matches_serial_on_small_tree(thread_pool):
+    setup, _ = _tussle_then_direct()
+
+    serial = enumerate_sequences(setup.game_state, "player1", workers=0)
+    stats = {}
+    split = enumerate_sequences(setup.game_state, "player1", workers=2, stats=stats)
+
+    assert _lines(split) == _lines(serial)
+    assert [s["rank_key"] for s in split] == [s["rank_key"] for s in serial]
+    assert stats["workers"] == 2
+    assert any(line.startswith("end_turn") for line in _lines(split))  # pass line kept
+
+
+def test_split_result_is_deterministic(thread_pool):
+    setup, _ = _busy_board()
+
+    first = enumerate_sequences(setup.game_state, "player1", workers=2)
+    second = enumerate_sequences(setup.game_state, "player1", workers=4)
+
+    assert _lines(first) == _lines(second)
+    assert first[0]["rank_key"] == max(s["rank_key"] for s in first)
+
+
+def test_branches_share_the_node_budget(thread_pool, monkeypatch):
+    monkeypatch.setattr(enumerator, "MAX_NODES", 40)
+    setup, _ = _busy_board()
+
+    stats = {}
+    sequences = enumerate_sequences(setup.game_state, "player1", workers=2, stats=stats)
+
+    assert sequences
+    assert 1 < stats["nodes_expanded"] <= 40
+
+
+def test_broken_pool_falls_back_to_in_process_search(monkeypatch):
+    class BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(enumerator, "_get_pool", lambda workers: BrokenPool())
+    monkeypatch.setattr(enumerator, "shutdown_enumeration_pool", lambda: None)
+    setup, _ = _tussle_then_direct()
+
+    split = enumerate_sequences(setup.game_state, "player1", workers=2)
+    assert _lines(split) == _lines(enumerate_sequences(setup.game_state, "player1", workers=0))
+
+
+def test_workers_env_var(monkeypatch):
+    monkeypatch.setenv(enumerator.ENUM_WORKERS_ENV, "3")
+    assert enumerator.enumeration_workers() == 3
+    monkeypatch.setenv(enumerator.ENUM_WORKERS_ENV, "lots")
+    assert enumerator.enumeration_workers() == 0
+    monkeypatch.delenv(enumerator.ENUM_WORKERS_ENV)
+    assert enumerator.enumeration_workers() == 0
+
+
+def test_process_pool_end_to_end():
+    setup, _ = _tussle_then_direct()
+    try:
+        split = enumerate_sequences(setup.game_state, "player1", workers=2)
+    finally:
+        enumerator.shutdown_enumeration_pool()
+
+    assert _lines(split) == _lines(enumerate_sequences(setup.game_state, "player1", workers=0))
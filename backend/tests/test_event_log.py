@@ -0,0 +1,162 @@
+"""
+Event-sourced game persistence (api.event_log) and GameService's event mode.
+"""
+
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import Base, GameActionModel, GameModel
+from api.event_log import capture_image, describe_event, diff_event, replay_events
+from api.game_service import GameService
+from api.serialization import serialize_game_state
+from api.snapshot_codec import decode_snapshot, encode_snapshot
+from conftest import create_game_with_cards
+from game_engine.data.card_catalog import get_card_catalog
+from game_engine.game_engine import GameEngine
+from game_engine.validation import ActionExecutor
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+
+
+def test_replay_rebuilds_state_including_random_breaks():
+    setup, cards = create_game_with_cards(
+        player1_hand=["Copy"],
+        player1_in_play=["Ka", "Knight"],
+        player2_hand=["Wizard", "Surge"],
+        player1_charge=6,
+        active_player="player1",
+        turn_number=3,
+    )
+    gs = setup.game_state
+    gs.finalize_turn_charge_tracking()
+    catalog = get_card_catalog()
+    base = encode_snapshot(gs, catalog)
+    image = capture_image(gs, catalog)
+    executor = ActionExecutor(GameEngine(gs))
+
+    events = []
+    for action in (
+        lambda: executor.execute_play_card(
+            "player1", cards["p1_hand_Copy"].id, target_card_id=cards["p1_inplay_Ka"].id,
+        ),
+        # No defenders: breaks a random card from player2's hand
+        lambda: executor.execute_tussle("player1", cards["p1_inplay_Knight"].id),
+    ):
+        assert action().success
+        gs.bump_state_version()
+        event, image = diff_event(image, gs, catalog)
+        events.append(event)
+
+    restored = replay_events(decode_snapshot(base, catalog), events, catalog)
+
+    assert serialize_game_state(restored) == serialize_game_state(gs)
+    assert restored.charge_history == gs.charge_history
+    assert restored.state_version == gs.state_version
+    assert len(restored.players["player2"].break_zone) == 1
+    # Only the changed cards are logged
+    assert len(events[1]["c"]) < len(image.cards)
+    # The executor adds no play-by-play (routes do)
+    assert describe_event(events[0]) == ("update", None)
+    # Events at or below the snapshot's version are skipped
+    assert replay_events(restored, events, catalog) is restored
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _query(session_factory, model, game_id):
+    db = session_factory()
+    try:
+        column = model.id if model is GameModel else model.game_id
+        return db.query(model).filter(column == uuid.UUID(game_id)).all()
+    finally:
+        db.close()
+
+
+def _new_game(svc):
+    return svc.create_game(
+        player1_id="p1", player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+        player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+        first_player_id="p1",
+    )
+
+
+def _act(svc, game_id, engine, description):
+    gs = engine.game_state
+    player = gs.players[gs.active_player_id]
+    player.charge += 1
+    gs.add_play_by_play(player_name=player.name, action_type="test", description=description)
+    svc.update_game(game_id, engine)
+
+
+def test_mid_turn_updates_append_events_and_replay_on_load(session_factory):
+    with patch("api.game_service.SessionLocal", session_factory):
+        svc = GameService(CARDS_CSV, event_log=True)
+        game_id, engine = _new_game(svc)
+        stored_version = _query(session_factory, GameModel, game_id)[0].game_state["state_version"]
+
+        _act(svc, game_id, engine, "first")
+        _act(svc, game_id, engine, "second")
+        expected = serialize_game_state(engine.game_state)
+
+        # The game row is untouched; each update is one event row
+        assert _query(session_factory, GameModel, game_id)[0].game_state["state_version"] == stored_version
+        actions = _query(session_factory, GameActionModel, game_id)
+        assert [(a.action_type, a.result_description, a.player_id) for a in actions] == [
+            ("test", "first", "p1"), ("test", "second", "p1"),
+        ]
+        assert set(actions[0].action_data) == {"v", "p", "pbp"}
+
+        svc._cache.clear()
+        reloaded = svc.get_game(game_id)
+        assert serialize_game_state(reloaded.game_state) == expected
+
+        # A turn change writes the game row
+        reloaded.end_turn()
+        svc.update_game(game_id, reloaded)
+        row = _query(session_factory, GameModel, game_id)[0]
+        assert row.game_state["state_version"] == reloaded.game_state.state_version
+        assert row.turn_number == reloaded.game_state.turn_number
+
+    stats = svc.storage_stats()
+    assert stats["event_log"] is True
+    assert stats["events"] == 3 and stats["replayed_events"] == 2
+    assert 0 < stats["avg_event_bytes"] < len(str(expected))
+
+
+def test_snapshot_every_bounds_replay(session_factory):
+    with patch("api.game_service.SessionLocal", session_factory):
+        svc = GameService(CARDS_CSV, event_log=True, event_snapshot_every=2)
+        game_id, engine = _new_game(svc)
+
+        _act(svc, game_id, engine, "first")
+        _act(svc, game_id, engine, "second")
+        assert _query(session_factory, GameModel, game_id)[0].game_state["state_version"] == 2
+        _act(svc, game_id, engine, "third")
+
+        svc._cache.clear()
+        reloaded = svc.get_game(game_id)
+        assert serialize_game_state(reloaded.game_state) == serialize_game_state(engine.game_state)
+        assert svc.storage_stats()["replayed_events"] == 1
+
+        assert svc.delete_game(game_id)
+        assert _query(session_factory, GameActionModel, game_id) == []
+
+
+def test_event_log_excludes_write_behind():
+    with pytest.raises(ValueError):
+        GameService(CARDS_CSV, use_database=False, event_log=True, write_behind_interval=0.5)
@@ -0,0 +1,123 @@
+"""
+Tests for conditional and incremental GET /games/{game_id}.
+
+Covers the state-version ETag (304 on If-None-Match, never across a reload
+of the game), the ``since`` play-by-play cursor, and the version surviving a
+serialization round trip.
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.app import app
+from api.game_service import GameService
+from api.routes_games import _etag_matches
+from api.serialization import deserialize_game_state, serialize_game_state
+from game_engine.game_engine import GameEngine
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    svc = GameService(CARDS_CSV, use_database=False)
+    monkeypatch.setattr("api.routes_games.get_game_service", lambda: svc)
+    return svc
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _new_game(svc):
+    return svc.create_game(
+        player1_id="p1", player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+        player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+        first_player_id="p1",
+    )
+
+
+def _log(svc, game_id, engine, description):
+    engine.game_state.add_play_by_play(player_name="Alice", action_type="test", description=description)
+    svc.update_game(game_id, engine)
+
+
+def test_unchanged_state_returns_304(service, client):
+    game_id, engine = _new_game(service)
+    first = client.get(f"/games/{game_id}", params={"player_id": "p1"})
+    etag = first.headers["etag"]
+    assert first.json()["version"] == engine.game_state.state_version
+
+    cached = client.get(f"/games/{game_id}", params={"player_id": "p1"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    _log(service, game_id, engine, "changed")
+    fresh = client.get(f"/games/{game_id}", params={"player_id": "p1"}, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
+def test_reloaded_game_does_not_match_old_etag(service, client, monkeypatch):
+    game_id, engine = _new_game(service)
+    etag = client.get(f"/games/{game_id}").headers["etag"]
+
+    # A reload after a crash may restore the same version for a different
+    # state (unflushed write-behind updates are lost)
+    restored = GameEngine(deserialize_game_state(serialize_game_state(engine.game_state)))
+    service._cache.pop(game_id)
+    monkeypatch.setattr(service, "_load_game_from_db", lambda _game_id: restored)
+    response = client.get(f"/games/{game_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["version"] == engine.game_state.state_version
+    assert response.headers["etag"] != etag
+
+
+def test_winner_decided_on_read_changes_etag(service, client):
+    game_id, engine = _new_game(service)
+    etag = client.get(f"/games/{game_id}").headers["etag"]
+
+    for card in list(engine.game_state.players["p2"].hand):
+        engine.game_state.players["p2"].break_card(card)
+    response = client.get(f"/games/{game_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["winner"] == "p1"
+
+
+def test_since_returns_only_new_entries(service, client):
+    game_id, engine = _new_game(service)
+    for description in ("one", "two", "three"):
+        _log(service, game_id, engine, description)
+
+    data = client.get(f"/games/{game_id}", params={"since": 2}).json()
+    assert data["play_by_play_start"] == 2
+    assert [e["description"] for e in data["play_by_play"]] == ["three"]
+
+    data = client.get(f"/games/{game_id}", params={"since": 10}).json()
+    assert data["play_by_play_start"] == 3
+    assert data["play_by_play"] == []
+
+    assert client.get(f"/games/{game_id}", params={"since": -1}).status_code == 422
+
+
+def test_etag_matching():
+    assert _etag_matches('W/"4"', 'W/"4"')
+    assert _etag_matches('"3", W/"4"', 'W/"4"')
+    assert _etag_matches("*", 'W/"4"')
+    assert not _etag_matches('W/"3"', 'W/"4"')
+    assert not _etag_matches(None, 'W/"4"')
+
+
+def test_state_version_survives_serialization(service):
+    game_id, engine = _new_game(service)
+    for _ in range(3):
+        service.update_game(game_id, engine)
+
+    restored = deserialize_game_state(serialize_game_state(engine.game_state))
+    assert restored.state_version == engine.game_state.state_version == 3
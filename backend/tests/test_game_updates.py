@@ -0,0 +1,183 @@
+"""
+Tests for push-based game updates (api.game_updates and the stream/updates routes).
+
+Covers the version bump in GameService.update_game, hub wake-ups and render
+memoization, the long-poll endpoint, and the SSE event sequence (full first
+event, play-by-play deltas, end on game over / deletion).
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.app import app
+from api.game_service import GameService
+from api.game_updates import GameUpdateHub
+from api.routes_games import _state_events
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+
+
+class FakeRequest:
+    """Stand-in for starlette's Request in the SSE generator."""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+@pytest.fixture
+def service(monkeypatch):
+    svc = GameService(CARDS_CSV, use_database=False)
+    monkeypatch.setattr("api.routes_games.get_game_service", lambda: svc)
+    return svc
+
+
+def _new_game(svc):
+    return svc.create_game(
+        player1_id="p1", player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+        player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+        first_player_id="p1",
+    )
+
+
+def _finish(engine):
+    gs = engine.game_state
+    for card in list(gs.players["p2"].hand):
+        gs.players["p2"].break_card(card)
+    gs.check_victory()
+
+
+def _parse_event(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    return fields.get("id"), fields.get("event"), json.loads(fields["data"])
+
+
+class TestGameUpdateHub:
+    def test_publish_wakes_watcher(self):
+        hub = GameUpdateHub()
+
+        async def scenario():
+            with hub.watch("g1", 3) as sub:
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.01, hub.publish, "g1", 4)
+                return await sub.wait_for_change(3, timeout=1.0)
+
+        assert asyncio.run(scenario()) == 4
+        assert hub.stats()["watchers"] == 0
+
+    def test_wait_times_out_without_change(self):
+        hub = GameUpdateHub()
+
+        async def scenario():
+            with hub.watch("g1", 3) as sub:
+                return await sub.wait_for_change(3, timeout=0.01)
+
+        assert asyncio.run(scenario()) is None
+
+    def test_render_is_memoized_per_version(self):
+        hub = GameUpdateHub()
+        calls = []
+
+        async def scenario():
+            with hub.watch("g1", 1):
+                for _ in range(3):
+                    hub.render("g1", 1, "p1", lambda: calls.append(1) or "payload")
+                hub.publish("g1", 2)
+                hub.render("g1", 2, "p1", lambda: calls.append(2) or "payload")
+
+        asyncio.run(scenario())
+        assert calls == [1, 2]
+        assert hub.stats()["render_hits"] == 2
+
+
+def test_update_game_bumps_version(service):
+    game_id, engine = _new_game(service)
+    before = engine.game_state.state_version
+    service.update_game(game_id, engine)
+    assert engine.game_state.state_version == before + 1
+
+    client = TestClient(app)
+    assert client.get(f"/games/{game_id}").json()["version"] == before + 1
+
+
+def test_long_poll_returns_204_when_unchanged(service):
+    game_id, engine = _new_game(service)
+    version = engine.game_state.state_version
+    client = TestClient(app)
+
+    response = client.get(f"/games/{game_id}/updates", params={"version": version, "timeout": 0.05})
+    assert response.status_code == 204
+
+    response = client.get(f"/games/{game_id}/updates", params={"version": version - 1})
+    assert response.status_code == 200
+    assert response.json()["version"] == version
+
+
+def test_stream_sends_full_state_then_deltas(service):
+    game_id, engine = _new_game(service)
+    gs = engine.game_state
+    gs.add_play_by_play(player_name="Alice", action_type="test", description="first")
+    service.update_game(game_id, engine)
+
+    async def scenario():
+        events = _state_events(FakeRequest(), game_id, "p1", gs.state_version, None)
+        first = await anext(events)
+
+        gs.add_play_by_play(player_name="Alice", action_type="test", description="second")
+        service.update_game(game_id, engine)
+        second = await anext(events)
+
+        _finish(engine)
+        service.update_game(game_id, engine)
+        final = await anext(events)
+        with pytest.raises(StopAsyncIteration):
+            await anext(events)
+        return first, second, final
+
+    first, second, final = asyncio.run(scenario())
+
+    _, event, data = _parse_event(first)
+    assert event == "state"
+    assert data["play_by_play_start"] == 0
+    assert [e["description"] for e in data["play_by_play"]] == ["first"]
+
+    event_id, _, data = _parse_event(second)
+    assert int(event_id) == data["version"]
+    assert data["play_by_play_start"] == 1
+    assert [e["description"] for e in data["play_by_play"]] == ["second"]
+
+    _, _, data = _parse_event(final)
+    assert data["is_game_over"] and data["winner"] == "p1"
+    assert service.update_hub.stats()["watchers"] == 0
+
+
+def test_stream_reports_deleted_game(service):
+    game_id, engine = _new_game(service)
+
+    async def scenario():
+        events = _state_events(FakeRequest(), game_id, None, engine.game_state.state_version, None)
+        await anext(events)
+        service.delete_game(game_id)
+        return [chunk async for chunk in events]
+
+    assert asyncio.run(scenario()) == ["event: gone\ndata: {}\n\n"]
+
+
+def test_stream_route_for_finished_game(service):
+    game_id, engine = _new_game(service)
+    _finish(engine)
+    service.update_game(game_id, engine)
+
+    client = TestClient(app)
+    response = client.get(f"/games/{game_id}/stream", params={"player_id": "p1"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    chunks = [c for c in response.text.split("\n\n") if c]
+    assert len(chunks) == 1
+    assert _parse_event(chunks[0])[2]["is_game_over"]
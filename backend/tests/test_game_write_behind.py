@@ -0,0 +1,176 @@
+"""
+Tests for write-behind game persistence (GameService + api.write_behind).
+
+Covers coalescing of per-game updates, the bounded dirty map, failed-flush
+requeue, and the GameService triggers: mid-turn updates are buffered, while
+turn end and game completion are flushed before update_game returns.
+"""
+
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import Base, GameModel
+from api.game_service import GameService
+from api.write_behind import GameWriteBehind
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+
+    def __call__(self, rows):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.batches.append([(gid, state["v"]) for gid, state, _ in rows])
+
+
+def _buffer(writer, **kwargs):
+    return GameWriteBehind(writer, start_thread=False, **kwargs)
+
+
+class TestGameWriteBehind:
+    def test_updates_coalesce_per_game(self):
+        writer = RecordingWriter()
+        wb = _buffer(writer)
+        for v in range(3):
+            wb.mark_dirty("g1", {"v": v}, {})
+        wb.mark_dirty("g2", {"v": 10}, {})
+
+        assert wb.flush() == 2
+        assert writer.batches == [[("g1", 2), ("g2", 10)]]
+        stats = wb.stats()
+        assert stats["updates"] == 4
+        assert stats["coalesced_updates"] == 2
+        assert stats["games_written"] == 2
+        assert stats["dirty_games"] == 0
+        assert wb.flush() == 0
+
+    def test_full_buffer_flushes_oldest_inline(self):
+        writer = RecordingWriter()
+        wb = _buffer(writer, max_dirty=2)
+        wb.mark_dirty("g1", {"v": 1}, {})
+        wb.mark_dirty("g2", {"v": 2}, {})
+        wb.mark_dirty("g3", {"v": 3}, {})
+
+        assert writer.batches == [[("g1", 1)]]
+        assert wb.stats()["dirty_games"] == 2
+        assert wb.stats()["backpressure_flushes"] == 1
+
+    def test_failed_flush_requeues_without_clobbering_newer(self):
+        writer = RecordingWriter()
+        wb = _buffer(writer)
+        wb.mark_dirty("g1", {"v": 1}, {})
+        wb.mark_dirty("g2", {"v": 1}, {})
+        writer.fail = True
+        assert wb.flush() == 0
+        assert wb.stats()["flush_errors"] == 1
+        with pytest.raises(RuntimeError):
+            wb.flush_game("g2")
+
+        wb.mark_dirty("g1", {"v": 2}, {})
+        writer.fail = False
+        wb.close()
+        assert sorted(writer.batches[0]) == [("g1", 2), ("g2", 1)]
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def service(session_factory):
+    mock_stats = MagicMock()
+    mock_stats.get_player_stats.return_value = None
+    with patch("api.game_service.SessionLocal", session_factory), \
+         patch("api.game_service.get_session_local", return_value=session_factory), \
+         patch("api.game_service.get_stats_service", return_value=mock_stats), \
+         patch("api.game_service.capture_game_analyzed"):
+        svc = GameService(CARDS_CSV, write_behind_interval=60)
+        yield svc
+        svc.shutdown()
+
+
+def _stored(session_factory, game_id):
+    db = session_factory()
+    try:
+        return db.query(GameModel).filter(GameModel.id == uuid.UUID(game_id)).first()
+    finally:
+        db.close()
+
+
+def _new_game(svc):
+    return svc.create_game(
+        player1_id="p1", player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+        player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+        first_player_id="p1",
+    )
+
+
+def test_mid_turn_updates_buffer_until_turn_end(service, session_factory):
+    game_id, engine = _new_game(service)
+    assert _stored(session_factory, game_id) is not None  # created rows are durable
+
+    gs = engine.game_state
+    gs.add_play_by_play(player_name="Alice", action_type="test", description="mid-turn 1")
+    service.update_game(game_id, engine)
+    gs.add_play_by_play(player_name="Alice", action_type="test", description="mid-turn 2")
+    service.update_game(game_id, engine)
+
+    row = _stored(session_factory, game_id)
+    assert len(row.game_state["play_by_play"]) == 0
+    assert service.persistence_stats()["dirty_games"] == 1
+
+    engine.end_turn()
+    service.update_game(game_id, engine)
+
+    row = _stored(session_factory, game_id)
+    assert row.turn_number == gs.turn_number
+    assert len(row.game_state["play_by_play"]) == len(gs.play_by_play)
+    assert service.persistence_stats()["dirty_games"] == 0
+
+
+def test_completion_flushes_and_reload_sees_buffered_update(service, session_factory):
+    game_id, engine = _new_game(service)
+
+    engine.game_state.add_play_by_play(player_name="Alice", action_type="test", description="buffered")
+    service.update_game(game_id, engine)
+    service._cache.clear()
+    engine = service.get_game(game_id)
+    gs = engine.game_state
+    assert gs.play_by_play[-1]["description"] == "buffered"
+
+    for card in list(gs.players["p2"].hand):
+        gs.players["p2"].break_card(card)
+    gs.check_victory()
+    service.update_game(game_id, engine)
+
+    row = _stored(session_factory, game_id)
+    assert row.winner_id == "p1"
+    assert service.persistence_stats()["dirty_games"] == 0
+
+
+def test_write_through_by_default(session_factory):
+    with patch("api.game_service.SessionLocal", session_factory):
+        svc = GameService(CARDS_CSV)
+        game_id, engine = _new_game(svc)
+        engine.game_state.add_play_by_play(player_name="Alice", action_type="test", description="x")
+        svc.update_game(game_id, engine)
+
+    assert len(_stored(session_factory, game_id).game_state["play_by_play"]) == 1
+    assert svc.persistence_stats() == {"enabled": False}
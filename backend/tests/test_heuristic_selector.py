@@ -0,0 +1,133 @@
+"""
+Tests for the heuristic (no-LLM) sequence selector.
+
+The heuristic selector replaces the Request-2 strategic-selection call with a
+local scorer over the enumerator's rank key and tactical labels, so planners,
+players and whole simulated games run without an API key.
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from conftest import create_game_with_cards
+from game_engine.ai.llm_player import LLMPlayer
+from game_engine.ai.selectors import HeuristicSelector, build_selector
+from game_engine.ai.turn_planner import TurnPlanner
+from simulation.config import DeckConfig, GameOutcome
+from simulation.runner import SimulationRunner
+
+
+@pytest.fixture(autouse=True)
+def _no_api_key(monkeypatch):
+    # Any attempt to build a Gemini provider fails loudly without a key.
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+
+def _seq(rank_key, label, **extra):
+    return {"rank_key": rank_key, "tactical_label": label, "cards_broken": [], **extra}
+
+
+def test_prefers_rank_key_then_label():
+    selector = HeuristicSelector()
+    sequences = [
+        _seq((0, 0, 0, 0, -1), "[Board Setup]"),
+        _seq((0, 1, 0, -2, -2), "[Resource Building]"),
+        _seq((0, 1, 0, -2, -2), "[Aggressive Removal]"),
+    ]
+    assert selector.select(None, "player1", sequences).index == 2
+
+    sequences.append(_seq((1, 0, 0, 0, -3), "[Conservative]"))
+    selection = selector.select(None, "player1", sequences)
+    assert selection.index == 3
+    assert selection.reasoning.startswith("[heuristic] [Conservative]")
+
+
+def test_exact_ties_are_first_or_seeded():
+    sequences = [_seq((0, 1, 0, 0, -2), "[Balanced]") for _ in range(5)]
+    assert HeuristicSelector().select(None, "player1", sequences).index == 0
+
+    picks = [
+        HeuristicSelector(rng=random.Random(7)).select(None, "player1", sequences).index
+        for _ in range(3)
+    ]
+    assert len(set(picks)) == 1
+
+
+def test_build_selector():
+    assert build_selector("llm") is None
+    assert isinstance(build_selector("heuristic", seed=1), HeuristicSelector)
+    with pytest.raises(ValueError, match="Unknown selector"):
+        build_selector("oracle")
+
+
+def test_planner_selects_locally_without_provider():
+    setup, _ = create_game_with_cards(
+        player1_in_play=["Knight"],
+        player2_in_play=["Paper Plane"],
+        player1_hand=["Ka"],
+        player1_charge=4,
+        active_player="player1",
+        turn_number=4,
+    )
+    planner = TurnPlanner(
+        client=None, model_name="heuristic", fallback_model=None,
+        selector=HeuristicSelector(),
+    )
+    assert planner.provider_client is None
+
+    plan = planner.create_plan(setup.game_state, "player1", setup.engine)
+
+    assert plan is not None
+    assert plan.selected_strategy.startswith("[heuristic]")
+    assert planner._enum_debug["selector"] == "heuristic"
+    # The Knight can break the Paper Plane; the top-ranked line does so.
+    assert any(a.action_type == "tussle" for a in plan.action_sequence)
+
+
+def test_player_runs_without_api_key():
+    player = LLMPlayer(selector=HeuristicSelector())
+    assert player.provider_client is None
+    assert player.get_endpoint_name() == "heuristic"
+
+
+def test_runner_completes_heuristic_game_without_api_key():
+    deck1 = DeckConfig(name="A", description="", cards=["Knight", "Ka", "Archer", "Wizard", "Surge", "Paper Plane"])
+    deck2 = DeckConfig(name="B", description="", cards=["Knight", "Ka", "Archer", "Wizard", "Surge", "Paper Plane"])
+    runner = SimulationRunner(
+        max_turns=8,
+        player1_selector="heuristic",
+        player2_selector="heuristic",
+    )
+
+    result = runner.run_game(deck1, deck2)
+
+    assert result.error_message is None
+    assert result.outcome in (GameOutcome.PLAYER1_WIN, GameOutcome.PLAYER2_WIN, GameOutcome.DRAW)
+    assert result.turn_count > 1
+    assert (result.player1_model, result.player2_model) == ("heuristic", "heuristic")
+
+
+def test_runner_seeds_selectors_per_game_and_player():
+    seeds = []
+
+    def record(kind, seed=None):
+        seeds.append(seed)
+        return build_selector(kind, seed=seed)
+
+    deck = DeckConfig(name="A", description="", cards=["Knight", "Ka", "Archer", "Wizard", "Surge", "Paper Plane"])
+    runner = SimulationRunner(
+        max_turns=2, player1_selector="heuristic", player2_selector="heuristic", seed=42,
+    )
+    with patch("simulation.runner.build_selector", side_effect=record):
+        for game_number in (1, 2):
+            runner.run_game(deck, deck, game_number)
+    assert None not in seeds and len(set(seeds)) == 4
+    assert runner._selector_seed(1, 1) == seeds[0]
+
+
+def test_runner_rejects_unknown_selector():
+    with pytest.raises(ValueError, match="Unknown selector"):
+        SimulationRunner(player1_selector="oracle")
@@ -0,0 +1,165 @@
+"""
+Tests for atomic player stats upserts and the batched AI stats queue.
+
+Covers SQL-side increments (no lost updates when games for one player finish
+concurrently), delta merging, and the AI-only batch queue with its
+retry-on-failure behaviour.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.db_models import Base, PlayerCardStatsModel, PlayerStatsModel
+from api.stats_queue import PlayerStatsDelta, PlayerStatsQueue
+from api.stats_service import StatsService
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # A file database so each thread gets its own connection
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def patched_sessions(session_factory):
+    with patch("api.stats_service._get_session_local", return_value=session_factory):
+        yield session_factory
+
+
+def _player(session_factory, player_id):
+    db = session_factory()
+    try:
+        stats = db.query(PlayerStatsModel).filter(PlayerStatsModel.player_id == player_id).one()
+        cards = {
+            r.card_name: (r.games_played, r.games_won)
+            for r in db.query(PlayerCardStatsModel).filter(PlayerCardStatsModel.player_id == player_id)
+        }
+        return stats, cards
+    finally:
+        db.close()
+
+
+def test_concurrent_games_do_not_lose_increments(patched_sessions):
+    service = StatsService()
+    threads, games_per_thread = 8, 5
+
+    def finish_games(n):
+        for i in range(games_per_thread):
+            service.update_player_stats(
+                "ai-gemiknight", "Gemiknight", won=(i % 2 == 0),
+                cards_used=["Ka", "Knight"], tussles_initiated=2, turn_count=7,
+            )
+
+    workers = [threading.Thread(target=finish_games, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    stats, cards = _player(patched_sessions, "ai-gemiknight")
+    total = threads * games_per_thread
+    assert stats.games_played == total
+    assert stats.games_won == threads * 3
+    assert stats.total_tussles == 2 * total
+    assert stats.total_turns == 7 * total
+    assert cards == {"Ka": (total, threads * 3), "Knight": (total, threads * 3)}
+
+
+def test_upsert_updates_display_name(patched_sessions):
+    service = StatsService()
+    service.update_player_stats("p1", "Alice", won=True, cards_used=["Ka"])
+    service.update_player_stats("p1", "Alicia", won=False, cards_used=[])
+
+    stats, cards = _player(patched_sessions, "p1")
+    assert (stats.display_name, stats.games_played, stats.games_won) == ("Alicia", 2, 1)
+    assert cards == {"Ka": (1, 1)}
+
+
+def test_delta_merge_sums_counters_and_cards():
+    delta = PlayerStatsDelta.for_game("ai-x", "X", True, ["Ka", "Ka", "Knight"], turn_count=5)
+    delta.merge(PlayerStatsDelta.for_game("ai-x", "X2", False, ["Ka"], turn_count=3))
+
+    assert (delta.games_played, delta.games_won, delta.total_turns) == (2, 1, 8)
+    assert delta.cards == {"Ka": [2, 1], "Knight": [1, 1]}
+    assert delta.display_name == "X2"
+
+
+class TestPlayerStatsQueue:
+    def test_flush_applies_one_merged_delta_per_player(self):
+        batches = []
+        queue = PlayerStatsQueue(batches.append, start_thread=False)
+        for won in (True, False, True):
+            queue.add(PlayerStatsDelta.for_game("ai-a", "A", won, ["Ka"]))
+        queue.add(PlayerStatsDelta.for_game("ai-b", "B", True, ["Knight"]))
+
+        assert queue.flush() == 2
+        (batch,) = batches
+        by_player = {d.player_id: d for d in batch}
+        assert (by_player["ai-a"].games_played, by_player["ai-a"].games_won) == (3, 2)
+        assert queue.stats()["queued_games"] == 4
+        assert queue.flush() == 0
+
+    def test_failed_flush_merges_back_into_newer_deltas(self):
+        batches = []
+        fail = [True]
+
+        def apply(batch):
+            if fail[0]:
+                raise RuntimeError("db down")
+            batches.append(batch)
+
+        queue = PlayerStatsQueue(apply, start_thread=False)
+        queue.add(PlayerStatsDelta.for_game("ai-a", "A", True, ["Ka"]))
+        assert queue.flush() == 0
+        queue.add(PlayerStatsDelta.for_game("ai-a", "A", False, ["Ka"]))
+        fail[0] = False
+        queue.close()
+
+        (delta,) = batches[0]
+        assert (delta.games_played, delta.games_won) == (2, 1)
+        assert delta.cards == {"Ka": [2, 1]}
+        assert queue.stats()["flush_errors"] == 1
+
+    def test_failed_flush_keeps_the_name_queued_during_it(self):
+        batches = []
+        queue = None
+
+        def apply(batch):
+            if not batches:
+                batches.append(None)
+                queue.add(PlayerStatsDelta.for_game("ai-a", "Renamed", False, ["Knight"]))
+                raise RuntimeError("db down")
+            batches.append(batch)
+
+        queue = PlayerStatsQueue(apply, start_thread=False)
+        queue.add(PlayerStatsDelta.for_game("ai-a", "Original", True, ["Ka"]))
+        assert queue.flush() == 0
+        assert queue.flush() == 1
+
+        (delta,) = batches[1]
+        assert delta.display_name == "Renamed"
+        assert (delta.games_played, delta.games_won) == (2, 1)
+        assert delta.cards == {"Ka": [1, 1], "Knight": [1, 0]}
+
+
+def test_service_batches_only_ai_players(patched_sessions):
+    service = StatsService(ai_batch_interval=60)
+    try:
+        service.update_player_stats("ai-gemiknight", "Gemiknight", won=True, cards_used=["Ka"])
+        service.update_player_stats("human-1", "Alice", won=False, cards_used=["Ka"])
+
+        assert service.get_player_stats("ai-gemiknight") is None
+        assert service.get_player_stats("human-1")["games_played"] == 1
+        assert service.queue_stats()["pending_players"] == 1
+
+        assert service.flush() == 1
+        assert service.get_player_stats("ai-gemiknight")["games_won"] == 1
+    finally:
+        service.shutdown()
+    assert StatsService().queue_stats() == {"enabled": False}
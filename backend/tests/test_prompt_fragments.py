@@ -0,0 +1,88 @@
+"""
+Tests for strategic-prompt fragment memoization (prompts.fragment_cache and
+the memoized card_loader fragments).
+"""
+
+from conftest import create_game_with_cards
+from game_engine.ai.prompts import card_loader
+from game_engine.ai.prompts.card_loader import format_board_legend, format_card_guidance
+from game_engine.ai.prompts.fragment_cache import (
+    PromptFragments,
+    get_prompt_metrics,
+    reset_prompt_metrics,
+)
+from game_engine.ai.turn_planner import TurnPlanner
+from game_engine.validation import ActionExecutor
+
+
+def _setup():
+    return create_game_with_cards(
+        player1_hand=["Knight"],
+        player1_in_play=["Ka", "Wizard"],
+        player2_in_play=["Paper Plane", "Gibbers"],
+        player1_charge=6,
+        active_player="player1",
+        turn_number=4,
+    )
+
+
+def test_legend_rerenders_only_changed_lines():
+    setup, cards = _setup()
+    gs, engine = setup.game_state, setup.engine
+    fragments = PromptFragments()
+
+    def legend():
+        cached = format_board_legend(gs, "player1", engine, fragments)
+        assert cached == format_board_legend(gs, "player1", engine)
+        return cached
+
+    first = legend()
+    lines = len(first.splitlines()) - 1
+    assert (fragments.hits, fragments.misses) == (0, lines)
+
+    legend()
+    assert (fragments.hits, fragments.misses) == (lines, lines)
+
+    # Damage changes one card's line only
+    cards["p1_inplay_Wizard"].current_stamina -= 1
+    assert legend() != first
+    assert (fragments.hits, fragments.misses) == (2 * lines - 1, lines + 1)
+
+    # A zone move rebuilds the effect index: every line is re-rendered
+    assert ActionExecutor(engine).execute_play_card("player1", cards["p1_hand_Knight"].id).success
+    legend()
+    assert fragments.misses == 2 * lines + 1
+
+
+def test_guidance_is_memoized_per_name_set():
+    setup, _ = _setup()
+    before = card_loader.guidance_cache_info()
+
+    first = format_card_guidance(setup.game_state, "player1")
+    second = format_card_guidance(_setup()[0].game_state, "player1")
+
+    assert first == second and "Gibbers" in first
+    after = card_loader.guidance_cache_info()
+    assert after["hits"] - before["hits"] >= 1
+
+
+class StubProvider:
+    def generate_json(self, prompt, schema, **kwargs):
+        return '{"selected_index": 0, "reasoning": "x"}'
+
+
+def test_planner_times_prompt_construction():
+    reset_prompt_metrics()
+    setup, _ = _setup()
+    planner = TurnPlanner(
+        client=None, model_name="m", fallback_model="f",
+        provider_client=StubProvider(), use_response_cache=False,
+    )
+
+    planner.create_plan(setup.game_state, "player1", setup.engine)
+    planner.create_plan(setup.game_state, "player1", setup.engine)
+
+    assert planner.get_last_plan_info()["enum_debug"]["prompt_build_ms"] >= 0
+    metrics = get_prompt_metrics()
+    assert metrics["builds"] == 2 and metrics["p95_ms"] is not None
+    assert metrics["legend_line_hits"] == metrics["legend_line_misses"] > 0
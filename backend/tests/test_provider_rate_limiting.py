@@ -267,7 +267,7 @@ class FakeLLMPlayer:
 
     instances = []
 
-    def __init__(self, api_key=None, model=None, rate_limiter=None):
+    def __init__(self, api_key=None, model=None, rate_limiter=None, selector=None, selector_cache=True):
         self.model = model
         self.rate_limiter = rate_limiter
         FakeLLMPlayer.instances.append(self)
@@ -0,0 +1,140 @@
+"""
+Per-turn enumerator cache (game_engine.ai.search_cache).
+
+A search stores its lines for every exhaustively searched position; a later
+search this turn from one of those positions (a mid-turn re-plan) is
+answered from the cache and must match a fresh search. Games sharing a cache
+keep separate entries.
+"""
+
+import threading
+
+from conftest import create_game_with_cards
+from game_engine.ai.enumerator import _apply_step, enumerate_sequences
+from game_engine.ai.search_cache import SearchCache
+from game_engine.game_engine import GameEngine
+
+
+def _board():
+    return create_game_with_cards(
+        player1_hand=["Surge"],
+        player1_in_play=["Knight"],
+        player2_hand=["Wizard"],
+        player2_in_play=["Ka"],
+        player1_charge=5,
+        active_player="player1",
+        turn_number=3,
+    )
+
+
+def _play(game_state, action):
+    step = {
+        "action_type": action["action_type"],
+        "card_id": action["card_id"],
+        "card_name": action["card_name"],
+        "target_ids": tuple(action["target_ids"] or ()),
+    }
+    assert _apply_step(GameEngine(game_state), "player1", step)
+
+
+def _view(sequences):
+    return sorted((s["rank_key"], s["raw_string"], s["total_charge_spent"]) for s in sequences)
+
+
+def test_replan_from_explored_position_is_answered_from_cache():
+    setup, _ = _board()
+    gs = setup.game_state
+    cache = SearchCache()
+
+    first_stats = {}
+    first = enumerate_sequences(gs, "player1", cache=cache, stats=first_stats)
+    assert first_stats["cache_hit"] is False
+    assert len(cache) > 1
+
+    # Execute the first action of the top line, then re-plan
+    _play(gs, first[0]["actions"][0])
+    stats = {}
+    replanned = enumerate_sequences(gs, "player1", cache=cache, stats=stats)
+
+    assert stats["cache_hit"] is True
+    assert stats["nodes_expanded"] == 0
+    assert _view(replanned) == _view(enumerate_sequences(gs, "player1"))
+    assert cache.stats()["hits"] == 1
+
+
+def test_repeated_plan_from_same_position_hits_cache():
+    setup, _ = _board()
+    cache = SearchCache()
+
+    fresh = enumerate_sequences(setup.game_state, "player1", cache=cache)
+    stats = {}
+    again = enumerate_sequences(setup.game_state, "player1", cache=cache, stats=stats)
+
+    assert stats["cache_hit"] is True
+    assert [s["raw_string"] for s in again] == [s["raw_string"] for s in fresh]
+    # Cached answers are fresh dicts: labelling one result can't leak into the next
+    again[0]["actions"][0]["tactical_note"] = "x"
+    third = enumerate_sequences(setup.game_state, "player1", cache=cache)
+    assert "tactical_note" not in third[0]["actions"][0]
+
+
+def test_cache_is_dropped_on_a_new_turn():
+    setup, _ = _board()
+    gs = setup.game_state
+    cache = SearchCache()
+    enumerate_sequences(gs, "player1", cache=cache)
+
+    gs.turn_number += 1
+    stats = {}
+    enumerate_sequences(gs, "player1", cache=cache, stats=stats)
+    assert stats["cache_hit"] is False
+
+
+def test_cut_subtrees_are_not_cached():
+    setup, _ = _board()
+    cache = SearchCache()
+
+    # Depth 1 cuts every line below the root short: nothing is exhaustive
+    enumerate_sequences(setup.game_state, "player1", max_actions=1, cache=cache)
+    assert len(cache) == 0
+
+
+def test_full_cache_stops_storing():
+    setup, _ = _board()
+    cache = SearchCache(max_traces=0)
+
+    enumerate_sequences(setup.game_state, "player1", cache=cache)
+    assert len(cache) == 0
+
+
+def test_concurrent_games_keep_their_entries():
+    cache = SearchCache()
+    boards = {
+        "game-a": _board()[0].game_state,
+        "game-b": create_game_with_cards(
+            player1_in_play=["Knight"], player2_in_play=["Paper Plane"], player1_charge=4,
+        )[0].game_state,
+    }
+    barrier = threading.Barrier(2, timeout=10)
+    results = {}
+
+    def play(game_id, gs):
+        gs.game_id = game_id
+        barrier.wait()
+        first = enumerate_sequences(gs, "player1", cache=cache)
+        barrier.wait()  # both games have stored before either re-plans
+        stats = {}
+        again = enumerate_sequences(gs, "player1", cache=cache, stats=stats)
+        results[game_id] = (first, again, stats["cache_hit"])
+
+    threads = [threading.Thread(target=play, args=item) for item in boards.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for first, again, hit in results.values():
+        assert hit is True
+        assert [s["raw_string"] for s in again] == [s["raw_string"] for s in first]
+    assert results["game-a"][0][0]["raw_string"] != results["game-b"][0][0]["raw_string"]
+    assert cache.stats()["games"] == 2 and cache.stats()["hits"] == 2
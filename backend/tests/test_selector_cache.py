@@ -0,0 +1,170 @@
+"""
+Tests for the strategic-selector response cache (game_engine.ai.selector_cache)
+and its use by TurnPlanner.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import Base, SelectorCacheModel
+from conftest import create_game_with_cards
+from game_engine.ai import selector_cache
+from game_engine.ai.selector_cache import SelectorResponseCache, selector_cache_key
+from game_engine.ai.turn_planner import TurnPlanner
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[SelectorCacheModel.__table__])
+    return sessionmaker(bind=engine)
+
+
+def test_key_covers_model_and_prompt_version(monkeypatch):
+    key = selector_cache_key("prompt", "system", "model-a", 0.4)
+
+    assert key == selector_cache_key("prompt", "system", "model-a", 0.4)
+    assert key != selector_cache_key("prompt", "system", "model-b", 0.4)
+    assert key != selector_cache_key("prompt!", "system", "model-a", 0.4)
+    monkeypatch.setattr(selector_cache, "PROMPTS_VERSION", "next")
+    assert key != selector_cache_key("prompt", "system", "model-a", 0.4)
+
+
+def test_memory_lru_and_ttl():
+    clock = FakeClock()
+    cache = SelectorResponseCache(max_entries=2, ttl=60, clock=clock)
+
+    cache.put("a", "A", "m")
+    cache.put("b", "B", "m")
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.put("c", "C", "m")
+    assert cache.get("b") is None
+    clock.now += 61
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["store"] == "memory"
+    assert (stats["memory_hits"], stats["misses"]) == (1, 2)
+    assert (stats["evictions_lru"], stats["evictions_ttl"]) == (1, 1)
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-4)
+
+
+def test_db_store_is_shared_and_pruned(session_factory, monkeypatch):
+    monkeypatch.setattr(selector_cache, "_PRUNE_EVERY", 1)
+    clock = FakeClock()
+    writer = SelectorResponseCache(max_entries=2, ttl=3600, session_factory=session_factory, clock=clock)
+    for key in ("a", "b", "c"):
+        writer.put(key, key.upper(), "model-a")
+        clock.now += 1
+
+    # Another process (a fresh cache) reads the rows back
+    reader = SelectorResponseCache(ttl=3600, session_factory=session_factory, clock=clock)
+    assert reader.get("c") == "C"
+    assert reader.get("c") == "C"
+    stats = reader.stats()
+    assert (stats["store_hits"], stats["memory_hits"]) == (1, 1)
+
+    session = session_factory()
+    try:
+        rows = session.query(SelectorCacheModel).order_by(SelectorCacheModel.key).all()
+        assert [(r.key, r.model) for r in rows] == [("b", "model-a"), ("c", "model-a")]
+    finally:
+        session.close()
+
+    clock.now += 3600
+    assert SelectorResponseCache(ttl=3600, session_factory=session_factory, clock=clock).get("b") is None
+
+
+def test_store_errors_are_misses():
+    def broken():
+        raise RuntimeError("db down")
+
+    cache = SelectorResponseCache(session_factory=broken)
+    cache.put("a", "A", "m")
+
+    assert cache.get("a") == "A"  # still served from memory
+    assert cache.get("b") is None
+    assert cache.stats()["store_errors"] == 2
+
+
+def _position():
+    setup, _ = create_game_with_cards(
+        player1_in_play=["Knight"],
+        player2_in_play=["Paper Plane"],
+        player1_hand=["Ka"],
+        player1_charge=4,
+        active_player="player1",
+        turn_number=4,
+    )
+    return setup
+
+
+class CountingProvider:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def generate_json(self, prompt, schema, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+def _planner(provider, cache, **kwargs):
+    return TurnPlanner(
+        client=None, model_name="m", fallback_model="f",
+        provider_client=provider, response_cache=cache, **kwargs,
+    )
+
+
+def test_repeated_position_in_another_game_skips_the_call():
+    cache = SelectorResponseCache()
+    provider = CountingProvider(json.dumps({"selected_index": 1, "reasoning": "Ka first"}))
+
+    plans = []
+    for _ in range(2):
+        setup = _position()
+        planner = _planner(provider, cache)
+        plans.append(planner.create_plan(setup.game_state, "player1", setup.engine))
+
+    assert provider.calls == 1
+    # Same choice, bound to each game's own cards
+    assert [
+        [(a.action_type, a.card_name, a.target_names) for a in plan.action_sequence] for plan in plans
+    ] == [[("play_card", "Ka", None), ("tussle", "Ka", ["Paper Plane"]), ("end_turn", None, None)]] * 2
+    assert plans[0].action_sequence[0].card_id != plans[1].action_sequence[0].card_id
+    assert planner.get_last_plan_info()["enum_debug"]["selection_cached"] is True
+    assert cache.stats()["hits"] == 1
+
+    # Bypassed planners neither read nor write
+    setup = _position()
+    bypassed = _planner(provider, cache, use_response_cache=False)
+    bypassed.create_plan(setup.game_state, "player1", setup.engine)
+    assert provider.calls == 2 and bypassed.response_cache is None
+
+
+def test_unparseable_response_is_not_cached():
+    cache = SelectorResponseCache()
+    provider = CountingProvider("not json")
+
+    for _ in range(2):
+        setup = _position()
+        assert _planner(provider, cache).create_plan(setup.game_state, "player1", setup.engine)
+
+    assert provider.calls == 2
+    assert len(cache) == 0
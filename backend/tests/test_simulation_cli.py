@@ -2,8 +2,8 @@
 Tests for PR B4: CLI support for multi-day throttled batch runs.
 
 Covers:
-- --rpm / --daily-budget land in the SimulationConfig passed to the
-  orchestrator.
+- --rpm / --daily-budget / --executor land in the SimulationConfig passed
+  to the orchestrator.
 - budget_exhausted + --wait: the CLI sleeps until resets_at (+ slack) and
   calls resume_simulation, looping until the run completes.
 - budget_exhausted + --no-wait: prints the resume command and exits with
@@ -88,6 +88,54 @@ class TestThrottleFlagsPassedToConfig:
         config = captured["config"]
         assert config.rpm == 30
         assert config.daily_request_budget == 500
+        assert config.executor == "thread"
+
+    def test_executor_flag_lands_in_config(self, runner, monkeypatch):
+        captured = {}
+
+        mock_orch = MagicMock()
+        mock_orch.start_simulation.side_effect = lambda config: captured.setdefault("config", config) or 1
+        mock_orch.run_simulation.return_value = _make_result(SimulationStatus.COMPLETED)
+        mock_orch.get_results.return_value = {
+            "run_id": 1, "config": {}, "games": [],
+        }
+        monkeypatch.setattr(cli_module, "SimulationOrchestrator", lambda: mock_orch)
+
+        result = runner.invoke(
+            cli_module.cli, ["quick", "DeckA", "DeckB", "--executor", "process"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert captured["config"].executor == "process"
+
+        result = runner.invoke(
+            cli_module.cli, ["quick", "DeckA", "DeckB", "--executor", "gpu"]
+        )
+        assert result.exit_code != 0
+
+    def test_selector_flags_land_in_config(self, runner, monkeypatch):
+        captured = []
+
+        mock_orch = MagicMock()
+        mock_orch.start_simulation.side_effect = lambda config: captured.append(config) or 1
+        mock_orch.run_simulation.return_value = _make_result(SimulationStatus.COMPLETED)
+        mock_orch.get_results.return_value = {
+            "run_id": 1, "config": {}, "games": [],
+        }
+        monkeypatch.setattr(cli_module, "SimulationOrchestrator", lambda: mock_orch)
+
+        result = runner.invoke(
+            cli_module.cli, ["quick", "DeckA", "DeckB", "--selector", "heuristic"]
+        )
+        assert result.exit_code == 0, result.output
+        assert (captured[-1].player1_selector, captured[-1].player2_selector) == ("heuristic", "heuristic")
+
+        result = runner.invoke(
+            cli_module.cli, ["quick", "DeckA", "DeckB", "--selector2", "heuristic"]
+        )
+        assert result.exit_code == 0, result.output
+        assert (captured[-1].player1_selector, captured[-1].player2_selector) == ("llm", "heuristic")
+        assert captured[-1].to_dict()["player2_selector"] == "heuristic"
 
 
 class TestBudgetExhaustedWaitLoop:
@@ -0,0 +1,273 @@
+"""
+Tests for the process-pool simulation backend (executor="process"), and
+the event-loop backend (executor="async").
+
+Covers:
+- LimiterCoordinator / RemoteLimiter: worker processes draw on the parent's
+  limiter, and BudgetExhaustedError (with resets_at) crosses the process
+  boundary intact.
+- Orchestrator process mode: results stream back and are persisted, one
+  daily budget is shared across all workers, and a budget-exhausted run
+  resumes to completion.
+- Orchestrator async mode: games run as tasks on one event loop thread, at
+  most parallel_games at a time, and budget exhaustion still pauses the run.
+
+Orchestrator tests use the "fork" start method so worker processes inherit
+the monkeypatched SimulationRunner.run_game (no real Gemini calls) and deck
+loading; the coordinator test uses the production "spawn" method.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from api.db_models import Base, SimulationGameModel, SimulationRunModel  # noqa: E402
+from game_engine.ai.rate_limiter import BudgetExhaustedError  # noqa: E402
+from simulation import orchestrator as orchestrator_module  # noqa: E402
+from simulation import process_pool  # noqa: E402
+from simulation.config import DeckConfig, GameOutcome, GameResult, SimulationConfig  # noqa: E402
+from simulation.orchestrator import SimulationOrchestrator  # noqa: E402
+
+
+DECK_NAMES = ["DeckA", "DeckB"]
+RESETS_AT = datetime(2099, 1, 1, tzinfo=timezone.utc)
+
+
+class CountingLimiter:
+    """Parent-side limiter: allows `budget` acquires, then raises."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.count = 0
+
+    def acquire(self):
+        if self.count >= self.budget:
+            raise BudgetExhaustedError(resets_at=RESETS_AT)
+        self.count += 1
+
+    def remaining(self):
+        return {"used_today": self.count, "daily_budget": self.budget}
+
+    def flush(self):
+        pass
+
+
+def _acquire_until_exhausted(max_calls):
+    """Worker task: acquire through the shared limiter until it raises."""
+    acquired = 0
+    for _ in range(max_calls):
+        try:
+            process_pool._worker_limiter.acquire()
+        except BudgetExhaustedError as e:
+            return acquired, e.resets_at
+        acquired += 1
+    return acquired, None
+
+
+class TestLimiterCoordinator:
+    def test_workers_share_one_budget(self):
+        limiter = CountingLimiter(budget=5)
+        ctx = multiprocessing.get_context("spawn")
+        with process_pool.LimiterCoordinator(limiter) as coordinator:
+            with ProcessPoolExecutor(
+                max_workers=2,
+                mp_context=ctx,
+                initializer=process_pool.init_worker,
+                initargs=(coordinator.client(), None),
+            ) as pool:
+                results = list(pool.map(_acquire_until_exhausted, [10, 10]))
+
+        assert sum(acquired for acquired, _ in results) == 5
+        assert limiter.count == 5
+        assert all(resets_at == RESETS_AT for _, resets_at in results)
+
+    def test_budget_exhausted_error_pickles_with_resets_at(self):
+        err = pickle.loads(pickle.dumps(BudgetExhaustedError(resets_at=RESETS_AT)))
+        assert err.resets_at == RESETS_AT
+        assert "2099" in str(err)
+
+
+@pytest.fixture
+def db_session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def _patch_orchestrator(monkeypatch, db_session_factory):
+    deck_dict = {
+        name: DeckConfig(name=name, description="", cards=["Ka"] * 6)
+        for name in DECK_NAMES
+    }
+    monkeypatch.setattr(orchestrator_module, "load_simulation_decks_dict", lambda: deck_dict)
+    monkeypatch.setattr(orchestrator_module, "validate_deck_names", lambda *a, **k: [])
+    monkeypatch.setattr(orchestrator_module, "validate_deck", lambda *a, **k: [])
+    monkeypatch.setattr(orchestrator_module, "SessionLocal", db_session_factory)
+    monkeypatch.setattr(process_pool, "PROCESS_START_METHOD", "fork")
+
+
+def _fake_run_game(self, deck1, deck2, game_number=1):
+    # Runs in a worker process; the limiter is the RemoteLimiter.
+    if self.rate_limiter is not None:
+        self.rate_limiter.acquire()
+    return GameResult(
+        game_number=game_number,
+        deck1_name=deck1.name,
+        deck2_name=deck2.name,
+        player1_model="test-model",
+        player2_model="test-model",
+        outcome=GameOutcome.PLAYER1_WIN,
+        winner_deck=deck1.name,
+        turn_count=3,
+        duration_ms=1,
+        charge_tracking=[],
+        action_log=[{"pid": multiprocessing.current_process().pid}],
+    )
+
+
+def _make_orchestrator(session_factory):
+    return SimulationOrchestrator(
+        db=session_factory(),
+        rate_limiter_session_factory=session_factory,
+    )
+
+
+def _run_row(session_factory, run_id):
+    db = session_factory()
+    try:
+        return db.query(SimulationRunModel).filter(SimulationRunModel.id == run_id).first()
+    finally:
+        db.close()
+
+
+class TestProcessExecutor:
+    def test_games_run_in_workers_and_persist(self, monkeypatch, db_session_factory):
+        monkeypatch.setattr(orchestrator_module.SimulationRunner, "run_game", _fake_run_game)
+        orch = _make_orchestrator(db_session_factory)
+        config = SimulationConfig(
+            deck_names=DECK_NAMES, iterations_per_matchup=2, parallel_games=2, executor="process"
+        )
+        run_id = orch.start_simulation(config)
+
+        result = orch.run_simulation(run_id)
+
+        assert result.status.value == "completed"
+        assert result.completed_games == 8
+        run = _run_row(db_session_factory, run_id)
+        assert run.status == "completed"
+        assert run.config["executor"] == "process"
+
+        db = db_session_factory()
+        games = db.query(SimulationGameModel).filter(SimulationGameModel.run_id == run_id).all()
+        db.close()
+        assert sorted(g.game_number for g in games) == list(range(1, 9))
+        worker_pids = {g.action_log[0]["pid"] for g in games}
+        assert multiprocessing.current_process().pid not in worker_pids
+
+    def test_shared_budget_pauses_and_resume_completes(self, monkeypatch, db_session_factory):
+        monkeypatch.setattr(orchestrator_module.SimulationRunner, "run_game", _fake_run_game)
+        orch = _make_orchestrator(db_session_factory)
+        config = SimulationConfig(
+            deck_names=DECK_NAMES,
+            iterations_per_matchup=2,
+            parallel_games=2,
+            daily_request_budget=3,
+            executor="process",
+        )
+        run_id = orch.start_simulation(config)
+
+        result = orch.run_simulation(run_id)
+
+        # One budget across both workers: exactly 3 games got a request.
+        assert result.status.value == "budget_exhausted"
+        assert result.resets_at is not None
+        run = _run_row(db_session_factory, run_id)
+        assert run.status == "budget_exhausted"
+        assert run.completed_games == 3
+
+        # Raise the budget (as `cli resume --daily-budget` does) and resume.
+        db = db_session_factory()
+        row = db.query(SimulationRunModel).filter(SimulationRunModel.id == run_id).first()
+        row.config = {**row.config, "daily_request_budget": 100}
+        db.commit()
+        db.close()
+
+        final = _make_orchestrator(db_session_factory).resume_simulation(run_id)
+        assert final.status.value == "completed"
+        assert _run_row(db_session_factory, run_id).completed_games == 8
+
+    def test_unknown_executor_is_rejected(self, db_session_factory):
+        orch = _make_orchestrator(db_session_factory)
+        run_id = orch.start_simulation(SimulationConfig(deck_names=DECK_NAMES, iterations_per_matchup=1))
+        with pytest.raises(ValueError, match="Unknown executor"):
+            orch.run_simulation(run_id, executor="gpu")
+
+
+class TestAsyncExecutor:
+    def test_games_share_one_event_loop_thread(self, monkeypatch, db_session_factory):
+        running, peak, threads = 0, 0, set()
+
+        async def fake_run_game_async(self, deck1, deck2, game_number=1):
+            nonlocal running, peak
+            threads.add(threading.current_thread().name)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)  # Waiting on the LLM
+            running -= 1
+            return _fake_run_game(self, deck1, deck2, game_number)
+
+        monkeypatch.setattr(
+            orchestrator_module.SimulationRunner, "run_game_async", fake_run_game_async
+        )
+        orch = _make_orchestrator(db_session_factory)
+        config = SimulationConfig(
+            deck_names=DECK_NAMES, iterations_per_matchup=2, parallel_games=3, executor="async"
+        )
+        run_id = orch.start_simulation(config)
+
+        result = orch.run_simulation(run_id)
+
+        assert result.status.value == "completed"
+        assert _run_row(db_session_factory, run_id).completed_games == 8
+        assert threads == {"simulation-games"}
+        assert peak == 3
+
+    def test_budget_exhaustion_pauses_the_run(self, monkeypatch, db_session_factory):
+        async def fake_run_game_async(self, deck1, deck2, game_number=1):
+            await asyncio.sleep(0)
+            return _fake_run_game(self, deck1, deck2, game_number)
+
+        monkeypatch.setattr(
+            orchestrator_module.SimulationRunner, "run_game_async", fake_run_game_async
+        )
+        orch = _make_orchestrator(db_session_factory)
+        config = SimulationConfig(
+            deck_names=DECK_NAMES,
+            iterations_per_matchup=2,
+            parallel_games=1,
+            daily_request_budget=3,
+            executor="async",
+        )
+        run_id = orch.start_simulation(config)
+
+        result = orch.run_simulation(run_id)
+
+        assert result.status.value == "budget_exhausted"
+        assert _run_row(db_session_factory, run_id).completed_games == 3
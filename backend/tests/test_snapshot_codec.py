@@ -0,0 +1,156 @@
+"""
+Compact game-state snapshots (api.snapshot_codec) and their use as
+GameService's storage format.
+"""
+
+import json
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.db_models import Base, GameModel
+from api.game_service import GameService
+from api.serialization import serialize_game_state
+from api.snapshot_codec import SnapshotError, decode_snapshot, encode_snapshot
+from conftest import create_game_with_cards
+from game_engine.data.card_catalog import CardCatalog, get_card_catalog
+from game_engine.game_engine import GameEngine
+from game_engine.validation import ActionExecutor
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+
+
+def _mid_game_state():
+    """A state with a transformed Copy, Charge history and stat modifications."""
+    setup, cards = create_game_with_cards(
+        player1_hand=["Copy", "Surge"],
+        player1_in_play=["Ka", "Knight"],
+        player2_hand=["Wizard"],
+        player2_in_play=["Paper Plane"],
+        player1_charge=6,
+        active_player="player1",
+        turn_number=3,
+    )
+    gs = setup.game_state
+    gs.finalize_turn_charge_tracking()
+    result = ActionExecutor(GameEngine(gs)).execute_play_card(
+        "player1", cards["p1_hand_Copy"].id, target_card_id=cards["p1_inplay_Ka"].id,
+    )
+    assert result.success
+    cards["p1_inplay_Knight"].modifications["strength"] = 1
+    cards["p1_inplay_Knight"].add_turn_modification(3, "speed", 2)
+    gs._turn_charge_gained = 1
+    gs.add_play_by_play(player_name="Alice", action_type="play_card", description="Copy of Ka")
+    return gs, cards
+
+
+def test_round_trip_keeps_copy_state_and_charge_history():
+    gs, cards = _mid_game_state()
+    copy = cards["p1_hand_Copy"]
+    assert copy._is_transformed and gs.charge_history
+
+    restored = decode_snapshot(encode_snapshot(gs))
+
+    assert serialize_game_state(restored) == serialize_game_state(gs)
+    assert restored.charge_history == gs.charge_history
+    assert restored._turn_charge_gained == 1
+    assert restored.get_state_hash() == gs.get_state_hash()
+    restored_copy = next(c for c in restored.players["player1"].in_play if c.id == copy.id)
+    assert restored_copy.name == copy.name
+    assert restored_copy._is_transformed
+    assert restored_copy._copied_effects
+    knight = next(c for c in restored.players["player1"].in_play if c.name == "Knight")
+    assert knight.turn_modifications == {"3": {"speed": 2}}
+
+
+def test_snapshot_is_much_smaller_than_json():
+    gs, _ = _mid_game_state()
+    json_size = len(json.dumps(serialize_game_state(gs)).encode("utf-8"))
+
+    compressed = encode_snapshot(gs)
+    raw = encode_snapshot(gs, compress_level=0)
+
+    assert len(compressed) < json_size / 4
+    assert len(compressed) < len(raw) < json_size
+    assert serialize_game_state(decode_snapshot(raw)) == serialize_game_state(gs)
+
+
+def test_decode_rejects_foreign_data():
+    gs, _ = _mid_game_state()
+    blob = encode_snapshot(gs)
+
+    with pytest.raises(SnapshotError):
+        decode_snapshot(b'{"game_id": 1}')
+    with pytest.raises(SnapshotError, match="version"):
+        decode_snapshot(blob[:3] + bytes((99,)) + blob[4:])
+    other_catalog = CardCatalog([d for d in get_card_catalog() if d.name != "Knight"])
+    with pytest.raises(SnapshotError, match="Knight"):
+        decode_snapshot(blob, other_catalog)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _stored(session_factory, game_id):
+    db = session_factory()
+    try:
+        return db.query(GameModel).filter(GameModel.id == uuid.UUID(game_id)).first()
+    finally:
+        db.close()
+
+
+def _new_game(svc):
+    return svc.create_game(
+        player1_id="p1", player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+        player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+        first_player_id="p1",
+    )
+
+
+def test_service_stores_and_reloads_snapshots(session_factory):
+    with patch("api.game_service.SessionLocal", session_factory):
+        svc = GameService(CARDS_CSV, compact_snapshots=True)
+        game_id, engine = _new_game(svc)
+        engine.game_state.add_play_by_play(player_name="Alice", action_type="test", description="x")
+        svc.update_game(game_id, engine)
+        expected = serialize_game_state(engine.game_state)
+
+        row = _stored(session_factory, game_id)
+        assert row.game_state == {"snapshot": 1}
+        assert row.game_state_snapshot is not None
+
+        svc._cache.clear()
+        reloaded = svc.get_game(game_id)
+
+    assert serialize_game_state(reloaded.game_state) == expected
+    stats = svc.storage_stats()
+    assert stats["format"] == "snapshot"
+    assert stats["snapshot_writes"] == 2 and stats["loads"] == 1
+    assert 0 < stats["avg_snapshot_bytes"] < len(json.dumps(expected))
+
+
+def test_json_rows_still_load_with_snapshots_enabled(session_factory):
+    with patch("api.game_service.SessionLocal", session_factory):
+        game_id, engine = _new_game(GameService(CARDS_CSV))
+        assert _stored(session_factory, game_id).game_state_snapshot is None
+
+        svc = GameService(CARDS_CSV, compact_snapshots=True)
+        reloaded = svc.get_game(game_id)
+        assert serialize_game_state(reloaded.game_state) == serialize_game_state(engine.game_state)
+
+        # The next write converts the row
+        svc.update_game(game_id, reloaded)
+        assert _stored(session_factory, game_id).game_state_snapshot is not None
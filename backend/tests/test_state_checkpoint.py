@@ -0,0 +1,114 @@
+"""
+Tests for GameState.checkpoint() / rollback().
+
+The enumerator applies moves in place and rolls them back instead of deep
+cloning every child state. These tests check that rollback fully restores
+the state, including Copy transformations and the append-only histories.
+They also check that the rollback search matches the deepcopy search.
+"""
+
+import random
+
+from conftest import create_game_with_cards
+from game_engine.ai.enumerator import enumerate_sequences
+from game_engine.models.card import Zone
+
+
+def _zones(gs):
+    return {
+        pid: (
+            [c.id for c in p.hand],
+            [c.id for c in p.in_play],
+            [c.id for c in p.break_zone],
+            p.charge,
+            p.direct_attacks_this_turn,
+        )
+        for pid, p in gs.players.items()
+    }
+
+
+def test_rollback_undoes_tussle_and_break():
+    setup, cards = create_game_with_cards(
+        player1_in_play=["Knight"],
+        player2_in_play=["Paper Plane"],
+        player2_hand=["Ka"],
+        player1_charge=5,
+    )
+    gs = setup.game_state
+    before = _zones(gs)
+    log_len, pbp_len = len(gs.game_log), len(gs.play_by_play)
+    plane = cards["p2_inplay_Paper Plane"]
+    plane_stamina = plane.current_stamina
+
+    cp = gs.checkpoint()
+    setup.engine.initiate_tussle(cards["p1_inplay_Knight"], plane, setup.player1)
+    gs.add_play_by_play("Player 1", "tussle", "Knight tussled Paper Plane")
+    assert _zones(gs) != before
+
+    gs.rollback(cp)
+    assert _zones(gs) == before
+    assert plane.current_stamina == plane_stamina
+    assert plane.zone == Zone.IN_PLAY
+    assert (len(gs.game_log), len(gs.play_by_play)) == (log_len, pbp_len)
+
+
+def test_rollback_is_repeatable_and_undoes_copy_transformation():
+    setup, cards = create_game_with_cards(
+        player1_hand=["Copy"],
+        player1_in_play=["Ka"],
+    )
+    gs = setup.game_state
+    copy_card = cards["p1_hand_Copy"]
+    ka = cards["p1_inplay_Ka"]
+    cp = gs.checkpoint()
+
+    for _ in range(2):
+        assert setup.engine.play_card(setup.player1, copy_card, target=ka, target_ids=[ka.id])
+        assert copy_card.name == "Copy of Ka"
+        gs.rollback(cp)
+        assert copy_card.name == "Copy"
+        assert copy_card.zone == Zone.HAND
+        assert not getattr(copy_card, "_is_transformed", False)
+        assert copy_card in setup.player1.hand
+
+
+def test_rollback_restores_turn_modifications_and_stats():
+    setup, cards = create_game_with_cards(player1_in_play=["Ka", "Knight"])
+    gs = setup.game_state
+    knight = cards["p1_inplay_Knight"]
+    strength = setup.engine.get_card_stat(knight, "strength")
+
+    cp = gs.checkpoint()
+    knight.add_turn_modification(gs.turn_number, "strength", 3)
+    setup.player1.move_card(cards["p1_inplay_Ka"], Zone.IN_PLAY, Zone.BREAK)
+    gs.rollback(cp)
+
+    assert knight.turn_modifications == {}
+    assert setup.engine.get_card_stat(knight, "strength") == strength
+
+
+def test_rollback_search_matches_deepcopy_search():
+    setup, _ = create_game_with_cards(
+        player1_hand=["Surge", "Twist", "Copy"],
+        player1_in_play=["Archer", "Knight"],
+        player2_hand=["Ka", "Wake"],
+        player2_in_play=["Paper Plane", "Wizard"],
+        player1_charge=7,
+        turn_number=4,
+    )
+    gs = setup.game_state
+
+    random.seed(7)
+    rollback_stats = {}
+    rolled = enumerate_sequences(gs, "player1", use_rollback=True, stats=rollback_stats)
+    random.seed(7)
+    clone_stats = {}
+    cloned = enumerate_sequences(gs, "player1", use_rollback=False, stats=clone_stats)
+
+    assert [s["raw_string"] for s in rolled] == [s["raw_string"] for s in cloned]
+    # Same tree searched; only the wall-clock fields may differ
+    for timing in ("elapsed_ms", "nodes_per_sec"):
+        rollback_stats.pop(timing)
+        clone_stats.pop(timing)
+    assert rollback_stats == clone_stats
+    assert rollback_stats["nodes_expanded"] > 1
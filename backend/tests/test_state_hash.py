@@ -0,0 +1,125 @@
+"""
+Tests for the incremental Zobrist state hash.
+
+The enumerator keys transpositions on ``GameState.get_state_hash()``, which is
+updated by card/player attribute hooks instead of being rebuilt per node.
+These tests check that it always matches a from-scratch hash of the canonical
+state signature, and that the debug cross-check catches drift.
+"""
+
+import copy
+import random
+
+import pytest
+
+from conftest import create_card, create_game_with_cards, steal_card
+from game_engine.ai.enumerator import _state_signature, enumerate_sequences
+from game_engine.models.card import Zone
+from game_engine.models.state_hash import signature_hash
+
+
+def _assert_consistent(gs):
+    assert gs.get_state_hash() == signature_hash(_state_signature(gs))
+
+
+def test_hash_tracks_tussle_and_counters():
+    setup, cards = create_game_with_cards(
+        player1_in_play=["Knight"],
+        player2_in_play=["Paper Plane"],
+        player1_charge=5,
+    )
+    gs = setup.game_state
+    before = gs.get_state_hash()
+
+    setup.engine.initiate_tussle(cards["p1_inplay_Knight"], cards["p2_inplay_Paper Plane"], setup.player1)
+    assert gs.get_state_hash() != before
+    _assert_consistent(gs)
+
+    setup.player1.direct_attacks_this_turn += 1
+    setup.player2.charge += 2
+    _assert_consistent(gs)
+
+
+def test_hash_returns_to_same_value_for_same_position():
+    setup, cards = create_game_with_cards(player1_in_play=["Ka"])
+    gs = setup.game_state
+    ka = cards["p1_inplay_Ka"]
+    start = gs.get_state_hash()
+
+    setup.player1.move_card(ka, Zone.IN_PLAY, Zone.BREAK)
+    assert gs.get_state_hash() != start
+    setup.player1.move_card(ka, Zone.BREAK, Zone.IN_PLAY)
+    assert gs.get_state_hash() == start
+
+
+def test_hash_tracks_control_change_and_direct_list_edits():
+    setup, cards = create_game_with_cards(
+        player1_in_play=["Ka"],
+        player2_in_play=["Knight"],
+    )
+    gs = setup.game_state
+    gs.get_state_hash()
+
+    steal_card(gs, cards["p2_inplay_Knight"], "player1")
+    _assert_consistent(gs)
+
+    # A card added straight to a zone list has no hook yet; the count change
+    # forces a recompute.
+    setup.player2.hand.append(create_card("Ka", owner="player2", zone=Zone.HAND))
+    _assert_consistent(gs)
+
+
+def test_rollback_restores_hash():
+    setup, cards = create_game_with_cards(
+        player1_hand=["Surge"],
+        player1_in_play=["Knight"],
+        player2_in_play=["Paper Plane"],
+        player1_charge=5,
+    )
+    gs = setup.game_state
+    start = gs.get_state_hash()
+    cp = gs.checkpoint()
+
+    setup.engine.play_card(setup.player1, cards["p1_hand_Surge"])
+    setup.engine.initiate_tussle(cards["p1_inplay_Knight"], cards["p2_inplay_Paper Plane"], setup.player1)
+    gs.rollback(cp)
+
+    assert gs.get_state_hash() == start
+    _assert_consistent(gs)
+
+
+def test_cloned_state_hashes_independently():
+    setup, cards = create_game_with_cards(player1_in_play=["Knight"], player1_charge=3)
+    gs = setup.game_state
+    start = gs.get_state_hash()
+
+    clone = copy.deepcopy(gs)
+    clone.players["player1"].charge -= 1
+    assert gs.get_state_hash() == start
+    assert clone.get_state_hash() != start
+    _assert_consistent(clone)
+
+
+def test_search_with_hash_verification():
+    setup, _ = create_game_with_cards(
+        player1_hand=["Surge", "Twist", "Copy"],
+        player1_in_play=["Archer", "Knight"],
+        player2_hand=["Ka", "Wake"],
+        player2_in_play=["Paper Plane", "Wizard"],
+        player1_charge=7,
+        turn_number=4,
+    )
+    random.seed(3)
+    sequences = enumerate_sequences(setup.game_state, "player1", verify_state_hash=True)
+    assert sequences
+
+
+def test_verification_raises_on_unhooked_mutation():
+    setup, cards = create_game_with_cards(player1_in_play=["Knight"], player1_charge=3)
+    gs = setup.game_state
+    gs.get_state_hash()
+
+    # Bypass the hook: the cached hash no longer matches the state.
+    object.__setattr__(cards["p1_inplay_Knight"], "current_stamina", 1)
+    with pytest.raises(RuntimeError, match="State hash drift"):
+        enumerate_sequences(gs, "player1", verify_state_hash=True)
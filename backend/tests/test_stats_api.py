@@ -293,6 +293,17 @@ class TestCardStatsAggregateEndpoint:
         assert client.get("/stats/cards?limit=0").status_code == 422
 
 
+def _with_card_rows(players):
+    """Seed rows plus the normalized per-card rows update_player_stats maintains."""
+    from api.db_models import PlayerCardStatsModel
+
+    rows = list(players)
+    for player in players:
+        for card_name, data in player.card_stats.items():
+            rows.append(PlayerCardStatsModel(player_id=player.player_id, card_name=card_name, **data))
+    return rows
+
+
 class TestStatsServiceIntegration:
     """Tests for StatsService card leaderboard method."""
 
@@ -333,7 +344,7 @@ class TestStatsServiceIntegration:
 
         # Two players both used Ka; only player1 used Knight
         seed = TestSession()
-        seed.add_all([
+        seed.add_all(_with_card_rows([
             PlayerStatsModel(
                 player_id="p1", display_name="Alice",
                 games_played=10, games_won=6,
@@ -351,7 +362,7 @@ class TestStatsServiceIntegration:
                     "Ka": {"games_played": 6, "games_won": 3},
                 },
             ),
-        ])
+        ]))
         seed.commit()
         seed.close()
 
@@ -395,7 +406,7 @@ class TestStatsServiceIntegration:
         TestSession = sessionmaker(bind=engine)
 
         seed = TestSession()
-        seed.add(PlayerStatsModel(
+        seed.add_all(_with_card_rows([PlayerStatsModel(
             player_id="p1", display_name="Alice",
             games_played=5, games_won=3,
             total_tussles=0, tussles_won=0,
@@ -403,7 +414,7 @@ class TestStatsServiceIntegration:
                 "Ka": {"games_played": 5, "games_won": 3},
                 "Rush": {"games_played": 1, "games_won": 0},
             },
-        ))
+        )]))
         seed.commit()
         seed.close()
 
@@ -0,0 +1,95 @@
+"""
+Per-search tracing (game_engine.tracing) in the validator, executor and
+enumerator hot paths.
+"""
+
+import logging
+import threading
+
+from conftest import create_game_with_cards
+from game_engine.ai.enumerator import enumerate_sequences
+from game_engine.game_engine import GameEngine
+from game_engine.tracing import TraceRecorder, get_tracer, is_simulated, trace_scope
+from game_engine.validation import ActionExecutor
+
+EXECUTOR_LOGGER = "game_engine.validation.action_executor"
+
+
+def _board():
+    return create_game_with_cards(
+        player1_hand=["Drop"],
+        player1_in_play=["Knight"],
+        player2_in_play=["Ka", "Paper Plane"],
+        player1_charge=4,
+        active_player="player1",
+        turn_number=3,
+    )
+
+
+def test_no_tracer_without_listener():
+    logger = logging.getLogger("test.tracing.quiet")
+    logger.setLevel(logging.INFO)
+    assert get_tracer(logger) is None
+    with trace_scope(simulated=True):
+        assert get_tracer(logger) is None
+
+
+def test_recorder_collects_search_decisions():
+    setup, _ = _board()
+    recorder = TraceRecorder()
+
+    enumerate_sequences(setup.game_state, "player1", trace=recorder)
+
+    counts = recorder.counts()
+    assert counts["expand"] >= 1
+    assert counts["target_options"] >= 1
+    assert counts["tussle_prediction"] >= 1
+    sources = {source for source, _, _ in recorder.events}
+    assert "game_engine.validation.action_validator" in sources
+    # The scope ends with the search
+    assert not is_simulated()
+
+
+def test_recorder_is_bounded():
+    setup, _ = _board()
+    recorder = TraceRecorder(max_events=3)
+
+    enumerate_sequences(setup.game_state, "player1", trace=recorder)
+
+    assert len(recorder.events) == 3
+    assert recorder.dropped > 0
+
+
+def test_simulated_plays_are_not_logged_but_real_ones_are(caplog):
+    setup, cards = _board()
+    exec_logger = logging.getLogger(EXECUTOR_LOGGER)
+    level = exec_logger.level
+
+    with caplog.at_level(logging.INFO, logger=EXECUTOR_LOGGER):
+        enumerate_sequences(setup.game_state, "player1")
+        assert not [r for r in caplog.records if r.getMessage().startswith("Playing Drop")]
+        assert exec_logger.level == logging.INFO
+
+        ActionExecutor(GameEngine(setup.game_state)).execute_play_card(
+            "player1", cards["p1_hand_Drop"].id, target_card_id=cards["p2_inplay_Ka"].id,
+        )
+        assert [r for r in caplog.records if r.getMessage().startswith("Playing Drop")]
+    exec_logger.setLevel(level)
+
+
+def test_scope_does_not_leak_to_other_threads():
+    seen = []
+    with trace_scope(simulated=True):
+        assert is_simulated()
+        thread = threading.Thread(target=lambda: seen.append(is_simulated()))
+        thread.start()
+        thread.join()
+    assert seen == [False]
+    assert not is_simulated()
+
+
+def test_debug_logging_emits_events(caplog):
+    setup, _ = _board()
+    with caplog.at_level(logging.DEBUG, logger="game_engine.validation.action_validator"):
+        enumerate_sequences(setup.game_state, "player1")
+    assert any(r.getMessage().startswith("target_options ") for r in caplog.records)
@@ -0,0 +1,326 @@
+"""
+Tests for the route worker pools (api.worker_pools).
+
+Covers saturation metrics, the queue cap (503 from offloaded routes),
+cancelled callers (queued calls dropped, running calls outlived),
+per-game serialization, state reads not waiting for a planning AI turn,
+AI turns of different games running concurrently without sharing player
+state (and releasing it once a game is finished or deleted), the event loop
+staying responsive while a handler blocks, and the pools' presence on
+/health.
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api import routes_actions, worker_pools
+from api.app import app
+from api.game_service import GameService, get_game_service
+from api.worker_pools import AI_POOL, DB_POOL, PoolSaturatedError, WorkerPool, offload
+from conftest import create_game_with_cards
+from game_engine.ai import llm_player
+from game_engine.ai.llm_player import LLMPlayer
+from game_engine.ai.selectors import HeuristicSelector
+
+
+CARDS_CSV = str(Path(__file__).parent.parent / "data" / "cards.csv")
+_GAME = dict(
+    player1_id="p1", player1_name="Alice", player1_deck=["Ka", "Knight", "Wizard"],
+    player2_id="p2", player2_name="Bob", player2_deck=["Ka", "Knight", "Wizard"],
+    first_player_id="p1",
+)
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    pools = {DB_POOL: WorkerPool(DB_POOL, max_workers=2, max_queued=1)}
+    monkeypatch.setattr(worker_pools, "_pools", pools)
+    yield pools
+    pools[DB_POOL].shutdown()
+
+
+def test_saturation_metrics():
+    pool = WorkerPool("test", max_workers=1)
+    release = threading.Event()
+
+    async def main():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: "done"))
+        await asyncio.sleep(0.05)
+        busy = pool.stats()
+        release.set()
+        return busy, await blocked, await queued
+
+    busy, _, result = asyncio.run(main())
+    pool.shutdown()
+
+    assert result == "done"
+    assert (busy["active"], busy["queued"]) == (1, 1)
+    stats = pool.stats()
+    assert stats["submitted"] == stats["completed"] == 2
+    assert stats["saturated"] == 1 and stats["peak_queued"] == 1
+    assert stats["max_wait_ms"] >= 40
+
+
+def test_cancelled_queued_call_is_dropped():
+    pool = WorkerPool("test", max_workers=1, max_queued=1)
+    release = threading.Event()
+    ran = []
+
+    async def main():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(ran.append, "queued"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        after_cancel = pool.stats()["queued"]
+        # The freed queue slot is usable again
+        next_call = asyncio.ensure_future(pool.run(lambda: "next"))
+        release.set()
+        return after_cancel, await blocked, await next_call
+
+    after_cancel, _, result = asyncio.run(main())
+    pool.shutdown()
+
+    assert after_cancel == 0
+    assert result == "next" and ran == []
+    assert pool.stats()["queued"] == 0
+
+
+def test_cancelled_running_call_keeps_the_game_lock(pools):
+    release = threading.Event()
+    events = []
+
+    @offload(DB_POOL, per_game=True)
+    def handler(game_id: str, name: str) -> None:
+        events.append(f"{name} start")
+        if name == "first":
+            release.wait()
+        events.append(f"{name} end")
+
+    async def main():
+        first = asyncio.ensure_future(handler(game_id="a", name="first"))
+        await asyncio.sleep(0.05)
+        second = asyncio.ensure_future(handler(game_id="a", name="second"))
+        first.cancel()
+        await asyncio.sleep(0.05)
+        assert not first.done()  # Still waiting for its running handler
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await second
+
+    asyncio.run(main())
+
+    assert events == ["first start", "first end", "second start", "second end"]
+
+
+def test_full_queue_is_rejected(pools):
+    release = threading.Event()
+
+    @offload(DB_POOL)
+    def handler(game_id: str) -> str:
+        release.wait()
+        return game_id
+
+    async def main():
+        running = [asyncio.ensure_future(handler(game_id=str(i))) for i in range(3)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(PoolSaturatedError):
+            await pools[DB_POOL].run(lambda: None)
+        with pytest.raises(HTTPException) as exc_info:
+            await handler(game_id="x")
+        release.set()
+        return exc_info.value.status_code, await asyncio.gather(*running)
+
+    status, results = asyncio.run(main())
+
+    assert status == 503
+    assert results == ["0", "1", "2"]
+    assert pools[DB_POOL].stats()["rejected"] == 2
+
+
+def test_per_game_calls_are_serialized(pools):
+    active = {"a": 0, "b": 0}
+    overlaps = []
+
+    @offload(DB_POOL, per_game=True)
+    def handler(game_id: str) -> None:
+        active[game_id] += 1
+        overlaps.append(dict(active))
+        time.sleep(0.02)
+        active[game_id] -= 1
+
+    async def main():
+        await asyncio.gather(*(handler(game_id=g) for g in ("a", "a", "b")))
+
+    asyncio.run(main())
+
+    assert all(counts["a"] <= 1 for counts in overlaps)
+    assert any(counts["a"] and counts["b"] for counts in overlaps)
+    assert len(worker_pools.game_locks) == 0
+
+
+def test_reads_wait_only_while_a_writer_touches_the_state(pools):
+    planning, touching, release = threading.Event(), threading.Event(), threading.Event()
+    events = []
+
+    @offload(DB_POOL, per_game=True)
+    def ai_turn(game_id: str) -> None:
+        with worker_pools.game_state_locks.released(game_id):
+            planning.set()
+            release.wait()  # Search and LLM call
+        touching.set()
+        time.sleep(0.05)
+        events.append("applied")
+
+    @offload(DB_POOL, reads_game=True)
+    def read(game_id: str) -> None:
+        events.append("read")
+
+    async def main():
+        turn = asyncio.ensure_future(ai_turn(game_id="a"))
+        await asyncio.to_thread(planning.wait, 5)
+        await asyncio.wait_for(read(game_id="a"), timeout=5)
+        release.set()
+        await asyncio.to_thread(touching.wait, 5)
+        await read(game_id="a")
+        await turn
+
+    asyncio.run(main())
+
+    assert events == ["read", "applied", "read"]
+    assert len(worker_pools.game_state_locks) == 0
+
+
+class _BarrierSelector(HeuristicSelector):
+    """Heuristic picks, but both games must be planning before either picks."""
+
+    def __init__(self):
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def select(self, *args, **kwargs):
+        self.barrier.wait()
+        return super().select(*args, **kwargs)
+
+
+class _DecisionLog:
+    def __init__(self):
+        self.entries = []
+
+    def log_ai_decision(self, **kwargs):
+        self.entries.append(kwargs)
+
+
+def test_concurrent_ai_turns_keep_separate_plans(monkeypatch):
+    pools = {name: WorkerPool(name, max_workers=2) for name in (DB_POOL, AI_POOL)}
+    monkeypatch.setattr(worker_pools, "_pools", pools)
+    monkeypatch.setattr(llm_player, "_ai_player", LLMPlayer(selector=_BarrierSelector()))
+    monkeypatch.setattr(llm_player, "_game_players", type(llm_player._game_players)())
+    decisions = _DecisionLog()
+    monkeypatch.setattr(routes_actions, "get_stats_service", lambda: decisions)
+    # A turn that ends its game releases the game's player, so keep a handle
+    players = {}
+
+    def get_ai_player(game_id):
+        players[game_id] = llm_player.get_ai_player(game_id)
+        return players[game_id]
+
+    monkeypatch.setattr(routes_actions, "get_ai_player", get_ai_player)
+    service = get_game_service()
+    monkeypatch.setattr(service, "use_database", False)
+
+    # Each game's only plan uses a card the other game does not have
+    games = {
+        "game-knight": create_game_with_cards(
+            player1_in_play=["Knight"], player2_in_play=["Paper Plane"], player1_charge=4,
+        )[0],
+        "game-ka": create_game_with_cards(
+            player1_hand=["Ka"], player2_in_play=["Paper Plane"], player1_charge=4,
+        )[0],
+    }
+    for game_id, setup in games.items():
+        setup.game_state.game_id = game_id
+        monkeypatch.setitem(service._cache, game_id, setup.engine)
+
+    async def main():
+        return await asyncio.gather(*(
+            routes_actions.ai_take_turn(game_id=game_id, player_id="player1") for game_id in games
+        ))
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        for pool in pools.values():
+            pool.shutdown()
+
+    assert all(result.success for result in results)
+    logged = {entry["game_id"]: entry["turn_plan"] for entry in decisions.entries}
+    for game_id, card in (("game-knight", "Knight"), ("game-ka", "Ka")):
+        plan = players[game_id].get_last_decision_info()["plan"]
+        assert plan["action_sequence"][0]["card_name"] == card
+        assert logged[game_id]["action_sequence"][0]["card_name"] == card
+    assert players["game-knight"] is not players["game-ka"]
+
+
+def test_finished_and_deleted_games_release_their_ai_player(monkeypatch):
+    monkeypatch.setattr(llm_player, "_ai_player", LLMPlayer(selector=HeuristicSelector()))
+    monkeypatch.setattr(llm_player, "_game_players", type(llm_player._game_players)())
+    service = GameService(CARDS_CSV, use_database=False)
+    monkeypatch.setattr(service, "_save_game_stats", lambda game_id, engine: None)
+    finished, _ = service.create_game(**_GAME)
+    deleted, _ = service.create_game(**_GAME)
+    for game_id in (finished, deleted):
+        llm_player.get_ai_player(game_id)
+
+    engine = service.get_game(finished)
+    engine.game_state.winner_id = "p1"
+    service.update_game(finished, engine)
+    service.delete_game(deleted)
+
+    assert len(llm_player._game_players) == 0
+
+
+def test_event_loop_stays_responsive(pools):
+    @offload(DB_POOL)
+    def slow_handler() -> str:
+        time.sleep(0.2)
+        return "ok"
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        result = await slow_handler()
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+
+    assert result == "ok"
+    assert ticks >= 5
+
+
+def test_offloaded_routes_keep_their_signature_and_health_reports_pools():
+    schema = app.openapi()["paths"]["/games/{game_id}/play-card"]["post"]
+    assert [p["name"] for p in schema["parameters"]] == ["game_id"]
+    assert "requestBody" in schema
+
+    health = TestClient(app).get("/health").json()
+
+    assert set(health["worker_pools"]) == {"db", "ai"}
+    assert health["worker_pools"]["db"]["submitted"] >= 1
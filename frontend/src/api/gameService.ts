@@ -84,12 +84,34 @@ export async function quickPlay(playerId: string, playerName: string): Promise<Q
   return response.data;
 }
 
-export async function getGameState(gameId: string, playerId?: string): Promise<GameState> {
+/**
+ * URL of the Server-Sent Events stream for a game, or null for design
+ * fixtures (which have no server-side game to watch).
+ */
+export function getGameStreamUrl(gameId: string, playerId?: string): string | null {
+  if (isDesignFixture(gameId)) return null;
+  const url = new URL(`${apiClient.defaults.baseURL}/games/${gameId}/stream`);
+  if (playerId) url.searchParams.set('player_id', playerId);
+  return url.toString();
+}
+
+/**
+ * Fetch game state. With `since`, only play-by-play entries from that index
+ * are returned (see `play_by_play_start`); merge them with mergePlayByPlay.
+ * Unchanged states are revalidated by the browser cache via ETag (304).
+ */
+export async function getGameState(
+  gameId: string,
+  playerId?: string,
+  since?: number
+): Promise<GameState> {
   if (isDesignFixture(gameId)) {
     const { getFixtureGameState } = await import('../fixtures/designFixtures');
     return getFixtureGameState(gameId);
   }
-  const params = playerId ? { player_id: playerId } : {};
+  const params: Record<string, string | number> = {};
+  if (playerId) params.player_id = playerId;
+  if (since) params.since = since;
   const response = await apiClient.get<GameState>(`/games/${gameId}`, { params });
   return response.data;
 }
@@ -10,7 +10,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import { LayoutGroup } from 'framer-motion';
 import type { ValidAction, GameState, Card } from '../types/game';
-import { useGameState, useValidActions } from '../hooks/useGame';
+import { useGameState, useGameStream, useValidActions } from '../hooks/useGame';
 import { usePacedGameState } from '../hooks/usePacedGameState';
 import { useGameMessages } from '../hooks/useGameMessages';
 import { useGameFlow } from '../hooks/useGameFlow';
@@ -45,9 +45,11 @@ export function GameBoard({ gameId, humanPlayerId, aiPlayerId, onGameEnd }: Game
   // Debug flag - set to true to show viewport debug info
   const DEBUG_VIEWPORT = false;
 
-  // Fetch game state with polling
+  // Game state is pushed over SSE; while the stream is up, polling drops to
+  // a slow safety net (the server's update hub is per process)
+  const streamConnected = useGameStream(gameId, humanPlayerId);
   const { data: fetchedGameState, isLoading, error } = useGameState(gameId, humanPlayerId, {
-    refetchInterval: 2000,
+    refetchInterval: streamConnected ? 30000 : 2000,
   });
 
   // Pace *rendered* opponent-turn snapshots so fast/plan-cached AI actions
@@ -2,6 +2,7 @@
  * React Query hooks for game state and actions
  */
 
+import { useEffect, useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import type { UseMutationResult, UseQueryResult } from '@tanstack/react-query';
 import type {
@@ -34,20 +35,82 @@ export const gameKeys = {
 // GAME STATE QUERIES
 // ============================================================================
 
+/**
+ * Combine an incremental game state (play_by_play from `play_by_play_start`)
+ * with the previously cached one into a full state.
+ */
+export function mergePlayByPlay(previous: GameState | undefined, update: GameState): GameState {
+  const start = update.play_by_play_start ?? 0;
+  const history = start > 0 ? (previous?.play_by_play ?? []).slice(0, start) : [];
+  return { ...update, play_by_play: [...history, ...(update.play_by_play ?? [])] };
+}
+
 export function useGameState(
   gameId: string | null,
   playerId?: string,
   options?: { enabled?: boolean; refetchInterval?: number }
 ): UseQueryResult<GameState, Error> {
+  const queryClient = useQueryClient();
+  const queryKey = gameKeys.gameState(gameId || '', playerId);
+
   return useQuery({
-    queryKey: gameKeys.gameState(gameId || '', playerId),
-    queryFn: () => gameService.getGameState(gameId!, playerId),
+    queryKey,
+    // Only ask for play-by-play entries we don't have yet
+    queryFn: async () => {
+      const previous = queryClient.getQueryData<GameState>(queryKey);
+      const update = await gameService.getGameState(gameId!, playerId, previous?.play_by_play?.length);
+      return mergePlayByPlay(previous, update);
+    },
     enabled: !!gameId && (options?.enabled !== false),
     refetchInterval: options?.refetchInterval || false,
     staleTime: 0, // Always fetch fresh data
   });
 }
 
+/**
+ * Subscribe to server-pushed game state (SSE) and write it into the
+ * useGameState query cache.
+ *
+ * The first event carries the full play-by-play; later events carry only
+ * new entries from `play_by_play_start`, which are appended to the cached
+ * history. Returns true while the stream is open, so callers can relax
+ * their polling interval; polling stays the fallback when it is not.
+ */
+export function useGameStream(gameId: string | null, playerId?: string): boolean {
+  const queryClient = useQueryClient();
+  const [connected, setConnected] = useState(false);
+
+  useEffect(() => {
+    const url = gameId ? gameService.getGameStreamUrl(gameId, playerId) : null;
+    if (!url || typeof EventSource === 'undefined') return;
+
+    const queryKey = gameKeys.gameState(gameId!, playerId);
+    const source = new EventSource(url);
+    source.onopen = () => setConnected(true);
+    source.onerror = () => setConnected(false);  // EventSource retries on its own
+    source.addEventListener('state', (event) => {
+      const update = JSON.parse((event as MessageEvent).data) as GameState;
+      queryClient.setQueryData<GameState>(queryKey, (previous) => mergePlayByPlay(previous, update));
+      if (update.is_game_over) {
+        source.close();
+        setConnected(false);
+      }
+    });
+    source.addEventListener('gone', () => {
+      source.close();
+      setConnected(false);
+      queryClient.invalidateQueries({ queryKey });
+    });
+
+    return () => {
+      source.close();
+      setConnected(false);
+    };
+  }, [gameId, playerId, queryClient]);
+
+  return connected;
+}
+
 export function useValidActions(
   gameId: string | null,
   playerId: string | null,
@@ -58,6 +58,8 @@ export interface GameState {
   winner: string | null;
   is_game_over: boolean;
   play_by_play?: PlayByPlayEntry[];
+  version?: number;  // Server state version; bumps on every change
+  play_by_play_start?: number;  // Index of play_by_play[0] (stream deltas)
 }
 
 export interface ValidAction {